@@ -0,0 +1,8 @@
+from undine import Filter, FilterSet
+
+from .models import Task
+
+
+class TaskFilterSet(FilterSet[Task], exists_subqueries=True):
+    assignee_name = Filter("assignees__name", distinct=True)
+    assignee_email = Filter("assignees__email", distinct=True)
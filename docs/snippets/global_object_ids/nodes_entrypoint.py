@@ -0,0 +1,16 @@
+from undine import Entrypoint, QueryType, RootType
+from undine.relay import Connection, Node, Nodes
+
+from .models import Person, Task
+
+
+class TaskType(QueryType[Task], interfaces=[Node]): ...
+
+
+class PersonType(QueryType[Person], interfaces=[Node]): ...
+
+
+class Query(RootType):
+    nodes = Entrypoint(Nodes)
+    tasks = Entrypoint(Connection(TaskType))
+    people = Entrypoint(Connection(PersonType))
@@ -0,0 +1,19 @@
+from django.db.models import OuterRef
+
+from undine import Calculation, CalculationArgument, Field, GQLInfo, QueryType
+from undine.typing import DjangoExpression
+from undine.utils.model_utils import SubqueryCount
+
+from .models import Task
+
+
+class ProjectTaskCount(Calculation[int], deduplicate=True, cache_time=60):
+    done = CalculationArgument(bool, default_value=False)
+
+    def __call__(self, info: GQLInfo) -> DjangoExpression:
+        tasks = Task.objects.filter(project=OuterRef("project"), done=self.done)
+        return SubqueryCount(tasks)
+
+
+class TaskType(QueryType[Task]):
+    project_task_count = Field(ProjectTaskCount)
@@ -0,0 +1,18 @@
+from django.db.models import Count, Q
+
+from undine import Calculation, Field, GQLInfo, QueryType
+from undine.typing import DjangoExpression
+
+from .models import Project
+
+
+class AssignedTaskCount(Calculation[int], cache_time=60):
+    def __call__(self, info: GQLInfo) -> DjangoExpression:
+        return Count("tasks", filter=Q(tasks__assignees__name=info.context.user.username))
+
+    def __cache_key__(self, info: GQLInfo) -> str:
+        return str(info.context.user.pk)
+
+
+class ProjectType(QueryType[Project]):
+    assigned_task_count = Field(AssignedTaskCount)
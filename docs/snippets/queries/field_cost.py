@@ -0,0 +1,15 @@
+from typing import Any
+
+from undine import Field, QueryType
+
+from .models import Task
+
+
+class TaskType(QueryType[Task]):
+    @Field
+    def similar_names(self: Task, count: int = 10) -> list[str]:
+        return []
+
+    @similar_names.cost
+    def similar_names_cost(self: Field, arguments: dict[str, Any]) -> int:
+        return arguments["count"]
@@ -0,0 +1,8 @@
+from undine import Field, QueryType
+
+from .models import Task
+
+
+class TaskType(QueryType[Task], entity_cache_time=60):
+    name = Field()
+    points = Field()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import operator
+import time
+from functools import reduce
+from typing import TYPE_CHECKING, Any
+
+from django.core.management import BaseCommand
+from django.db.models import Q
+
+from example_project.app.models import Task
+from tests.helpers import mock_gql_info
+from undine import Filter, FilterSet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.management.base import CommandParser
+
+
+class TaskFilterSet(FilterSet[Task], auto=False):
+    pk = Filter(many=True)
+
+
+class Command(BaseCommand):
+    help = "Benchmark building and compiling the SQL for 'many' filters with a large number of values."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--values", type=int, nargs="+", default=[10, 100, 1_000, 2_000, 10_000])
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        info = mock_gql_info()
+        ftr = TaskFilterSet.pk
+        repeat: int = options["repeat"]
+
+        def collapsed(values: list[int]) -> Q:
+            return ftr.get_many_expression(values, info)
+
+        def expanded(values: list[int]) -> Q:
+            conditions = (ftr.get_expression(value, info) for value in values)
+            return reduce(operator.or_, conditions, Q())
+
+        self.stdout.write(f"{'values':>8} {'method':>10} {'build (ms)':>12} {'compile (ms)':>14} {'sql length':>12}")
+
+        for count in options["values"]:
+            values = list(range(count))
+            for name, build in (("expanded", expanded), ("collapsed", collapsed)):
+                build_ms, condition = _best_of(repeat, build, values)
+                compile_ms, sql = _best_of(repeat, _compile, condition)
+                self.stdout.write(f"{count:>8} {name:>10} {build_ms:>12.3f} {compile_ms:>14.3f} {len(sql):>12}")
+
+
+def _compile(condition: Q) -> str:
+    sql, params = Task.objects.filter(condition).query.sql_with_params()
+    return sql % tuple("%s" for _ in params)
+
+
+def _best_of(repeat: int, func: Callable[[Any], Any], arg: Any) -> tuple[float, Any]:
+    best = float("inf")
+    result: Any = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
@@ -184,6 +184,10 @@ class KeywordData:
             type_checker=is_string,
             expected_type="str",
         ),
+        "exists_subqueries": KeywordData(
+            type_checker=is_boolean,
+            expected_type="bool",
+        ),
         "directives": KeywordData(
             type_checker=is_directive_list,
             expected_type="list[Directive]",
@@ -312,6 +316,10 @@ class KeywordData:
             type_checker=is_boolean,
             expected_type="bool",
         ),
+        "entity_cache_time": KeywordData(
+            type_checker=is_integer_or_none,
+            expected_type="int | None",
+        ),
         "register": KeywordData(
             type_checker=is_boolean,
             expected_type="bool",
@@ -11,11 +11,13 @@
 from undine.directives import AtomicDirective, CacheRulesDirective, ComplexityDirective
 from undine.federation.directives import USED_FEDERATION_DIRECTIVES
 from undine.federation.federation_type import FEDERATION_TYPE_REGISTRY
+from undine.persisted_documents.cache import persisted_document_cache
 from undine.query import QUERY_TYPE_REGISTRY
 from undine.relay import Node
 from undine.utils.graphql.type_registry import DIRECTIVE_REGISTRY, GRAPHQL_REGISTRY, register_builtins
 from undine.utils.graphql.utils import enable_did_you_mean_suggestions
 from undine.utils.reflection import get_signature
+from undine.utils.visibility import audience_schema_cache
 
 if TYPE_CHECKING:
     from tests.helpers import AccessLog
@@ -48,6 +50,16 @@ def _clear_registries() -> None:
     register_builtins()
 
 
+@pytest.fixture(autouse=True)
+def _clear_persisted_document_cache() -> None:
+    persisted_document_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_audience_schema_cache() -> None:
+    audience_schema_cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def _reset_faker_uniqueness() -> None:
     """Reset the uniqueness between tests so that we don't run out of unique values."""
@@ -255,3 +255,40 @@ def __call__(self, info: GQLInfo) -> DjangoExpression:
             return Value(self.value)
 
     assert ExampleCalculation.value.visible_func is not None
+
+
+def test_calculation__deduplicate_and_cache_time() -> None:
+    class ExampleCalculation(Calculation[int]):
+        value = CalculationArgument(int)
+
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return Value(self.value)
+
+    class DeduplicatedCalculation(Calculation[int], deduplicate=True):
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return Value(1)
+
+    class CachedCalculation(Calculation[int], cache_time=10):
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return Value(1)
+
+    assert ExampleCalculation.__deduplicate__ is False
+    assert ExampleCalculation.__cache_time__ == 0
+
+    assert DeduplicatedCalculation.__deduplicate__ is True
+    assert DeduplicatedCalculation.__cache_time__ == 0
+
+    # Cached calculations are always deduplicated.
+    assert CachedCalculation.__deduplicate__ is True
+    assert CachedCalculation.__cache_time__ == 10
+
+
+def test_calculation__identity() -> None:
+    class ExampleCalculation(Calculation[int]):
+        value = CalculationArgument(int)
+
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return Value(self.value)
+
+    assert ExampleCalculation("foo", value=1).__identity__ == ExampleCalculation("bar", value=1).__identity__
+    assert ExampleCalculation("foo", value=1).__identity__ != ExampleCalculation("foo", value=2).__identity__
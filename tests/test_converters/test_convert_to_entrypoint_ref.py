@@ -10,7 +10,7 @@
 from undine.converters import convert_to_entrypoint_ref
 from undine.exceptions import FunctionDispatcherError, MissingEntrypointRefError
 from undine.pagination import OffsetPagination
-from undine.relay import Connection, Node
+from undine.relay import Connection, Node, Nodes
 
 
 def test_convert_to_entrypoint_ref__undefined_type() -> None:
@@ -117,6 +117,18 @@ class Query(RootType):
     assert Query.node.nullable is False
 
 
+def test_convert_to_entrypoint_ref__nodes() -> None:
+    @Node
+    class TaskType(QueryType[Task]): ...
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+
+    assert convert_to_entrypoint_ref(Nodes, caller=Query.nodes) == Nodes
+    assert Query.nodes.many is False
+    assert Query.nodes.nullable is False
+
+
 def test_convert_to_entrypoint_ref__connection() -> None:
     class TaskType(QueryType[Task]): ...
 
@@ -10,7 +10,7 @@
 from undine.converters import convert_to_entrypoint_resolver
 from undine.exceptions import InvalidEntrypointMutationTypeError
 from undine.pagination import OffsetPagination
-from undine.relay import Connection, Node
+from undine.relay import Connection, Node, Nodes
 from undine.resolvers import (
     BulkCreateResolver,
     BulkDeleteResolver,
@@ -22,6 +22,7 @@
     InterfaceTypeConnectionResolver,
     InterfaceTypeResolver,
     NodeResolver,
+    NodesResolver,
     QueryTypeManyResolver,
     QueryTypeSingleResolver,
     UnionTypeConnectionResolver,
@@ -413,3 +414,15 @@ class Query(RootType):
     resolver = convert_to_entrypoint_resolver(Node, caller=Query.node)
 
     assert isinstance(resolver, NodeResolver)
+
+
+def test_convert_entrypoint_ref_to_resolver__nodes() -> None:
+    @Node
+    class TaskType(QueryType[Task]): ...
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+
+    resolver = convert_to_entrypoint_resolver(Nodes, caller=Query.nodes)
+
+    assert isinstance(resolver, NodesResolver)
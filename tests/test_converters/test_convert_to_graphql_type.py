@@ -1241,6 +1241,19 @@ class TaskType(QueryType[Task]): ...
     assert sorted(result.fields) == ["edges", "pageInfo", "totalCount"]
 
 
+def test_convert_to_graphql_type__connection__estimated_total_count() -> None:
+    class TaskType(QueryType[Task]): ...
+
+    connection = Connection(TaskType, total_count_strategy="estimated")
+
+    result = convert_to_graphql_type(connection)
+    assert isinstance(result, GraphQLObjectType)
+
+    assert result.name == "TaskTypeConnection"
+    assert sorted(result.fields) == ["edges", "pageInfo", "totalCount", "totalCountIsExact"]
+    assert result.fields["totalCountIsExact"].type == GraphQLNonNull(GraphQLBoolean)
+
+
 def test_convert_to_graphql_type__offset_pagination() -> None:
     class TaskType(QueryType[Task]): ...
 
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import MagicMock, call
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.db import connection
+
+from example_project.app.models import Task
+from tests.factories import TaskFactory
+from undine import Entrypoint, Field, GQLInfo, QueryType, RootType, create_schema
+from undine.deadlines import (
+    DEADLINE_EXTENSION_KEY,
+    OperationDeadlineHook,
+    _current_deadline,  # noqa: PLC2701
+    limit_database_query,
+    set_statement_timeout,
+)
+
+# Counts to a large number, so that the query takes a long time in SQLite.
+SLOW_SQL = (
+    "WITH RECURSIVE numbers(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM numbers WHERE x < 100000000) "
+    "SELECT COUNT(*) FROM numbers"
+)
+
+
+def create_deadline_schema(**entrypoint_params: Any) -> Any:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+        @Field
+        def slow(self: Task) -> str | None:
+            time.sleep(0.1)
+            return self.name
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True, **entrypoint_params)
+
+        @Entrypoint
+        def hello(self, info: GQLInfo) -> str:
+            return "world"
+
+        @Entrypoint(nullable=True)
+        def count(self, info: GQLInfo) -> int | None:
+            with connection.cursor() as cursor:
+                cursor.execute(SLOW_SQL)
+                return cursor.fetchone()[0]
+
+    return create_schema(query=Query)
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__no_timeout(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    TaskFactory.create(name="foo")
+
+    response = graphql("query { tasks { name slow } hello }")
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo", "slow": "foo"}], "hello": "world"}
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__entrypoint_timeout(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema(timeout=0.15)
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    TaskFactory.create(name="foo")
+    TaskFactory.create(name="bar")
+    TaskFactory.create(name="baz")
+
+    response = graphql("query { tasks { slow } hello }")
+
+    # Fields that could be resolved before the deadline are returned.
+    assert response.data == {
+        "tasks": [
+            {"slow": "foo"},
+            {"slow": "bar"},
+            {"slow": None},
+        ],
+        "hello": "world",
+    }
+    assert response.errors == [
+        {
+            "message": "Operation timed out.",
+            "path": ["tasks", 2, "slow"],
+            "extensions": {"error_code": "OPERATION_TIMEOUT", "status_code": 504},
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__statement_timeout(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+    undine_settings.OPERATION_TIMEOUT = 0.1
+
+    start = time.monotonic()
+    response = graphql("query { count }")
+
+    # The query was interrupted when the deadline passed.
+    assert time.monotonic() - start < 5
+    assert response.data == {"count": None}
+    assert response.errors[0]["path"] == ["count"]
+    assert response.errors[0]["extensions"] == {"error_code": "OPERATION_TIMEOUT", "status_code": 504}
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__client_timeout(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    TaskFactory.create(name="foo")
+    TaskFactory.create(name="bar")
+
+    response = graphql("query { tasks { slow } }", extensions={DEADLINE_EXTENSION_KEY: 0.05})
+
+    assert response.data == {"tasks": [{"slow": "foo"}, {"slow": None}]}
+    assert response.errors[0]["path"] == ["tasks", 1, "slow"]
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__client_timeout__capped(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+    undine_settings.MAX_OPERATION_TIMEOUT = 0.05
+
+    TaskFactory.create(name="foo")
+    TaskFactory.create(name="bar")
+
+    response = graphql("query { tasks { slow } }", extensions={DEADLINE_EXTENSION_KEY: 60})
+
+    assert response.data == {"tasks": [{"slow": "foo"}, {"slow": None}]}
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__client_timeout__cannot_extend_server_timeout(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema(timeout=0.05)
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    TaskFactory.create(name="foo")
+    TaskFactory.create(name="bar")
+
+    response = graphql("query { tasks { slow } }", extensions={DEADLINE_EXTENSION_KEY: 60})
+
+    assert response.data == {"tasks": [{"slow": "foo"}, {"slow": None}]}
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__client_timeout__invalid(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    TaskFactory.create(name="foo")
+
+    response = graphql("query { tasks { slow } }", extensions={DEADLINE_EXTENSION_KEY: "soon"})
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"slow": "foo"}]}
+
+
+@pytest.mark.django_db
+def test_operation_deadline_hook__statement_timeout_not_used_after_operation(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+    undine_settings.OPERATION_TIMEOUT = 10
+
+    TaskFactory.create(name="foo")
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+
+    # Queries made outside operations are not limited.
+    assert Task.objects.count() == 1
+
+
+def test_set_statement_timeout__postgresql() -> None:
+    raw_cursor = MagicMock()
+    db_connection = MagicMock(spec=["vendor", "connection"], vendor="postgresql")
+    db_connection.connection.cursor.return_value = raw_cursor
+
+    set_statement_timeout(db_connection, timeout=1.234)
+
+    # The timeout is set using a separate cursor, since the query's cursor can be a server-side cursor.
+    assert raw_cursor.execute.call_args_list == [call("SET statement_timeout = 1300")]
+    raw_cursor.close.assert_called_once()
+
+    # The timeout is not set again if the rounded timeout hasn't changed.
+    set_statement_timeout(db_connection, timeout=1.25)
+    assert raw_cursor.execute.call_count == 1
+
+    set_statement_timeout(db_connection, timeout=None)
+    assert raw_cursor.execute.call_args_list[-1] == call("SET statement_timeout = DEFAULT")
+
+    set_statement_timeout(db_connection, timeout=None)
+    assert raw_cursor.execute.call_count == 2
+
+
+def test_limit_database_query__postgresql__server_side_cursor() -> None:
+    raw_cursor = MagicMock()
+    db_connection = MagicMock(spec=["vendor", "connection"], vendor="postgresql")
+    db_connection.connection.cursor.return_value = raw_cursor
+
+    query_cursor = MagicMock()
+    context = {"connection": db_connection, "cursor": query_cursor}
+    execute = MagicMock(return_value="result")
+
+    token = _current_deadline.set(time.monotonic() + 10)
+    try:
+        result = limit_database_query(execute, "SELECT 1", None, False, context)
+    finally:
+        _current_deadline.reset(token)
+
+    assert result == "result"
+    execute.assert_called_once_with("SELECT 1", None, False, context)
+
+    raw_cursor.execute.assert_called_once()
+    assert query_cursor.mock_calls == []
+
+
+def create_async_deadline_schema() -> Any:
+    class Query(RootType):
+        @Entrypoint(nullable=True, timeout=0.05)
+        async def slow(self, info: GQLInfo) -> str | None:
+            await asyncio.sleep(5)
+            return "slow"
+
+        @Entrypoint
+        async def fast(self, info: GQLInfo) -> str:
+            await asyncio.sleep(0)
+            return "fast"
+
+    return create_schema(query=Query)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_operation_deadline_hook__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_async_deadline_schema()
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    start = time.monotonic()
+    response = await graphql_async("query { slow fast }")
+
+    # The slow resolver was cancelled when the deadline passed.
+    assert time.monotonic() - start < 5
+    assert response.data == {"slow": None, "fast": "fast"}
+    assert response.errors[0]["path"] == ["slow"]
+    assert response.errors[0]["extensions"] == {"error_code": "OPERATION_TIMEOUT", "status_code": 504}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_operation_deadline_hook__async__query_type(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_deadline_schema(timeout=10)
+    undine_settings.LIFECYCLE_HOOKS = [OperationDeadlineHook]
+
+    await sync_to_async(TaskFactory.create)(name="foo")
+
+    response = await graphql_async("query { tasks { name } }")
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo"}]}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import json
 from io import BytesIO
+from typing import Any
 
 import pytest
 from django.core.files import File
@@ -9,6 +11,7 @@
 from example_project.app.models import Task
 from tests.helpers import create_png
 from undine import Entrypoint, Field, Input, MutationType, QueryType, RootType, create_schema
+from undine.http.files import GraphQLFileUploadHandler
 
 
 @pytest.mark.django_db
@@ -188,3 +191,132 @@ class Mutation(RootType):
     )
 
     assert response.error_message(0) == msg
+
+
+def create_file_upload_schema() -> Any:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+        attachment = Field()
+
+    class TaskCreateMutation(MutationType[Task], auto=False):
+        name = Input()
+        attachment = Input()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    class Mutation(RootType):
+        create_task = Entrypoint(TaskCreateMutation)
+
+    return create_schema(query=Query, mutation=Mutation)
+
+
+FILE_UPLOAD_MUTATION = """
+    mutation ($input: TaskCreateMutation!) {
+      createTask(input: $input) {
+        name
+        attachment
+      }
+    }
+"""
+
+
+@pytest.mark.django_db
+def test_end_to_end__mutation__file_upload__file_too_large(graphql, undine_settings) -> None:
+    undine_settings.MUTATION_FULL_CLEAN = False
+    undine_settings.FILE_UPLOAD_MAX_FILE_SIZE = 10
+    undine_settings.SCHEMA = create_file_upload_schema()
+
+    file = File(BytesIO(b"x" * 11), name="file.txt")
+
+    response = graphql(FILE_UPLOAD_MUTATION, variables={"input": {"name": "Test task", "attachment": file}})
+
+    assert response.error_message(0) == "File 'file.txt' is larger than the maximum allowed file size of 10 bytes."
+    assert response.errors[0]["extensions"] == {"status_code": 413, "error_code": "FILE_TOO_LARGE"}
+    assert not Task.objects.exists()
+
+
+@pytest.mark.django_db
+def test_end_to_end__mutation__file_upload__total_too_large(graphql, undine_settings) -> None:
+    undine_settings.MUTATION_FULL_CLEAN = False
+    undine_settings.FILE_UPLOAD_MAX_TOTAL_SIZE = 10
+    undine_settings.SCHEMA = create_file_upload_schema()
+
+    query = """
+        mutation ($one: TaskCreateMutation!, $two: TaskCreateMutation!) {
+          one: createTask(input: $one) { name }
+          two: createTask(input: $two) { name }
+        }
+    """
+
+    variables = {
+        "one": {"name": "one", "attachment": File(BytesIO(b"x" * 6), name="one.txt")},
+        "two": {"name": "two", "attachment": File(BytesIO(b"x" * 6), name="two.txt")},
+    }
+
+    response = graphql(query, variables=variables)
+
+    assert response.errors[0]["extensions"] == {"status_code": 413, "error_code": "FILE_UPLOAD_TOO_LARGE"}
+
+
+@pytest.mark.django_db
+def test_end_to_end__mutation__file_upload__map_rejected_before_reading_files(
+    graphql,
+    undine_settings,
+    monkeypatch,
+) -> None:
+    undine_settings.SCHEMA = create_file_upload_schema()
+
+    chunks: list[bytes] = []
+    original = GraphQLFileUploadHandler.receive_data_chunk
+
+    def receive_data_chunk(self: GraphQLFileUploadHandler, raw_data: bytes, start: int) -> bytes:
+        chunks.append(raw_data)
+        return original(self, raw_data, start)
+
+    monkeypatch.setattr(GraphQLFileUploadHandler, "receive_data_chunk", receive_data_chunk)
+
+    operations = {"query": FILE_UPLOAD_MUTATION, "variables": {"input": {"name": "Test task", "attachment": None}}}
+    data = {
+        "operations": json.dumps(operations),
+        "map": json.dumps({"0": ["variables.input.unknown"]}),
+        "0": File(BytesIO(b"x" * 100), name="file.txt"),
+    }
+
+    response = graphql.post(path=f"/{undine_settings.GRAPHQL_PATH}", data=data)
+
+    assert response.json()["errors"][0]["message"] == (
+        "Value 'variables.input.unknown' in file map does not lead to a null value."
+    )
+    assert chunks == []
+
+
+@pytest.mark.django_db
+def test_end_to_end__mutation__file_upload__file_not_in_map(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_file_upload_schema()
+
+    operations = {"query": FILE_UPLOAD_MUTATION, "variables": {"input": {"name": "Test task", "attachment": None}}}
+    data = {
+        "operations": json.dumps(operations),
+        "map": json.dumps({"0": ["variables.input.attachment"]}),
+        "0": File(BytesIO(b"foo"), name="file.txt"),
+        "1": File(BytesIO(b"bar"), name="other.txt"),
+    }
+
+    response = graphql.post(path=f"/{undine_settings.GRAPHQL_PATH}", data=data)
+
+    assert response.json()["errors"][0]["message"] == "File '1' is not in the file map."
+
+
+@pytest.mark.django_db
+def test_end_to_end__mutation__file_upload__upload_handlers(graphql, undine_settings) -> None:
+    undine_settings.MUTATION_FULL_CLEAN = False
+    undine_settings.FILE_UPLOAD_HANDLERS = ["django.core.files.uploadhandler.TemporaryFileUploadHandler"]
+    undine_settings.SCHEMA = create_file_upload_schema()
+
+    file = File(BytesIO(b"foo"), name="file.txt")
+
+    response = graphql(FILE_UPLOAD_MUTATION, variables={"input": {"name": "Test task", "attachment": file}})
+
+    assert response.has_errors is False, response.errors
+    assert response.data["createTask"]["attachment"].startswith("/media/file")
@@ -1,20 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import hashlib
 import json
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from typing import Any, Generator
 from unittest.mock import patch
 
 import freezegun
 import pytest
+from asgiref.sync import sync_to_async
 from django.core.cache import caches
 from django.core.cache.backends.locmem import LocMemCache
 from graphql import GraphQLNonNull, GraphQLString, Undefined
 
-from example_project.app.models import Project, Task
-from tests.factories import ProjectFactory, TaskFactory, UserFactory
+from example_project.app.models import Person, Project, Task
+from tests.factories import PersonFactory, ProjectFactory, TaskFactory, UserFactory
 from undine import (
     Entrypoint,
     Field,
@@ -30,7 +32,11 @@
 from undine.exceptions import GraphQLPermissionError
 from undine.hooks import LifecycleHookContext
 from undine.typing import CacheKeyData, GQLInfo
-from undine.utils.graphql.caching import RequestCacheCalculator
+from undine.utils.graphql.caching import (
+    RequestCacheCalculator,
+    connect_request_cache_invalidation,
+    disconnect_request_cache_invalidation,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -116,6 +122,31 @@ def mock_set(*args, **kwargs):
         yield results
 
 
+@contextmanager
+def disallow_blocking_cache_access() -> Generator[None, None, None]:
+    original_get = LocMemCache.get
+    original_add = LocMemCache.add
+
+    def check_not_in_event_loop() -> None:
+        with suppress(RuntimeError):
+            asyncio.get_running_loop()
+            pytest.fail("Blocking cache access in the event loop.")
+
+    def mock_get(*args, **kwargs):
+        check_not_in_event_loop()
+        return original_get(*args, **kwargs)
+
+    def mock_add(*args, **kwargs):
+        check_not_in_event_loop()
+        return original_add(*args, **kwargs)
+
+    with (
+        patch.object(LocMemCache, "get", new=mock_get),
+        patch.object(LocMemCache, "add", new=mock_add),
+    ):
+        yield
+
+
 @pytest.mark.django_db
 def test_end_to_end__caching__entrypoint_cacheable(graphql, undine_settings) -> None:
     class TaskType(QueryType[Task], auto=False):
@@ -440,6 +471,33 @@ def should_read_from_cache(context: LifecycleHookContext) -> bool:
     assert results.writes == 1
 
 
+@pytest.mark.django_db
+def test_end_to_end__caching__entrypoint_cacheable__should_read_from_cache__no_single_flight(
+    graphql,
+    undine_settings,
+) -> None:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True, cache_time=10)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+    undine_settings.REQUEST_CACHE_READ_PREDICATE = lambda context: False
+
+    TaskFactory.create(name="Test task")
+
+    # Identical operations are not coalesced if their results are not read from the cache,
+    # since the followers would run the operation anyway after waiting for the leader.
+    with patch("undine.hooks.single_flight") as mock_single_flight:
+        response = graphql("query { tasks { name } }")
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Test task"}]}
+
+    mock_single_flight.assert_not_called()
+
+
 @pytest.mark.django_db
 def test_end_to_end__caching__entrypoint_cacheable__should_write_to_cache(graphql, undine_settings) -> None:
     class TaskType(QueryType[Task], auto=False):
@@ -887,3 +945,236 @@ class Mutation(RootType):
     assert cache.get(key) is None
     assert results.cache_time is Undefined
     assert results.cache_per_user is Undefined
+
+
+@pytest.fixture
+def _cache_invalidation(undine_settings) -> Generator[None, None, None]:
+    undine_settings.REQUEST_CACHE_INVALIDATION = True
+    connect_request_cache_invalidation()
+    try:
+        yield
+    finally:
+        disconnect_request_cache_invalidation()
+
+
+def create_invalidation_schema() -> Any:
+    class ProjectType(QueryType[Project], auto=False):
+        name = Field()
+
+    class PersonType(QueryType[Person], auto=False):
+        name = Field()
+
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+        project = Field(ProjectType)
+        assignees = Field(PersonType, many=True)
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True, cache_time=3600)
+        projects = Entrypoint(ProjectType, many=True, cache_time=3600)
+
+    return create_schema(query=Query)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_cache_invalidation")
+def test_end_to_end__caching__invalidation__save(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_invalidation_schema()
+
+    task = TaskFactory.create(name="Task", project__name="Project")
+
+    query = "query { tasks { name project { name } } }"
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task", "project": {"name": "Project"}}]}
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+    response.assert_query_count(0)
+
+    task.name = "Changed task"
+    task.save()
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Changed task", "project": {"name": "Project"}}]}
+    response.assert_query_count(1)
+
+    # Changes in related models fetched with the same query also invalidate the result.
+    task.project.name = "Changed project"
+    task.project.save()
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Changed task", "project": {"name": "Changed project"}}]}
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_cache_invalidation")
+async def test_end_to_end__caching__invalidation__save__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_invalidation_schema()
+
+    task = await sync_to_async(TaskFactory.create)(name="Task", project__name="Project")
+
+    query = "query { tasks { name project { name } } }"
+
+    with disallow_blocking_cache_access():
+        response = await graphql_async(query)
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task", "project": {"name": "Project"}}]}
+
+    # Updating without signals doesn't invalidate the cached result.
+    await Task.objects.filter(pk=task.pk).aupdate(name="Updated task")
+
+    response = await graphql_async(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task", "project": {"name": "Project"}}]}
+
+    task.name = "Changed task"
+    await task.asave()
+
+    response = await graphql_async(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Changed task", "project": {"name": "Project"}}]}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_cache_invalidation")
+def test_end_to_end__caching__invalidation__delete(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_invalidation_schema()
+
+    task = TaskFactory.create(name="Task")
+
+    query = "query { tasks { name } }"
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task"}]}
+
+    task.delete()
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": []}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_cache_invalidation")
+def test_end_to_end__caching__invalidation__m2m_changed(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_invalidation_schema()
+
+    task = TaskFactory.create(name="Task")
+    person = PersonFactory.create(name="Person")
+
+    query = "query { tasks { name assignees { name } } }"
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task", "assignees": []}]}
+
+    task.assignees.add(person)
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task", "assignees": [{"name": "Person"}]}]}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_cache_invalidation")
+def test_end_to_end__caching__invalidation__unrelated_model(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_invalidation_schema()
+
+    TaskFactory.create(name="Task")
+
+    query = "query { tasks { name } }"
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+
+    ProjectFactory.create(name="Project")
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+    response.assert_query_count(0)
+
+
+@pytest.mark.django_db
+def test_end_to_end__caching__invalidation__disabled(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_invalidation_schema()
+
+    task = TaskFactory.create(name="Task")
+
+    query = "query { tasks { name } }"
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+
+    task.name = "Changed task"
+    task.save()
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "Task"}]}
+
+
+@pytest.mark.django_db
+def test_end_to_end__caching__stale_while_revalidate(graphql, undine_settings) -> None:
+    undine_settings.REQUEST_CACHE_STALE_WHILE_REVALIDATE = 30
+
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True, cache_time=10)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task = TaskFactory.create(name="Task")
+
+    query = "query { tasks { name } }"
+    key = get_cache_key(source=query, variables={})
+    cache = caches[undine_settings.REQUEST_CACHE_ALIAS]
+
+    with freezegun.freeze_time("2023-01-01T10:00:00Z") as freezer:
+        response = graphql(query)
+        assert response.has_errors is False, response.errors
+
+        task.name = "Changed task"
+        task.save()
+
+        freezer.move_to("2023-01-01T10:00:15Z")
+
+        # While another request is refreshing the cache, the stale result is returned.
+        cache.add(f"{key}:revalidate", True)  # noqa: FBT003
+
+        response = graphql(query, count_queries=True)
+        assert response.has_errors is False, response.errors
+        assert response.data == {"tasks": [{"name": "Task"}]}
+        assert response.response.headers["Age"] == "15"
+        response.assert_query_count(0)
+
+        cache.delete(f"{key}:revalidate")
+
+        # Otherwise, the request refreshes the cache.
+        response = graphql(query, count_queries=True)
+        assert response.has_errors is False, response.errors
+        assert response.data == {"tasks": [{"name": "Changed task"}]}
+        assert response.response.headers["Age"] == "0"
+        response.assert_query_count(1)
+
+        assert cache.get(f"{key}:revalidate") is None
+
+        task.name = "Changed again"
+        task.save()
+
+        # Results are not returned after the stale-while-revalidate window.
+        freezer.move_to("2023-01-01T10:00:56Z")
+
+        response = graphql(query)
+        assert response.has_errors is False, response.errors
+        assert response.data == {"tasks": [{"name": "Changed again"}]}
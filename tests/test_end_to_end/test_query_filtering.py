@@ -4,7 +4,7 @@
 
 import pytest
 from asgiref.sync import sync_to_async
-from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
+from django.db.models import Case, F, IntegerField, Q, QuerySet, Value, When
 from graphql import GraphQLNonNull, GraphQLString, version_info
 
 from example_project.app.models import Person, Project, Task
@@ -350,6 +350,113 @@ class Query(RootType):
     }
 
 
+@pytest.mark.django_db
+def test_end_to_end__filtering__exists_subqueries(graphql, undine_settings) -> None:
+    class TaskFilterSet(FilterSet[Task], auto=False, exists_subqueries=True):
+        assignee_name_contains = Filter("assignees__name", lookup="contains", distinct=True)
+
+    class TaskType(QueryType[Task], auto=False, filterset=TaskFilterSet):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    assignee_1 = PersonFactory.create(name="foo")
+    assignee_2 = PersonFactory.create(name="bar")
+    assignee_3 = PersonFactory.create(name="baz")
+    assignee_4 = PersonFactory.create(name="fizz")
+    assignee_5 = PersonFactory.create(name="buzz")
+
+    TaskFactory.create(name="one", assignees=[assignee_1, assignee_4, assignee_5])
+    TaskFactory.create(name="two", assignees=[assignee_2, assignee_3, assignee_5])
+    TaskFactory.create(name="three", assignees=[assignee_1])
+
+    query = """
+        query {
+          tasks(filter: {assigneeNameContains: "z"}) {
+            name
+          }
+        }
+    """
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {"name": "one"},
+            {"name": "two"},
+        ],
+    }
+
+    response.assert_query_count(1)
+    assert "DISTINCT" not in response.queries[0]
+    assert "EXISTS" in response.queries[0]
+
+
+@pytest.mark.django_db
+def test_end_to_end__filtering__exists_subqueries__same_related_object(graphql, undine_settings) -> None:
+    undine_settings.FILTER_EXISTS_SUBQUERIES = True
+
+    class TaskFilterSet(FilterSet[Task], auto=False):
+        assignee_name = Filter("assignees__name", distinct=True)
+        assignee_email = Filter("assignees__email", distinct=True)
+
+    class TaskType(QueryType[Task], auto=False, filterset=TaskFilterSet):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    assignee_1 = PersonFactory.create(name="foo", email="foo@example.com")
+    assignee_2 = PersonFactory.create(name="foo", email="bar@example.com")
+    assignee_3 = PersonFactory.create(name="bar", email="baz@example.com")
+
+    TaskFactory.create(name="one", assignees=[assignee_1])
+    TaskFactory.create(name="two", assignees=[assignee_2, assignee_3])
+
+    # Both conditions must match the same assignee, like when filtering with a join.
+    query = """
+        query {
+          tasks(filter: {assigneeName: "foo", AND: {assigneeEmail: "baz@example.com"}}) {
+            name
+          }
+        }
+    """
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": []}
+
+    query = """
+        query {
+          tasks(filter: {OR: {assigneeName: "bar", assigneeEmail: "foo@example.com"}}) {
+            name
+          }
+        }
+    """
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "one"}, {"name": "two"}]}
+
+    query = """
+        query {
+          tasks(filter: {NOT: {assigneeName: "bar"}}) {
+            name
+          }
+        }
+    """
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "one"}]}
+
+
 @pytest.mark.django_db
 def test_end_to_end__filtering__distinct_missing(graphql, undine_settings) -> None:
     class TaskFilterSet(FilterSet[Task], auto=False):
@@ -587,6 +694,50 @@ class Query(RootType):
     }
 
 
+@pytest.mark.django_db
+def test_end_to_end__filtering__limit(graphql, undine_settings) -> None:
+    class TaskFilterSet(FilterSet[Task], auto=False):
+        project = Filter("project__name")
+        min_points = Filter("points", lookup="gte")
+
+    # Like a search rank limit, keeps only the highest-ranked rows that match all the filters.
+    min_points = TaskFilterSet.__filter_map__["min_points"]
+    min_points.order_by_func = lambda root, info, *, value: [F("points").desc()]
+    min_points.limit_func = lambda root, info, *, value: 2
+
+    class TaskType(QueryType[Task], auto=False, filterset=TaskFilterSet):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    TaskFactory.create(name="foo", points=1, project__name="foo")
+    TaskFactory.create(name="bar", points=2, project__name="foo")
+    TaskFactory.create(name="baz", points=3, project__name="foo")
+    TaskFactory.create(name="qux", points=10, project__name="bar")
+    TaskFactory.create(name="quux", points=11, project__name="bar")
+
+    query = """
+        query {
+          tasks(filter: {minPoints: 0, project: "foo"}) {
+            name
+          }
+        }
+    """
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {"name": "baz"},
+            {"name": "bar"},
+        ],
+    }
+
+
 @pytest.mark.django_db
 def test_end_to_end__filtering__logical_operators(graphql, undine_settings) -> None:
     class TaskFilterSet(FilterSet[Task], auto=False):
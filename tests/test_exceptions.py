@@ -24,7 +24,6 @@
     FederationFeatureVersionError,
     FederationFieldSetTooComplexError,
     FederationKeyRequiresCustomResolverError,
-    FederationMultipleKeysRequireCustomResolverError,
     FederationRequiresNonExternalFieldError,
     FederationRequiresUnknownFieldError,
     FederationServiceFieldConflictError,
@@ -315,8 +314,8 @@ class UndineErrorParams(NamedTuple):
             cls=FederationFieldSetTooComplexError,
             args={"fields": "a { b }", "cls": MyClass},
             message=(
-                "'@key(fields: 'a { b }')' on 'tests.test_exceptions.MyClass' contains a compound key, "
-                "a nested selection or field alias, which the default '__resolve_reference__' does not support. "
+                "'@key(fields: 'a { b }')' on 'tests.test_exceptions.MyClass' contains a nested selection "
+                "or field alias, which the default '__resolve_reference__' does not support. "
                 "Define '__resolve_reference__' as a classmethod on the class to handle this key."
             ),
         ),
@@ -329,14 +328,6 @@ class UndineErrorParams(NamedTuple):
                 "Define '__resolve_reference__' as a classmethod on the class to handle this key."
             ),
         ),
-        FederationMultipleKeysRequireCustomResolverError.__name__: UndineErrorParams(
-            cls=FederationMultipleKeysRequireCustomResolverError,
-            args={"cls": MyClass},
-            message=(
-                "'tests.test_exceptions.MyClass' has zero or multiple resolvable '@key' directives. "
-                "Define '__resolve_reference__' as a classmethod on the class to handle this."
-            ),
-        ),
         FederationRequiresNonExternalFieldError.__name__: UndineErrorParams(
             cls=FederationRequiresNonExternalFieldError,
             args={"fields": "foo", "cls": MyClass, "name": "bar", "token": "foo"},
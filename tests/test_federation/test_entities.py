@@ -14,7 +14,6 @@
     FederationEntitiesFieldConflictError,
     FederationFieldSetTooComplexError,
     FederationKeyRequiresCustomResolverError,
-    FederationMultipleKeysRequireCustomResolverError,
     GraphQLPermissionError,
 )
 from undine.federation import ExternalDirective, FederationField, FederationType, KeyDirective, create_federation_schema
@@ -310,16 +309,234 @@ class Query(RootType):
     assert response.data["_entities"] == [{"name": "aliased"}]
 
 
+@pytest.mark.django_db
+def test_entities__default_resolver_fetches_representations_in_single_query(graphql, undine_settings) -> None:
+    @KeyDirective(fields="pk")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    undine_settings.SCHEMA = create_federation_schema(query=Query)
+
+    task_1 = TaskFactory.create(name="first")
+    task_2 = TaskFactory.create(name="second")
+    task_3 = TaskFactory.create(name="third")
+
+    query = """
+        query ($reps: [_Any!]!) {
+            _entities(representations: $reps) { ... on TaskType { name } }
+        }
+    """
+    variables = {
+        "reps": [
+            {"__typename": "TaskType", "pk": task_3.pk},
+            {"__typename": "TaskType", "pk": task_1.pk},
+            {"__typename": "TaskType", "pk": task_2.pk},
+            {"__typename": "TaskType", "pk": task_1.pk},
+        ],
+    }
+
+    response = graphql(query, variables=variables, count_queries=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.data["_entities"] == [{"name": "third"}, {"name": "first"}, {"name": "second"}, {"name": "first"}]
+
+    assert len(response.queries) == 1
+
+
+@pytest.mark.django_db
+def test_entities__default_resolver_missing_instance_yields_null_and_error(graphql, undine_settings) -> None:
+    @KeyDirective(fields="pk")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    undine_settings.SCHEMA = create_federation_schema(query=Query)
+
+    task = TaskFactory.create(name="found")
+
+    query = """
+        query ($reps: [_Any!]!) {
+            _entities(representations: $reps) { ... on TaskType { name } }
+        }
+    """
+    variables = {
+        "reps": [
+            {"__typename": "TaskType", "pk": task.pk + 1},
+            {"__typename": "TaskType", "pk": task.pk},
+        ],
+    }
+
+    response = graphql(query, variables=variables)
+
+    assert response.data["_entities"] == [None, {"name": "found"}]
+    assert response.error_message(0) == (
+        f"Field 'pk' with value {task.pk + 1} on model 'example_project.app.models.Task' did not match any row."
+    )
+
+
+@pytest.mark.django_db
+def test_entities__default_resolver_compound_key(graphql, undine_settings) -> None:
+    @KeyDirective(fields="name project")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
+        project = Field()
+
+    @KeyDirective(fields="pk")
+    class ProjectType(QueryType[Project]):
+        pk = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    undine_settings.SCHEMA = create_federation_schema(query=Query)
+
+    task_1 = TaskFactory.create(name="same", project__name="first")
+    task_2 = TaskFactory.create(name="same", project__name="second")
+    TaskFactory.create(name="other", project=task_1.project)
+
+    query = """
+        query ($reps: [_Any!]!) {
+            _entities(representations: $reps) { ... on TaskType { pk } }
+        }
+    """
+    variables = {
+        "reps": [
+            {"__typename": "TaskType", "name": "same", "project": task_2.project.pk},
+            {"__typename": "TaskType", "name": "same", "project": task_1.project.pk},
+        ],
+    }
+
+    response = graphql(query, variables=variables, count_queries=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.data["_entities"] == [{"pk": task_2.pk}, {"pk": task_1.pk}]
+
+    assert len(response.queries) == 1
+
+
+@pytest.mark.django_db
+def test_entities__default_resolver_multiple_keys(graphql, undine_settings) -> None:
+    @KeyDirective(fields="pk")
+    @KeyDirective(fields="name")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    undine_settings.SCHEMA = create_federation_schema(query=Query)
+
+    task_1 = TaskFactory.create(name="by-pk")
+    task_2 = TaskFactory.create(name="by-name")
+
+    query = """
+        query ($reps: [_Any!]!) {
+            _entities(representations: $reps) { ... on TaskType { pk name } }
+        }
+    """
+    variables = {
+        "reps": [
+            {"__typename": "TaskType", "name": "by-name"},
+            {"__typename": "TaskType", "pk": task_1.pk},
+        ],
+    }
+
+    response = graphql(query, variables=variables, count_queries=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.data["_entities"] == [
+        {"pk": task_2.pk, "name": "by-name"},
+        {"pk": task_1.pk, "name": "by-pk"},
+    ]
+
+    # One query for each key.
+    assert len(response.queries) == 2
+
+
+@pytest.mark.django_db
+def test_entities__default_resolver_representation_without_key_fields(graphql, undine_settings) -> None:
+    @KeyDirective(fields="pk")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    undine_settings.SCHEMA = create_federation_schema(query=Query)
+
+    query = """
+        query ($reps: [_Any!]!) {
+            _entities(representations: $reps) { ... on TaskType { name } }
+        }
+    """
+    variables = {"reps": [{"__typename": "TaskType", "name": "foo"}]}
+
+    response = graphql(query, variables=variables)
+
+    assert response.data["_entities"] == [None]
+    assert response.error_message(0) == "No resolvable '@key' of 'TaskType' found in given representation."
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_entities__default_resolver_fetches_representations_in_single_query__async(
+    graphql_async,
+    undine_settings,
+) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+
+    task_1 = await sync_to_async(TaskFactory.create)(name="first")
+    task_2 = await sync_to_async(TaskFactory.create)(name="second")
+
+    @KeyDirective(fields="pk")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+
+    undine_settings.SCHEMA = create_federation_schema(query=Query)
+
+    query = """
+        query ($reps: [_Any!]!) {
+            _entities(representations: $reps) { ... on TaskType { name } }
+        }
+    """
+    variables = {
+        "reps": [
+            {"__typename": "TaskType", "pk": task_2.pk},
+            {"__typename": "TaskType", "pk": task_1.pk},
+        ],
+    }
+
+    response = await graphql_async(query, variables=variables)
+
+    assert response.has_errors is False, response.errors
+    assert response.data["_entities"] == [{"name": "second"}, {"name": "first"}]
+
+
 # Class-definition-time validation
 
 
-def test_key_directive__compound_key_without_custom_resolver_raises() -> None:
-    with pytest.raises(FederationFieldSetTooComplexError):
+def test_key_directive__compound_key_without_custom_resolver_passes() -> None:
+    @KeyDirective(fields="pk name")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
 
-        @KeyDirective(fields="id name")
-        class TaskType(QueryType[Task]):
-            pk = Field()
-            name = Field()
+    assert "__resolve_reference__" not in TaskType.__dict__
 
 
 def test_key_directive__complex_fieldset_without_custom_resolver_raises() -> None:
@@ -358,14 +575,14 @@ class TaskType(QueryType[Task]):
             pk = Field()
 
 
-def test_key_directive__multiple_resolvable_keys_without_custom_resolver_raises() -> None:
-    with pytest.raises(FederationMultipleKeysRequireCustomResolverError):
+def test_key_directive__multiple_resolvable_keys_without_custom_resolver_passes() -> None:
+    @KeyDirective(fields="pk")
+    @KeyDirective(fields="name")
+    class TaskType(QueryType[Task]):
+        pk = Field()
+        name = Field()
 
-        @KeyDirective(fields="pk")
-        @KeyDirective(fields="name")
-        class TaskType(QueryType[Task]):
-            pk = Field()
-            name = Field()
+    assert "__resolve_reference__" not in TaskType.__dict__
 
 
 def test_key_directive__multiple_resolvable_keys_with_custom_resolver_passes() -> None:
@@ -10,7 +10,6 @@
 from undine.exceptions import (
     FederationFieldSetTooComplexError,
     FederationKeyRequiresCustomResolverError,
-    FederationMultipleKeysRequireCustomResolverError,
     MissingFederationKeysError,
     MissingFederationReferenceResolverError,
 )
@@ -248,13 +247,13 @@ class BookExt(FederationType, schema_name="Book"):
             isbn = FederationField(str)
 
 
-def test_federation_type__compound_key_raises_field_set_too_complex() -> None:
-    with pytest.raises(FederationFieldSetTooComplexError):
+def test_federation_type__compound_key_passes_validation() -> None:
+    @KeyDirective(fields="isbn upc")
+    class BookExt(FederationType, schema_name="Book"):
+        isbn = FederationField(str)
+        upc = FederationField(str)
 
-        @KeyDirective(fields="isbn upc")
-        class BookExt(FederationType, schema_name="Book"):
-            isbn = FederationField(str)
-            upc = FederationField(str)
+    assert BookExt.__schema_name__ == "Book"
 
 
 def test_federation_type__nested_key_raises_field_set_too_complex() -> None:
@@ -273,14 +272,14 @@ class BookExt(FederationType, schema_name="Book"):
             id = FederationField(str)
 
 
-def test_federation_type__two_resolvable_keys_without_custom_resolver_raises() -> None:
-    with pytest.raises(FederationMultipleKeysRequireCustomResolverError):
+def test_federation_type__two_resolvable_keys_without_custom_resolver_pass_validation() -> None:
+    @KeyDirective(fields="isbn")
+    @KeyDirective(fields="upc")
+    class BookExt(FederationType, schema_name="Book"):
+        isbn = FederationField(str)
+        upc = FederationField(str)
 
-        @KeyDirective(fields="isbn")
-        @KeyDirective(fields="upc")
-        class BookExt(FederationType, schema_name="Book"):
-            isbn = FederationField(str)
-            upc = FederationField(str)
+    assert BookExt.__schema_name__ == "Book"
 
 
 def test_federation_type__two_keys_with_custom_resolver_pass_validation() -> None:
@@ -320,6 +320,145 @@ def resolve_people(obj: Any, info: Any) -> list[dict[str, Any]]:
     """)
 
 
+def _build_people_schema() -> GraphQLSchema:
+    people = [{"name": "Ada", "email": "ada@example.com"}, {"name": "Grace", "email": "grace@example.com"}]
+
+    person_type = GraphQLObjectType(
+        "Person",
+        fields={
+            "name": GraphQLField(
+                GraphQLNonNull(GraphQLString),
+                resolve=lambda obj, info: obj["name"],  # noqa: ARG005
+            ),
+            "email": GraphQLField(GraphQLNonNull(GraphQLString)),
+        },
+    )
+    return GraphQLSchema(
+        query=GraphQLObjectType(
+            "Query",
+            fields={
+                "people": GraphQLField(
+                    GraphQLNonNull(GraphQLList(GraphQLNonNull(person_type))),
+                    resolve=lambda obj, info: people,  # noqa: ARG005
+                ),
+            },
+        ),
+    )
+
+
+def test_federated_tracing__not_sampled(undine_settings) -> None:
+    undine_settings.SCHEMA = _build_schema()
+    undine_settings.LIFECYCLE_HOOKS = [FederatedTracingHook]
+    undine_settings.FEDERATION_TRACING_SAMPLE_RATE = 0
+
+    result = _run_query("{ greeting }", headers={TRACING_HEADER_NAME: TRACING_HEADER_VALUE})
+
+    assert result.data == {"greeting": "hello"}
+    assert not (result.extensions or {}).get(TRACING_EXTENSION_KEY)
+
+
+def test_federated_tracing__aggregate_list_items(undine_settings) -> None:
+    undine_settings.SCHEMA = _build_people_schema()
+    undine_settings.LIFECYCLE_HOOKS = [FederatedTracingHook]
+    undine_settings.FEDERATION_TRACING_AGGREGATE_LIST_ITEMS = True
+
+    result = _run_query("{ people { name } }", headers={TRACING_HEADER_NAME: TRACING_HEADER_VALUE})
+
+    assert result.data == {"people": [{"name": "Ada"}, {"name": "Grace"}]}
+
+    trace = _decode(result.extensions[TRACING_EXTENSION_KEY])
+    people = _child_by_name(trace.root, "people")
+
+    # Both list items are recorded under a single index node.
+    assert len(people.child) == 1
+    assert people.child[0].index == 0
+
+    name = _child_by_name(people.child[0], "name")
+    assert name.start_time > 0
+    assert name.end_time >= name.start_time
+
+
+def test_federated_tracing__max_nodes(undine_settings) -> None:
+    undine_settings.SCHEMA = _build_people_schema()
+    undine_settings.LIFECYCLE_HOOKS = [FederatedTracingHook]
+    undine_settings.FEDERATION_TRACING_MAX_NODES = 4
+
+    result = _run_query("{ people { name } }", headers={TRACING_HEADER_NAME: TRACING_HEADER_VALUE})
+
+    assert result.data == {"people": [{"name": "Ada"}, {"name": "Grace"}]}
+
+    trace = _decode(result.extensions[TRACING_EXTENSION_KEY])
+    people = _child_by_name(trace.root, "people")
+
+    # Only the first list item fits in the trace: root, 'people', index 0, and its 'name'.
+    assert len(people.child) == 1
+    assert people.child[0].index == 0
+    assert _child_by_name(people.child[0], "name").type == "String!"
+
+
+def test_federated_tracing__max_nodes__not_exceeded(undine_settings) -> None:
+    undine_settings.SCHEMA = _build_people_schema()
+    undine_settings.LIFECYCLE_HOOKS = [FederatedTracingHook]
+    undine_settings.FEDERATION_TRACING_MAX_NODES = 3
+
+    result = _run_query("{ people { name } }", headers={TRACING_HEADER_NAME: TRACING_HEADER_VALUE})
+
+    assert result.data == {"people": [{"name": "Ada"}, {"name": "Grace"}]}
+
+    trace = _decode(result.extensions[TRACING_EXTENSION_KEY])
+    people = _child_by_name(trace.root, "people")
+
+    # Recording a list item's field would need two more nodes, which don't fit in the limit.
+    assert len(people.child) == 0
+
+
+def test_federated_tracing__skip_trivial_resolvers(undine_settings) -> None:
+    undine_settings.SCHEMA = _build_people_schema()
+    undine_settings.LIFECYCLE_HOOKS = [FederatedTracingHook]
+    undine_settings.FEDERATION_TRACING_SKIP_TRIVIAL_RESOLVERS = True
+
+    result = _run_query("{ people { name email } }", headers={TRACING_HEADER_NAME: TRACING_HEADER_VALUE})
+
+    assert result.data == {
+        "people": [
+            {"name": "Ada", "email": "ada@example.com"},
+            {"name": "Grace", "email": "grace@example.com"},
+        ],
+    }
+
+    trace = _decode(result.extensions[TRACING_EXTENSION_KEY])
+    people = _child_by_name(trace.root, "people")
+
+    # 'email' uses the default resolver, so it's not traced.
+    for item in people.child:
+        assert [child.response_name for child in item.child] == ["name"]
+
+
+def test_federated_tracing__skip_trivial_resolvers__typename(undine_settings) -> None:
+    undine_settings.SCHEMA = _build_people_schema()
+    undine_settings.LIFECYCLE_HOOKS = [FederatedTracingHook]
+    undine_settings.FEDERATION_TRACING_SKIP_TRIVIAL_RESOLVERS = True
+
+    result = _run_query("{ __typename people { __typename name } }", headers={TRACING_HEADER_NAME: TRACING_HEADER_VALUE})
+
+    assert result.errors is None
+    assert result.data == {
+        "__typename": "Query",
+        "people": [
+            {"__typename": "Person", "name": "Ada"},
+            {"__typename": "Person", "name": "Grace"},
+        ],
+    }
+
+    trace = _decode(result.extensions[TRACING_EXTENSION_KEY])
+    people = _child_by_name(trace.root, "people")
+
+    # Meta fields are not traced.
+    assert [child.response_name for child in trace.root.child] == ["people"]
+    for item in people.child:
+        assert [child.response_name for child in item.child] == ["name"]
+
+
 def test_federated_tracing__errors_when_protobuf_missing(undine_settings, monkeypatch) -> None:
     """Registering the hook and setting the header without `protobuf` installed must surface the error."""
 
@@ -23,6 +23,7 @@
 )
 from undine.filtering import Filter, FilterSet
 from undine.interface import InterfaceField
+from undine.utils.model_utils import ExistsFilter
 
 CREATED_AT_FIELDS = (
     "createdAt",
@@ -429,6 +430,42 @@ class MyFilterSet(FilterSet[Task], auto=False):
     assert results.aliases == {}
 
 
+def test_filterset__exists_subqueries() -> None:
+    class MyFilterSet(FilterSet[Task], auto=False, exists_subqueries=True):
+        name = Filter()
+        assignee_name = Filter("assignees__name", distinct=True)
+        assignee_email = Filter("assignees__email", distinct=True)
+
+    data = {"name": "foo", "assignee_name": "bar", "AND": {"assignee_email": "baz"}}
+
+    results = MyFilterSet.__build__(filter_data=data, info=mock_gql_info())
+
+    # Filters in an `AND` block use the same subquery.
+    assert results.filters == [
+        Q(name__exact="foo"),
+        Q(),
+        ExistsFilter(Q(assignees__name__exact="bar"), Q(assignees__email__exact="baz")),
+    ]
+    assert results.distinct is False
+    assert results.aliases == {}
+
+
+def test_filterset__exists_subqueries__or() -> None:
+    class MyFilterSet(FilterSet[Task], auto=False, exists_subqueries=True):
+        assignee_name = Filter("assignees__name", distinct=True)
+        assignee_email = Filter("assignees__email", distinct=True)
+
+    data = {"OR": {"assignee_name": "bar", "assignee_email": "baz"}, "NOT": {"assignee_name": "foo"}}
+
+    results = MyFilterSet.__build__(filter_data=data, info=mock_gql_info())
+
+    assert results.filters == [
+        ExistsFilter(Q(assignees__name__exact="bar") | Q(assignees__email__exact="baz")),
+        ~ExistsFilter(Q(assignees__name__exact="foo")),
+    ]
+    assert results.distinct is False
+
+
 def test_filterset__many__any() -> None:
     class MyFilterSet(FilterSet[Task], auto=False):
         name = Filter(many=True)
@@ -437,7 +474,7 @@ class MyFilterSet(FilterSet[Task], auto=False):
 
     results = MyFilterSet.__build__(filter_data=data, info=mock_gql_info())
 
-    assert results.filters == [Q(name__exact="foo") | Q(name__exact="bar")]
+    assert results.filters == [Q(name__in=["foo", "bar"])]
     assert results.distinct is False
     assert results.aliases == {}
 
@@ -455,6 +492,40 @@ class MyFilterSet(FilterSet[Task], auto=False):
     assert results.aliases == {}
 
 
+def test_filterset__many__any__in_lookup() -> None:
+    class MyFilterSet(FilterSet[Task], auto=False):
+        name = Filter(many=True, lookup="in")
+
+    data = {"name": [["foo", "bar"], ["baz"]]}
+
+    results = MyFilterSet.__build__(filter_data=data, info=mock_gql_info())
+
+    assert results.filters == [Q(name__in=["foo", "bar", "baz"])]
+
+
+def test_filterset__many__any__null() -> None:
+    class MyFilterSet(FilterSet[Task], auto=False):
+        points = Filter(many=True)
+
+    data = {"points": [1, None]}
+
+    results = MyFilterSet.__build__(filter_data=data, info=mock_gql_info())
+
+    # `in` lookup would ignore the `None` value.
+    assert results.filters == [Q(points__exact=1) | Q(points__exact=None)]
+
+
+def test_filterset__many__any__not_collapsible() -> None:
+    class MyFilterSet(FilterSet[Task], auto=False):
+        name = Filter(many=True, lookup="icontains")
+
+    data = {"name": ["foo", "bar"]}
+
+    results = MyFilterSet.__build__(filter_data=data, info=mock_gql_info())
+
+    assert results.filters == [Q(name__icontains="foo") | Q(name__icontains="bar")]
+
+
 def test_filterset__add_to_query_type() -> None:
     class MyFilterSet(FilterSet[Task], auto=False):
         name = Filter()
@@ -7,6 +7,7 @@
 
 import pytest
 from asgiref.sync import sync_to_async
+from django.core.cache import caches
 from graphql import ExecutionResult, GraphQLError, GraphQLFieldResolver, parse
 
 from example_project.app.models import Task
@@ -19,10 +20,12 @@
     AtomicMutationHook,
     AutomaticPersistedQueriesHook,
     ExecutionLifecycleHookManager,
+    IntrospectionCacheHook,
     LifecycleHook,
     LifecycleHookContext,
     OperationLifecycleHookManager,
     ParseLifecycleHookManager,
+    QueryCostHook,
     RequestCacheHook,
     ValidationLifecycleHookManager,
     VisibilityCacheHook,
@@ -31,6 +34,7 @@
 from undine.persisted_documents.utils import to_document_id
 from undine.typing import DjangoRequestProtocol
 from undine.utils.graphql.caching import RequestCacheCalculator
+from undine.utils.graphql.type_registry import GRAPHQL_REGISTRY
 from undine.utils.visibility import apply_visibility
 
 
@@ -972,3 +976,231 @@ async def test_visibility_cache_hook__async_result_has_errors(undine_settings) -
 
         with contextlib.suppress(StopAsyncIteration):
             await anext(gen)
+
+
+# IntrospectionCacheHook
+
+
+def create_introspection_cache_schema() -> Any:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    return create_schema(query=Query)
+
+
+@pytest.mark.django_db
+def test_introspection_cache_hook(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_introspection_cache_schema()
+    undine_settings.LIFECYCLE_HOOKS = [IntrospectionCacheHook]
+
+    query = 'query { __type(name: "TaskType") { name fields { name } } }'
+
+    context = make_hook_context(source=query)
+    key = IntrospectionCacheHook(context=context).get_cache_key()
+    assert key is not None
+
+    cache = IntrospectionCacheHook(context=context).cache
+    cache.delete(key)
+
+    response = graphql(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__type": {"name": "TaskType", "fields": [{"name": "name"}]}}
+
+    assert cache.get(key) == b'{"data":{"__type":{"name":"TaskType","fields":[{"name":"name"}]}}}'
+
+    # Cached response is returned as is.
+    cache.set(key, b'{"data":{"__type":null}}')
+
+    # Documents are normalized before hashing.
+    response = graphql('query {\n  __type(name: "TaskType") {\n    name\n    fields { name }\n  }\n}')
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__type": None}
+
+
+@pytest.mark.django_db
+def test_introspection_cache_hook__schema_changed(undine_settings) -> None:
+    undine_settings.SCHEMA = create_introspection_cache_schema()
+
+    context = make_hook_context(source="query { __schema { types { name } } }")
+    key = IntrospectionCacheHook(context=context).get_cache_key()
+
+    GRAPHQL_REGISTRY.clear()
+
+    class Query(RootType):
+        @Entrypoint
+        def hello(self) -> str:
+            return "Hello"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    assert IntrospectionCacheHook(context=context).get_cache_key() != key
+
+
+@pytest.mark.django_db
+def test_introspection_cache_hook__not_introspection(undine_settings) -> None:
+    undine_settings.SCHEMA = create_introspection_cache_schema()
+
+    context = make_hook_context(source="query { __typename tasks { name } }")
+    assert IntrospectionCacheHook(context=context).get_cache_key() is None
+
+
+@pytest.mark.django_db
+def test_introspection_cache_hook__disabled(undine_settings) -> None:
+    undine_settings.SCHEMA = create_introspection_cache_schema()
+    undine_settings.INTROSPECTION_CACHE_TIMEOUT = 0
+
+    context = make_hook_context(source="query { __schema { types { name } } }")
+    assert IntrospectionCacheHook(context=context).get_cache_key() is None
+
+
+@pytest.mark.django_db
+def test_introspection_cache_hook__visibility(undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+        @classmethod
+        def __is_visible__(cls, request: DjangoRequestProtocol) -> bool:
+            return True
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+    apply_visibility(undine_settings.SCHEMA)
+
+    # Visibility is checked separately for each request, so results cannot be shared.
+    context = make_hook_context(source="query { __schema { types { name } } }")
+    assert IntrospectionCacheHook(context=context).get_cache_key() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_introspection_cache_hook__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_introspection_cache_schema()
+    undine_settings.LIFECYCLE_HOOKS = [IntrospectionCacheHook]
+
+    query = 'query { __type(name: "TaskType") { name } }'
+
+    context = make_hook_context(source=query)
+    hook = IntrospectionCacheHook(context=context)
+    key = hook.get_cache_key()
+    await hook.cache.adelete(key)
+
+    response = await graphql_async(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__type": {"name": "TaskType"}}
+
+    await hook.cache.aset(key, b'{"data":{"__type":null}}')
+
+    response = await graphql_async(query)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__type": None}
+
+
+# QueryCostHook
+
+
+def create_query_cost_schema() -> Any:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True, limit=10)
+
+    return create_schema(query=Query)
+
+
+@pytest.mark.django_db
+def test_query_cost_hook(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_query_cost_schema()
+    undine_settings.LIFECYCLE_HOOKS = [QueryCostHook]
+
+    TaskFactory.create(name="foo")
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo"}]}
+    assert response.json["extensions"] == {"cost": {"requested": 1}}
+
+
+@pytest.mark.django_db
+def test_query_cost_hook__extensions_disabled(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_query_cost_schema()
+    undine_settings.LIFECYCLE_HOOKS = [QueryCostHook]
+    undine_settings.QUERY_COST_RESPONSE_EXTENSIONS = False
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert "extensions" not in response.json
+
+
+@pytest.mark.django_db
+def test_query_cost_hook__max_cost(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_query_cost_schema()
+    undine_settings.LIFECYCLE_HOOKS = [QueryCostHook]
+    undine_settings.MAX_QUERY_COST = 1
+
+    response = graphql("query { first: tasks { name } second: tasks { name } }", count_queries=True)
+
+    assert response.errors == [
+        {
+            "message": "Query cost of 2 exceeds the maximum allowed cost of 1.",
+            "extensions": {"error_code": "QUERY_COST_TOO_HIGH", "status_code": 400},
+        }
+    ]
+    assert response.json["extensions"] == {"cost": {"requested": 2}}
+
+    response.assert_query_count(0)
+
+
+@pytest.mark.django_db
+def test_query_cost_hook__budget(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_query_cost_schema()
+    undine_settings.LIFECYCLE_HOOKS = [QueryCostHook]
+    undine_settings.QUERY_COST_BUDGET = 2
+    undine_settings.QUERY_COST_BUDGET_REFILL_RATE = 0
+
+    cache_key = f"{undine_settings.QUERY_COST_BUDGET_CACHE_PREFIX}:ip:127.0.0.1"
+    caches[undine_settings.QUERY_COST_BUDGET_CACHE_ALIAS].delete(cache_key)
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert response.json["extensions"] == {"cost": {"requested": 1, "remainingBudget": 1}}
+
+    response = graphql("query { first: tasks { name } second: tasks { name } }")
+    assert response.errors == [
+        {
+            "message": "Query cost of 2 exceeds the remaining cost budget of 1.",
+            "extensions": {"error_code": "QUERY_COST_BUDGET_EXCEEDED", "status_code": 429},
+        }
+    ]
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert response.json["extensions"] == {"cost": {"requested": 1, "remainingBudget": 0}}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_query_cost_hook__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_query_cost_schema()
+    undine_settings.LIFECYCLE_HOOKS = [QueryCostHook]
+    undine_settings.QUERY_COST_BUDGET = 1
+    undine_settings.QUERY_COST_BUDGET_REFILL_RATE = 0
+
+    cache_key = f"{undine_settings.QUERY_COST_BUDGET_CACHE_PREFIX}:ip:127.0.0.1"
+    await caches[undine_settings.QUERY_COST_BUDGET_CACHE_ALIAS].adelete(cache_key)
+
+    response = await graphql_async("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert response.json["extensions"] == {"cost": {"requested": 1, "remainingBudget": 0}}
+
+    response = await graphql_async("query { tasks { name } }")
+    assert response.errors[0]["extensions"] == {"error_code": "QUERY_COST_BUDGET_EXCEEDED", "status_code": 429}
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from io import BytesIO
 from typing import Any
 
 import pytest
 from django.core.files.uploadedfile import UploadedFile
 
 from tests.helpers import create_png
-from undine.exceptions import GraphQLFileNotFoundError, GraphQLFilePlacingError
-from undine.http.files import extract_files, place_files
+from undine.exceptions import (
+    GraphQLFileNotFoundError,
+    GraphQLFilePlacingError,
+    GraphQLFileTooLargeError,
+    GraphQLFileUploadTooLargeError,
+)
+from undine.http.files import check_files_map, check_uploaded_files, extract_files, place_files
 
 pytestmark = [
     pytest.mark.django_db,
@@ -138,3 +144,59 @@ def test_place_files__value_at_end_is_not_none() -> None:
 
     with pytest.raises(GraphQLFilePlacingError):
         place_files(operations, files_map, files)
+
+
+def test_check_files_map() -> None:
+    operations: dict[str, Any] = {
+        "image": None,
+        "foo": [None, None],
+    }
+    files_map: dict[str, list[str]] = {
+        "0": ["image", "foo.0"],
+        "1": ["foo.1"],
+    }
+
+    check_files_map(operations, files_map)
+
+    # Operations are not modified.
+    assert operations == {"image": None, "foo": [None, None]}
+
+
+def test_check_files_map__incorrect_path() -> None:
+    operations: dict[str, Any] = {
+        "image": None,
+    }
+    files_map: dict[str, list[str]] = {
+        "0": ["image"],
+        "1": ["foo"],
+    }
+
+    with pytest.raises(GraphQLFilePlacingError):
+        check_files_map(operations, files_map)
+
+
+def test_check_uploaded_files(undine_settings) -> None:
+    undine_settings.FILE_UPLOAD_MAX_FILE_SIZE = 100
+    undine_settings.FILE_UPLOAD_MAX_TOTAL_SIZE = 200
+
+    files = [UploadedFile(file=BytesIO(b"x" * 100), name="file.txt", size=100) for _ in range(2)]
+
+    check_uploaded_files(files)
+
+
+def test_check_uploaded_files__file_too_large(undine_settings) -> None:
+    undine_settings.FILE_UPLOAD_MAX_FILE_SIZE = 100
+
+    files = [UploadedFile(file=BytesIO(b"x" * 101), name="file.txt", size=101)]
+
+    with pytest.raises(GraphQLFileTooLargeError):
+        check_uploaded_files(files)
+
+
+def test_check_uploaded_files__total_too_large(undine_settings) -> None:
+    undine_settings.FILE_UPLOAD_MAX_TOTAL_SIZE = 150
+
+    files = [UploadedFile(file=BytesIO(b"x" * 100), name="file.txt", size=100) for _ in range(2)]
+
+    with pytest.raises(GraphQLFileUploadTooLargeError):
+        check_uploaded_files(files)
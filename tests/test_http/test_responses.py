@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import pickle
+
+from graphql import ExecutionResult
+
 from undine.http.responses import (
     HttpEventSourcingNotAllowedResponse,
     HttpMethodNotAllowedResponse,
     HttpUnsupportedContentTypeResponse,
+    SerializedExecutionResult,
+    graphql_result_response,
 )
 
 
@@ -33,3 +39,35 @@ def test_http_event_sourcing_not_allowed_response() -> None:
     assert response["Connection"] == "Upgrade"
     assert response["Content-Type"] == "text/plain; charset=utf-8"
     assert response.content.decode() == "Cannot use Server-Sent Events with HTTP protocol lower than 2.0."
+
+
+def test_serialized_execution_result() -> None:
+    content = b'{"data":{"hello":"world"}}'
+    result = SerializedExecutionResult(content)
+
+    assert result.data == {"hello": "world"}
+    assert result.errors is None
+    assert result.extensions is None
+    assert result.content == content
+
+    response = graphql_result_response(result)
+    assert response.content == content
+
+
+def test_serialized_execution_result__modified() -> None:
+    result = SerializedExecutionResult(b'{"data":{"hello":"world"}}')
+    result.extensions = {"foo": "bar"}
+
+    assert result.content is None
+    assert result.formatted == {"data": {"hello": "world"}, "extensions": {"foo": "bar"}}
+
+    response = graphql_result_response(result)
+    assert response.content == b'{"data":{"hello":"world"},"extensions":{"foo":"bar"}}'
+
+
+def test_serialized_execution_result__pickle() -> None:
+    result = SerializedExecutionResult(b'{"data":{"hello":"world"}}')
+    assert pickle.loads(pickle.dumps(result)).content == result.content  # noqa: S301
+
+    result.data = {"hello": "there"}
+    assert pickle.loads(pickle.dumps(result)) == ExecutionResult(data={"hello": "there"})  # noqa: S301
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from tests.factories import PersistedDocumentFactory
+from undine.persisted_documents.management.commands import compile_persisted_documents
+from undine.settings import example_schema
+
+COMMAND_NAME = compile_persisted_documents.__name__.split(".")[-1]
+
+
+@pytest.mark.django_db
+def test_compile_persisted_documents(undine_settings) -> None:
+    undine_settings.SCHEMA = example_schema
+
+    PersistedDocumentFactory.create(document="query { testing }")
+
+    out = io.StringIO()
+
+    call_command(COMMAND_NAME, stdout=out)
+
+    assert out.getvalue().strip() == "All persisted documents are valid."
+
+
+@pytest.mark.django_db
+def test_compile_persisted_documents__invalid(undine_settings) -> None:
+    undine_settings.SCHEMA = example_schema
+
+    PersistedDocumentFactory.create(document_id="1", document="query { foo }")
+
+    err = io.StringIO()
+
+    with pytest.raises(CommandError, match=r"1 persisted document\(s\) are invalid\."):
+        call_command(COMMAND_NAME, stderr=err)
+
+    assert err.getvalue().splitlines() == [
+        "Persisted document '1' is invalid:",
+        "  Cannot query field 'foo' on type 'Query'.",
+    ]
@@ -21,6 +21,7 @@ class TaskFilterSet(
     auto=True,
     exclude=["foo", "bar"],
     schema_name="test",
+    exists_subqueries=True,
     directives=[MockDirective()],
     extensions={"foo": "bar"},
 ): ...
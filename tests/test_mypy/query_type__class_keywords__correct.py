@@ -33,6 +33,7 @@ class TaskType(
     exclude=["foo", "bar"],
     cache_time=1,
     cache_per_user=True,
+    entity_cache_time=60,
     interfaces=[MockInterface],
     register=True,
     schema_name="TaskQuery",
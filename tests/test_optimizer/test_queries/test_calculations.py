@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.db.models import Count, F, OuterRef, Value, Window
+
+from example_project.app.models import Project, Task
+from tests.factories import ProjectFactory, TaskFactory, UserFactory
+from undine import Calculation, CalculationArgument, Entrypoint, Field, GQLInfo, QueryType, RootType, create_schema
+from undine.exceptions import CachedCalculationExpressionError
+from undine.typing import DjangoExpression
+from undine.utils.model_utils import SubqueryCount
+
+
+def create_calculation_schema(**calculation_params: Any) -> Any:
+    class ExampleCalculation(Calculation[int], **calculation_params):
+        value = CalculationArgument(int, default_value=1)
+
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return F("pk") + Value(self.value * 1000)
+
+    class TaskType(QueryType[Task], auto=False):
+        pk = Field()
+        calc = Field(ExampleCalculation)
+
+    class ProjectType(QueryType[Project], auto=False):
+        pk = Field()
+        tasks = Field(TaskType, many=True)
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+        projects = Entrypoint(ProjectType, many=True)
+
+    return create_schema(query=Query)
+
+
+@pytest.fixture
+def _clear_cache() -> None:
+    caches["default"].clear()
+
+
+@pytest.mark.django_db
+def test_optimizer__calculations__not_deduplicated(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_calculation_schema()
+
+    task = TaskFactory.create()
+
+    response = graphql("query { tasks { first: calc(value: 2) second: calc(value: 2) } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {"tasks": [{"first": task.pk + 2000, "second": task.pk + 2000}]}
+
+    response.assert_query_count(1)
+    assert response.queries[0].count("2000") == 2
+
+
+@pytest.mark.django_db
+def test_optimizer__calculations__deduplicate(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_calculation_schema(deduplicate=True)
+
+    task = TaskFactory.create()
+
+    query = "query { tasks { first: calc(value: 2) second: calc(value: 2) third: calc(value: 3) calc } }"
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {
+                "first": task.pk + 2000,
+                "second": task.pk + 2000,
+                "third": task.pk + 3000,
+                "calc": task.pk + 1000,
+            },
+        ],
+    }
+
+    response.assert_query_count(1)
+    assert response.queries[0].count("2000") == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_calculation_schema(cache_time=60)
+
+    task_1 = TaskFactory.create()
+    task_2 = TaskFactory.create()
+
+    query = "query { tasks { pk first: calc(value: 2) second: calc(value: 2) } }"
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {"pk": task_1.pk, "first": task_1.pk + 2000, "second": task_1.pk + 2000},
+            {"pk": task_2.pk, "first": task_2.pk + 2000, "second": task_2.pk + 2000},
+        ],
+    }
+
+    # Main query and one query for all missing values.
+    response.assert_query_count(2)
+    assert "2000" not in response.queries[0]
+    assert response.queries[1].count("2000") == 1
+
+    task_3 = TaskFactory.create()
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {"pk": task_1.pk, "first": task_1.pk + 2000, "second": task_1.pk + 2000},
+            {"pk": task_2.pk, "first": task_2.pk + 2000, "second": task_2.pk + 2000},
+            {"pk": task_3.pk, "first": task_3.pk + 2000, "second": task_3.pk + 2000},
+        ],
+    }
+
+    # Only the value for the new task is calculated.
+    response.assert_query_count(2)
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    response.assert_query_count(1)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache__different_arguments(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_calculation_schema(cache_time=60)
+
+    task = TaskFactory.create()
+
+    response = graphql("query { tasks { calc(value: 2) } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"calc": task.pk + 2000}]}
+
+    response = graphql("query { tasks { calc(value: 3) } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"calc": task.pk + 3000}]}
+
+    response.assert_query_count(2)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache__prefetch(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_calculation_schema(cache_time=60)
+
+    project = ProjectFactory.create()
+    task = TaskFactory.create(project=project)
+
+    response = graphql("query { tasks { calc } }")
+    assert response.has_errors is False, response.errors
+
+    # Values cached when querying the list are used for the nested list.
+    response = graphql("query { projects { tasks { calc } } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"projects": [{"tasks": [{"calc": task.pk + 1000}]}]}
+
+    response.assert_query_count(2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures("_clear_cache")
+async def test_optimizer__calculations__cache__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_calculation_schema(cache_time=60)
+
+    task = await sync_to_async(TaskFactory.create)()
+
+    response = await graphql_async("query { tasks { first: calc second: calc } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"first": task.pk + 1000, "second": task.pk + 1000}]}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache__window(graphql, undine_settings) -> None:
+    class ProjectTaskCount(Calculation[int], cache_time=60):
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return Window(Count("pk"), partition_by=F("project"))
+
+    class TaskType(QueryType[Task], auto=False):
+        count = Field(ProjectTaskCount)
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    TaskFactory.create()
+
+    response = graphql("query { tasks { count } }")
+
+    assert response.errors == [
+        {
+            "message": str(CachedCalculationExpressionError(name="ProjectTaskCount")),
+            "path": ["tasks"],
+            "extensions": {"status_code": 500},
+        },
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache__subquery(graphql, undine_settings) -> None:
+    class ProjectTaskCount(Calculation[int], cache_time=60):
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return SubqueryCount(Task.objects.filter(project=OuterRef("project")))
+
+    class TaskType(QueryType[Task], auto=False):
+        pk = Field()
+        count = Field(ProjectTaskCount)
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    project = ProjectFactory.create()
+    tasks = TaskFactory.create_batch(3, project=project)
+
+    # Cache the value for one of the tasks first.
+    response = graphql("query ($pk: Int!) { task(pk: $pk) { count } }", variables={"pk": tasks[0].pk})
+    assert response.has_errors is False, response.errors
+    assert response.data == {"task": {"count": 3}}
+
+    # Values calculated for the missing objects don't depend on which objects are missing.
+    response = graphql("query { tasks { pk count } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk, "count": 3} for task in tasks]}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache__aggregate(graphql, undine_settings) -> None:
+    class TaskCount(Calculation[int], cache_time=60):
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return Count("tasks")
+
+    class ProjectType(QueryType[Project], auto=False):
+        pk = Field()
+        count = Field(TaskCount)
+
+    class Query(RootType):
+        project = Entrypoint(ProjectType)
+        projects = Entrypoint(ProjectType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    project_1 = ProjectFactory.create()
+    project_2 = ProjectFactory.create()
+    TaskFactory.create_batch(3, project=project_1)
+    TaskFactory.create_batch(2, project=project_2)
+
+    # Cache the value for one of the projects first.
+    response = graphql("query ($pk: Int!) { project(pk: $pk) { count } }", variables={"pk": project_1.pk})
+    assert response.has_errors is False, response.errors
+    assert response.data == {"project": {"count": 3}}
+
+    # Aggregates are calculated for each object, so they don't depend on which objects are missing.
+    response = graphql("query { projects { pk count } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {
+        "projects": [
+            {"pk": project_1.pk, "count": 3},
+            {"pk": project_2.pk, "count": 2},
+        ],
+    }
+
+    response.assert_query_count(2)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__calculations__cache__cache_key(graphql, undine_settings) -> None:
+    class UserCalculation(Calculation[int], cache_time=60):
+        def __call__(self, info: GQLInfo) -> DjangoExpression:
+            return F("pk") + Value(info.context.user.pk * 1000)
+
+        def __cache_key__(self, info: GQLInfo) -> str:
+            return str(info.context.user.pk)
+
+    class TaskType(QueryType[Task], auto=False):
+        calc = Field(UserCalculation)
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task = TaskFactory.create()
+    user_1 = UserFactory.create(username="foo")
+    user_2 = UserFactory.create(username="bar")
+
+    graphql.force_login(user=user_1)
+
+    response = graphql("query { tasks { calc } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"calc": task.pk + user_1.pk * 1000}]}
+
+    # Values cached for one user are not used for other users.
+    graphql.force_login(user=user_2)
+
+    response = graphql("query { tasks { calc } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"calc": task.pk + user_2.pk * 1000}]}
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+
+from example_project.app.models import Project, Task
+from tests.factories import ProjectFactory, TaskFactory
+from undine import Entrypoint, Field, Input, MutationType, QueryType, RootType, create_schema
+
+
+def create_entity_cache_schema() -> Any:
+    class TaskType(QueryType[Task], auto=False, entity_cache_time=60):
+        pk = Field()
+        name = Field()
+        points = Field()
+
+    class ProjectType(QueryType[Project], auto=False):
+        pk = Field()
+        tasks = Field(TaskType, many=True)
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+        projects = Entrypoint(ProjectType, many=True)
+
+    return create_schema(query=Query)
+
+
+@pytest.fixture
+def _clear_cache() -> None:
+    caches["default"].clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__entity_cache(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_entity_cache_schema()
+
+    task_1 = TaskFactory.create(name="foo", points=1)
+    task_2 = TaskFactory.create(name="bar", points=2)
+
+    query = "query { tasks { pk name points } }"
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {"pk": task_1.pk, "name": "foo", "points": 1},
+            {"pk": task_2.pk, "name": "bar", "points": 2},
+        ],
+    }
+
+    # Main query only fetches primary keys, and one query fetches all missing values.
+    response.assert_query_count(2)
+    assert '"app_task"."name"' not in response.queries[0]
+    assert '"app_task"."name"' in response.queries[1]
+
+    task_3 = TaskFactory.create(name="baz", points=3)
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    assert response.data == {
+        "tasks": [
+            {"pk": task_1.pk, "name": "foo", "points": 1},
+            {"pk": task_2.pk, "name": "bar", "points": 2},
+            {"pk": task_3.pk, "name": "baz", "points": 3},
+        ],
+    }
+
+    # Only the values for the new task are fetched.
+    response.assert_query_count(2)
+    assert str(task_3.pk) in response.queries[1]
+
+    response = graphql(query, count_queries=True)
+    assert response.has_errors is False, response.errors
+
+    response.assert_query_count(1)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__entity_cache__different_selections(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_entity_cache_schema()
+
+    task = TaskFactory.create(name="foo", points=1)
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo"}]}
+
+    # Values are cached separately for each selection of fields.
+    response = graphql("query { tasks { name points } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo", "points": 1}]}
+
+    response.assert_query_count(2)
+
+    response = graphql("query { tasks { pk } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk}]}
+
+    response.assert_query_count(1)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__entity_cache__prefetch(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_entity_cache_schema()
+
+    project = ProjectFactory.create()
+    TaskFactory.create(name="foo", points=1, project=project)
+
+    response = graphql("query { tasks { name points } }")
+    assert response.has_errors is False, response.errors
+
+    # Values cached when querying the list are used for the nested list.
+    response = graphql("query { projects { tasks { name points } } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"projects": [{"tasks": [{"name": "foo", "points": 1}]}]}
+
+    response.assert_query_count(2)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__entity_cache__invalidation(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_entity_cache_schema()
+
+    task = TaskFactory.create(name="foo", points=1)
+
+    response = graphql("query { tasks { name } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo"}]}
+
+    task.name = "bar"
+    task.save()
+
+    response = graphql("query { tasks { name } }", count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "bar"}]}
+
+    response.assert_query_count(2)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_clear_cache")
+def test_optimizer__entity_cache__invalidation__mutation(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, entity_cache_time=60):
+        pk = Field()
+        name = Field()
+
+    class TaskUpdateMutation(MutationType[Task], auto=False):
+        pk = Input()
+        name = Input()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    class Mutation(RootType):
+        update_task = Entrypoint(TaskUpdateMutation)
+
+    undine_settings.SCHEMA = create_schema(query=Query, mutation=Mutation)
+
+    task = TaskFactory.create(name="Old")
+
+    response = graphql("query { tasks { pk name } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk, "name": "Old"}]}
+
+    query = """
+        mutation($input: TaskUpdateMutation!) {
+            updateTask(input: $input) {
+                pk
+                name
+            }
+        }
+    """
+
+    response = graphql(query, variables={"input": {"pk": task.pk, "name": "New"}})
+    assert response.has_errors is False, response.errors
+    assert response.data == {"updateTask": {"pk": task.pk, "name": "New"}}
+
+    response = graphql("query { tasks { pk name } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk, "name": "New"}]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures("_clear_cache")
+async def test_optimizer__entity_cache__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_entity_cache_schema()
+
+    task = await sync_to_async(TaskFactory.create)(name="foo", points=1)
+
+    response = await graphql_async("query { tasks { pk name points } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk, "name": "foo", "points": 1}]}
+
+    response = await graphql_async("query { tasks { pk name points } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk, "name": "foo", "points": 1}]}
+
+    task.name = "bar"
+    await task.asave()
+
+    response = await graphql_async("query { tasks { pk name points } }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"pk": task.pk, "name": "bar", "points": 1}]}
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.db.backends.signals import connection_created
+from graphql import OperationDefinitionNode, OperationType, SelectionSetNode
+from graphql.pyutils import Path
+
+from example_project.app.models import Task
+from tests.factories import TaskFactory
+from tests.helpers import mock_gql_info
+from undine import Entrypoint, Field, QueryType, RootType, create_schema
+from undine.optimizer.parallel import is_parallel_entrypoint
+from undine.relay import Connection
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_optimizer__parallel_entrypoints(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.PARALLEL_ENTRYPOINT_WORKERS = 2
+
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+    class Query(RootType):
+        task = Entrypoint(TaskType)
+        tasks = Entrypoint(TaskType, many=True)
+        paged_tasks = Entrypoint(Connection(TaskType))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task = await sync_to_async(TaskFactory.create)(name="foo")
+    await sync_to_async(TaskFactory.create)(name="bar")
+
+    query = f"""
+        query {{
+            task(pk: {task.pk}) {{ name }}
+            tasks {{ name }}
+            pagedTasks {{ edges {{ node {{ name }} }} }}
+        }}
+    """
+
+    thread_names: set[str] = set()
+
+    def on_connection_created(**kwargs) -> None:
+        thread_names.add(threading.current_thread().name)
+
+    connection_created.connect(on_connection_created)
+    try:
+        response = await graphql_async(query)
+    finally:
+        connection_created.disconnect(on_connection_created)
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {
+        "task": {"name": "foo"},
+        "tasks": [{"name": "foo"}, {"name": "bar"}],
+        "pagedTasks": {"edges": [{"node": {"name": "foo"}}, {"node": {"name": "bar"}}]},
+    }
+
+    # Entrypoints were fetched using connections opened in the entrypoint thread pool.
+    assert thread_names
+    assert all(name.startswith("undine-entrypoint") for name in thread_names)
+
+
+def test_optimizer__is_parallel_entrypoint(undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.PARALLEL_ENTRYPOINT_WORKERS = 2
+
+    info = mock_gql_info(path=Path(prev=None, key="tasks", typename="Query"))
+    assert is_parallel_entrypoint(info) is True
+
+
+def test_optimizer__is_parallel_entrypoint__disabled(undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.PARALLEL_ENTRYPOINT_WORKERS = 0
+
+    info = mock_gql_info(path=Path(prev=None, key="tasks", typename="Query"))
+    assert is_parallel_entrypoint(info) is False
+
+
+def test_optimizer__is_parallel_entrypoint__not_async(undine_settings) -> None:
+    undine_settings.ASYNC = False
+    undine_settings.PARALLEL_ENTRYPOINT_WORKERS = 2
+
+    info = mock_gql_info(path=Path(prev=None, key="tasks", typename="Query"))
+    assert is_parallel_entrypoint(info) is False
+
+
+def test_optimizer__is_parallel_entrypoint__nested_field(undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.PARALLEL_ENTRYPOINT_WORKERS = 2
+
+    path = Path(prev=None, key="tasks", typename="Query").add_key(0).add_key("name", "TaskType")
+    info = mock_gql_info(path=path)
+    assert is_parallel_entrypoint(info) is False
+
+
+def test_optimizer__is_parallel_entrypoint__mutation(undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.PARALLEL_ENTRYPOINT_WORKERS = 2
+
+    operation = OperationDefinitionNode(operation=OperationType.MUTATION, selection_set=SelectionSetNode())
+    info = mock_gql_info(path=Path(prev=None, key="createTask", typename="Mutation"), operation=operation)
+    assert is_parallel_entrypoint(info) is False
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import pytest
+from asgiref.sync import sync_to_async
 
 from example_project.app.models import Comment, Person, Project, Report, Task, TaskStep, Team
 from tests.factories import CommentFactory, PersonFactory, ReportFactory, TaskFactory, TaskStepFactory, TeamFactory
 from tests.helpers import cache_content_types
-from undine import Entrypoint, Field, OrderSet, QueryType, RootType, create_schema
+from undine import Entrypoint, Field, GQLInfo, OrderSet, QueryType, RootType, create_schema
+from undine.exceptions import GraphQLPermissionError
 from undine.pagination import OffsetPagination
-from undine.relay import Connection, Node, offset_to_cursor, to_global_id
+from undine.relay import Connection, Node, Nodes, offset_to_cursor, to_global_id
+from undine.typing import DjangoRequestProtocol
 
 # Relay Node interface
 
@@ -143,6 +146,227 @@ class Query(RootType):
     response.assert_query_count(2)
 
 
+@pytest.mark.django_db
+def test_optimizer__relay__nodes(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class ProjectType(QueryType[Project], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+        tasks = Entrypoint(Connection(TaskType))
+        projects = Entrypoint(Connection(ProjectType))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task_1 = TaskFactory.create(name="Task 1", project__name="Project")
+    task_2 = TaskFactory.create(name="Task 2", project=task_1.project)
+
+    ids = [
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_2.pk),
+        to_global_id(typename=ProjectType.__schema_name__, object_id=task_1.project.pk),
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_1.pk),
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_2.pk + 100),
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_2.pk),
+    ]
+
+    query = """
+        query NodesQuery($ids: [ID!]!) {
+          nodes(ids: $ids) {
+            __typename
+            ... on TaskType { name }
+            ... on ProjectType { name }
+          }
+        }
+    """
+
+    response = graphql(query, variables={"ids": ids}, count_queries=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {
+        "nodes": [
+            {"__typename": "TaskType", "name": "Task 2"},
+            {"__typename": "ProjectType", "name": "Project"},
+            {"__typename": "TaskType", "name": "Task 1"},
+            None,
+            {"__typename": "TaskType", "name": "Task 2"},
+        ],
+    }
+
+    # One query for each object type.
+    response.assert_query_count(2)
+
+
+@pytest.mark.django_db
+def test_optimizer__relay__nodes__errors(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+        @classmethod
+        def __permissions__(cls, instance: Task, info: GQLInfo) -> None:
+            if instance.name == "Secret":
+                raise GraphQLPermissionError
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+        tasks = Entrypoint(Connection(TaskType))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task_1 = TaskFactory.create(name="Task")
+    task_2 = TaskFactory.create(name="Secret")
+
+    ids = [
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_1.pk),
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_2.pk),
+        "foo",
+    ]
+
+    query = """
+        query NodesQuery($ids: [ID!]!) {
+          nodes(ids: $ids) {
+            ... on TaskType { name }
+          }
+        }
+    """
+
+    response = graphql(query, variables={"ids": ids})
+
+    assert response.data == {"nodes": [{"name": "Task"}, None, None]}
+    assert response.errors == [
+        {
+            "message": "Permission denied.",
+            "extensions": {"error_code": "PERMISSION_DENIED", "status_code": 403},
+            "path": ["nodes", 1],
+        },
+        {
+            "message": "'foo' is not a valid Global ID.",
+            "extensions": {"error_code": "NODE_INVALID_GLOBAL_ID", "status_code": 400},
+            "path": ["nodes", 2],
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_optimizer__relay__nodes__invalid_pk(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+        tasks = Entrypoint(Connection(TaskType))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task = TaskFactory.create(name="Task")
+
+    invalid_id = to_global_id(typename=TaskType.__schema_name__, object_id="abc")
+    ids = [
+        invalid_id,
+        to_global_id(typename=TaskType.__schema_name__, object_id=task.pk),
+    ]
+
+    query = """
+        query NodesQuery($ids: [ID!]!) {
+          nodes(ids: $ids) {
+            ... on TaskType { name }
+          }
+        }
+    """
+
+    response = graphql(query, variables={"ids": ids})
+
+    assert response.data == {"nodes": [None, {"name": "Task"}]}
+    assert response.errors == [
+        {
+            "message": f"'{invalid_id}' is not a valid Global ID.",
+            "extensions": {"error_code": "NODE_INVALID_GLOBAL_ID", "status_code": 400},
+            "path": ["nodes", 0],
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_optimizer__relay__nodes__not_visible(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+        @classmethod
+        def __is_visible__(cls, request: DjangoRequestProtocol) -> bool:
+            return False
+
+    class ProjectType(QueryType[Project], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+        tasks = Entrypoint(Connection(TaskType))
+        projects = Entrypoint(Connection(ProjectType))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task = TaskFactory.create(name="Task", project__name="Project")
+
+    ids = [
+        to_global_id(typename=TaskType.__schema_name__, object_id=task.pk),
+        to_global_id(typename=ProjectType.__schema_name__, object_id=task.project.pk),
+    ]
+
+    query = """
+        query NodesQuery($ids: [ID!]!) {
+          nodes(ids: $ids) {
+            id
+          }
+        }
+    """
+
+    response = graphql(query, variables={"ids": ids}, count_queries=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"nodes": [None, {"id": ids[1]}]}
+
+    response.assert_query_count(1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_optimizer__relay__nodes__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class Query(RootType):
+        nodes = Entrypoint(Nodes)
+        tasks = Entrypoint(Connection(TaskType))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    task_1 = await sync_to_async(TaskFactory.create)(name="Task 1")
+    task_2 = await sync_to_async(TaskFactory.create)(name="Task 2")
+
+    ids = [
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_2.pk),
+        to_global_id(typename=TaskType.__schema_name__, object_id=task_1.pk),
+    ]
+
+    query = """
+        query NodesQuery($ids: [ID!]!) {
+          nodes(ids: $ids) {
+            ... on TaskType { name }
+          }
+        }
+    """
+
+    response = await graphql_async(query, variables={"ids": ids})
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"nodes": [{"name": "Task 2"}, {"name": "Task 1"}]}
+
+
 # Relay Connections
 
 
@@ -425,6 +649,100 @@ class Query(RootType):
     response.assert_query_count(2)
 
 
+@pytest.mark.django_db
+def test_optimizer__relay__connection__capped_total_count(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(Connection(TaskType, total_count_strategy="capped", total_count_limit=2))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    TaskFactory.create(name="Task 1")
+    TaskFactory.create(name="Task 2")
+    TaskFactory.create(name="Task 3")
+
+    query = """
+        query {
+          tasks(first: 1) {
+            totalCount
+            totalCountIsExact
+            pageInfo {
+              hasNextPage
+            }
+            edges {
+              node {
+                name
+              }
+            }
+          }
+        }
+    """
+
+    response = graphql(query, count_queries=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {
+        "tasks": {
+            "totalCount": 2,
+            "totalCountIsExact": False,
+            "pageInfo": {
+                "hasNextPage": True,
+            },
+            "edges": [
+                {
+                    "node": {
+                        "name": "Task 1",
+                    },
+                },
+            ],
+        },
+    }
+
+    response.assert_query_count(2)
+
+
+@pytest.mark.django_db
+def test_optimizer__relay__connection__capped_total_count__exact(graphql, undine_settings) -> None:
+    class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
+        name = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(Connection(TaskType, total_count_strategy="capped", total_count_limit=5))
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    TaskFactory.create(name="Task 1")
+    TaskFactory.create(name="Task 2")
+    TaskFactory.create(name="Task 3")
+
+    query = """
+        query {
+          tasks(first: 1) {
+            totalCount
+            totalCountIsExact
+            pageInfo {
+              hasNextPage
+            }
+          }
+        }
+    """
+
+    response = graphql(query)
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {
+        "tasks": {
+            "totalCount": 3,
+            "totalCountIsExact": True,
+            "pageInfo": {
+                "hasNextPage": True,
+            },
+        },
+    }
+
+
 @pytest.mark.django_db
 def test_optimizer__relay__connection__no_page_size(graphql, undine_settings) -> None:
     class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
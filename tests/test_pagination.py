@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import NamedTuple
+from unittest.mock import patch
 
 import pytest
 from django.db.models import Expression, Value
@@ -13,7 +14,7 @@
 from undine.exceptions import GraphQLPaginationArgumentValidationError
 from undine.pagination import PaginationHandler
 from undine.relay import offset_to_cursor
-from undine.typing import ToManyField
+from undine.typing import ToManyField, TotalCountStrategy
 
 
 class PaginationParams(NamedTuple):
@@ -348,6 +349,160 @@ def test_pagination_handler__paginate_queryset__no_page_size__filter_last(undine
     assert pagination.stop == 3
 
 
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__capped_total_count(undine_settings) -> None:
+    TaskFactory.create_batch(5)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        first=2,
+        total_count_strategy=TotalCountStrategy.capped,
+        total_count_limit=3,
+    )
+    pagination.requires_total_count = True
+    pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    assert pagination.total_count == 3
+    assert pagination.total_count_is_exact is False
+    assert pagination.has_next_page() is True
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__capped_total_count__below_limit(undine_settings) -> None:
+    TaskFactory.create_batch(3)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        first=2,
+        total_count_strategy=TotalCountStrategy.capped,
+        total_count_limit=3,
+    )
+    pagination.requires_total_count = True
+    pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    assert pagination.total_count == 3
+    assert pagination.total_count_is_exact is True
+    assert pagination.has_next_page() is True
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__capped_total_count__page_past_limit(undine_settings) -> None:
+    TaskFactory.create_batch(6)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        after=offset_to_cursor("Test", 1),
+        first=3,
+        total_count_strategy=TotalCountStrategy.capped,
+        total_count_limit=2,
+    )
+    pagination.requires_total_count = True
+    pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    # Counted up to the end of the current page, which is past the limit.
+    assert pagination.total_count == 5
+    assert pagination.total_count_is_exact is False
+    assert pagination.has_next_page() is True
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__capped_total_count__last(undine_settings) -> None:
+    TaskFactory.create_batch(5)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        last=2,
+        total_count_strategy=TotalCountStrategy.capped,
+        total_count_limit=3,
+    )
+    pagination.requires_total_count = True
+    pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    # Paginating from the end requires an exact count.
+    assert pagination.total_count == 5
+    assert pagination.total_count_is_exact is True
+    assert pagination.start == 3
+    assert pagination.stop == 5
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__estimated_total_count(undine_settings) -> None:
+    TaskFactory.create_batch(3)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        first=2,
+        total_count_strategy=TotalCountStrategy.estimated,
+        total_count_limit=10,
+    )
+    pagination.requires_total_count = True
+
+    with patch("undine.pagination._estimate_count", return_value=1_000):
+        pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    assert pagination.total_count == 1_000
+    assert pagination.total_count_is_exact is False
+    assert pagination.has_next_page() is True
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__estimated_total_count__no_next_page(undine_settings) -> None:
+    TaskFactory.create_batch(2)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        first=2,
+        total_count_strategy=TotalCountStrategy.estimated,
+        total_count_limit=10,
+    )
+    pagination.requires_total_count = True
+
+    with patch("undine.pagination._estimate_count", return_value=1_000):
+        pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    # Next page is checked separately, since the estimate cannot be trusted for it.
+    assert pagination.total_count == 1_000
+    assert pagination.total_count_is_exact is False
+    assert pagination.has_next_page() is False
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__estimated_total_count__below_limit(undine_settings) -> None:
+    TaskFactory.create_batch(3)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        first=2,
+        total_count_strategy=TotalCountStrategy.estimated,
+        total_count_limit=10,
+    )
+    pagination.requires_total_count = True
+
+    with patch("undine.pagination._estimate_count", return_value=5):
+        pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    assert pagination.total_count == 3
+    assert pagination.total_count_is_exact is True
+
+
+@pytest.mark.django_db
+def test_pagination_handler__paginate_queryset__estimated_total_count__sqlite(undine_settings) -> None:
+    TaskFactory.create_batch(3)
+
+    pagination = PaginationHandler(
+        typename="Test",
+        first=2,
+        total_count_strategy=TotalCountStrategy.estimated,
+        total_count_limit=1,
+    )
+    pagination.requires_total_count = True
+    pagination.paginate_queryset(Task.objects.all(), mock_gql_info())
+
+    # SQLite doesn't provide estimates, so the count is exact.
+    assert pagination.total_count == 3
+    assert pagination.total_count_is_exact is True
+
+
 @pytest.mark.parametrize(
     **parametrize_helper({
         "none": InputParams(
@@ -33,6 +33,8 @@
 )
 from undine.parsers import GraphQLRequestParamsParser
 from undine.persisted_documents.apps import UndinePersistedDocumentsConfig
+from undine.persisted_documents.cache import persisted_document_cache
+from undine.persisted_documents.models import PersistedDocument
 from undine.persisted_documents.utils import to_document_id
 
 
@@ -420,6 +422,152 @@ async def test_parse_graphql_params__persisted_document__async() -> None:
     assert params.extensions == {}
 
 
+@pytest.mark.django_db
+def test_parse_graphql_params__persisted_documents__cached() -> None:
+    PersistedDocumentFactory.create(document_id="1", document="query MyQuery { hello }")
+
+    request = MockRequest(
+        method="POST",
+        content_type="application/json",
+        body=b'{"documentId": "1", "variables": {}}',
+    )
+
+    params = GraphQLRequestParamsParser.run(request)
+    assert params.document == "query MyQuery { hello }"
+    assert params.persisted_document is not None
+
+    # Queryset updates don't send signals, so the cached document is still used.
+    PersistedDocument.objects.filter(document_id="1").update(document="query OtherQuery { hello }")
+
+    params_cached = GraphQLRequestParamsParser.run(request)
+    assert params_cached.document == "query MyQuery { hello }"
+    assert params_cached.persisted_document is params.persisted_document
+
+
+@pytest.mark.django_db
+def test_parse_graphql_params__persisted_documents__cached__invalidated_on_save() -> None:
+    document = PersistedDocumentFactory.create(document_id="1", document="query MyQuery { hello }")
+
+    request = MockRequest(
+        method="POST",
+        content_type="application/json",
+        body=b'{"documentId": "1", "variables": {}}',
+    )
+
+    params = GraphQLRequestParamsParser.run(request)
+    assert params.document == "query MyQuery { hello }"
+
+    document.document = "query OtherQuery { hello }"
+    document.save()
+
+    params = GraphQLRequestParamsParser.run(request)
+    assert params.document == "query OtherQuery { hello }"
+
+
+@pytest.mark.django_db
+def test_parse_graphql_params__persisted_documents__cached__invalidated_on_delete() -> None:
+    document = PersistedDocumentFactory.create(document_id="1", document="query MyQuery { hello }")
+
+    request = MockRequest(
+        method="POST",
+        content_type="application/json",
+        body=b'{"documentId": "1", "variables": {}}',
+    )
+
+    GraphQLRequestParamsParser.run(request)
+
+    document.delete()
+
+    with pytest.raises(GraphQLPersistedDocumentNotFoundError):
+        GraphQLRequestParamsParser.run(request)
+
+
+@pytest.mark.django_db
+def test_parse_graphql_params__persisted_documents__cache_disabled(undine_settings) -> None:
+    undine_settings.PERSISTED_DOCUMENTS_CACHE_MAX_SIZE = 0
+
+    PersistedDocumentFactory.create(document_id="1", document="query MyQuery { hello }")
+
+    request = MockRequest(
+        method="POST",
+        content_type="application/json",
+        body=b'{"documentId": "1", "variables": {}}',
+    )
+
+    params = GraphQLRequestParamsParser.run(request)
+    assert params.document == "query MyQuery { hello }"
+    assert params.persisted_document is not None
+    assert params.persisted_document.document_node is None
+
+    PersistedDocument.objects.filter(document_id="1").update(document="query OtherQuery { hello }")
+
+    params = GraphQLRequestParamsParser.run(request)
+    assert params.document == "query OtherQuery { hello }"
+
+
+@pytest.mark.django_db
+def test_parse_graphql_params__persisted_documents__cache_max_size(undine_settings) -> None:
+    undine_settings.PERSISTED_DOCUMENTS_CACHE_MAX_SIZE = 1
+
+    PersistedDocumentFactory.create(document_id="1", document="query MyQuery { hello }")
+    PersistedDocumentFactory.create(document_id="2", document="query OtherQuery { hello }")
+
+    GraphQLRequestParamsParser.get_persisted_document("1")
+    GraphQLRequestParamsParser.get_persisted_document("2")
+
+    assert persisted_document_cache.get("1") is None
+    assert persisted_document_cache.get("2") is not None
+
+
+@pytest.mark.django_db
+def test_parse_graphql_params__persisted_documents__shared_cache(undine_settings) -> None:
+    undine_settings.PERSISTED_DOCUMENTS_CACHE_ALIAS = "default"
+
+    PersistedDocumentFactory.create(document_id="1", document="query MyQuery { hello }")
+
+    request = MockRequest(
+        method="POST",
+        content_type="application/json",
+        body=b'{"documentId": "1", "variables": {}}',
+    )
+
+    GraphQLRequestParamsParser.run(request)
+
+    # Simulate another process, which doesn't have the document in its in-process cache.
+    persisted_document_cache.clear()
+    PersistedDocument.objects.filter(document_id="1").update(document="query OtherQuery { hello }")
+
+    try:
+        params = GraphQLRequestParamsParser.run(request)
+    finally:
+        persisted_document_cache.delete("1")
+
+    assert params.document == "query MyQuery { hello }"
+    assert params.persisted_document is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_parse_graphql_params__persisted_document__async__cached() -> None:
+    await sync_to_async(PersistedDocumentFactory.create)(document_id="1", document="query MyQuery { hello }")
+
+    request = MockRequest(
+        method="POST",
+        content_type="application/json",
+        body=b'{"documentId": "1"}',
+    )
+
+    params = await GraphQLRequestParamsParser.run_async(request)
+    assert params.document == "query MyQuery { hello }"
+    assert params.persisted_document is not None
+
+    await PersistedDocument.objects.filter(document_id="1").aupdate(document="query OtherQuery { hello }")
+
+    params_cached = await GraphQLRequestParamsParser.run_async(request)
+    assert params_cached.document == "query MyQuery { hello }"
+    assert params_cached.persisted_document is params.persisted_document
+
+
 @pytest.mark.django_db
 def test_parse_graphql_params__aqp__not_enabled(undine_settings) -> None:
     undine_settings.LIFECYCLE_HOOKS = []
@@ -2,16 +2,21 @@
 
 import hashlib
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
+from django.db import DatabaseError
 
 from pytest_undine.client import GraphQLClientHTTPResponse
 from pytest_undine.query_logging import DBQueryData
 from tests.factories import PersistedDocumentFactory
 from undine import Entrypoint, RootType, create_schema
+from undine.dataclasses import CacheControlResults
+from undine.persisted_documents.apq import automatic_persisted_query_writer
 from undine.persisted_documents.apps import UndinePersistedDocumentsConfig
+from undine.persisted_documents.cache import persisted_document_cache
 from undine.persisted_documents.models import PersistedDocument
-from undine.persisted_documents.utils import to_document_id
+from undine.persisted_documents.utils import register_persisted_documents, to_document_id
 
 
 @pytest.fixture
@@ -51,6 +56,53 @@ def hello() -> str:
     assert response.json == {"data": {"hello": "Hello World"}}
 
 
+@pytest.mark.django_db
+def test_persisted_documents__precompiled(graphql, undine_settings) -> None:
+    class Query(RootType):
+        @Entrypoint(cache_time=10)
+        def hello() -> str:
+            return "Hello World"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    document = "query { hello }"
+    document_id = register_persisted_documents({"hello": document})["hello"]
+
+    data = persisted_document_cache.get(document_id)
+    assert data is not None
+    assert data.is_precompiled(undine_settings.SCHEMA) is True
+    assert data.cache_control == {None: CacheControlResults(cache_time=10, cache_per_user=False)}
+
+    response = graphql(document, use_persisted_document=True)
+
+    assert response.has_errors is False, response.errors
+    assert response.json == {"data": {"hello": "Hello World"}}
+
+
+@pytest.mark.django_db
+def test_persisted_documents__precompiled__schema_changed(graphql, undine_settings) -> None:
+    class Query(RootType):
+        @Entrypoint
+        def hello() -> str:
+            return "Hello World"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    document = "query { hello }"
+    register_persisted_documents({"hello": document})
+
+    class NewQuery(RootType):
+        @Entrypoint
+        def greeting() -> str:
+            return "Hello World"
+
+    undine_settings.SCHEMA = create_schema(query=NewQuery)
+
+    response = graphql(document, use_persisted_document=True)
+
+    assert response.error_message(0) == "Cannot query field 'hello' on type 'NewQuery'."
+
+
 @pytest.mark.django_db
 def test_persisted_documents__not_found(graphql, undine_settings) -> None:
     document = "query { hello }"
@@ -182,6 +234,112 @@ def hello() -> str:
     assert persisted_document.document == document
 
 
+@pytest.mark.django_db
+def test_persisted_documents__apq__save__already_cached(graphql, undine_settings) -> None:
+
+    document = "query { hello }"
+
+    class Query(RootType):
+        @Entrypoint
+        def hello() -> str:
+            return "Hello World"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    sha_hash = hashlib.sha256(document.encode("utf-8")).hexdigest()
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": sha_hash}}
+
+    response = graphql(document, extensions=extensions, count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert len(response.queries) == 1
+
+    # Document is already in the cache, so it isn't written again.
+    response = graphql(document, extensions=extensions, count_queries=True)
+    assert response.has_errors is False, response.errors
+    assert len(response.queries) == 0
+
+
+@pytest.mark.django_db
+def test_persisted_documents__apq__save__write_behind(graphql, undine_settings) -> None:
+    undine_settings.PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL = 60
+
+    document = "query { hello }"
+    document_id = to_document_id(document)
+
+    class Query(RootType):
+        @Entrypoint
+        def hello() -> str:
+            return "Hello World"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    sha_hash = hashlib.sha256(document.encode("utf-8")).hexdigest()
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": sha_hash}}
+
+    try:
+        response = graphql(document, extensions=extensions)
+
+        assert response.has_errors is False, response.errors
+        assert response.json == {"data": {"hello": "Hello World"}}
+
+        # Document is queued to be written, but can already be used from the cache.
+        assert PersistedDocument.objects.filter(document_id=document_id).exists() is False
+
+        resp = graphql.post(
+            path=f"/{undine_settings.GRAPHQL_PATH}",
+            data={"extensions": extensions},
+            content_type="application/json",
+        )
+        response = GraphQLClientHTTPResponse(resp, DBQueryData(queries=[]))
+
+        assert response.has_errors is False, response.errors
+        assert response.json == {"data": {"hello": "Hello World"}}
+
+    finally:
+        automatic_persisted_query_writer.flush()
+
+    persisted_document = PersistedDocument.objects.get(document_id=document_id)
+    assert persisted_document.document == document
+
+
+@pytest.mark.django_db
+def test_persisted_documents__apq__save__write_behind__write_fails(graphql, undine_settings) -> None:
+    undine_settings.PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL = 60
+
+    document = "query { hello }"
+    document_id = to_document_id(document)
+
+    class Query(RootType):
+        @Entrypoint
+        def hello() -> str:
+            return "Hello World"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    sha_hash = hashlib.sha256(document.encode("utf-8")).hexdigest()
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": sha_hash}}
+
+    try:
+        response = graphql(document, extensions=extensions)
+        assert response.has_errors is False, response.errors
+
+        with patch.object(automatic_persisted_query_writer, "write", side_effect=DatabaseError):
+            automatic_persisted_query_writer.flush()
+
+        # Document is removed from the cache, since it couldn't be written.
+        assert persisted_document_cache.get(document_id) is None
+
+        # Registering the document again writes it.
+        response = graphql(document, extensions=extensions)
+        assert response.has_errors is False, response.errors
+
+    finally:
+        automatic_persisted_query_writer.flush()
+
+    persisted_document = PersistedDocument.objects.get(document_id=document_id)
+    assert persisted_document.document == document
+
+
 @pytest.mark.django_db
 def test_persisted_documents__apq__save__missing_version(graphql, undine_settings) -> None:
 
@@ -5,8 +5,10 @@
 import pytest
 from graphql import GraphQLError
 
+from tests.factories import PersistedDocumentFactory
 from undine.exceptions import GraphQLErrorGroup
-from undine.persisted_documents.utils import register_persisted_documents, to_document_id
+from undine.persisted_documents.cache import persisted_document_cache
+from undine.persisted_documents.utils import compile_persisted_documents, register_persisted_documents, to_document_id
 from undine.settings import example_schema
 
 
@@ -63,6 +65,41 @@ def test_register_persisted_document(undine_settings) -> None:
     }
 
 
+@pytest.mark.django_db
+def test_register_persisted_document__cached(undine_settings) -> None:
+    undine_settings.SCHEMA = example_schema
+
+    data = {"foo": "query { testing }"}
+
+    doc = register_persisted_documents(data)
+
+    cached = persisted_document_cache.get(doc["foo"])
+    assert cached is not None
+    assert cached.document == "query { testing }"
+    assert cached.is_precompiled(example_schema) is True
+
+
+@pytest.mark.django_db
+def test_compile_persisted_documents(undine_settings) -> None:
+    undine_settings.SCHEMA = example_schema
+
+    PersistedDocumentFactory.create(document_id="1", document="query { testing }")
+    PersistedDocumentFactory.create(document_id="2", document="query { foo }")
+
+    errors = compile_persisted_documents()
+
+    assert list(errors) == ["2"]
+    assert [error.message for error in errors["2"]] == ["Cannot query field 'foo' on type 'Query'."]
+
+    valid = persisted_document_cache.get("1")
+    assert valid is not None
+    assert valid.is_precompiled(example_schema) is True
+
+    invalid = persisted_document_cache.get("2")
+    assert invalid is not None
+    assert invalid.is_precompiled(example_schema) is False
+
+
 @pytest.mark.django_db
 def test_register_persisted_document__invalid_query__validation_error(undine_settings) -> None:
     undine_settings.SCHEMA = example_schema
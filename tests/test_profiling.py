@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import logging
+import sys
+from types import ModuleType
+from typing import Any
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from example_project.app.models import Task
+from tests.factories import TaskFactory
+from undine import Entrypoint, Field, QueryType, RootType, create_schema
+from undine.profiling import PROFILING_EXTENSION_KEY, ProfilingHook, get_tracer
+
+
+def create_task_schema() -> Any:
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+
+        @Field
+        def upper_name(self: Task) -> str:
+            return self.name.upper()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    return create_schema(query=Query)
+
+
+@pytest.mark.django_db
+def test_profiling_hook(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_task_schema()
+    undine_settings.LIFECYCLE_HOOKS = [ProfilingHook]
+    undine_settings.PROFILING_RESPONSE_EXTENSIONS = True
+
+    TaskFactory.create(name="foo")
+    TaskFactory.create(name="bar")
+
+    response = graphql("query { tasks { name upperName } }")
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo", "upperName": "FOO"}, {"name": "bar", "upperName": "BAR"}]}
+
+    profile = response.json["extensions"][PROFILING_EXTENSION_KEY]
+
+    assert profile.keys() == {"duration", "parse", "validation", "execution", "database", "entrypoints", "resolvers"}
+    assert profile["database"]["queries"] == 1
+
+    assert profile["entrypoints"].keys() == {"tasks"}
+    assert profile["entrypoints"]["tasks"]["database"]["queries"] == 1
+
+    # Model field resolvers without permissions are not timed.
+    assert profile["resolvers"].keys() == {"TaskType.upperName"}
+    assert profile["resolvers"]["TaskType.upperName"]["count"] == 2
+
+
+@pytest.mark.django_db
+def test_profiling_hook__typename(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_task_schema()
+    undine_settings.LIFECYCLE_HOOKS = [ProfilingHook]
+    undine_settings.PROFILING_RESPONSE_EXTENSIONS = True
+
+    TaskFactory.create(name="foo")
+
+    response = graphql("query { __typename tasks { __typename name } }")
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__typename": "Query", "tasks": [{"__typename": "TaskType", "name": "foo"}]}
+
+    # Meta fields are not timed.
+    profile = response.json["extensions"][PROFILING_EXTENSION_KEY]
+    assert profile["resolvers"] == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_profiling_hook__async(graphql_async, undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_task_schema()
+    undine_settings.LIFECYCLE_HOOKS = [ProfilingHook]
+    undine_settings.PROFILING_RESPONSE_EXTENSIONS = True
+
+    await sync_to_async(TaskFactory.create)(name="foo")
+
+    response = await graphql_async("query { tasks { name upperName } }")
+
+    assert response.has_errors is False, response.errors
+    assert response.data == {"tasks": [{"name": "foo", "upperName": "FOO"}]}
+
+    profile = response.json["extensions"][PROFILING_EXTENSION_KEY]
+
+    assert profile["entrypoints"]["tasks"]["database"]["queries"] == 1
+    assert profile["resolvers"]["TaskType.upperName"]["count"] == 1
+
+
+@pytest.mark.django_db
+def test_profiling_hook__not_in_extensions_by_default(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_task_schema()
+    undine_settings.LIFECYCLE_HOOKS = [ProfilingHook]
+
+    response = graphql("query { tasks { name } }")
+
+    assert response.has_errors is False, response.errors
+    assert PROFILING_EXTENSION_KEY not in response.json.get("extensions", {})
+
+
+@pytest.mark.django_db
+def test_profiling_hook__log(graphql, undine_settings, caplog) -> None:
+    undine_settings.SCHEMA = create_task_schema()
+    undine_settings.LIFECYCLE_HOOKS = [ProfilingHook]
+    undine_settings.PROFILING_LOG_LEVEL = logging.INFO
+
+    with caplog.at_level(logging.INFO, logger="undine"):
+        response = graphql("query Tasks { tasks { name } }")
+
+    assert response.has_errors is False, response.errors
+    assert any(record.getMessage().startswith("Profile for operation 'Tasks'") for record in caplog.records)
+
+
+@pytest.mark.django_db
+def test_profiling_hook__opentelemetry(graphql, undine_settings, monkeypatch) -> None:
+    spans: list[FakeSpan] = []
+
+    class FakeSpan:
+        def __init__(self, name: str, **kwargs: Any) -> None:
+            self.name = name
+            self.kwargs = kwargs
+            self.events: list[str] = []
+            self.ended = False
+
+        def add_event(self, name: str, attributes: dict[str, Any]) -> None:
+            self.events.append(attributes["graphql.field.coordinate"])
+
+        def end(self, end_time: int) -> None:
+            self.ended = end_time >= self.kwargs["start_time"]
+
+    class FakeTracer:
+        def start_span(self, name: str, **kwargs: Any) -> FakeSpan:
+            span = FakeSpan(name, **kwargs)
+            spans.append(span)
+            return span
+
+    opentelemetry = ModuleType("opentelemetry")
+    trace = ModuleType("opentelemetry.trace")
+    trace.get_tracer = lambda name: FakeTracer()  # type: ignore[attr-defined]
+    trace.set_span_in_context = lambda span: {"parent": span}  # type: ignore[attr-defined]
+    opentelemetry.trace = trace  # type: ignore[attr-defined]
+
+    monkeypatch.setitem(sys.modules, "opentelemetry", opentelemetry)
+    monkeypatch.setitem(sys.modules, "opentelemetry.trace", trace)
+    get_tracer.cache_clear()
+
+    undine_settings.SCHEMA = create_task_schema()
+    undine_settings.LIFECYCLE_HOOKS = [ProfilingHook]
+
+    TaskFactory.create(name="foo")
+
+    try:
+        response = graphql("query Tasks { tasks { upperName } }")
+    finally:
+        get_tracer.cache_clear()
+
+    assert response.has_errors is False, response.errors
+
+    assert [span.name for span in spans] == [
+        "graphql.operation",
+        "graphql.parse",
+        "graphql.validation",
+        "graphql.execution",
+        "graphql.entrypoint tasks",
+    ]
+    assert all(span.ended for span in spans)
+    assert spans[0].kwargs["attributes"]["graphql.operation.name"] == "Tasks"
+    assert spans[0].events == ["TaskType.upperName"]
+    assert spans[4].kwargs["context"] == {"parent": spans[0]}
+    assert spans[4].kwargs["attributes"]["db.queries"] == 1
@@ -6,7 +6,7 @@
 
 import pytest
 from asgiref.sync import sync_to_async
-from django.db.models import Model, Prefetch, Q, QuerySet, Value
+from django.db.models import F, Model, Prefetch, Q, QuerySet, Value
 from graphql import GraphQLEnumType, GraphQLEnumValue, GraphQLNonNull, GraphQLResolveInfo, GraphQLString
 
 from example_project.app.models import Comment, Person, Project, Task
@@ -505,6 +505,91 @@ class Query(RootType):
         assert resolver.run_sync(root=task, info=mock_gql_info()) == [task]
 
 
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_resolvers__query_type_many_resolver__stream(undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.INCREMENTAL_DELIVERY_STREAM_CHUNK_SIZE = 2
+
+    class ProjectType(QueryType[Project]): ...
+
+    class Query(RootType):
+        projects = Entrypoint(ProjectType, many=True)
+
+    resolver: QueryTypeManyResolver[Project] = QueryTypeManyResolver(
+        query_type=ProjectType,
+        entrypoint=Query.projects,
+    )
+
+    for i in range(5):
+        await sync_to_async(TaskFactory.create)(project__name=f"Project {i}")
+
+    with patch_optimizer(prefetch_related={"tasks"}):
+        results = [project async for project in resolver.run_stream(root=None, info=mock_gql_info())]
+
+    assert sorted(project.name for project in results) == [f"Project {i}" for i in range(5)]
+
+    # Related objects are prefetched for each chunk.
+    for project in results:
+        assert len(project._prefetched_objects_cache["tasks"]) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_resolvers__query_type_many_resolver__stream__limit(undine_settings) -> None:
+    undine_settings.ASYNC = True
+    undine_settings.INCREMENTAL_DELIVERY_STREAM_CHUNK_SIZE = 2
+
+    class TaskType(QueryType[Task]): ...
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True, limit=3)
+
+    resolver: QueryTypeManyResolver[Task] = QueryTypeManyResolver(
+        query_type=TaskType,
+        entrypoint=Query.tasks,
+    )
+
+    for _ in range(5):
+        await sync_to_async(TaskFactory.create)()
+
+    with patch_optimizer():
+        results = [task async for task in resolver.run_stream(root=None, info=mock_gql_info())]
+
+    assert len(results) == 3
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_resolvers__query_type_many_resolver__stream__permissions(undine_settings) -> None:
+    undine_settings.ASYNC = True
+
+    class TaskType(QueryType[Task]):
+        @classmethod
+        def __permissions__(cls, instance: Task, info: GQLInfo) -> None:
+            if instance.name == "Secret":
+                raise GraphQLPermissionError
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    resolver: QueryTypeManyResolver[Task] = QueryTypeManyResolver(
+        query_type=TaskType,
+        entrypoint=Query.tasks,
+    )
+
+    await sync_to_async(TaskFactory.create)(name="Public")
+    await sync_to_async(TaskFactory.create)(name="Secret")
+
+    results: list[Task] = []
+    with patch_optimizer(order_by=[F("pk").asc()]), pytest.raises(GraphQLPermissionError):
+        async for task in resolver.run_stream(root=None, info=mock_gql_info()):
+            results.append(task)  # noqa: PERF401
+
+    # Items before the one that failed the permission check have already been delivered.
+    assert [task.name for task in results] == ["Public"]
+
+
 @pytest.mark.django_db
 def test_resolvers__nested_query_type_single_resolver() -> None:
     class ProjectType(QueryType[Project]): ...
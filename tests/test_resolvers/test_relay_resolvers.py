@@ -234,6 +234,7 @@ class Query(RootType):
     assert result == (
         ConnectionDict(
             totalCount=100,
+            totalCountIsExact=True,
             pageInfo=PageInfoDict(
                 hasNextPage=True,
                 hasPreviousPage=False,
@@ -276,6 +277,7 @@ class Query(RootType):
     assert result == (
         ConnectionDict(
             totalCount=100,
+            totalCountIsExact=True,
             pageInfo=PageInfoDict(
                 hasNextPage=True,
                 hasPreviousPage=False,
@@ -353,6 +355,7 @@ class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
     assert result == (
         ConnectionDict(
             totalCount=100,
+            totalCountIsExact=True,
             pageInfo=PageInfoDict(
                 hasNextPage=True,
                 hasPreviousPage=False,
@@ -479,6 +482,7 @@ class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
     assert result == (
         ConnectionDict(
             totalCount=100,
+            totalCountIsExact=True,
             pageInfo=PageInfoDict(
                 hasNextPage=True,
                 hasPreviousPage=False,
@@ -532,6 +536,7 @@ class TaskType(QueryType[Task], auto=False, interfaces=[Node]):
     assert result == (
         ConnectionDict(
             totalCount=100,
+            totalCountIsExact=True,
             pageInfo=PageInfoDict(
                 hasNextPage=True,
                 hasPreviousPage=False,
@@ -790,6 +795,7 @@ class Query(RootType):
 
     assert result == ConnectionDict(
         totalCount=0,
+        totalCountIsExact=True,
         pageInfo=PageInfoDict(
             hasNextPage=False,
             hasPreviousPage=False,
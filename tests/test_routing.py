@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from example_project.app.models import Task
+from tests.factories import TaskFactory
+from undine import Entrypoint, GQLInfo, RootType, create_schema
+from undine.routing import DatabaseRoutingHook, OperationDatabaseRouter
+
+
+def create_routing_schema() -> Any:
+    class Query(RootType):
+        @Entrypoint
+        def database(self, info: GQLInfo) -> str | None:
+            return OperationDatabaseRouter().db_for_read(Task)
+
+    class Mutation(RootType):
+        @Entrypoint
+        def database(self, info: GQLInfo) -> str | None:
+            return OperationDatabaseRouter().db_for_write(Task)
+
+    return create_schema(query=Query, mutation=Mutation)
+
+
+def test_database_routing__outside_operation() -> None:
+    assert OperationDatabaseRouter().db_for_read(Task) is None
+    assert OperationDatabaseRouter().db_for_write(Task) is None
+
+
+@pytest.mark.django_db
+def test_database_routing__query__round_robin(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_routing_schema()
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+    undine_settings.DATABASE_REPLICA_ALIASES = ["replica_1", "replica_2"]
+
+    databases: list[str] = []
+    for _ in range(4):
+        response = graphql("query { database }")
+        assert response.has_errors is False, response.errors
+        databases.append(response.data["database"])
+
+    assert sorted(databases) == ["replica_1", "replica_1", "replica_2", "replica_2"]
+    assert databases[0] != databases[1]
+
+
+@pytest.mark.django_db
+def test_database_routing__query__no_replicas(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_routing_schema()
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+
+    response = graphql("query { database }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"database": "default"}
+
+
+@pytest.mark.django_db
+def test_database_routing__mutation(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_routing_schema()
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+    undine_settings.DATABASE_REPLICA_ALIASES = ["replica"]
+
+    response = graphql("mutation { database }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"database": "default"}
+
+    cookie = response.response.headers["Set-Cookie"]
+    assert cookie.startswith("undine-primary=")
+    assert "Max-Age=5" in cookie
+
+
+@pytest.mark.django_db
+def test_database_routing__mutation__sticky_time_disabled(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_routing_schema()
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+    undine_settings.DATABASE_PRIMARY_STICKY_TIME = 0
+
+    response = graphql("mutation { database }")
+    assert response.has_errors is False, response.errors
+    assert "Set-Cookie" not in response.response.headers
+
+
+@pytest.mark.django_db
+def test_database_routing__query__sticky(graphql, undine_settings) -> None:
+    undine_settings.SCHEMA = create_routing_schema()
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+    undine_settings.DATABASE_REPLICA_ALIASES = ["replica"]
+
+    graphql.cookies["undine-primary"] = str(int(time.time()) + 3)
+
+    response = graphql("query { database }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"database": "default"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("value", ["foo", "0", str(10**12)])
+def test_database_routing__query__sticky__invalid(graphql, undine_settings, value) -> None:
+    undine_settings.SCHEMA = create_routing_schema()
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+    undine_settings.DATABASE_REPLICA_ALIASES = ["replica"]
+
+    # Expired, malformed, and too distant expiry times don't route queries to the primary database.
+    graphql.cookies["undine-primary"] = value
+
+    response = graphql("query { database }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"database": "replica"}
+
+
+@pytest.mark.django_db
+def test_database_routing__allow_relation(undine_settings) -> None:
+    undine_settings.DATABASE_REPLICA_ALIASES = ["replica"]
+
+    task_1 = TaskFactory.build()
+    task_2 = TaskFactory.build()
+    task_1._state.db = "default"
+    task_2._state.db = "replica"
+
+    assert OperationDatabaseRouter().allow_relation(task_1, task_2) is True
+
+    task_2._state.db = "other"
+
+    assert OperationDatabaseRouter().allow_relation(task_1, task_2) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+async def test_database_routing__async(graphql_async, undine_settings) -> None:
+    @sync_to_async
+    def get_database() -> str | None:
+        return OperationDatabaseRouter().db_for_read(Task)
+
+    class Query(RootType):
+        # Database queries are made in another thread.
+        @Entrypoint
+        async def database(self, info: GQLInfo) -> str | None:
+            return await get_database()
+
+    undine_settings.ASYNC = True
+    undine_settings.GRAPHQL_PATH = "graphql/async/"
+    undine_settings.SCHEMA = create_schema(query=Query)
+    undine_settings.LIFECYCLE_HOOKS = [DatabaseRoutingHook]
+    undine_settings.DATABASE_REPLICA_ALIASES = ["replica"]
+
+    response = await graphql_async("query { database }")
+    assert response.has_errors is False, response.errors
+    assert response.data == {"database": "replica"}
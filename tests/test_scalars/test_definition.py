@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import datetime
+from unittest.mock import patch
+
+import pytest
 from graphql import DirectiveLocation
 
 from undine import Directive
+from undine.exceptions import GraphQLScalarConversionError
 from undine.scalars import ScalarType
+from undine.scalars.datetime import datetime_scalar
+from undine.utils.function_dispatcher import FunctionDispatcher
 
 
 def test_scalar__scalar_type__repr() -> None:
@@ -71,3 +78,56 @@ def _(value: str) -> str:
         return value.upper()
 
     assert my_scalar.serialize("foo") == "FOO"
+
+
+def test_scalar__scalar_type__serialize__cached_by_exact_type() -> None:
+    my_scalar: ScalarType[int, str] = ScalarType(name="MyScalar")
+
+    @my_scalar.serialize.register
+    def _(value: int) -> str:
+        return str(value)
+
+    assert my_scalar.serialize(1) == "1"
+    assert my_scalar.serialize(True) == "True"
+
+    assert set(my_scalar.serialize.cache) == {int, bool}
+
+
+def test_scalar__scalar_type__serialize__register_clears_cache() -> None:
+    my_scalar: ScalarType[int, str] = ScalarType(name="MyScalar")
+
+    @my_scalar.serialize.register
+    def _(value: int) -> str:
+        return str(value)
+
+    assert my_scalar.serialize(True) == "True"
+
+    @my_scalar.serialize.register
+    def _(value: bool) -> str:  # noqa: FBT001
+        return "yes" if value else "no"
+
+    assert my_scalar.serialize(True) == "yes"
+
+
+def test_scalar__scalar_type__serialize__not_supported() -> None:
+    my_scalar: ScalarType[int, str] = ScalarType(name="MyScalar")
+
+    with pytest.raises(GraphQLScalarConversionError) as exc_info:
+        my_scalar.serialize(1)
+
+    assert str(exc_info.value) == "'MyScalar' cannot represent value 1: Type 'builtins.int' is not supported"
+
+    # Unsupported types are cached as well.
+    assert set(my_scalar.serialize.cache) == {int}
+
+
+def test_scalar__scalar_type__serialize__resolved_once_per_type() -> None:
+    values = [datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)] * 10_000
+
+    datetime_scalar.serialize.cache.clear()
+
+    with patch.object(FunctionDispatcher, "__getitem__", autospec=True, wraps=FunctionDispatcher.__getitem__) as getitem:
+        results = [datetime_scalar.serialize(value) for value in values]
+
+    assert results[0] == "2024-01-01T00:00:00+00:00"
+    assert getitem.call_count == 1
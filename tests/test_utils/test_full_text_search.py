@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import pytest
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, Q
 from django.http import HttpRequest
 
-from undine.typing import DjangoRequestProtocol
+from example_project.app.models import Task
+from tests.helpers import mock_gql_info
+from undine import Filter, FilterSet
+from undine.typing import DjangoRequestProtocol, GQLContext
 from undine.utils.full_text_search import (
+    PostgresFTS,
     SearchLanguage,
     TextSearchLang,
     build_pg_search,
@@ -150,3 +156,82 @@ def test_get_request_search_language__referer_path__no_lang(settings) -> None:
     settings.LANGUAGE_CODE = "en"
 
     assert get_request_search_language(request) == SearchLanguage("english", code="en")
+
+
+def test_postgres_fts__vector_fields(settings) -> None:
+    settings.LANGUAGE_CODE = "en"
+
+    class TaskFilterSet(FilterSet[Task]):
+        search = Filter(PostgresFTS(vector_fields={"english": "search_vector_english"}))
+
+    info = mock_gql_info(context=GQLContext(request=HttpRequest()))  # type: ignore[arg-type]
+    results = TaskFilterSet.__build__({"search": "foo bar"}, info)
+
+    # Stored search vectors are searched directly without annotating a vector to the queryset.
+    assert results.aliases == {}
+    assert results.order_by == []
+    assert results.filters == [
+        Q(search_vector_english=SearchQuery(value="'foo':* | 'bar':*", config="english", search_type="raw")),
+    ]
+
+
+def test_postgres_fts__lang_specific(settings) -> None:
+    settings.LANGUAGE_CODE = "en"
+
+    class TaskFilterSet(FilterSet[Task]):
+        search = Filter(PostgresFTS(english=["name"]))
+
+    info = mock_gql_info(context=GQLContext(request=HttpRequest()))  # type: ignore[arg-type]
+    results = TaskFilterSet.__build__({"search": "foo"}, info)
+
+    assert results.aliases == {"_undine_ts_vector_search_english": SearchVector("name", config="english")}
+    assert results.filters == [
+        Q(_undine_ts_vector_search_english=SearchQuery(value="'foo':*", config="english", search_type="raw")),
+    ]
+
+
+def test_postgres_fts__rank(settings) -> None:
+    settings.LANGUAGE_CODE = "en"
+
+    class TaskFilterSet(FilterSet[Task]):
+        search = Filter(PostgresFTS(vector_fields={"english": "search_vector_english"}, rank=True))
+
+    info = mock_gql_info(context=GQLContext(request=HttpRequest()))  # type: ignore[arg-type]
+    results = TaskFilterSet.__build__({"search": "foo"}, info)
+
+    query = SearchQuery(value="'foo':*", config="english", search_type="raw")
+    assert results.aliases == {
+        "_undine_ts_vector_search_english_rank": SearchRank(F("search_vector_english"), query),
+    }
+    assert results.order_by == [F("_undine_ts_vector_search_english_rank").desc()]
+
+
+def test_postgres_fts__rank_limit(settings) -> None:
+    settings.LANGUAGE_CODE = "en"
+
+    class TaskFilterSet(FilterSet[Task], auto=False):
+        search = Filter(PostgresFTS(english=["name"], rank=True, rank_limit=100))
+        project = Filter("project__name")
+
+    info = mock_gql_info(context=GQLContext(request=HttpRequest()))  # type: ignore[arg-type]
+    results = TaskFilterSet.__build__({"search": "foo", "project": "bar"}, info)
+
+    # The limit is applied to the rows matching all the filters, so the search filter itself isn't limited.
+    assert results.limit == 100
+    assert results.order_by == [F("_undine_ts_vector_search_english_rank").desc()]
+    assert results.filters == [
+        Q(_undine_ts_vector_search_english=SearchQuery(value="'foo':*", config="english", search_type="raw")),
+        Q(project__name__exact="bar"),
+    ]
+
+
+def test_postgres_fts__rank_limit__no_rank(settings) -> None:
+    settings.LANGUAGE_CODE = "en"
+
+    class TaskFilterSet(FilterSet[Task]):
+        search = Filter(PostgresFTS(english=["name"], rank_limit=100))
+
+    info = mock_gql_info(context=GQLContext(request=HttpRequest()))  # type: ignore[arg-type]
+    results = TaskFilterSet.__build__({"search": "foo"}, info)
+
+    assert results.limit is None
\ No newline at end of file
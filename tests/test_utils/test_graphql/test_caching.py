@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+
 import pytest
 from graphql import GraphQLInterfaceType, GraphQLNonNull, GraphQLString, parse
 
 from example_project.app.models import Project, Task
 from undine import Entrypoint, Field, InterfaceField, InterfaceType, QueryType, RootType, UnionType, create_schema
 from undine.typing import DjangoRequestProtocol
-from undine.utils.graphql.caching import RequestCacheCalculator
+from undine.utils.graphql.caching import RequestCacheCalculator, single_flight, single_flight_async
 from undine.utils.graphql.utils import get_fragment_definitions, get_operation_definition
 
 
@@ -381,3 +385,68 @@ class Query(RootType):
     calc.parse_cache_time_from_type(union_type)
 
     assert calc.cache_per_user is True
+
+
+def test_single_flight() -> None:
+    events: list[str] = []
+    leader_started = threading.Event()
+
+    def follower() -> None:
+        leader_started.wait()
+        with single_flight("key") as is_leader:
+            events.append(f"follower:{is_leader}")
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+
+    with single_flight("key") as is_leader:
+        leader_started.set()
+        time.sleep(0.05)
+        events.append(f"leader:{is_leader}")
+
+    thread.join()
+
+    assert events == ["leader:True", "follower:False"]
+
+    # Once the leader has finished, the next caller becomes the leader.
+    with single_flight("key") as is_leader:
+        assert is_leader is True
+
+
+def test_single_flight__disabled(undine_settings) -> None:
+    undine_settings.REQUEST_CACHE_SINGLE_FLIGHT = False
+
+    with single_flight("key") as first, single_flight("key") as second:
+        assert first is True
+        assert second is True
+
+
+def test_single_flight__timeout(undine_settings) -> None:
+    undine_settings.REQUEST_CACHE_SINGLE_FLIGHT_TIMEOUT = 0.01
+
+    result: list[bool] = []
+
+    def follower() -> None:
+        with single_flight("key") as is_leader:
+            result.append(is_leader)
+
+    with single_flight("key"):
+        thread = threading.Thread(target=follower)
+        thread.start()
+        thread.join()
+
+    assert result == [False]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_async() -> None:
+    events: list[str] = []
+
+    async def execute(name: str) -> None:
+        async with single_flight_async("key") as is_leader:
+            await asyncio.sleep(0.01)
+            events.append(f"{name}:{is_leader}")
+
+    await asyncio.gather(execute("first"), execute("second"), execute("third"))
+
+    assert events == ["first:True", "second:False", "third:False"]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from django.core.cache import caches
+from freezegun import freeze_time
+from graphql import parse
+
+from example_project.app.models import Person, Project, Task
+from undine import Entrypoint, Field, QueryType, RootType, create_schema
+from undine.pagination import OffsetPagination
+from undine.relay import Connection
+from undine.utils.graphql.cost import QueryCostCalculator, consume_cost_budget
+from undine.utils.graphql.utils import get_fragment_definitions, get_operation_definition
+
+
+def create_cost_schema() -> Any:
+    class PersonType(QueryType[Person], auto=False):
+        name = Field()
+
+    class TaskType(QueryType[Task], auto=False):
+        name = Field()
+        assignees = Field(Connection(PersonType))
+
+        @Field(complexity=5)
+        def expensive(self: Task) -> str:
+            return self.name
+
+        @Field
+        def priced(self: Task, factor: int = 1) -> str:
+            return self.name
+
+        @priced.cost
+        def priced_cost(self: Field, arguments: dict[str, Any]) -> int:
+            return 2 * arguments["factor"]
+
+    class ProjectType(QueryType[Project], auto=False):
+        name = Field()
+        tasks = Field(TaskType, many=True)
+        paginated_tasks = Field(OffsetPagination(TaskType), field_name="tasks")
+
+    class Query(RootType):
+        projects = Entrypoint(ProjectType, many=True)
+        limited_projects = Entrypoint(ProjectType, many=True, limit=5)
+        tasks = Entrypoint(Connection(TaskType, page_size=20))
+        project = Entrypoint(ProjectType)
+
+    return create_schema(query=Query)
+
+
+def calculate_cost(source: str, variables: dict[str, Any] | None = None) -> int:
+    document = parse(source)
+    operation = get_operation_definition(document, None)
+    fragments = get_fragment_definitions(document)
+    return QueryCostCalculator(operation, fragments, variables or {}).run()
+
+
+@pytest.mark.parametrize(
+    ("source", "cost"),
+    [
+        # Scalar fields don't cost anything, but each object costs one.
+        ("query { project(pk: 1) { name } }", 1),
+        # List size defaults to the `QUERY_COST_LIST_SIZE` setting.
+        ("query { projects { name } }", 1),
+        ("query { projects { tasks { name } } }", 1 + 100),
+        # List entrypoint limit.
+        ("query { limitedProjects { tasks { name } } }", 1 + 5),
+        # Connection page size and pagination arguments.
+        ("query { tasks { edges { node { name } } } }", 1 + 20 + 20),
+        (
+            "query { tasks(first: 10) { edges { node { assignees(last: 3) { edges { node { name } } } } } } }",
+            1 + 10 + 10 + 10 + 10 * 3 + 10 * 3,
+        ),
+        # Offset pagination limit.
+        ("query { project(pk: 1) { paginatedTasks(limit: 7) { expensive } } }", 1 + 1 + 7 * 5),
+        # Complexity and cost functions are multiplied by the number of parent objects.
+        ("query { limitedProjects { paginatedTasks(limit: 2) { expensive } } }", 1 + 5 + 5 * 2 * 5),
+        ("query { limitedProjects { paginatedTasks(limit: 2) { priced(factor: 3) } } }", 1 + 5 + 5 * 2 * 6),
+        # Fragments
+        ("query { limitedProjects { ...Tasks } } fragment Tasks on ProjectType { tasks { name } }", 1 + 5),
+        ("query { limitedProjects { ... on ProjectType { tasks { name } } } }", 1 + 5),
+    ],
+)
+def test_query_cost_calculator(undine_settings, source, cost) -> None:
+    undine_settings.SCHEMA = create_cost_schema()
+
+    assert calculate_cost(source) == cost
+
+
+def test_query_cost_calculator__variables(undine_settings) -> None:
+    undine_settings.SCHEMA = create_cost_schema()
+
+    source = "query ($first: Int) { tasks(first: $first) { edges { node { expensive } } } }"
+
+    assert calculate_cost(source, {"first": 2}) == 1 + 2 + 2 + 2 * 5
+
+
+def test_query_cost_calculator__list_size_setting(undine_settings) -> None:
+    undine_settings.SCHEMA = create_cost_schema()
+    undine_settings.QUERY_COST_LIST_SIZE = 10
+
+    assert calculate_cost("query { projects { tasks { name } } }") == 1 + 10
+
+
+def test_consume_cost_budget(undine_settings) -> None:
+    caches[undine_settings.QUERY_COST_BUDGET_CACHE_ALIAS].clear()
+    undine_settings.QUERY_COST_BUDGET = 100
+    undine_settings.QUERY_COST_BUDGET_REFILL_RATE = 10
+
+    with freeze_time("2025-01-01T00:00:00Z") as frozen_time:
+        assert consume_cost_budget("foo", 60) == (True, 40)
+        assert consume_cost_budget("foo", 60) == (False, 40)
+
+        # Budgets are separate for each client.
+        assert consume_cost_budget("bar", 60) == (True, 40)
+
+        frozen_time.tick(2)
+        assert consume_cost_budget("foo", 60) == (True, 0)
+
+        # Budget doesn't refill over its capacity.
+        frozen_time.tick(60)
+        assert consume_cost_budget("foo", 0) == (True, 100)
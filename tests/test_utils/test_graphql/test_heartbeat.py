@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from undine.utils.graphql.heartbeat import HeartbeatScheduler, with_heartbeat
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+pytestmark = [
+    pytest.mark.asyncio,
+]
+
+
+async def collect(gen: AsyncIterator) -> list:
+    return [item async for item in gen]
+
+
+async def test_with_heartbeat__events() -> None:
+    async def source() -> AsyncIterator[str]:  # noqa: RUF029
+        yield "foo"
+        yield "bar"
+
+    items = await collect(with_heartbeat(source(), interval=60, heartbeat=lambda: "heartbeat"))
+
+    assert items == ["foo", "bar"]
+    assert HeartbeatScheduler.schedulers == {}
+
+
+async def test_with_heartbeat__idle() -> None:
+    event = asyncio.Event()
+
+    async def source() -> AsyncIterator[str]:
+        yield "foo"
+        await event.wait()
+        yield "bar"
+
+    items: list[str] = []
+    async for item in with_heartbeat(source(), interval=0.01, heartbeat=lambda: "heartbeat"):
+        items.append(item)
+        if items.count("heartbeat") == 2:
+            event.set()
+
+    assert items == ["foo", "heartbeat", "heartbeat", "bar"]
+
+
+async def test_with_heartbeat__error() -> None:
+    async def source() -> AsyncIterator[str]:  # noqa: RUF029
+        yield "foo"
+        msg = "error"
+        raise ValueError(msg)
+
+    gen = with_heartbeat(source(), interval=60, heartbeat=lambda: "heartbeat")
+
+    assert await anext(gen) == "foo"
+
+    with pytest.raises(ValueError, match="error"):
+        await anext(gen)
+
+    assert HeartbeatScheduler.schedulers == {}
+
+
+async def test_with_heartbeat__close() -> None:
+    cancelled = asyncio.Event()
+
+    async def source() -> AsyncIterator[str]:
+        try:
+            await asyncio.sleep(100)
+            yield "foo"
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    gen = with_heartbeat(source(), interval=0.01, heartbeat=lambda: "heartbeat")
+
+    assert await anext(gen) == "heartbeat"
+
+    await gen.aclose()
+    await asyncio.wait_for(cancelled.wait(), timeout=5)
+
+    assert HeartbeatScheduler.schedulers == {}
+
+
+async def test_with_heartbeat__many_streams() -> None:
+    streams = 2_000
+    all_received = asyncio.Event()
+    received = 0
+
+    async def source() -> AsyncIterator[str]:
+        await all_received.wait()
+        yield "done"
+
+    async def consume() -> list[str]:
+        nonlocal received
+
+        items: list[str] = []
+        async for item in with_heartbeat(source(), interval=0.01, heartbeat=lambda: "heartbeat"):
+            items.append(item)
+            if items.count("heartbeat") == 1:
+                received += 1
+                if received == streams:
+                    all_received.set()
+
+        return items
+
+    tasks = [asyncio.create_task(consume()) for _ in range(streams)]
+    await asyncio.wait_for(all_received.wait(), timeout=10)
+
+    # All idle streams are sent heartbeats by the same scheduler.
+    assert len(HeartbeatScheduler.schedulers) == 1
+    scheduler = next(iter(HeartbeatScheduler.schedulers.values()))
+    assert len(scheduler.streams) == streams
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=10)
+
+    assert all(items[0] == "heartbeat" and items[-1] == "done" for items in results)
+    assert HeartbeatScheduler.schedulers == {}
@@ -14,11 +14,15 @@
     GraphQLScalarType,
     GraphQLSchema,
     GraphQLString,
+    parse,
 )
 
 from undine import Entrypoint, RootType, create_schema
+from undine.utils.graphql.utils import get_fragment_definitions, get_operation_definition
 from undine.utils.graphql.introspection import (
     _root_type_visible,  # noqa: PLC2701
+    get_schema_fingerprint,
+    is_introspection_operation,
     resolve_directive_args,
     resolve_directive_description,
     resolve_directive_is_repeatable,
@@ -223,3 +227,41 @@ def test_root_type_visible__no_undine_wrapper_returns_true() -> None:
     plain_object = GraphQLObjectType("Plain", fields={"x": GraphQLField(GraphQLString)})
 
     assert _root_type_visible(plain_object, _FakeInfo()) is True
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("query { __schema { types { name } } }", True),
+        ('query { __type(name: "Query") { name } __typename }', True),
+        ("query { ... on Query { __typename } }", True),
+        ("query { ...Schema } fragment Schema on Query { __schema { types { name } } }", True),
+        ("query { ...Schema } fragment Schema on Query { __typename ...Schema }", True),
+        ("query { __typename hello }", False),
+        ("query { ... on Query { hello } }", False),
+        ("query { ...Hello } fragment Hello on Query { hello }", False),
+    ],
+)
+def test_is_introspection_operation(source: str, expected: bool) -> None:
+    document = parse(source)
+    operation = get_operation_definition(document, None)
+    fragments = get_fragment_definitions(document)
+
+    assert is_introspection_operation(operation, fragments) is expected
+
+
+def test_get_schema_fingerprint() -> None:
+    def hello() -> str:
+        return "Hello"
+
+    def create_hello_schema(description: str) -> GraphQLSchema:
+        query = GraphQLObjectType("Query", {"hello": GraphQLField(GraphQLString, description=description)})
+        return GraphQLSchema(query=query)
+
+    schema_1 = create_hello_schema("Description")
+    schema_2 = create_hello_schema("Description")
+    schema_3 = create_hello_schema("Other description")
+
+    assert get_schema_fingerprint(schema_1) == get_schema_fingerprint(schema_1)
+    assert get_schema_fingerprint(schema_1) == get_schema_fingerprint(schema_2)
+    assert get_schema_fingerprint(schema_1) != get_schema_fingerprint(schema_3)
@@ -1263,3 +1263,156 @@ class Query(RootType):
 
     assert results.cache_time == 60
     assert results.cache_per_user is True
+
+
+def _role_audience(request: DjangoRequestProtocol) -> Any:
+    return request.headers.get("X-Role")
+
+
+@pytest.mark.django_db
+def test_visibility_audience__validates_against_audience_schema(graphql, undine_settings) -> None:
+    undine_settings.VISIBILITY_AUDIENCE = _role_audience
+
+    calls: list[str] = []
+
+    class TaskType(QueryType[Task], auto=False):
+        pk = Field()
+        name = Field()
+
+        @name.visible
+        def name_visible(self, request: DjangoRequestProtocol) -> bool:
+            calls.append(request.headers.get("X-Role"))
+            return request.headers.get("X-Role") == "admin"
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    query = "query { tasks { pk name } }"
+
+    response = graphql(query, headers={"X-Role": "user"})
+    assert response.error_message(0) == "Cannot query field 'name' on type 'TaskType'."
+
+    response = graphql(query, headers={"X-Role": "admin"})
+    assert response.has_errors is False, response.errors
+
+    response = graphql(query, headers={"X-Role": "user"})
+    assert response.error_message(0) == "Cannot query field 'name' on type 'TaskType'."
+
+    response = graphql(query, headers={"X-Role": "admin"})
+    assert response.has_errors is False, response.errors
+
+    # Visibility is only checked when the schema for the audience is built.
+    assert calls == ["user", "admin"]
+
+
+@pytest.mark.django_db
+def test_visibility_audience__introspection(graphql, undine_settings) -> None:
+    undine_settings.VISIBILITY_AUDIENCE = _role_audience
+
+    class TaskType(QueryType[Task], auto=False):
+        pk = Field()
+        name = Field()
+
+        @name.visible
+        def name_visible(self, request: DjangoRequestProtocol) -> bool:
+            return request.headers.get("X-Role") == "admin"
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    query = 'query { __type(name: "TaskType") { fields { name } } }'
+
+    response = graphql(query, headers={"X-Role": "user"})
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__type": {"fields": [{"name": "pk"}]}}
+
+    response = graphql(query, headers={"X-Role": "admin"})
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__type": {"fields": [{"name": "name"}, {"name": "pk"}]}}
+
+
+@pytest.mark.django_db
+def test_visibility_audience__hidden_root_type(graphql, undine_settings) -> None:
+    undine_settings.VISIBILITY_AUDIENCE = _role_audience
+
+    class TaskType(QueryType[Task], auto=False):
+        pk = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+        @classmethod
+        def __is_visible__(cls, request: DjangoRequestProtocol) -> bool:
+            return request.headers.get("X-Role") == "admin"
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    response = graphql("query { tasks { pk } }", headers={"X-Role": "user"})
+    assert response.error_message(0) == "Cannot query field 'tasks' on type 'Query'."
+
+    response = graphql("query { __schema { queryType { name } } }", headers={"X-Role": "user"})
+    assert response.has_errors is False, response.errors
+    assert response.data == {"__schema": {"queryType": None}}
+
+
+@pytest.mark.django_db
+def test_visibility_audience__hidden_filter_in_variables(graphql, undine_settings) -> None:
+    undine_settings.VISIBILITY_AUDIENCE = _role_audience
+
+    class TaskFilterSet(FilterSet[Task], auto=False):
+        pk = Filter()
+        name = Filter()
+
+        @name.visible
+        def name_visible(self, request: DjangoRequestProtocol) -> bool:
+            return request.headers.get("X-Role") == "admin"
+
+    class TaskType(QueryType[Task], auto=False, filterset=TaskFilterSet):
+        pk = Field()
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    query = "query ($filter: TaskFilterSet) { tasks(filter: $filter) { pk } }"
+    variables = {"filter": {"name": "foo"}}
+
+    response = graphql(query, variables=variables, headers={"X-Role": "user"})
+    assert response.error_message(0) == (
+        "Variable '$filter' got invalid value {'name': 'foo'}; Field 'name' is not defined by type 'TaskFilterSet'."
+    )
+
+    response = graphql(query, variables=variables, headers={"X-Role": "admin"})
+    assert response.has_errors is False, response.errors
+
+
+@pytest.mark.django_db
+def test_visibility_audience__schema_cache_is_bounded(graphql, undine_settings) -> None:
+    undine_settings.VISIBILITY_AUDIENCE = _role_audience
+    undine_settings.VISIBILITY_AUDIENCE_SCHEMA_MAX_SIZE = 1
+
+    calls: list[str] = []
+
+    class TaskType(QueryType[Task], auto=False):
+        pk = Field()
+
+        @classmethod
+        def __is_visible__(cls, request: DjangoRequestProtocol) -> bool:
+            calls.append(request.headers.get("X-Role"))
+            return True
+
+    class Query(RootType):
+        tasks = Entrypoint(TaskType, many=True)
+
+    undine_settings.SCHEMA = create_schema(query=Query)
+
+    for role in ["user", "user", "admin", "user"]:
+        response = graphql("query { tasks { pk } }", headers={"X-Role": role})
+        assert response.has_errors is False, response.errors
+
+    assert calls == ["user", "admin", "user"]
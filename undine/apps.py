@@ -18,6 +18,7 @@ def ready(self) -> None:
         self.register_converters()
         self.maybe_disable_did_you_mean()
         self.patch_debug_toolbar_if_installed()
+        self.connect_request_cache_invalidation()
 
     def patch_graphql_wrapping_object(self) -> None:
         """Set wrapping types to compare their wrapped types."""
@@ -65,3 +66,12 @@ def patch_debug_toolbar_if_installed(self) -> None:
             return
 
         monkeypatch_middleware()
+
+    def connect_request_cache_invalidation(self) -> None:
+        """Invalidate cached requests when the models fetched for them change, if enabled."""
+        from undine.settings import undine_settings  # noqa: PLC0415
+
+        if undine_settings.REQUEST_CACHE_INVALIDATION:
+            from undine.utils.graphql.caching import connect_request_cache_invalidation  # noqa: PLC0415
+
+            connect_request_cache_invalidation()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Self, Unpack
@@ -25,6 +26,7 @@
 
     from undine.typing import (
         CalculationArgumentParams,
+        CalculationParams,
         DefaultValueType,
         DjangoExpression,
         GQLInfo,
@@ -50,6 +52,16 @@ class Calculation(ABC, Generic[T_co]):
     >>>
     >>> class TaskType(QueryType[Task]): ...
     >>>     example = Field(ExampleCalculation)
+
+    Class keyword arguments:
+
+    :param deduplicate: If the calculation is queried multiple times with the same arguments
+                        for the same objects, calculate it only once. Defaults to `False`.
+    :param cache_time: How many seconds to cache the calculated values for each object across requests.
+                       Cached values are fetched after the main query, and missing values are calculated
+                       in a single query. Calculations using the cache are also deduplicated.
+                       If the calculated values depend on the request, override `__cache_key__`.
+                       Defaults to `0`, meaning no caching.
     """
 
     # Members should use `__dunder__` names to avoid name collisions with possible `CalculationArgument` names.
@@ -58,16 +70,26 @@ class Calculation(ABC, Generic[T_co]):
     __returns__: ClassVar[TypeHint]
     __arguments__: ClassVar[dict[str, CalculationArgument]]
     __attribute_docstrings__: ClassVar[dict[str, str]]
+    __deduplicate__: ClassVar[bool]
+    __cache_time__: ClassVar[int]
 
     @abstractmethod
     def __call__(self, info: GQLInfo) -> DjangoExpression:
         """Calculate the value of the Field. Return an expression that can be annotated to a queryset."""
 
+    def __cache_key__(self, info: GQLInfo) -> str:
+        """
+        Key for caching the calculated values in addition to the calculation's arguments, if `cache_time` is set.
+        Override this if the calculated values depend on the request (e.g. the request user or language),
+        so that they are cached separately for each request that can get different values.
+        """
+        return ""
+
     def __class_getitem__(cls, returns: TypeHint) -> type[Calculation[TypeHint]]:
         cls.__returns__ = returns
         return cls  # type: ignore[return-value]
 
-    def __init_subclass__(cls) -> None:
+    def __init_subclass__(cls, **kwargs: Unpack[CalculationParams]) -> None:
         try:
             cls.__returns__ = Calculation.__returns__
             del Calculation.__returns__
@@ -76,6 +98,8 @@ def __init_subclass__(cls) -> None:
 
         cls.__arguments__ = get_members(cls, CalculationArgument)
         cls.__attribute_docstrings__ = parse_class_attribute_docstrings(cls)
+        cls.__cache_time__ = kwargs.get("cache_time", 0)
+        cls.__deduplicate__ = kwargs.get("deduplicate", False) or cls.__cache_time__ > 0
 
         for name, arg in cls.__arguments__.items():
             arg.__connect__(cls, name)
@@ -96,6 +120,13 @@ def __init__(self, __field_name__: str, /, **kwargs: Any) -> None:
         self.__field_name__: str = __field_name__
         self.__parameters__: MappingProxyType[str, Any] = MappingProxyType(parameters)
 
+    @property
+    def __identity__(self) -> str:
+        """Identifies calculations of the same class with the same arguments."""
+        parameters = sorted(self.__parameters__.items())
+        value = f"{dotpath(self.__class__)}:{parameters!r}"
+        return hashlib.sha256(value.encode()).hexdigest()
+
 
 class CalculationArgument:
     """Defines an input argument for a `Calculation`."""
@@ -11,7 +11,7 @@
 from undine.federation.entities import EntitiesRef
 from undine.pagination import OffsetPagination
 from undine.parsers import parse_is_nullable
-from undine.relay import Connection, Node
+from undine.relay import Connection, Node, Nodes
 from undine.settings import undine_settings
 from undine.subscriptions import SignalSubscription
 
@@ -61,6 +61,13 @@ def _(ref: type[Node], **kwargs: Any) -> Any:
     return ref
 
 
+@convert_to_entrypoint_ref.register
+def _(ref: type[Nodes], **kwargs: Any) -> Any:
+    caller: Entrypoint = kwargs["caller"]
+    caller.many = False
+    return ref
+
+
 @convert_to_entrypoint_ref.register
 def _(ref: Connection, **kwargs: Any) -> Any:
     caller: Entrypoint = kwargs["caller"]
@@ -13,7 +13,7 @@
 from undine.federation.entities import EntitiesRef, EntitiesResolver
 from undine.pagination import OffsetPagination
 from undine.parsers import parse_return_annotation
-from undine.relay import Connection, Node
+from undine.relay import Connection, Node, Nodes
 from undine.resolvers import (
     BulkCreateResolver,
     BulkDeleteResolver,
@@ -24,6 +24,7 @@
     EntrypointFunctionResolver,
     InterfaceTypeResolver,
     NodeResolver,
+    NodesResolver,
     QueryTypeManyResolver,
     QueryTypeSingleResolver,
     SubscriptionValueResolver,
@@ -131,6 +132,12 @@ def _(_: type[Node], **kwargs: Any) -> GraphQLFieldResolver:
     return NodeResolver(entrypoint=caller)
 
 
+@convert_to_entrypoint_resolver.register
+def _(_: type[Nodes], **kwargs: Any) -> GraphQLFieldResolver:
+    caller: Entrypoint = kwargs["caller"]
+    return NodesResolver(entrypoint=caller)
+
+
 @convert_to_entrypoint_resolver.register
 def _(ref: type[InterfaceType], **kwargs: Any) -> GraphQLFieldResolver:
     caller: Entrypoint = kwargs["caller"]
@@ -188,10 +188,10 @@ def aliases(root: Filter, info: GQLInfo, *, value: Any) -> dict[str, DjangoExpre
             if user_func is not None:
                 results |= user_func(root, info, value=value)
 
-            lang = ref.get_search_language(info)
-            key = ref.get_vector_alias_key(root, lang)
-            results[key] = ref.vectors[lang.name]
+            results |= ref.get_aliases(root, info, value=value)
             return results
 
         caller.aliases_func = aliases
+        caller.order_by_func = ref.get_order_by
+        caller.limit_func = ref.get_limit
         return ref
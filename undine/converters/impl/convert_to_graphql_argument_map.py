@@ -9,6 +9,7 @@
 from graphql import (
     GraphQLArgument,
     GraphQLArgumentMap,
+    GraphQLID,
     GraphQLInputType,
     GraphQLInt,
     GraphQLList,
@@ -30,7 +31,7 @@
 from undine.federation.scalars import FederationAnyScalar
 from undine.pagination import OffsetPagination
 from undine.parsers import docstring_parser, parse_is_nullable, parse_parameters
-from undine.relay import Connection, Node
+from undine.relay import Connection, Node, Nodes
 from undine.settings import undine_settings
 from undine.subscriptions import SignalSubscription
 from undine.typing import CombinableExpression, ModelField, RelatedField
@@ -312,6 +313,17 @@ def _(ref: type[Node], **kwargs: Any) -> GraphQLArgumentMap:
     }
 
 
+@convert_to_graphql_argument_map.register
+def _(_: type[Nodes], **kwargs: Any) -> GraphQLArgumentMap:
+    return {
+        "ids": GraphQLArgument(
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLID))),
+            description="The Global IDs of the objects.",
+            out_name="ids",
+        ),
+    }
+
+
 @convert_to_graphql_argument_map.register
 def _(_: SignalSubscription, **kwargs: Any) -> GraphQLArgumentMap:
     return {}
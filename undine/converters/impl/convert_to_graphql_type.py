@@ -96,7 +96,7 @@
 from undine.mutation import Input, MutationTypeMeta
 from undine.pagination import OffsetPagination
 from undine.parsers import parse_first_param_type, parse_is_nullable, parse_return_annotation
-from undine.relay import Connection, PageInfoType
+from undine.relay import Connection, Node, Nodes, PageInfoType
 from undine.resolvers.query import NamedTupleFieldResolver, TypedDictFieldResolver
 from undine.scalars import (
     GraphQLAny,
@@ -118,7 +118,7 @@
 )
 from undine.settings import undine_settings
 from undine.subscriptions import QueryTypeSignalSubscription
-from undine.typing import ID, CombinableExpression, ModelField, eval_type
+from undine.typing import ID, CombinableExpression, ModelField, TotalCountStrategy, eval_type
 from undine.utils.graphql.type_registry import (
     get_or_create_graphql_enum,
     get_or_create_graphql_input_object_type,
@@ -937,23 +937,39 @@ def edge_fields() -> dict[str, GraphQLField]:
         },
     )
 
+    fields: dict[str, GraphQLField] = {
+        undine_settings.TOTAL_COUNT_PARAM_NAME: GraphQLField(
+            GraphQLNonNull(GraphQLInt),
+            description="Total number of items in the connection.",
+        ),
+    }
+
+    if ref.total_count_strategy != TotalCountStrategy.exact:
+        fields[undine_settings.TOTAL_COUNT_PARAM_NAME].description = (
+            f"Total number of items in the connection. Uses the '{ref.total_count_strategy}' strategy, "
+            f"so it's only exact if '{undine_settings.TOTAL_COUNT_IS_EXACT_PARAM_NAME}' is true."
+        )
+        fields[undine_settings.TOTAL_COUNT_IS_EXACT_PARAM_NAME] = GraphQLField(
+            GraphQLNonNull(GraphQLBoolean),
+            description=(
+                "Whether the total count is exact. If not, it's a lower bound for capped counts, "
+                "and an estimate for estimated counts."
+            ),
+        )
+
+    fields["pageInfo"] = GraphQLField(
+        GraphQLNonNull(PageInfoType),
+        description="Information about the current state of the pagination.",
+    )
+    fields["edges"] = GraphQLField(
+        GraphQLList(EdgeType),
+        description="The items in the connection.",
+    )
+
     return get_or_create_graphql_object_type(
         name=f"{ref_type.__schema_name__}Connection",
         description="A connection to a list of items.",
-        fields={
-            undine_settings.TOTAL_COUNT_PARAM_NAME: GraphQLField(
-                GraphQLNonNull(GraphQLInt),
-                description="Total number of items in the connection.",
-            ),
-            "pageInfo": GraphQLField(
-                GraphQLNonNull(PageInfoType),
-                description="Information about the current state of the pagination.",
-            ),
-            "edges": GraphQLField(
-                GraphQLList(EdgeType),
-                description="The items in the connection.",
-            ),
-        },
+        fields=fields,
         extensions={
             undine_settings.CONNECTION_EXTENSIONS_KEY: ref,
         },
@@ -974,6 +990,12 @@ def _(ref: type[InterfaceType], **kwargs: Any) -> GraphQLInputType | GraphQLOutp
     return ref.__interface__()
 
 
+@convert_to_graphql_type.register
+def _(_: type[Nodes], **kwargs: Any) -> GraphQLInputType | GraphQLOutputType:
+    # Objects that don't exist or are not visible resolve to null.
+    return GraphQLList(Node.__interface__())
+
+
 @convert_to_graphql_type.register
 def _(ref: InterfaceField, **kwargs: Any) -> GraphQLInputType | GraphQLOutputType:
     return ref.ref
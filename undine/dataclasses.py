@@ -16,10 +16,12 @@
     from django.contrib.contenttypes.fields import GenericForeignKey
     from django.db.models import Model, OrderBy, Q, QuerySet
     from graphql import (  # type: ignore[attr-defined]
+        DocumentNode,
         FieldNode,
         FormattedInitialIncrementalExecutionResult,
         FormattedSubsequentIncrementalExecutionResult,
         GraphQLError,
+        GraphQLSchema,
         InitialIncrementalExecutionResult,
         InlineFragmentNode,
         SubsequentIncrementalExecutionResult,
@@ -49,6 +51,7 @@
     "IncrementalDeliveryComplete",
     "IncrementalDeliveryHeartbeat",
     "IncrementalDeliveryResponse",
+    "InstancesWithPagination",
     "KeepAliveSignalDC",
     "LazyGenericForeignKey",
     "LazyLambda",
@@ -64,6 +67,7 @@
     "OptimizationWithPagination",
     "OrderResults",
     "Parameter",
+    "PersistedDocumentData",
     "RelInfo",
     "RootAndInfoParams",
     "TypeRef",
@@ -89,6 +93,9 @@ class FilterResults:
     distinct: bool
     none: bool = False
     filter_count: int = 0
+    order_by: list[OrderBy] = dataclasses.field(default_factory=list)
+    limit: int | None = None
+    """Maximum number of rows to return, taking the first rows in the order given by `order_by`."""
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -109,6 +116,32 @@ class GraphQLHttpParams:
     operation_name: str | None
     extensions: dict[str, Any]
 
+    persisted_document: PersistedDocumentData | None = None
+    """Precompiled persisted document, if the document was fetched from the persisted document cache."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PersistedDocumentData:
+    """A persisted document, and the results of precompiling it against the current schema."""
+
+    document: str
+
+    document_node: DocumentNode | None = None
+    """Parsed GraphQL document. `None` if the document wasn't precompiled or it couldn't be parsed."""
+
+    schema: GraphQLSchema | None = None
+    """The schema the document was precompiled against."""
+
+    errors: list[GraphQLError] = dataclasses.field(default_factory=list)
+    """Errors from parsing or validating the document without a request."""
+
+    cache_control: dict[str | None, CacheControlResults] = dataclasses.field(default_factory=dict)
+    """Request cache results for the query operations in the document by operation name."""
+
+    def is_precompiled(self, schema: GraphQLSchema) -> bool:
+        """Has the document been successfully parsed and validated against the given schema?"""
+        return self.document_node is not None and self.schema is schema and not self.errors
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class TypeRef:
@@ -166,6 +199,14 @@ class OptimizationWithPagination(Generic[TModel]):
     pagination: PaginationHandler
 
 
+@dataclasses.dataclass(slots=True)
+class InstancesWithPagination(Generic[TModel]):
+    """Instances fetched from an optimized queryset, and the pagination used for fetching them."""
+
+    instances: list[TModel]
+    pagination: PaginationHandler
+
+
 @dataclasses.dataclass(slots=True)
 class QuerySetMapWithPagination(Generic[TModel]):
     """Pagination arguments that have been validated."""
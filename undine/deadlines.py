@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any
+
+from django.db import DatabaseError, connections  # noqa: ICN003
+from django.db.backends.signals import connection_created
+
+from undine.exceptions import GraphQLOperationTimeoutError
+from undine.hooks import LifecycleHook
+from undine.settings import undine_settings
+from undine.utils.graphql.undine_extensions import get_undine_entrypoint
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator
+
+    from django.db.backends.base.base import BaseDatabaseWrapper
+    from graphql import GraphQLFieldResolver
+    from graphql.pyutils import Path
+
+    from undine import Entrypoint
+    from undine.hooks import LifecycleHookContext
+    from undine.typing import GQLInfo
+
+__all__ = [
+    "OperationDeadlineHook",
+]
+
+
+DEADLINE_EXTENSION_KEY: str = "timeout"
+"""Key under GraphQL request `extensions` where clients can request a timeout for the operation in seconds."""
+
+_current_deadline: ContextVar[float | None] = ContextVar("undine_current_deadline", default=None)
+
+# Set on database connections to the statement timeout set for them in milliseconds, or None if not set.
+_STATEMENT_TIMEOUT = "_undine_statement_timeout"
+
+STATEMENT_TIMEOUT_RESOLUTION_MS: int = 100
+"""
+Statement timeouts are rounded up to a multiple of this many milliseconds, so that the timeout
+doesn't need to be set again for queries made in quick succession.
+"""
+
+
+class OperationDeadlineHook(LifecycleHook):
+    """
+    Lifecycle hook that gives the entrypoints of an operation a deadline to resolve by.
+
+    The remaining time is used as the statement timeout for database queries made while
+    resolving the entrypoint, and in async execution, unfinished resolvers are cancelled
+    when the deadline passes. Fields that cannot be resolved in time are returned as null
+    with an error, while other entrypoints are still resolved normally.
+    """
+
+    def __init__(self, context: LifecycleHookContext) -> None:
+        super().__init__(context)
+        self.start: float = 0.0
+        self.deadlines: dict[str, float] = {}
+
+    def on_execution(self) -> Generator[None, None, None]:
+        install_database_wrappers()
+        self.start = time.monotonic()
+        yield
+
+    async def on_execution_async(self) -> AsyncGenerator[None, None]:
+        # Database queries are run in another thread, where the wrappers are installed
+        # by the `connection_created` signal when the connection is opened.
+        self.start = time.monotonic()
+        yield
+
+    def resolve(self, resolver: GraphQLFieldResolver, root: Any, info: GQLInfo, **kwargs: Any) -> Any:  # type: ignore[override]
+        if info.path.prev is None:
+            field = info.parent_type.fields.get(info.field_name)
+            entrypoint = get_undine_entrypoint(field) if field is not None else None
+            timeout = self.get_timeout(entrypoint)
+            if timeout is None:
+                return resolver(root, info, **kwargs)
+
+            deadline = self.deadlines[str(info.path.key)] = self.start + timeout
+            return resolve_with_deadline(resolver, root, info, deadline, **kwargs)
+
+        if not self.deadlines:
+            return resolver(root, info, **kwargs)
+
+        deadline = self.deadlines.get(str(get_root_key(info.path)))
+        if deadline is None:
+            return resolver(root, info, **kwargs)
+
+        return resolve_with_deadline(resolver, root, info, deadline, **kwargs)
+
+    def get_timeout(self, entrypoint: Entrypoint | None) -> float | None:
+        """Get the number of seconds the given entrypoint can take to resolve, or None if it's not limited."""
+        timeout = undine_settings.OPERATION_TIMEOUT
+        if entrypoint is not None and entrypoint.timeout is not None:
+            timeout = entrypoint.timeout
+
+        requested = self.get_requested_timeout()
+        if requested is None:
+            return timeout
+
+        # Clients can only shorten the server's timeouts, unless a maximum timeout is set.
+        max_timeout = undine_settings.MAX_OPERATION_TIMEOUT
+        if max_timeout is None:
+            max_timeout = timeout
+        if max_timeout is None:
+            return requested
+
+        return min(requested, max_timeout)
+
+    def get_requested_timeout(self) -> float | None:
+        """Get the timeout requested by the client in the request `extensions`, if it's valid."""
+        value = self.context.extensions.get(DEADLINE_EXTENSION_KEY)
+        if isinstance(value, bool) or not isinstance(value, int | float) or value <= 0:
+            return None
+        return value
+
+
+def resolve_with_deadline(
+    resolver: GraphQLFieldResolver,
+    root: Any,
+    info: GQLInfo,
+    deadline: float,
+    **kwargs: Any,
+) -> Any:
+    """Resolve a field so that the given deadline is used for database queries and awaited results."""
+    if time.monotonic() >= deadline:
+        raise GraphQLOperationTimeoutError
+
+    token = _current_deadline.set(deadline)
+    try:
+        result = resolver(root, info, **kwargs)
+    finally:
+        _current_deadline.reset(token)
+
+    if isawaitable(result):
+
+        async def _await_with_deadline() -> Any:
+            token = _current_deadline.set(deadline)
+            try:
+                # Cancels the awaited resolver, and any tasks it's waiting on, when the deadline passes.
+                async with asyncio.timeout(max(deadline - time.monotonic(), 0)):
+                    return await result
+            except TimeoutError as error:
+                if time.monotonic() < deadline:
+                    raise
+                raise GraphQLOperationTimeoutError from error
+            finally:
+                _current_deadline.reset(token)
+
+        return _await_with_deadline()
+
+    return result
+
+
+def get_root_key(path: Path) -> str | int:
+    while path.prev is not None:
+        path = path.prev
+    return path.key
+
+
+def limit_database_query(execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any) -> Any:  # noqa: FBT001
+    """Database execute wrapper that limits the query to the time remaining until the current deadline, if any."""
+    connection: BaseDatabaseWrapper = context["connection"]
+
+    deadline = _current_deadline.get()
+    if deadline is None:
+        set_statement_timeout(connection, timeout=None)
+        return execute(sql, params, many, context)
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise GraphQLOperationTimeoutError
+
+    try:
+        if connection.vendor == "sqlite":
+            return execute_with_progress_handler(execute, sql, params, many, context, deadline=deadline)
+
+        set_statement_timeout(connection, timeout=remaining)
+        return execute(sql, params, many, context)
+
+    except DatabaseError as error:
+        if time.monotonic() < deadline:
+            raise
+        raise GraphQLOperationTimeoutError from error
+
+
+def set_statement_timeout(connection: BaseDatabaseWrapper, *, timeout: float | None) -> None:
+    """
+    Set the statement timeout for the given database connection, if it has changed.
+    If timeout is None, reset the statement timeout to the database's default.
+
+    The timeout is set using a separate raw cursor, since the cursor of the query
+    can be a server-side cursor (e.g. for `QuerySet.iterator()`), which can only
+    be used for the query it's declared for.
+    """
+    timeout_ms: int | None = None
+    if timeout is not None:
+        timeout_ms = math.ceil(timeout * 1000 / STATEMENT_TIMEOUT_RESOLUTION_MS) * STATEMENT_TIMEOUT_RESOLUTION_MS
+
+    if getattr(connection, _STATEMENT_TIMEOUT, None) == timeout_ms:
+        return
+
+    if connection.vendor == "postgresql":
+        value = "DEFAULT" if timeout_ms is None else timeout_ms
+        sql = f"SET statement_timeout = {value}"
+
+    elif connection.vendor == "mysql":
+        if connection.mysql_is_mariadb:  # type: ignore[attr-defined]
+            value = "DEFAULT" if timeout_ms is None else timeout_ms / 1000
+            sql = f"SET SESSION max_statement_time = {value}"
+        else:
+            value = "DEFAULT" if timeout_ms is None else timeout_ms
+            sql = f"SET SESSION max_execution_time = {value}"
+
+    else:
+        return
+
+    cursor = connection.connection.cursor()  # type: ignore[union-attr]
+    try:
+        cursor.execute(sql)
+    finally:
+        cursor.close()
+
+    setattr(connection, _STATEMENT_TIMEOUT, timeout_ms)
+
+
+def execute_with_progress_handler(
+    execute: Callable[..., Any],
+    sql: str,
+    params: Any,
+    many: bool,  # noqa: FBT001
+    context: Any,
+    *,
+    deadline: float,
+) -> Any:
+    """SQLite doesn't have a statement timeout, so interrupt the query from its progress handler instead."""
+    raw_connection = context["connection"].connection
+    raw_connection.set_progress_handler(lambda: time.monotonic() >= deadline, 1_000)
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        raw_connection.set_progress_handler(None, 0)
+
+
+def install_database_wrappers() -> None:
+    """Add the deadline execute wrapper to all database connections in the current thread."""
+    for connection in connections.all():
+        install_database_wrapper(connection=connection)
+
+
+def install_database_wrapper(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    # Insert at the start of the list, so that `connection.execute_wrapper()` context managers,
+    # which `pop()` the last wrapper when exiting, don't remove this one. Django applies the wrappers
+    # in reverse order, so this makes it the outermost wrapper.
+    if limit_database_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, limit_database_query)
+
+
+def on_connection_created(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    # New connections use the database's default statement timeout.
+    setattr(connection, _STATEMENT_TIMEOUT, None)
+    install_database_wrapper(connection)
+
+
+connection_created.connect(on_connection_created)
@@ -31,6 +31,7 @@
     from graphql import GraphQLArgumentMap, GraphQLFieldResolver, GraphQLObjectType, GraphQLOutputType
 
     from undine.typing import (
+        CostFunc,
         DjangoRequestProtocol,
         EntrypointParams,
         EntrypointPermFunc,
@@ -168,6 +169,7 @@ def __init__(self, ref: Any = Undefined, **kwargs: Unpack[EntrypointParams]) ->
         :param complexity: The complexity of resolving this `Entrypoint` (not the entire query!).
         :param cache_time: How many seconds this `Entrypoint` can be cached for.
         :param cache_per_user: Whether the `Entrypoint` is cached per user or not.
+        :param timeout: Seconds the `Entrypoint` can take to resolve. Overrides the `OPERATION_TIMEOUT` setting.
         :param schema_name: Actual name in the GraphQL schema. Only needed if argument name is a python keyword.
         :param errors: List of errors that when raised by the `Entrypoint` should be returned as values.
                        If any errors are defined here, the `Entrypoint's` return type will be a union with the errors.
@@ -184,6 +186,7 @@ def __init__(self, ref: Any = Undefined, **kwargs: Unpack[EntrypointParams]) ->
         self.complexity: int = kwargs.get("complexity", 0)  # type: ignore[assignment]
         self.cache_time: int | None = kwargs.get("cache_time")
         self.cache_per_user: bool = kwargs.get("cache_per_user", False)
+        self.timeout: float | None = kwargs.get("timeout")
         self.schema_name: str = kwargs.get("schema_name", Undefined)  # type: ignore[assignment]
         self.errors: list[type[Exception]] = sort_by_mro(kwargs.get("errors", []))
 
@@ -201,6 +204,7 @@ def __init__(self, ref: Any = Undefined, **kwargs: Unpack[EntrypointParams]) ->
         self.resolver_func: GraphQLFieldResolver | None = None
         self.permissions_func: EntrypointPermFunc | None = None
         self.visible_func: VisibilityFunc | None = None
+        self.cost_func: CostFunc | None = None
 
     def __connect__(self, root_type: type[RootType], name: str) -> None:
         """Connect this `Entrypoint` to the given `RootType` using the given name."""
@@ -313,3 +317,20 @@ def visible(self, func: VisibilityFunc | None = None, /) -> VisibilityFunc:
             return self.visible  # type: ignore[return-value]
         self.visible_func = get_wrapped_func(func)
         return func
+
+    def cost(self, func: CostFunc | None = None, /) -> CostFunc:
+        """
+        Decorate a function to calculate the cost of this Entrypoint from its arguments.
+        Used by `QueryCostHook` instead of the Entrypoint's complexity.
+
+        >>> class Query(RootType):
+        ...     task = Entrypoint(TaskType, many=True)
+        ...
+        ...     @task.cost
+        ...     def task_cost(self: Entrypoint, arguments: dict[str, Any]) -> int:
+        ...         return 10
+        """
+        if func is None:  # Allow `@<entrypoint_name>.cost()`
+            return self.cost  # type: ignore[return-value]
+        self.cost_func = get_wrapped_func(func)
+        return func
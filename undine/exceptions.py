@@ -109,6 +109,16 @@ class BulkMutateNeedsImplementationError(UndineError):
     msg = "Must implement '{mutation_type}.__bulk_mutate__' to handle related inputs"
 
 
+class CachedCalculationExpressionError(UndineError):
+    """Error raised if a cached calculation uses an expression whose value depends on the other rows."""
+
+    msg = (
+        "Calculation '{name}' cannot set 'cache_time', since its expression contains a window function. "
+        "Its values depend on the other rows in the queryset, so they cannot be cached for each object. "
+        "Use a subquery instead."
+    )
+
+
 class DirectiveLocationError(UndineError):
     """Error raised if Directive is passed to a location it cannot be used in."""
 
@@ -170,7 +180,7 @@ class FederationFieldSetTooComplexError(UndineError):
     """Error raised if a `@KeyDirective` `fields` FieldSet is too complex for the default resolver."""
 
     msg = (
-        "'@key(fields: {fields!r})' on '{cls:dotpath}' contains a compound key, a nested selection or field alias, "
+        "'@key(fields: {fields!r})' on '{cls:dotpath}' contains a nested selection or field alias, "
         "which the default '__resolve_reference__' does not support. "
         "Define '__resolve_reference__' as a classmethod on the class to handle this key."
     )
@@ -186,15 +196,6 @@ class FederationKeyRequiresCustomResolverError(UndineError):
     )
 
 
-class FederationMultipleKeysRequireCustomResolverError(UndineError):
-    """Error raised if a `QueryType` has multiple resolvable `@KeyDirective`s without a custom resolver."""
-
-    msg = (
-        "'{cls:dotpath}' has zero or multiple resolvable '@key' directives. "
-        "Define '__resolve_reference__' as a classmethod on the class to handle this."
-    )
-
-
 class FederationRequiresNonExternalFieldError(UndineError):
     """Error raised if a `@RequiresDirective` on a `FederationField` references a non-`@external` field."""
 
@@ -988,6 +989,22 @@ class GraphQLFilePlacingError(GraphQLStatusError):
     code = UndineErrorCodes.FILE_NOT_FOUND
 
 
+class GraphQLFileTooLargeError(GraphQLStatusError):
+    """Error raised when an uploaded file is larger than the maximum allowed file size."""
+
+    msg = "File '{name}' is larger than the maximum allowed file size of {max_size} bytes."
+    status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    code = UndineErrorCodes.FILE_TOO_LARGE
+
+
+class GraphQLFileUploadTooLargeError(GraphQLStatusError):
+    """Error raised when the uploaded files are larger than the maximum allowed total size."""
+
+    msg = "Uploaded files are larger than the maximum allowed total size of {max_size} bytes."
+    status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    code = UndineErrorCodes.FILE_UPLOAD_TOO_LARGE
+
+
 class GraphQLIncrementalDeliveryNotRequestedError(GraphQLStatusError):
     """Error raised when an operation requires incremental delivery, but the client didn't request it."""
 
@@ -1233,6 +1250,14 @@ class GraphQLNoExecutionResultError(GraphQLStatusError):
     code = UndineErrorCodes.NO_EXECUTION_RESULT
 
 
+class GraphQLOperationTimeoutError(GraphQLStatusError):
+    """Error raised when a field cannot be resolved before the deadline of the operation."""
+
+    msg = "Operation timed out."
+    status = HTTPStatus.GATEWAY_TIMEOUT
+    code = UndineErrorCodes.OPERATION_TIMEOUT
+
+
 class GraphQLOptimizerError(GraphQLStatusError):
     """Error raised during the optimization compilation process."""
 
@@ -1281,6 +1306,22 @@ class GraphQLPrimaryKeysMissingError(GraphQLStatusError):
     code = UndineErrorCodes.PRIMARY_KEYS_MISSING
 
 
+class GraphQLQueryCostBudgetExceededError(GraphQLStatusError):
+    """Error raised when the cost of an operation exceeds the remaining cost budget of the client."""
+
+    msg = "Query cost of {cost} exceeds the remaining cost budget of {remaining}."
+    status = HTTPStatus.TOO_MANY_REQUESTS
+    code = UndineErrorCodes.QUERY_COST_BUDGET_EXCEEDED
+
+
+class GraphQLQueryCostTooHighError(GraphQLStatusError):
+    """Error raised when the cost of an operation exceeds the maximum allowed cost."""
+
+    msg = "Query cost of {cost} exceeds the maximum allowed cost of {max_cost}."
+    status = HTTPStatus.BAD_REQUEST
+    code = UndineErrorCodes.QUERY_COST_TOO_HIGH
+
+
 class GraphQLRelationMultipleInstancesError(GraphQLStatusError):
     """
     Error raised when trying to change the reverse one-to-one relation
@@ -1479,6 +1520,14 @@ class GraphQLUnexpectedCalculationArgumentError(GraphQLStatusError):
     code = UndineErrorCodes.UNEXPECTED_CALCULATION_ARGUMENT
 
 
+class GraphQLUnexpectedFileError(GraphQLStatusError):
+    """Error raised when a file upload contains a file that is not in the files map."""
+
+    msg = "File '{key}' is not in the file map."
+    status = HTTPStatus.BAD_REQUEST
+    code = UndineErrorCodes.UNEXPECTED_FILE
+
+
 class GraphQLUnexpectedError(GraphQLStatusError):
     """Error raised when an unexpected error occurs."""
 
@@ -70,8 +70,10 @@
     graphql_errors_hook,
     located_validation_error,
 )
-from undine.utils.graphql.validation_rules import get_validation_rules
+from undine.utils.graphql.validation_rules import get_request_validation_rules, get_validation_rules
+from undine.utils.graphql.validation_rules.visibility_rule import VisibilityRule
 from undine.utils.reflection import cancel_awaitable
+from undine.utils.visibility import get_request_schema, is_audience_schema
 
 if version_info >= (3, 3, 0):  # pragma: no cover
     from graphql import Executor  # type: ignore[attr-defined]
@@ -82,9 +84,17 @@
 
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
-
-    from graphql import DocumentNode, GraphQLInputType, GraphQLOutputType, GraphQLSchema, Node, ValueNode
+    from collections.abc import Awaitable, Callable, Collection
+
+    from graphql import (
+        ASTValidationRule,
+        DocumentNode,
+        GraphQLInputType,
+        GraphQLOutputType,
+        GraphQLSchema,
+        Node,
+        ValueNode,
+    )
     from graphql.execution.collect_fields import FieldDetailsList  # type: ignore[attr-defined]
     from graphql.execution.execute import IncrementalContext  # type: ignore[attr-defined]
     from graphql.pyutils import AwaitableOrValue, Path
@@ -188,6 +198,7 @@ def _validate_document_sync(context: LifecycleHookContext) -> None:
         document=context.document,  # type: ignore[arg-type]
         variables=context.variables,
         request=context.request,
+        rules=_get_validation_rules(context),
     )
     if validation_errors:
         context.result = get_error_execution_result(validation_errors)
@@ -318,6 +329,7 @@ async def _validate_document_async(context: LifecycleHookContext) -> None:  # no
         document=context.document,  # type: ignore[arg-type]
         variables=context.variables,
         request=context.request,
+        rules=_get_validation_rules(context),
     )
     if validation_errors:
         context.result = get_error_execution_result(validation_errors)
@@ -643,7 +655,7 @@ def _get_executor(
     middleware: MiddlewareManager | None,
 ) -> UndineExecutor:
     executor_or_errors = undine_settings.EXECUTOR_CLASS.build(
-        schema=undine_settings.SCHEMA,
+        schema=get_request_schema(request),
         document=document,
         root_value=root_value,
         context_value=GQLContext(request=request),
@@ -663,11 +675,26 @@ def _get_middleware_manager(lifecycle_hooks: list[LifecycleHook]) -> MiddlewareM
     return MiddlewareManager(*reversed(hooks)) if hooks else None
 
 
+def _get_validation_rules(context: LifecycleHookContext) -> tuple[type[ASTValidationRule], ...]:
+    # Precompiled persisted documents have already been validated with the rules that don't depend on the request.
+    # Requests using an audience schema must be validated against that schema instead.
+    if context.precompiled_document is not None and not is_audience_schema(get_request_schema(context.request)):
+        return get_request_validation_rules()
+    return get_validation_rules(inside_request=True)
+
+
 def _validate(
     document: DocumentNode,
     variables: dict[str, Any] | None = None,
     request: DjangoRequestProtocol | None = None,
+    rules: Collection[type[ASTValidationRule]] | None = None,
 ) -> list[GraphQLError]:
+    if rules is None:
+        rules = get_validation_rules(inside_request=request is not None)
+
+    if not rules:
+        return []
+
     errors: list[GraphQLError] = []
 
     def on_error(error: GraphQLError) -> None:
@@ -677,10 +704,15 @@ def on_error(error: GraphQLError) -> None:
 
         errors.append(error)
 
-    type_info = TypeInfo(schema=undine_settings.SCHEMA)
+    schema = get_request_schema(request)
+    if is_audience_schema(schema):
+        # Audience schemas only contain the parts of the schema that are visible to the audience.
+        rules = [rule for rule in rules if rule is not VisibilityRule]
+
+    type_info = TypeInfo(schema=schema)
 
     context = UndineValidationContext(
-        schema=undine_settings.SCHEMA,
+        schema=schema,
         document=document,
         variables=variables or {},
         request=request,
@@ -688,7 +720,7 @@ def on_error(error: GraphQLError) -> None:
         on_error=on_error,
     )
 
-    visitors = [rule(context) for rule in get_validation_rules(inside_request=request is not None)]
+    visitors = [rule(context) for rule in rules]
 
     with suppress(GraphQLValidationAbortedError):
         visit(document, TypeInfoVisitor(type_info, ParallelVisitor(visitors)))
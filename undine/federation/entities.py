@@ -2,27 +2,33 @@
 
 import dataclasses
 import inspect
-from functools import partial
+import operator
+from collections import defaultdict
+from functools import reduce
 from typing import TYPE_CHECKING, Any
 
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
 from graphql import GraphQLAbstractType  # noqa: TC002
 
 from undine import Entrypoint, QueryType
+from undine.exceptions import GraphQLModelFieldNotFoundError, GraphQLMultipleModelsFoundError
 from undine.federation.directives import KeyDirective
 from undine.federation.federation_type import FederationType
 from undine.settings import undine_settings
 from undine.utils.graphql.type_registry import get_or_create_graphql_union
 from undine.utils.graphql.utils import pre_evaluate_request_user
-from undine.utils.model_utils import get_instance_by_field_or_raise, get_instance_by_field_or_raise_async
+from undine.utils.model_utils import get_model_field
+from undine.utils.text import to_schema_name
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from django.db.models import Model
+    from django.db.models import Model, QuerySet
     from graphql import GraphQLUnionType
 
     from undine.entrypoint import RootType
-    from undine.typing import GQLInfo
+    from undine.typing import GQLInfo, ModelField
 
 
 __all__ = [
@@ -37,13 +43,13 @@ def make_entities_entrypoint(
 ) -> Entrypoint:
     entity_union = _build_entity_union(query_types, federation_types)
 
-    entities_by_typename: dict[str, type[QueryType | FederationType]] = {}
+    plans_by_typename: dict[str, EntityPlan] = {}
     for query_type in query_types:
-        entities_by_typename[query_type.__schema_name__] = query_type
+        plans_by_typename[query_type.__schema_name__] = EntityPlan.from_query_type(query_type)
     for federation_type in federation_types:
-        entities_by_typename[federation_type.__schema_name__] = federation_type
+        plans_by_typename[federation_type.__schema_name__] = EntityPlan.from_federation_type(federation_type)
 
-    ref = EntitiesRef(entities_by_typename=entities_by_typename, entity_union=entity_union)
+    ref = EntitiesRef(plans_by_typename=plans_by_typename, entity_union=entity_union)
 
     entrypoint = Entrypoint(
         ref,
@@ -77,15 +83,180 @@ def resolve_type(instance: Model | FederationType, info: GQLInfo, abstract_type:
     )
 
 
+@dataclasses.dataclass(slots=True, kw_only=True, frozen=True)
+class EntityKey:
+    """A resolvable `@key` of a `QueryType` entity, mapped to the model lookups it corresponds to."""
+
+    fields: tuple[str, ...]
+    """Names of the key fields in the entity representations."""
+
+    lookups: tuple[str, ...]
+    """Model lookups for the key fields, in the same order as `fields`."""
+
+    model_fields: tuple[ModelField, ...]
+    """Model fields for the lookups, used for converting representation values to python values."""
+
+    @property
+    def aliases(self) -> tuple[str, ...]:
+        return tuple(f"_undine_entity_key_{index}" for index in range(len(self.lookups)))
+
+    def matches(self, representation: dict[str, Any]) -> bool:
+        return all(representation.get(field) is not None for field in self.fields)
+
+    def get_values(self, representation: dict[str, Any]) -> tuple[Any, ...]:
+        """
+        Get the python values of the key fields from the given representation.
+
+        :raises ValidationError: A value cannot be converted to the python value of its model field.
+        """
+        return tuple(
+            model_field.to_python(representation[field])
+            for field, model_field in zip(self.fields, self.model_fields, strict=True)
+        )
+
+    def filter_queryset(self, queryset: QuerySet, values: set[tuple[Any, ...]]) -> QuerySet:
+        """Filter the queryset to the instances matching any of the given key values in a single query."""
+        queryset = queryset.annotate(**{
+            alias: F(lookup) for alias, lookup in zip(self.aliases, self.lookups, strict=True)
+        })
+
+        if len(self.lookups) == 1:
+            return queryset.filter(**{f"{self.lookups[0]}__in": [value for (value,) in values]})
+
+        conditions = (Q(**dict(zip(self.lookups, value, strict=True))) for value in values)
+        return queryset.filter(reduce(operator.or_, conditions))
+
+    def get_instance_values(self, instance: Model) -> tuple[Any, ...]:
+        return tuple(getattr(instance, alias) for alias in self.aliases)
+
+    def not_found_error(self, model: type[Model], values: tuple[Any, ...]) -> GraphQLModelFieldNotFoundError:
+        field, value = self._describe(values)
+        return GraphQLModelFieldNotFoundError(field=field, value=value, model=model)
+
+    def multiple_found_error(self, model: type[Model], values: tuple[Any, ...]) -> GraphQLMultipleModelsFoundError:
+        field, value = self._describe(values)
+        return GraphQLMultipleModelsFoundError(field=field, value=value, model=model)
+
+    def _describe(self, values: tuple[Any, ...]) -> tuple[str, Any]:
+        if len(self.lookups) == 1:
+            return self.lookups[0], values[0]
+        return " ".join(self.lookups), values
+
+
+@dataclasses.dataclass(slots=True, kw_only=True, frozen=True, eq=False)
+class EntityPlan:
+    """
+    How entities of a single `__typename` are resolved from their representations.
+
+    Plans are built once when the schema is created, so that resolving a representation
+    doesn't need to inspect the entity's directives or fields.
+    """
+
+    entity: type[QueryType | FederationType]
+
+    resolve_reference: Callable[[dict[str, Any], GQLInfo], Any] | None = None
+    """Custom `__resolve_reference__` of the entity, if it has one."""
+
+    is_resolve_reference_async: bool = False
+
+    is_permissions_async: bool = False
+
+    keys: tuple[EntityKey, ...] = ()
+    """Resolvable keys of a `QueryType` without a custom resolver, in declaration order."""
+
+    field_names: dict[str, str] = dataclasses.field(default_factory=dict)
+    """Mapping of representation field names to `FederationType` field names."""
+
+    @property
+    def batched(self) -> bool:
+        """Are the entities fetched from the database together with other entities of the same key?"""
+        return self.resolve_reference is None and issubclass(self.entity, QueryType)
+
+    @classmethod
+    def from_query_type(cls, query_type: type[QueryType]) -> EntityPlan:
+        resolve_reference = getattr(query_type, "__resolve_reference__", None)
+        is_permissions_async = inspect.iscoroutinefunction(query_type.__permissions__)
+
+        if resolve_reference is not None:
+            return cls(
+                entity=query_type,
+                resolve_reference=resolve_reference,
+                is_resolve_reference_async=inspect.iscoroutinefunction(resolve_reference),
+                is_permissions_async=is_permissions_async,
+            )
+
+        lookup_by_schema_name = {
+            field.schema_name or to_schema_name(name): field.field_name
+            for name, field in query_type.__field_map__.items()
+        }
+
+        keys: list[EntityKey] = []
+        for directive in query_type.__directives__:
+            if not isinstance(directive, KeyDirective) or not directive.__parameters__["resolvable"]:
+                continue
+
+            fields = tuple(directive.__parameters__["fields"].split())
+            lookups = tuple(lookup_by_schema_name[field] for field in fields)
+            model_fields = tuple(get_model_field(model=query_type.__model__, lookup=lookup) for lookup in lookups)
+            keys.append(EntityKey(fields=fields, lookups=lookups, model_fields=model_fields))
+
+        return cls(entity=query_type, is_permissions_async=is_permissions_async, keys=tuple(keys))
+
+    @classmethod
+    def from_federation_type(cls, federation_type: type[FederationType]) -> EntityPlan:
+        resolve_reference = getattr(federation_type, "__resolve_reference__", None)
+        return cls(
+            entity=federation_type,
+            resolve_reference=resolve_reference,
+            is_resolve_reference_async=inspect.iscoroutinefunction(resolve_reference),
+            is_permissions_async=inspect.iscoroutinefunction(federation_type.__permissions__),
+            field_names={field.schema_name: name for name, field in federation_type.__field_map__.items()},
+        )
+
+    def find_key(self, representation: dict[str, Any]) -> EntityKey:
+        """Find the first resolvable key whose fields are all included in the given representation."""
+        for key in self.keys:
+            if key.matches(representation):
+                return key
+
+        msg = f"No resolvable '@key' of '{self.entity.__name__}' found in given representation."
+        raise RuntimeError(msg)
+
+
 @dataclasses.dataclass(slots=True, kw_only=True, frozen=True, eq=False)
 class EntitiesRef:
-    entities_by_typename: dict[str, type[QueryType | FederationType]]
+    plans_by_typename: dict[str, EntityPlan]
     entity_union: GraphQLUnionType
 
 
+@dataclasses.dataclass(slots=True, kw_only=True)
+class EntityBatch:
+    """Representations of a single entity with the same key, fetched from the database in a single query."""
+
+    plan: EntityPlan
+    key: EntityKey
+    values_by_index: dict[int, tuple[Any, ...]] = dataclasses.field(default_factory=dict)
+
+    def get_queryset(self, info: GQLInfo) -> QuerySet:
+        queryset = self.plan.entity.__get_queryset__(info)  # type: ignore[union-attr]
+        return self.key.filter_queryset(queryset, set(self.values_by_index.values()))
+
+    def group_instances(self, instances: list[Model]) -> dict[tuple[Any, ...], list[Model]]:
+        instances_by_values: dict[tuple[Any, ...], list[Model]] = defaultdict(list)
+        for instance in instances:
+            instances_by_values[self.key.get_instance_values(instance)].append(instance)
+        return instances_by_values
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class EntitiesResolver:
-    """Resolves the Apollo Federation `Query._entities` field."""
+    """
+    Resolves the Apollo Federation `Query._entities` field.
+
+    Representations of `QueryType` entities without a custom `__resolve_reference__` are grouped
+    by their entity and key, and each group is fetched with a single database query.
+    Results are returned in the same order as the given representations.
+    """
 
     ref: EntitiesRef
 
@@ -101,7 +272,26 @@ def _run_sync(
         info: GQLInfo,
         representations: list[dict[str, Any]],
     ) -> list[Any]:
-        return [self._resolve_one_sync(rep, info) for rep in representations]
+        results: list[Any] = [None] * len(representations)
+        batches: dict[tuple[EntityPlan, EntityKey], EntityBatch] = {}
+
+        for index, representation in enumerate(representations):
+            plan = self._lookup(representation)
+            if plan is None:
+                continue
+
+            if plan.batched:
+                results[index] = self._add_to_batch(batches, plan, index, representation)
+                continue
+
+            results[index] = self._resolve_reference(plan, representation, info)
+
+        for batch in batches.values():
+            instances = batch.group_instances(list(batch.get_queryset(info)))
+            for index, values in batch.values_by_index.items():
+                results[index] = self._check_instances(batch, values, instances.get(values, []), info)
+
+        return results
 
     async def _run_async(
         self,
@@ -110,199 +300,162 @@ async def _run_async(
         representations: list[dict[str, Any]],
     ) -> list[Any]:
         await pre_evaluate_request_user(info)
-        return [await self._resolve_one_async(rep, info) for rep in representations]
 
-    def _resolve_one_sync(self, representation: dict[str, Any], info: GQLInfo) -> Any:
-        entity_cls = self._lookup(representation)
-        if entity_cls is None:
-            return None
+        results: list[Any] = [None] * len(representations)
+        batches: dict[tuple[EntityPlan, EntityKey], EntityBatch] = {}
 
-        if issubclass(entity_cls, QueryType):
-            return self._resolve_query_type_reference(entity_cls, representation, info)
+        for index, representation in enumerate(representations):
+            plan = self._lookup(representation)
+            if plan is None:
+                continue
 
-        if issubclass(entity_cls, FederationType):
-            return self._resolve_federation_type_reference(entity_cls, representation, info)
+            if plan.batched:
+                results[index] = self._add_to_batch(batches, plan, index, representation)
+                continue
 
-        msg = f"Unknown entity type: {entity_cls}"  # pragma: no cover
-        raise TypeError(msg)  # pragma: no cover
+            results[index] = await self._resolve_reference_async(plan, representation, info)
 
-    async def _resolve_one_async(self, representation: dict[str, Any], info: GQLInfo) -> Any:
-        entity_cls = self._lookup(representation)
-        if entity_cls is None:
-            return None
-
-        if issubclass(entity_cls, QueryType):
-            return await self._resolve_query_type_reference_async(entity_cls, representation, info)
+        for batch in batches.values():
+            instances = batch.group_instances([instance async for instance in batch.get_queryset(info)])
+            for index, values in batch.values_by_index.items():
+                results[index] = await self._check_instances_async(batch, values, instances.get(values, []), info)
 
-        if issubclass(entity_cls, FederationType):
-            return await self._resolve_federation_type_reference_async(entity_cls, representation, info)
+        return results
 
-        msg = f"Unknown entity type: {entity_cls}"  # pragma: no cover
-        raise TypeError(msg)  # pragma: no cover
+    def _lookup(self, representation: dict[str, Any]) -> EntityPlan | None:
+        typename = representation.get("__typename")
+        if not isinstance(typename, str):
+            return None
+        return self.ref.plans_by_typename.get(typename)
 
-    def _resolve_query_type_reference(
+    def _add_to_batch(
         self,
-        query_type: type[QueryType],
+        batches: dict[tuple[EntityPlan, EntityKey], EntityBatch],
+        plan: EntityPlan,
+        index: int,
         representation: dict[str, Any],
-        info: GQLInfo,
-    ) -> Model | Exception | None:
-        default = partial(self._default_query_type_reference_resolver, query_type)
-        resolve_reference: Callable[[dict, GQLInfo], Any] = getattr(query_type, "__resolve_reference__", default)
+    ) -> Exception | None:
+        try:
+            key = plan.find_key(representation)
+        except RuntimeError as error:
+            return error
 
         try:
-            instance = resolve_reference(representation, info)
-            if instance is None:
-                return None
+            values = key.get_values(representation)
+        except ValidationError:
+            # Values that cannot be converted for the model field can't match any row.
+            values = tuple(representation[field] for field in key.fields)
+            return key.not_found_error(plan.entity.__model__, values)  # type: ignore[union-attr]
 
-            query_type.__permissions__(instance, info)
+        batch = batches.get((plan, key))
+        if batch is None:
+            batch = batches[plan, key] = EntityBatch(plan=plan, key=key)
 
+        batch.values_by_index[index] = values
+        return None
+
+    def _check_instances(
+        self,
+        batch: EntityBatch,
+        values: tuple[Any, ...],
+        instances: list[Model],
+        info: GQLInfo,
+    ) -> Model | Exception:
+        model: type[Model] = batch.plan.entity.__model__  # type: ignore[union-attr]
+        if not instances:
+            return batch.key.not_found_error(model, values)
+        if len(instances) > 1:
+            return batch.key.multiple_found_error(model, values)
+
+        instance = instances[0]
+        try:
+            batch.plan.entity.__permissions__(instance, info)
         except Exception as error:  # noqa: BLE001
             return error
 
         return instance
 
-    async def _resolve_query_type_reference_async(
+    async def _check_instances_async(
         self,
-        query_type: type[QueryType],
-        representation: dict[str, Any],
+        batch: EntityBatch,
+        values: tuple[Any, ...],
+        instances: list[Model],
         info: GQLInfo,
-    ) -> Model | Exception | None:
-        default = partial(self._default_query_type_reference_resolver_async, query_type)
-        resolve_reference: Callable[[dict, GQLInfo], Any] = getattr(query_type, "__resolve_reference__", default)
-
+    ) -> Model | Exception:
+        model: type[Model] = batch.plan.entity.__model__  # type: ignore[union-attr]
+        if not instances:
+            return batch.key.not_found_error(model, values)
+        if len(instances) > 1:
+            return batch.key.multiple_found_error(model, values)
+
+        instance = instances[0]
         try:
-            if inspect.iscoroutinefunction(resolve_reference):
-                instance = await resolve_reference(representation, info)
-            else:
-                instance = resolve_reference(representation, info)
-
-            if instance is None:
-                return None
-
-            if inspect.iscoroutinefunction(query_type.__permissions__):
-                await query_type.__permissions__(instance, info)
+            if batch.plan.is_permissions_async:
+                await batch.plan.entity.__permissions__(instance, info)
             else:
-                query_type.__permissions__(instance, info)
-
+                batch.plan.entity.__permissions__(instance, info)
         except Exception as error:  # noqa: BLE001
             return error
 
         return instance
 
-    def _resolve_federation_type_reference(
+    def _resolve_reference(
         self,
-        federation_type: type[FederationType],
+        plan: EntityPlan,
         representation: dict[str, Any],
         info: GQLInfo,
-    ) -> FederationType | Exception | None:
-        default = partial(self._default_federation_type_reference_resolver, federation_type)
-        resolve_reference: Callable[[dict, GQLInfo], Any] = getattr(federation_type, "__resolve_reference__", default)
-
+    ) -> Model | FederationType | Exception | None:
         try:
-            instance = resolve_reference(representation, info)
+            if plan.resolve_reference is not None:
+                instance = plan.resolve_reference(representation, info)
+            else:
+                instance = self._default_federation_type_reference_resolver(plan, representation)
+
             if instance is None:
                 return None
 
-            federation_type.__permissions__(instance, info)
+            plan.entity.__permissions__(instance, info)
 
         except Exception as error:  # noqa: BLE001
             return error
 
         return instance
 
-    async def _resolve_federation_type_reference_async(
+    async def _resolve_reference_async(
         self,
-        federation_type: type[FederationType],
+        plan: EntityPlan,
         representation: dict[str, Any],
         info: GQLInfo,
-    ) -> FederationType | Exception | None:
-        default = partial(self._default_federation_type_reference_resolver, federation_type)
-        resolve_reference: Callable[[dict, GQLInfo], Any] = getattr(federation_type, "__resolve_reference__", default)
-
+    ) -> Model | FederationType | Exception | None:
         try:
-            if inspect.iscoroutinefunction(resolve_reference):
-                instance = await resolve_reference(representation, info)
+            if plan.resolve_reference is None:
+                instance = self._default_federation_type_reference_resolver(plan, representation)
+            elif plan.is_resolve_reference_async:
+                instance = await plan.resolve_reference(representation, info)
             else:
-                instance = resolve_reference(representation, info)
+                instance = plan.resolve_reference(representation, info)
 
             if instance is None:
                 return None
 
-            if inspect.iscoroutinefunction(federation_type.__permissions__):
-                await federation_type.__permissions__(instance, info)
+            if plan.is_permissions_async:
+                await plan.entity.__permissions__(instance, info)
             else:
-                federation_type.__permissions__(instance, info)
+                plan.entity.__permissions__(instance, info)
 
         except Exception as error:  # noqa: BLE001
             return error
 
         return instance
 
-    def _lookup(self, representation: dict[str, Any]) -> type[QueryType | FederationType] | None:
-        typename = representation.get("__typename")
-        if not isinstance(typename, str):
-            return None
-        return self.ref.entities_by_typename.get(typename)
-
-    def _default_query_type_reference_resolver(
-        self,
-        query_type: type[QueryType],
-        representation: dict[str, Any],
-        info: GQLInfo,
-    ) -> Model:
-        name, value = self._find_queryset_filter_pair(query_type, representation)
-        queryset = query_type.__get_queryset__(info)
-        return get_instance_by_field_or_raise(queryset=queryset, field_name=name, value=value)
-
-    async def _default_query_type_reference_resolver_async(
-        self,
-        query_type: type[QueryType],
-        representation: dict[str, Any],
-        info: GQLInfo,
-    ) -> Model:
-        name, value = self._find_queryset_filter_pair(query_type, representation)
-        queryset = query_type.__get_queryset__(info)
-        return await get_instance_by_field_or_raise_async(queryset=queryset, field_name=name, value=value)
-
     def _default_federation_type_reference_resolver(
         self,
-        federation_type: type[FederationType],
+        plan: EntityPlan,
         representation: dict[str, Any],
-        info: GQLInfo,
     ) -> FederationType:
         kwargs = {
-            field.name: representation[field.schema_name]
-            for field in federation_type.__field_map__.values()
-            if field.schema_name in representation
+            name: representation[schema_name]
+            for schema_name, name in plan.field_names.items()
+            if schema_name in representation
         }
-        return federation_type(**kwargs)
-
-    def _find_queryset_filter_pair(
-        self,
-        query_type: type[QueryType],
-        representation: dict[str, Any],
-    ) -> tuple[str, Any]:
-        key_directive = self._first_resolvable_key_directive(query_type)
-        key_field = key_directive.__parameters__["fields"]
-        key_value = representation.get(key_field)
-
-        if key_value is None:  # pragma: no cover
-            msg = f"Key field '{key_field}' not found in given representation"
-            raise RuntimeError(msg)
-
-        gen = (field.field_name for field in query_type.__field_map__.values() if field.schema_name == key_field)
-        field_name = next(gen, None)
-
-        if field_name is None:  # pragma: no cover
-            msg = f"Field '{key_field}' not found in '{query_type.__name__}'"
-            raise RuntimeError(msg)
-
-        return field_name, key_value
-
-    def _first_resolvable_key_directive(self, query_type: type[QueryType]) -> KeyDirective:
-        for directive in query_type.__directives__:
-            if isinstance(directive, KeyDirective) and directive.__parameters__["resolvable"]:
-                return directive
-
-        msg = f"No resolvable '@KeyDirective' on '{query_type.__name__}'."  # pragma: no cover
-        raise RuntimeError(msg)  # pragma: no cover
+        return plan.entity(**kwargs)  # type: ignore[call-arg]
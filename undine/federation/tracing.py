@@ -3,6 +3,7 @@
 import base64
 import dataclasses
 import json
+import random
 import time
 from inspect import isawaitable
 from typing import TYPE_CHECKING, Any
@@ -10,6 +11,8 @@
 from graphql import ExecutionResult
 
 from undine.hooks import LifecycleHook
+from undine.settings import undine_settings
+from undine.utils.graphql.utils import is_trivial_resolver
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
@@ -39,6 +42,10 @@ def _is_tracing_requested(request: DjangoRequestProtocol) -> bool:
     return request.headers.get(TRACING_HEADER_NAME) == TRACING_HEADER_VALUE
 
 
+def _is_sampled() -> bool:
+    return random.random() < undine_settings.FEDERATION_TRACING_SAMPLE_RATE  # noqa: S311
+
+
 def _require_protobuf() -> None:
     try:
         import google.protobuf.timestamp_pb2  # noqa: F401, PLC0415
@@ -56,10 +63,14 @@ class FederatedTracingHook(LifecycleHook):
     def __init__(self, context: LifecycleHookContext) -> None:
         super().__init__(context)
 
-        self.enabled: bool = _is_tracing_requested(context.request)
+        self.enabled: bool = _is_tracing_requested(context.request) and _is_sampled()
         if self.enabled:
             _require_protobuf()
 
+        self.max_nodes: int | None = undine_settings.FEDERATION_TRACING_MAX_NODES
+        self.aggregate_list_items: bool = undine_settings.FEDERATION_TRACING_AGGREGATE_LIST_ITEMS
+        self.skip_trivial_resolvers: bool = undine_settings.FEDERATION_TRACING_SKIP_TRIVIAL_RESOLVERS
+
         root_path: tuple[str | int, ...] = ()
 
         self.trace: FederationTrace = FederationTrace()
@@ -94,10 +105,20 @@ def resolve(self, resolver: GraphQLFieldResolver, root: Any, info: GQLInfo, **kw
         if not self.enabled:
             return resolver(root, info, **kwargs)
 
-        node = self._ensure_node(tuple(info.path.as_list()))
-        node.parent_type = str(info.parent_type)
-        node.type = str(info.return_type)
-        node.start_time = time.perf_counter_ns() - self.start_perf_counter_ns
+        if self.skip_trivial_resolvers and is_trivial_resolver(info):
+            return resolver(root, info, **kwargs)
+
+        path = self._get_path(info.path.as_list())
+        node = self.nodes.get(path)
+
+        if node is None:
+            if self.max_nodes is not None and len(self.nodes) + self._count_missing_nodes(path) > self.max_nodes:
+                return resolver(root, info, **kwargs)
+
+            node = self._ensure_node(path)
+            node.parent_type = str(info.parent_type)
+            node.type = str(info.return_type)
+            node.start_time = time.perf_counter_ns() - self.start_perf_counter_ns
 
         result = resolver(root, info, **kwargs)
 
@@ -107,13 +128,31 @@ async def _await_and_time() -> Any:
                 try:
                     return await result
                 finally:
-                    node.end_time = time.perf_counter_ns() - self.start_perf_counter_ns
+                    self._set_end_time(node)
 
             return _await_and_time()
 
-        node.end_time = time.perf_counter_ns() - self.start_perf_counter_ns
+        self._set_end_time(node)
         return result
 
+    def _get_path(self, path: list[str | int]) -> tuple[str | int, ...]:
+        # When aggregating, all items in a list are recorded under the node for the first item.
+        if self.aggregate_list_items:
+            return tuple(0 if isinstance(key, int) else key for key in path)
+        return tuple(path)
+
+    def _set_end_time(self, node: FederationTraceNode) -> None:
+        end_time = time.perf_counter_ns() - self.start_perf_counter_ns
+        node.end_time = max(node.end_time, end_time)
+
+    def _count_missing_nodes(self, path: tuple[str | int, ...]) -> int:
+        # Nodes for list indices are created along with the first field under them.
+        count = 0
+        while path not in self.nodes:
+            count += 1
+            path = path[:-1]
+        return count
+
     def _ensure_node(self, path: tuple[str | int, ...]) -> FederationTraceNode:
         node = self.nodes.get(path)
         if node is not None:
@@ -151,7 +190,7 @@ def _attach_trace(self) -> None:
         result.extensions = extensions
 
     def _assign_error(self, error: GraphQLError) -> None:
-        path = tuple(error.path or ())
+        path = self._get_path(error.path or [])
         node = self.nodes.get(path)
 
         while node is None and path:
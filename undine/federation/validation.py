@@ -6,7 +6,6 @@
     DirectiveVersionError,
     FederationFieldSetTooComplexError,
     FederationKeyRequiresCustomResolverError,
-    FederationMultipleKeysRequireCustomResolverError,
     FederationRequiresNonExternalFieldError,
     FederationRequiresUnknownFieldError,
     MissingFederationKeysError,
@@ -36,36 +35,7 @@ def validate_query_type_key(directive: KeyDirective, query_type: type[QueryType]
         return
 
     if directive.__parameters__["resolvable"]:
-        validate_only_one_resolvable_key_directive(query_type)
-        validate_simple_query_type_key(directive, query_type)
-
-
-def validate_only_one_resolvable_key_directive(query_type: type[QueryType]) -> None:
-    from undine.federation.directives import KeyDirective  # noqa: PLC0415
-
-    resolvable_key_count = sum(
-        1
-        for other in query_type.__directives__
-        if isinstance(other, KeyDirective) and other.__parameters__["resolvable"]
-    )
-    if resolvable_key_count != 1:
-        raise FederationMultipleKeysRequireCustomResolverError(cls=query_type)
-
-
-def validate_simple_query_type_key(directive: KeyDirective, query_type: type[QueryType]) -> None:
-    fields = directive.__parameters__["fields"]
-
-    if any(value in fields for value in ("{", ":", " ")):
-        raise FederationFieldSetTooComplexError(fields=fields, cls=query_type)
-
-    schema_name_to_field = {
-        field.schema_name or to_schema_name(name): field for (name, field) in query_type.__field_map__.items()
-    }
-
-    for token in fields.split():
-        field = schema_name_to_field.get(token)
-        if field is None:
-            raise FederationKeyRequiresCustomResolverError(fields=fields, cls=query_type, token=token)
+        validate_simple_key(directive, query_type)
 
 
 def validate_federation_type_key(directive: KeyDirective, federation_type: type[FederationType]) -> None:
@@ -73,36 +43,25 @@ def validate_federation_type_key(directive: KeyDirective, federation_type: type[
         return
 
     if directive.__parameters__["resolvable"]:
-        validate_only_one_resolvable_key_directive_federation_type(federation_type)
-        validate_simple_federation_type_key(directive, federation_type)
-
-
-def validate_only_one_resolvable_key_directive_federation_type(federation_type: type[FederationType]) -> None:
-    from undine.federation.directives import KeyDirective  # noqa: PLC0415
-
-    resolvable_key_count = sum(
-        1
-        for other in federation_type.__directives__
-        if isinstance(other, KeyDirective) and other.__parameters__["resolvable"]
-    )
-    if resolvable_key_count != 1:
-        raise FederationMultipleKeysRequireCustomResolverError(cls=federation_type)
+        validate_simple_key(directive, federation_type)
 
 
-def validate_simple_federation_type_key(directive: KeyDirective, federation_type: type[FederationType]) -> None:
+def validate_simple_key(directive: KeyDirective, cls: type[QueryType | FederationType]) -> None:
+    # Compound keys and multiple resolvable keys are supported by the default resolver,
+    # but nested selections and aliases are not.
     fields = directive.__parameters__["fields"]
 
-    if any(value in fields for value in ("{", ":", " ")):
-        raise FederationFieldSetTooComplexError(fields=fields, cls=federation_type)
+    if any(value in fields for value in ("{", ":")):
+        raise FederationFieldSetTooComplexError(fields=fields, cls=cls)
 
     schema_name_to_field = {
-        field.schema_name or to_schema_name(name): field for (name, field) in federation_type.__field_map__.items()
+        field.schema_name or to_schema_name(name): field for (name, field) in cls.__field_map__.items()
     }
 
     for token in fields.split():
         field = schema_name_to_field.get(token)
         if field is None:
-            raise FederationKeyRequiresCustomResolverError(fields=fields, cls=federation_type, token=token)
+            raise FederationKeyRequiresCustomResolverError(fields=fields, cls=cls, token=token)
 
 
 def validate_federation_field_requires(directive: RequiresDirective, field: FederationField) -> None:
@@ -36,7 +36,13 @@
 from undine.settings import undine_settings
 from undine.typing import ManyMatch, TModels
 from undine.utils.graphql.type_registry import get_or_create_graphql_input_object_type
-from undine.utils.model_utils import get_model_field, get_model_fields_for_graphql, is_to_many, lookup_to_display_name
+from undine.utils.model_utils import (
+    ExistsFilter,
+    get_model_field,
+    get_model_fields_for_graphql,
+    is_to_many,
+    lookup_to_display_name,
+)
 from undine.utils.reflection import (
     FunctionEqualityWrapper,
     cache_signature_if_function,
@@ -49,7 +55,7 @@
 if TYPE_CHECKING:
     from collections.abc import Callable, Container, Iterable
 
-    from django.db.models import Model, QuerySet
+    from django.db.models import Model, OrderBy, QuerySet
     from graphql import GraphQLFieldResolver, GraphQLInputObjectType, GraphQLInputType
 
     from undine import InterfaceType, QueryType, UnionType
@@ -57,6 +63,8 @@
         DjangoExpression,
         DjangoRequestProtocol,
         FilterAliasesFunc,
+        FilterLimitFunc,
+        FilterOrderByFunc,
         FilterParams,
         FilterSetParams,
         GQLInfo,
@@ -78,6 +86,7 @@ class FilterSetMeta(type):
     __models__: tuple[type[Model], ...]
     __filter_map__: dict[str, Filter]
     __schema_name__: str
+    __exists_subqueries__: bool
     __directives__: DirectiveList
     __extensions__: dict[str, Any]
     __attribute_docstrings__: dict[str, str]
@@ -114,6 +123,7 @@ def __new__(
         filterset.__models__ = models
         filterset.__filter_map__ = get_members(filterset, Filter)
         filterset.__schema_name__ = kwargs.get("schema_name", _name)
+        filterset.__exists_subqueries__ = kwargs.get("exists_subqueries", undine_settings.FILTER_EXISTS_SUBQUERIES)
         filterset.__attribute_docstrings__ = parse_class_attribute_docstrings(filterset)
 
         directives = kwargs.get("directives", [])
@@ -164,66 +174,128 @@ def __call__(cls, ref: T) -> T:
 
         return ref
 
-    def __build__(cls, filter_data: dict[str, Any], info: GQLInfo) -> FilterResults:
+    def __build__(  # noqa: C901, PLR0912, PLR0914, PLR0915
+        cls,
+        filter_data: dict[str, Any],
+        info: GQLInfo,
+        *,
+        exists_filters: list[Q] | None = None,
+    ) -> FilterResults:
         """
         Build a list of 'Q' expression from the given filter data to apply to the queryset.
-        Also indicate if 'queryset.distinct()' is needed, what aliases are required,
+        Also indicate if 'queryset.distinct()' is needed, what aliases and ordering are required,
         or if the filtering should result in an empty queryset.
 
         :param filter_data: The input filter data.
         :param info: The GraphQL resolve info for the request.
+        :param exists_filters: If the `FilterSet` uses EXISTS subqueries, filters that require 'queryset.distinct()'
+                               are added to this list instead, so that the caller can combine them into a subquery.
+                               If not given, the subquery is added to the returned filters.
         """
         filters: list[Q] = []
         distinct: bool = False
         aliases: dict[str, DjangoExpression] = {}
+        order_by: list[OrderBy] = []
+        limits: list[int] = []
         none: bool = False
         filter_count: int = 0
 
+        use_exists = cls.__exists_subqueries__
+        build_exists = exists_filters is None
+        if exists_filters is None:
+            exists_filters = []
+        exists_aliases: dict[str, DjangoExpression] = {}
+
         try:
             for filter_name, filter_value in filter_data.items():
                 if filter_name == "NOT":
                     if not filter_value:
                         continue
 
-                    results = cls.__build__(filter_value, info)
+                    nested_exists: list[Q] = []
+                    results = cls.__build__(filter_value, info, exists_filters=nested_exists)
                     distinct |= results.distinct
                     aliases |= results.aliases
+                    exists_aliases |= results.aliases
                     filter_count += results.filter_count
                     filters.extend(~frt for frt in results.filters)
+                    filters.extend(~ExistsFilter(frt, aliases=results.aliases or None) for frt in nested_exists)
 
                 elif filter_name in {"AND", "OR", "XOR"}:
                     if not filter_value:
                         continue
 
-                    results = cls.__build__(filter_value, info)
+                    nested_exists = []
+                    results = cls.__build__(filter_value, info, exists_filters=nested_exists)
                     distinct |= results.distinct
                     aliases |= results.aliases
+                    exists_aliases |= results.aliases
+                    order_by.extend(results.order_by)
+                    if results.limit is not None:
+                        limits.append(results.limit)
                     filter_count += results.filter_count
                     func = op.and_ if filter_name == "AND" else op.or_ if filter_name == "OR" else op.xor
-                    filters.append(reduce(func, results.filters, Q()))
+
+                    # Conditions in an `AND` block must match the same related objects as the other conditions
+                    # on this level, while conditions in other blocks are combined into a subquery of their own.
+                    block_filters = list(results.filters)
+                    if filter_name == "AND":
+                        exists_filters.extend(nested_exists)
+                    elif nested_exists:
+                        condition = reduce(func, nested_exists, Q())
+                        block_filters.append(ExistsFilter(condition, aliases=results.aliases or None))
+
+                    filters.append(reduce(func, block_filters, Q()))
 
                 else:
                     ftr = cls.__filter_map__[filter_name]
                     if filter_value in ftr.empty_values:
                         continue
 
-                    distinct |= ftr.distinct
                     if ftr.aliases_func is not None:
-                        aliases |= ftr.aliases_func(ftr, info, value=filter_value)
+                        filter_aliases = ftr.aliases_func(ftr, info, value=filter_value)
+                        aliases |= filter_aliases
+                        exists_aliases |= filter_aliases
+                    if ftr.order_by_func is not None:
+                        order_by.extend(ftr.order_by_func(ftr, info, value=filter_value))
+                    if ftr.limit_func is not None:
+                        limit = ftr.limit_func(ftr, info, value=filter_value)
+                        if limit is not None:
+                            limits.append(limit)
 
                     if ftr.many:
-                        conditions = (ftr.get_expression(value, info) for value in filter_value)
-                        filter_expression = reduce(ftr.match.operator, conditions, Q())
+                        filter_expression = ftr.get_many_expression(filter_value, info)
                     else:
                         filter_expression = ftr.get_expression(filter_value, info)
 
-                    filters.append(filter_expression)
                     filter_count += 1
 
+                    # Filters that would require `queryset.distinct()` are applied in an EXISTS subquery.
+                    # All conditions on the same level are applied in the same subquery, so that conditions
+                    # for the same to-many relation must match the same related object, like they would
+                    # when applied in the same `queryset.filter()` call.
+                    if ftr.distinct and use_exists:
+                        exists_filters.append(filter_expression)
+                        continue
+
+                    distinct |= ftr.distinct
+                    filters.append(filter_expression)
+
         except EmptyFilterResult:
             none = True
 
-        return FilterResults(filters=filters, aliases=aliases, distinct=distinct, none=none, filter_count=filter_count)
+        if build_exists and exists_filters:
+            filters.append(ExistsFilter(*exists_filters, aliases=exists_aliases or None))
+
+        return FilterResults(
+            filters=filters,
+            aliases=aliases,
+            distinct=distinct,
+            none=none,
+            filter_count=filter_count,
+            order_by=order_by,
+            limit=min(limits, default=None),
+        )
 
     def __input_type__(cls) -> GraphQLInputObjectType:
         """
@@ -322,6 +394,9 @@ class FilterSet(Generic[*TModels], metaclass=FilterSetMeta):
     `schema_name: str = <class name>`
         Override the name for the `InputObjectType` for this `FilterSet` in the GraphQL schema.
 
+    `exists_subqueries: bool = <FILTER_EXISTS_SUBQUERIES setting>`
+        Whether to apply `Filters` that require `queryset.distinct()` using an EXISTS subquery instead.
+
     `directives: list[Directive] = []`
         `Directives` to add to the created `InputObjectType`.
 
@@ -338,6 +413,7 @@ class FilterSet(Generic[*TModels], metaclass=FilterSetMeta):
     __models__: ClassVar[tuple[type[Model], ...]]
     __filter_map__: ClassVar[dict[str, Filter]]
     __schema_name__: ClassVar[str]
+    __exists_subqueries__: ClassVar[bool]
     __directives__: ClassVar[DirectiveList]
     __extensions__: ClassVar[dict[str, Any]]
     __attribute_docstrings__: ClassVar[dict[str, str]]
@@ -406,6 +482,8 @@ def __init__(self, ref: Any = None, **kwargs: Unpack[FilterParams]) -> None:
         self.extensions[undine_settings.FILTER_EXTENSIONS_KEY] = self
 
         self.aliases_func: FilterAliasesFunc | None = None
+        self.order_by_func: FilterOrderByFunc | None = None
+        self.limit_func: FilterLimitFunc | None = None
         self.visible_func: VisibilityFunc | None = None
 
     def __connect__(self, filterset: type[FilterSet], name: str) -> None:
@@ -445,6 +523,29 @@ def __str__(self) -> str:
     def get_expression(self, value: Any, info: GQLInfo) -> Q:
         return self.resolver(self, info, value=value)
 
+    def get_many_expression(self, values: list[Any], info: GQLInfo) -> Q:
+        """
+        Get the expression for filtering with the values of a `many` filter.
+
+        If the filter should match any of the values, and the values are compared to a model field
+        with the `exact` or `in` lookup, use a single `in` lookup instead of a condition for each value,
+        which would be slow to compile for large number of values, and for the database to plan.
+        """
+        from undine.resolvers import FilterModelFieldResolver  # noqa: PLC0415
+
+        if values and self.match == ManyMatch.any and isinstance(self.resolver, FilterModelFieldResolver):
+            field_path, _, lookup = self.resolver.lookup.rpartition(LOOKUP_SEP)
+
+            # `exact` lookup with `None` checks for `NULL`, which `in` lookup ignores.
+            if lookup == "exact" and field_path and None not in values:
+                return Q(**{f"{field_path}{LOOKUP_SEP}in": values})
+
+            if lookup == "in" and field_path:
+                return Q(**{self.resolver.lookup: list(itertools.chain.from_iterable(values))})
+
+        conditions = (self.get_expression(value, info) for value in values)
+        return reduce(self.match.operator, conditions, Q())
+
     def as_graphql_input_field(self) -> GraphQLInputField:
         return GraphQLInputField(
             type_=self.get_field_type(),
@@ -5,20 +5,35 @@
 import json
 import time
 from abc import ABC, abstractmethod
-from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager, nullcontext
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Self
 
 from django.core.cache import caches
 from django.db import transaction  # noqa: ICN003
 from django.utils.connection import ConnectionProxy
-from graphql import ExecutionResult, GraphQLError, OperationType
+from graphql import ExecutionResult, GraphQLError, OperationType, print_ast
 
-from undine.exceptions import GraphQLAPQHashInvalidError, GraphQLAsyncAtomicMutationNotSupportedError
+from undine.exceptions import (
+    GraphQLAPQHashInvalidError,
+    GraphQLAsyncAtomicMutationNotSupportedError,
+    GraphQLQueryCostBudgetExceededError,
+    GraphQLQueryCostTooHighError,
+)
+from undine.http.responses import SerializedExecutionResult
 from undine.parsers import GraphQLRequestParamsParser
 from undine.settings import undine_settings
 from undine.typing import CacheKeyData, ResultCacheData, VisibilityCacheData
-from undine.utils.graphql.caching import RequestCacheCalculator
+from undine.utils.graphql.caching import (
+    RequestCacheCalculator,
+    get_model_versions,
+    get_model_versions_async,
+    single_flight,
+    single_flight_async,
+    track_model_versions,
+)
+from undine.utils.graphql.cost import QueryCostCalculator, consume_cost_budget, consume_cost_budget_async
+from undine.utils.graphql.introspection import get_schema_fingerprint, is_introspection_operation
 from undine.utils.graphql.utils import (
     get_error_execution_result,
     get_fragment_definitions,
@@ -26,16 +41,18 @@
     is_atomic_mutation,
 )
 from undine.utils.reflection import delegate_to_subgenerator
+from undine.utils.visibility import get_request_schema, is_audience_schema
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+    from contextlib import AbstractContextManager
 
     from django.contrib.auth.models import AbstractUser, AnonymousUser
     from django.core.cache import BaseCache
-    from graphql import DocumentNode, GraphQLFieldResolver
+    from graphql import DocumentNode, GraphQLFieldResolver, OperationDefinitionNode
     from graphql.pyutils import AwaitableOrValue
 
-    from undine.dataclasses import CacheControlResults, GraphQLHttpParams
+    from undine.dataclasses import CacheControlResults, GraphQLHttpParams, PersistedDocumentData
     from undine.typing import DjangoRequestProtocol, GQLInfo, GraphQLResult, GraphQLStream, T
 
 __all__ = [
@@ -48,6 +65,10 @@
 ]
 
 
+QUERY_COST_EXTENSION_KEY: str = "cost"
+"""Key under GraphQL response `extensions` where `QueryCostHook` writes the cost of the operation."""
+
+
 @dataclasses.dataclass(kw_only=True)
 class LifecycleHookContext:
     """Context passed to a lifecycle hook."""
@@ -73,22 +94,41 @@ class LifecycleHookContext:
     result: AwaitableOrValue[GraphQLResult | GraphQLStream] | None
     """Execution result of the GraphQL operation. Adding a result here will cause an early exit."""
 
+    persisted_document: PersistedDocumentData | None = None
+    """Precompiled persisted document, if the operation is executed using a cached persisted document."""
+
     lifecycle_hooks: list[LifecycleHook] = dataclasses.field(init=False)
     """Lifecycle hooks for this operation."""
 
     def __post_init__(self) -> None:
         self.lifecycle_hooks = [hook(context=self) for hook in undine_settings.LIFECYCLE_HOOKS]
 
+    @property
+    def precompiled_document(self) -> PersistedDocumentData | None:
+        """The precompiled persisted document, if it can be used for the current document and schema."""
+        if self.persisted_document is None:
+            return None
+
+        # A hook could have replaced the document during parsing.
+        if self.document is None or self.document is not self.persisted_document.document_node:
+            return None
+
+        if not self.persisted_document.is_precompiled(undine_settings.SCHEMA):
+            return None
+
+        return self.persisted_document
+
     @classmethod
     def from_graphql_params(cls, params: GraphQLHttpParams, request: DjangoRequestProtocol) -> Self:
         return cls(
             source=params.document,
-            document=None,
+            document=params.persisted_document.document_node if params.persisted_document else None,
             variables=params.variables,
             operation_name=params.operation_name,
             extensions=params.extensions,
             request=request,
             result=None,
+            persisted_document=params.persisted_document,
         )
 
 
@@ -185,7 +225,7 @@ def on_execution(self) -> Generator[None, None, None]:
             yield
             return
 
-        atomic = transaction.atomic()
+        atomic = transaction.atomic(using=undine_settings.DATABASE_PRIMARY_ALIAS)
         atomic.__enter__()  # noqa: PLC2801
         try:
             yield
@@ -239,8 +279,7 @@ def on_execution(self) -> Generator[None, None, None]:
             yield
             return
 
-        fragments = get_fragment_definitions(self.context.document)  # type: ignore[arg-type]
-        cache_results = RequestCacheCalculator(operation, fragments).run()
+        cache_results = self.get_cache_control_results(operation)
 
         if cache_results.cache_time <= 0:
             yield
@@ -249,28 +288,48 @@ def on_execution(self) -> Generator[None, None, None]:
         user = self.context.request.user
         key = self.get_cache_key(user, cache_per_user=cache_results.cache_per_user)
 
-        if undine_settings.REQUEST_CACHE_READ_PREDICATE(self.context):
+        read_from_cache = undine_settings.REQUEST_CACHE_READ_PREDICATE(self.context)
+        revalidate = False
+
+        if read_from_cache:
             data: ResultCacheData | None = self.cache.get(key)
 
-            if data is not None:
-                self.context.result = data["result"]
-                self.set_cache_read_headers(cache_results, data)
-                yield
-                return
+            if data is not None and self.is_up_to_date(data):
+                # Stale results are returned while a single request refreshes the cache.
+                revalidate = self.is_stale(data, cache_results) and self.cache.add(
+                    self.get_revalidation_key(key),
+                    True,  # noqa: FBT003
+                    cache_results.cache_time,
+                )
+                if not revalidate:
+                    self.context.result = data["result"]
+                    self.set_cache_read_headers(cache_results, data)
+                    yield
+                    return
+
+        # Only coalesce identical operations if their results can be read from the cache.
+        coalesce = single_flight(key) if read_from_cache else nullcontext(enter_result=True)
 
-        yield
+        try:
+            with coalesce as is_leader:
+                # If an identical operation was just executed in this process, its result should be in the cache.
+                if not is_leader:
+                    data = self.cache.get(key)
 
-        if not isinstance(self.context.result, ExecutionResult):
-            return
+                    if data is not None and self.is_up_to_date(data):
+                        self.context.result = data["result"]
+                        self.set_cache_read_headers(cache_results, data)
+                        yield
+                        return
 
-        # Never cache errors since they can result from something transient (e.g. a connection error)
-        if self.context.result.errors:
-            return
+                with self.track_model_versions() as versions:
+                    yield
 
-        if undine_settings.REQUEST_CACHE_WRITE_PREDICATE(self.context):
-            data = ResultCacheData(result=self.context.result, created_at=int(time.time()))
-            self.cache.set(key, data, cache_results.cache_time)
-            self.set_cache_write_headers(cache_results)
+                self.write_to_cache(key, cache_results, versions)
+
+        finally:
+            if revalidate:
+                self.cache.delete(self.get_revalidation_key(key))
 
     async def on_execution_async(self) -> AsyncGenerator[None, None]:
         # We need a separate async version for caching and fetching the request user.
@@ -280,8 +339,7 @@ async def on_execution_async(self) -> AsyncGenerator[None, None]:
             yield
             return
 
-        fragments = get_fragment_definitions(self.context.document)  # type: ignore[arg-type]
-        cache_results = RequestCacheCalculator(operation, fragments).run()
+        cache_results = self.get_cache_control_results(operation)
 
         if cache_results.cache_time <= 0:
             yield
@@ -290,28 +348,128 @@ async def on_execution_async(self) -> AsyncGenerator[None, None]:
         user = await self.context.request.auser()
         key = self.get_cache_key(user, cache_per_user=cache_results.cache_per_user)
 
-        if undine_settings.REQUEST_CACHE_READ_PREDICATE(self.context):
+        read_from_cache = undine_settings.REQUEST_CACHE_READ_PREDICATE(self.context)
+        revalidate = False
+
+        if read_from_cache:
             data: ResultCacheData | None = await self.cache.aget(key)
 
-            if data is not None:
-                self.context.result = data["result"]
-                self.set_cache_read_headers(cache_results, data)
-                yield
-                return
+            if data is not None and await self.is_up_to_date_async(data):
+                # Stale results are returned while a single request refreshes the cache.
+                revalidate = self.is_stale(data, cache_results) and await self.cache.aadd(
+                    self.get_revalidation_key(key),
+                    True,  # noqa: FBT003
+                    cache_results.cache_time,
+                )
+                if not revalidate:
+                    self.context.result = data["result"]
+                    self.set_cache_read_headers(cache_results, data)
+                    yield
+                    return
+
+        # Only coalesce identical operations if their results can be read from the cache.
+        coalesce = single_flight_async(key) if read_from_cache else nullcontext(enter_result=True)
 
-        yield
+        try:
+            async with coalesce as is_leader:
+                # If an identical operation was just executed in this process, its result should be in the cache.
+                if not is_leader:
+                    data = await self.cache.aget(key)
+
+                    if data is not None and await self.is_up_to_date_async(data):
+                        self.context.result = data["result"]
+                        self.set_cache_read_headers(cache_results, data)
+                        yield
+                        return
+
+                with self.track_model_versions() as versions:
+                    yield
+
+                await self.write_to_cache_async(key, cache_results, versions)
 
+        finally:
+            if revalidate:
+                await self.cache.adelete(self.get_revalidation_key(key))
+
+    def write_to_cache(
+        self, key: str, cache_results: CacheControlResults, versions: dict[str, int | None] | None
+    ) -> None:
+        data = self.get_cache_data(versions)
+        if data is not None:
+            timeout = cache_results.cache_time + undine_settings.REQUEST_CACHE_STALE_WHILE_REVALIDATE
+            self.cache.set(key, data, timeout)
+            self.set_cache_write_headers(cache_results)
+
+    async def write_to_cache_async(
+        self,
+        key: str,
+        cache_results: CacheControlResults,
+        versions: dict[str, int | None] | None,
+    ) -> None:
+        data = self.get_cache_data(versions)
+        if data is not None:
+            timeout = cache_results.cache_time + undine_settings.REQUEST_CACHE_STALE_WHILE_REVALIDATE
+            await self.cache.aset(key, data, timeout)
+            self.set_cache_write_headers(cache_results)
+
+    def get_cache_data(self, versions: dict[str, int | None] | None) -> ResultCacheData | None:
         if not isinstance(self.context.result, ExecutionResult):
-            return
+            return None
 
         # Never cache errors since they can result from something transient (e.g. a connection error)
         if self.context.result.errors:
-            return
+            return None
 
-        if undine_settings.REQUEST_CACHE_WRITE_PREDICATE(self.context):
-            data = ResultCacheData(result=self.context.result, created_at=int(time.time()))
-            await self.cache.aset(key, data, cache_results.cache_time)
-            self.set_cache_write_headers(cache_results)
+        if not undine_settings.REQUEST_CACHE_WRITE_PREDICATE(self.context):
+            return None
+
+        # A model version that was never looked up means that we can't tell if the result is up to date.
+        if versions is not None and None in versions.values():
+            return None
+
+        data = ResultCacheData(result=self.context.result, created_at=int(time.time()))
+        if versions is not None:
+            data["versions"] = versions  # type: ignore[typeddict-item]
+        return data
+
+    def is_stale(self, data: ResultCacheData, cache_results: CacheControlResults) -> bool:
+        """Check if the cached result is past its cache time, but can still be returned while it is refreshed."""
+        if undine_settings.REQUEST_CACHE_STALE_WHILE_REVALIDATE <= 0:
+            return False
+        return int(time.time()) - data["created_at"] >= cache_results.cache_time
+
+    def get_revalidation_key(self, key: str) -> str:
+        return f"{key}:revalidate"
+
+    def track_model_versions(self) -> AbstractContextManager[dict[str, int | None] | None]:
+        if not undine_settings.REQUEST_CACHE_INVALIDATION:
+            return nullcontext()
+        return track_model_versions()
+
+    def is_up_to_date(self, data: ResultCacheData) -> bool:
+        """Check that none of the models fetched for the cached result have changed since it was cached."""
+        versions = data.get("versions")
+        if versions is None or not undine_settings.REQUEST_CACHE_INVALIDATION:
+            return True
+        return get_model_versions(list(versions)) == versions
+
+    async def is_up_to_date_async(self, data: ResultCacheData) -> bool:
+        """Check that none of the models fetched for the cached result have changed since it was cached."""
+        versions = data.get("versions")
+        if versions is None or not undine_settings.REQUEST_CACHE_INVALIDATION:
+            return True
+        return await get_model_versions_async(list(versions)) == versions
+
+    def get_cache_control_results(self, operation: OperationDefinitionNode) -> CacheControlResults:
+        precompiled = self.context.precompiled_document
+        if precompiled is not None:
+            operation_name = operation.name.value if operation.name else None
+            cache_results = precompiled.cache_control.get(operation_name)
+            if cache_results is not None:
+                return cache_results
+
+        fragments = get_fragment_definitions(self.context.document)  # type: ignore[arg-type]
+        return RequestCacheCalculator(operation, fragments).run()
 
     def set_cache_read_headers(self, cache_results: CacheControlResults, data: ResultCacheData) -> None:
         self.context.request.response_headers["Cache-Control"] = cache_results.to_cache_control_header()
@@ -419,6 +577,181 @@ def get_cache_key(self, user: AbstractUser | AnonymousUser) -> str:
         return f"{undine_settings.VISIBILITY_CACHE_PREFIX}:{key}"
 
 
+class IntrospectionCacheHook(LifecycleHook):
+    """
+    Hook for caching the responses of operations that only query introspection fields.
+
+    Responses are cached as serialized JSON, keyed by a fingerprint of the schema and the normalized
+    document, so a cache hit skips execution and serialization entirely. Changes to the schema
+    result in a different fingerprint, so stale responses are never returned.
+    """
+
+    @property
+    def cache(self) -> BaseCache:
+        return ConnectionProxy(caches, undine_settings.INTROSPECTION_CACHE_ALIAS)  # type: ignore[return-value]
+
+    def on_execution(self) -> Generator[None, None, None]:
+        key = self.get_cache_key()
+        if key is None:
+            yield
+            return
+
+        content: bytes | None = self.cache.get(key)
+        if content is not None:
+            self.context.result = SerializedExecutionResult(content)
+            yield
+            return
+
+        yield
+
+        content = self.serialize_result()
+        if content is not None:
+            self.cache.set(key, content, undine_settings.INTROSPECTION_CACHE_TIMEOUT)
+
+    async def on_execution_async(self) -> AsyncGenerator[None, None]:
+        key = self.get_cache_key()
+        if key is None:
+            yield
+            return
+
+        content: bytes | None = await self.cache.aget(key)
+        if content is not None:
+            self.context.result = SerializedExecutionResult(content)
+            yield
+            return
+
+        yield
+
+        content = self.serialize_result()
+        if content is not None:
+            await self.cache.aset(key, content, undine_settings.INTROSPECTION_CACHE_TIMEOUT)
+
+    def get_cache_key(self) -> str | None:
+        """Get the cache key for the operation, or `None` if the operation should not be cached."""
+        if undine_settings.INTROSPECTION_CACHE_TIMEOUT <= 0:
+            return None
+
+        # Another hook has already set the result.
+        if self.context.result is not None:
+            return None
+
+        schema = get_request_schema(self.context.request)
+
+        # Introspection results depend on the user if visibility is checked separately for each request.
+        if schema.extensions.get(undine_settings.VISIBILITY_ACTIVE_EXTENSIONS_KEY, False) and not is_audience_schema(
+            schema
+        ):
+            return None
+
+        document: DocumentNode = self.context.document  # type: ignore[assignment]
+        operation = get_operation_definition(document, self.context.operation_name)
+        if operation.operation != OperationType.QUERY:
+            return None
+
+        fragments = get_fragment_definitions(document)
+        if not is_introspection_operation(operation, fragments):
+            return None
+
+        key_data = {
+            "schema": get_schema_fingerprint(schema),
+            "document": print_ast(document),
+            "operation_name": self.context.operation_name,
+            "variables": self.context.variables,
+        }
+
+        key = hashlib.sha256(json.dumps(key_data, separators=(",", ":"), sort_keys=True).encode()).hexdigest()
+        return f"{undine_settings.INTROSPECTION_CACHE_PREFIX}:{key}"
+
+    def serialize_result(self) -> bytes | None:
+        result = self.context.result
+        if not isinstance(result, ExecutionResult) or result.errors:
+            return None
+
+        if isinstance(result, SerializedExecutionResult) and result.content is not None:
+            return result.content
+
+        return json.dumps(result.formatted, separators=(",", ":")).encode()
+
+
+class QueryCostHook(LifecycleHook):
+    """
+    Hook for calculating the cost of operations based on the number of objects they can fetch.
+    Rejects operations whose cost exceeds the maximum cost, or the remaining cost budget of the client.
+    """
+
+    def __init__(self, context: LifecycleHookContext) -> None:
+        super().__init__(context)
+
+        self.cost: int = 0
+        self.remaining_budget: float | None = None
+
+    def on_execution(self) -> Generator[None, None, None]:
+        self.cost = self.calculate_cost()
+
+        error = self.check_max_cost()
+        if error is None and undine_settings.QUERY_COST_BUDGET is not None:
+            identifier = self.get_budget_identifier(self.context.request.user)
+            allowed, self.remaining_budget = consume_cost_budget(identifier, self.cost)
+            if not allowed:
+                error = GraphQLQueryCostBudgetExceededError(cost=self.cost, remaining=int(self.remaining_budget))
+
+        if error is not None:
+            self.context.result = get_error_execution_result(error)
+
+        yield
+        self.add_cost_extensions()
+
+    async def on_execution_async(self) -> AsyncGenerator[None, None]:
+        # Separate async version for fetching the request user and using the cache.
+        self.cost = self.calculate_cost()
+
+        error = self.check_max_cost()
+        if error is None and undine_settings.QUERY_COST_BUDGET is not None:
+            identifier = self.get_budget_identifier(await self.context.request.auser())
+            allowed, self.remaining_budget = await consume_cost_budget_async(identifier, self.cost)
+            if not allowed:
+                error = GraphQLQueryCostBudgetExceededError(cost=self.cost, remaining=int(self.remaining_budget))
+
+        if error is not None:
+            self.context.result = get_error_execution_result(error)
+
+        yield
+        self.add_cost_extensions()
+
+    def calculate_cost(self) -> int:
+        operation = get_operation_definition(self.context.document, self.context.operation_name)  # type: ignore[arg-type]
+        fragments = get_fragment_definitions(self.context.document)  # type: ignore[arg-type]
+        return QueryCostCalculator(operation, fragments, self.context.variables).run()
+
+    def check_max_cost(self) -> GraphQLError | None:
+        max_cost = undine_settings.MAX_QUERY_COST
+        if max_cost is not None and self.cost > max_cost:
+            return GraphQLQueryCostTooHighError(cost=self.cost, max_cost=max_cost)
+        return None
+
+    def get_budget_identifier(self, user: AbstractUser | AnonymousUser) -> str:
+        """Identifies the client whose cost budget the operation is consumed from."""
+        if user.is_authenticated:
+            return f"user:{user.pk}"
+        return f"ip:{self.context.request.META.get('REMOTE_ADDR', '')}"
+
+    def add_cost_extensions(self) -> None:
+        if not undine_settings.QUERY_COST_RESPONSE_EXTENSIONS:
+            return
+
+        result = self.context.result
+        if not isinstance(result, ExecutionResult):
+            return
+
+        data: dict[str, Any] = {"requested": self.cost}
+        if self.remaining_budget is not None:
+            data["remainingBudget"] = int(self.remaining_budget)
+
+        extensions = dict(result.extensions) if result.extensions else {}
+        extensions[QUERY_COST_EXTENSION_KEY] = data
+        result.extensions = extensions
+
+
 class AutomaticPersistedQueriesHook(LifecycleHook):
     """Hook for saving automatic persisted queries."""
 
@@ -439,7 +772,7 @@ def on_execution(self) -> Generator[None, None, None]:
             yield
             return
 
-        from undine.persisted_documents.models import PersistedDocument  # noqa: PLC0415
+        from undine.persisted_documents.apq import automatic_persisted_query_writer  # noqa: PLC0415
         from undine.persisted_documents.utils import to_document_id  # noqa: PLC0415
 
         document_id = to_document_id(self.context.source)
@@ -448,10 +781,7 @@ def on_execution(self) -> Generator[None, None, None]:
             yield
             return
 
-        PersistedDocument.objects.update_or_create(
-            document_id=document_id,
-            defaults={"document": self.context.source},
-        )
+        automatic_persisted_query_writer.save(document_id, self.context.source)
 
         yield
 
@@ -472,7 +802,7 @@ async def on_execution_async(self) -> AsyncGenerator[None, None]:
             yield
             return
 
-        from undine.persisted_documents.models import PersistedDocument  # noqa: PLC0415
+        from undine.persisted_documents.apq import automatic_persisted_query_writer  # noqa: PLC0415
         from undine.persisted_documents.utils import to_document_id  # noqa: PLC0415
 
         document_id = to_document_id(self.context.source)
@@ -481,10 +811,7 @@ async def on_execution_async(self) -> AsyncGenerator[None, None]:
             yield
             return
 
-        await PersistedDocument.objects.aupdate_or_create(
-            document_id=document_id,
-            defaults={"document": self.context.source},
-        )
+        await automatic_persisted_query_writer.asave(document_id, self.context.source)
 
         yield
 
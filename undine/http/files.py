@@ -11,13 +11,28 @@
 from typing import TYPE_CHECKING, Any
 
 from django.core.files import File
+from django.core.files.uploadhandler import FileUploadHandler
 
-from undine.exceptions import GraphQLFileNotFoundError, GraphQLFilePlacingError
+from undine.exceptions import (
+    GraphQLFileNotFoundError,
+    GraphQLFilePlacingError,
+    GraphQLFileTooLargeError,
+    GraphQLFileUploadTooLargeError,
+    GraphQLUnexpectedFileError,
+)
+from undine.settings import undine_settings
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.core.files.uploadedfile import UploadedFile
+    from django.http import HttpRequest
+    from django.http.multipartparser import MultiPartParser
 
 __all__ = [
+    "GraphQLFileUploadHandler",
+    "check_files_map",
+    "check_uploaded_files",
     "extract_files",
     "place_files",
 ]
@@ -112,11 +127,19 @@ def place_files(operations: dict[str, Any], files_map: dict[str, list[str]], fil
             raise GraphQLFileNotFoundError(key=key)
 
         for value in values:
-            _place_file(file, value, operations)
+            data, data_key = _find_file_location(value, operations)
+            data[data_key] = file
+
+
+def check_files_map(operations: dict[str, Any], files_map: dict[str, list[str]]) -> None:
+    """Check that all paths in the files map lead to null values in the given operations."""
+    for values in files_map.values():
+        for value in values:
+            _find_file_location(value, operations)
 
 
-def _place_file(file: UploadedFile, value: str, operations: dict[str, Any] | list[Any]) -> None:
-    """Handle placing a single file to a single path in the `operations` object."""
+def _find_file_location(value: str, operations: dict[str, Any] | list[Any]) -> tuple[Any, str | int]:
+    """Find the object and key where a file should be placed for a single path in the `operations` object."""
     path: list[str] = value.split(".")
 
     data: Any = operations
@@ -144,4 +167,75 @@ def _place_file(file: UploadedFile, value: str, operations: dict[str, Any] | lis
         if nested_data is not None:
             raise GraphQLFilePlacingError(value=value)
 
-        data[key] = file
+        return data, key
+
+    raise GraphQLFilePlacingError(value=value)  # pragma: no cover
+
+
+def check_uploaded_files(files: Iterable[UploadedFile]) -> None:
+    """Check that the given uploaded files don't exceed the file upload size limits."""
+    total_size = 0
+    for file in files:
+        total_size += file.size or 0
+        _check_upload_size(file.name or "", file_size=file.size or 0, total_size=total_size)
+
+
+def _check_upload_size(name: str, *, file_size: int, total_size: int) -> None:
+    max_file_size = undine_settings.FILE_UPLOAD_MAX_FILE_SIZE
+    if max_file_size is not None and file_size > max_file_size:
+        raise GraphQLFileTooLargeError(name=name, max_size=max_file_size)
+
+    max_total_size = undine_settings.FILE_UPLOAD_MAX_TOTAL_SIZE
+    if max_total_size is not None and total_size > max_total_size:
+        raise GraphQLFileUploadTooLargeError(max_size=max_total_size)
+
+
+class GraphQLFileUploadHandler(FileUploadHandler):
+    """
+    Upload handler that checks the file upload size limits while the request body is being read.
+    Should be the first upload handler, so that data exceeding the limits is not passed to other handlers.
+
+    If `parser` is set, also checks that the files map is valid when the first file is encountered.
+    This way invalid requests are rejected before the files are read, since the GraphQL multipart
+    request specification requires the `operations` and `map` fields to come before any files.
+    """
+
+    def __init__(self, request: HttpRequest | None = None) -> None:
+        super().__init__(request)
+        self.parser: MultiPartParser | None = None
+        self.files_map: dict[str, list[str]] | None = None
+        self.file_size: int = 0
+        self.total_size: int = 0
+
+    def new_file(self, field_name: str, file_name: str, *args: Any, **kwargs: Any) -> None:
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self.file_size = 0
+
+        # Reject files that declare a size over the limit before reading them.
+        if self.content_length is not None:
+            _check_upload_size(file_name, file_size=self.content_length, total_size=self.total_size)
+
+        if self.parser is not None:
+            self.check_files_map(field_name)
+
+    def check_files_map(self, field_name: str) -> None:
+        if self.files_map is None:
+            from undine.parsers import GraphQLRequestParamsParser  # noqa: PLC0415
+
+            # Fields parsed before the first file.
+            post_data = self.parser._post.dict()  # type: ignore[union-attr]  # noqa: SLF001
+            operations = GraphQLRequestParamsParser.get_operations(post_data)
+            self.files_map = GraphQLRequestParamsParser.get_map(post_data)
+            check_files_map(operations, self.files_map)
+
+        if field_name not in self.files_map:
+            raise GraphQLUnexpectedFileError(key=field_name)
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes:
+        self.file_size += len(raw_data)
+        self.total_size += len(raw_data)
+        _check_upload_size(self.file_name or "", file_size=self.file_size, total_size=self.total_size)
+        return raw_data
+
+    def file_complete(self, file_size: int) -> None:
+        return None
@@ -2,16 +2,17 @@
 
 import json
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from django.http import HttpResponse
 from django.http.response import ResponseHeaders
+from graphql import ExecutionResult
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from django.http.request import MediaType
-    from graphql import ExecutionResult
+    from graphql import GraphQLError
 
     from undine.typing import DjangoResponseProtocol, RequestMethod
 
@@ -20,6 +21,7 @@
     "HttpEventSourcingNotAllowedResponse",
     "HttpMethodNotAllowedResponse",
     "HttpUnsupportedContentTypeResponse",
+    "SerializedExecutionResult",
     "graphql_result_response",
 ]
 
@@ -46,6 +48,75 @@ def __init__(self) -> None:
         self["Connection"] = "Upgrade"
 
 
+class SerializedExecutionResult(ExecutionResult):
+    """
+    Execution result that has already been serialized to JSON, e.g., a result read from a cache.
+
+    The JSON is only decoded if the result is accessed, and it's serialized again
+    for the response only if the result is modified.
+    """
+
+    __slots__ = ("_content", "_data", "_decoded", "_errors", "_extensions")
+
+    def __init__(self, content: bytes) -> None:
+        self._content: bytes | None = content
+        self._decoded = False
+        self._data: dict[str, Any] | None = None
+        self._errors: list[GraphQLError] | None = None
+        self._extensions: dict[str, Any] | None = None
+
+    @property
+    def content(self) -> bytes | None:
+        """The serialized result, or `None` if the result has been modified."""
+        return self._content
+
+    @property  # type: ignore[override]
+    def data(self) -> dict[str, Any] | None:
+        self._decode()
+        return self._data
+
+    @data.setter
+    def data(self, value: dict[str, Any] | None) -> None:
+        self._decode()
+        self._data = value
+        self._content = None
+
+    @property  # type: ignore[override]
+    def errors(self) -> list[GraphQLError] | None:
+        return self._errors
+
+    @errors.setter
+    def errors(self, value: list[GraphQLError] | None) -> None:
+        self._decode()
+        self._errors = value
+        self._content = None
+
+    @property  # type: ignore[override]
+    def extensions(self) -> dict[str, Any] | None:
+        self._decode()
+        return self._extensions
+
+    @extensions.setter
+    def extensions(self, value: dict[str, Any] | None) -> None:
+        self._decode()
+        self._extensions = value
+        self._content = None
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self._content is None:
+            return ExecutionResult, (self.data, self.errors, self.extensions)
+        return self.__class__, (self._content,)
+
+    def _decode(self) -> None:
+        if self._decoded or self._content is None:
+            return
+
+        result = json.loads(self._content)
+        self._data = result.get("data")
+        self._extensions = result.get("extensions")
+        self._decoded = True
+
+
 def graphql_result_response(
     result: ExecutionResult,
     *,
@@ -54,7 +125,10 @@ def graphql_result_response(
     headers: ResponseHeaders | None = None,
 ) -> DjangoResponseProtocol:
     """Serialize the given execution result to an HTTP response."""
-    content = json.dumps(result.formatted, separators=(",", ":"))
+    if isinstance(result, SerializedExecutionResult) and result.content is not None:
+        content: bytes | str = result.content
+    else:
+        content = json.dumps(result.formatted, separators=(",", ":"))
     headers = headers or ResponseHeaders({})
     headers["Content-Type"] = str(content_type) if content_type is not None else "application/json"
     return HttpResponse(content=content, status=status, headers=headers)
@@ -192,7 +192,10 @@ def handle_typename_metafield(self, parent_type: GraphQLCompositeType, field_nod
     def handle_connection(self, parent_type: GraphQLObjectType, field_node: FieldNode) -> None:
         field_type: GraphQLObjectType = self.get_field_type(parent_type, field_node)  # type: ignore[assignment]
 
-        if field_node.name.value == undine_settings.TOTAL_COUNT_PARAM_NAME:
+        if field_node.name.value in {
+            undine_settings.TOTAL_COUNT_PARAM_NAME,
+            undine_settings.TOTAL_COUNT_IS_EXACT_PARAM_NAME,
+        }:
             self.handle_total_count(field_type, field_node)  # type: ignore[arg-type]
             return
 
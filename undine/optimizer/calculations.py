@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+
+from undine.exceptions import CachedCalculationExpressionError
+from undine.optimizer.post_fetch import add_post_fetch_processor
+from undine.settings import undine_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.db.models import Model, QuerySet
+
+    from undine import Calculation
+    from undine.typing import DjangoExpression, GQLInfo, TModel
+
+__all__ = [
+    "CachedCalculation",
+    "CalculationResults",
+    "annotate_calculations",
+]
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class CachedCalculation:
+    """A calculation whose values are cached for each object across requests."""
+
+    name: str
+    """Attribute name to set the calculated value to."""
+
+    identity: str
+    """Identifies the calculation class, its arguments, and its cache key."""
+
+    expression: DjangoExpression
+    """Expression for calculating the values missing from the cache."""
+
+    cache_time: int
+    """How many seconds to cache the calculated values for."""
+
+    def get_cache_key(self, instance: Model) -> str:
+        prefix = undine_settings.CALCULATION_CACHE_PREFIX
+        return f"{prefix}:{instance._meta.label_lower}:{self.identity}:{instance.pk}"
+
+    def set_values(self, instances: Sequence[Model], *, using: str) -> None:
+        """Set the calculated values to the given instances, calculating only the ones missing from the cache."""
+        cache = caches[undine_settings.CALCULATION_CACHE_ALIAS]
+
+        keys = {self.get_cache_key(instance): instance for instance in instances}
+        values: dict[str, Any] = cache.get_many(list(keys))
+
+        missing = {key: instance for key, instance in keys.items() if key not in values}
+        if missing:
+            model = type(next(iter(missing.values())))
+            queryset = model._base_manager.db_manager(using).filter(pk__in=[obj.pk for obj in missing.values()])
+            calculated = dict(queryset.annotate(**{self.name: self.expression}).values_list("pk", self.name))
+
+            new_values = {key: calculated.get(instance.pk) for key, instance in missing.items()}
+            cache.set_many(new_values, timeout=self.cache_time)
+            values.update(new_values)
+
+        for key, instance in keys.items():
+            setattr(instance, self.name, values.get(key))
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class CalculationResults:
+    """Calculation values that are set to the model instances after they have been fetched."""
+
+    cached: list[CachedCalculation] = dataclasses.field(default_factory=list)
+    """Calculations whose values are read from the cache."""
+
+    copies: dict[str, str] = dataclasses.field(default_factory=dict)
+    """Deduplicated calculations. Maps the attribute name to set to the attribute name to copy the value from."""
+
+    def set_values(self, instances: Sequence[Model], *, using: str) -> None:
+        for calculation in self.cached:
+            calculation.set_values(instances, using=using)
+
+        for name, original in self.copies.items():
+            for instance in instances:
+                setattr(instance, name, getattr(instance, original, None))
+
+
+def annotate_calculations(
+    queryset: QuerySet[TModel],
+    calculations: list[Calculation],
+    info: GQLInfo,
+) -> QuerySet[TModel]:
+    """
+    Annotate the given calculations to the queryset.
+
+    Calculations that should be deduplicated are annotated only once for the same arguments,
+    and cached calculations are not annotated at all. Their values are set to the model instances
+    after the queryset has been evaluated.
+    """
+    results = CalculationResults()
+    names: dict[str, str] = {}
+
+    for calculation in calculations:
+        name = calculation.__field_name__
+
+        if not calculation.__deduplicate__:
+            queryset = queryset.annotate(**{name: calculation(info)})
+            continue
+
+        identity = calculation.__identity__
+        original = names.get(identity)
+        if original is not None:
+            results.copies[name] = original
+            continue
+
+        names[identity] = name
+
+        if calculation.__cache_time__ <= 0:
+            queryset = queryset.annotate(**{name: calculation(info)})
+            continue
+
+        expression = calculation(info)
+
+        # Values missing from the cache are calculated only for the missing objects, so the value
+        # of each object must not depend on the other rows in the queryset. Aggregates are fine,
+        # since they are grouped by each object, but window functions are not.
+        if getattr(expression, "contains_over_clause", False):
+            raise CachedCalculationExpressionError(name=type(calculation).__name__)
+
+        # Values are cached separately for each cache key, e.g. for each user if they depend on the user.
+        cache_key = calculation.__cache_key__(info)
+        if cache_key:
+            identity = hashlib.sha256(f"{identity}:{cache_key}".encode()).hexdigest()
+
+        cached = CachedCalculation(
+            name=name,
+            identity=identity,
+            expression=expression,
+            cache_time=calculation.__cache_time__,
+        )
+        results.cached.append(cached)
+
+    if not results.cached and not results.copies:
+        return queryset
+
+    return add_post_fetch_processor(queryset, results)
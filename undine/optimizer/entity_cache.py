@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.signals import post_delete, post_save
+
+from undine.optimizer.post_fetch import add_post_fetch_processor
+from undine.settings import undine_settings
+from undine.utils.graphql.caching import get_model_label, get_model_version_for_label, invalidate_model
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.db.models import Model, QuerySet
+
+    from undine.typing import TModel
+
+__all__ = [
+    "EntityCache",
+    "cache_entity_fields",
+    "connect_entity_cache_invalidation",
+]
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class EntityCache:
+    """Values of the selected model fields cached for each object across requests."""
+
+    fields: list[str]
+    """Attribute names of the cached model fields."""
+
+    label: str
+    """Label of the model whose version is used to invalidate the cached values."""
+
+    selection: str
+    """Identifies the selected fields."""
+
+    cache_time: int
+    """How many seconds to cache the field values for."""
+
+    def get_key_prefix(self) -> str:
+        # Looked up when the values are set so that the version is read in the thread fetching the data.
+        version = get_model_version_for_label(self.label)
+        return f"{undine_settings.ENTITY_CACHE_PREFIX}:{self.label}:{version}:{self.selection}"
+
+    def set_values(self, instances: Sequence[Model], *, using: str) -> None:
+        """Set the field values to the given instances, fetching only the ones missing from the cache."""
+        cache = caches[undine_settings.ENTITY_CACHE_ALIAS]
+
+        key_prefix = self.get_key_prefix()
+        keys = {f"{key_prefix}:{instance.pk}": instance for instance in instances}
+        values: dict[str, tuple[Any, ...]] = cache.get_many(list(keys))
+
+        missing = {key: instance for key, instance in keys.items() if key not in values}
+        if missing:
+            model = type(next(iter(missing.values())))
+            queryset = model._base_manager.db_manager(using).filter(pk__in=[obj.pk for obj in missing.values()])
+            fetched = {row[0]: row[1:] for row in queryset.values_list("pk", *self.fields)}
+
+            new_values = {key: fetched[instance.pk] for key, instance in missing.items() if instance.pk in fetched}
+            cache.set_many(new_values, timeout=self.cache_time)
+            values.update(new_values)
+
+        for key, instance in keys.items():
+            row = values.get(key)
+            # Objects deleted after the main query are left deferred.
+            if row is None:
+                continue
+
+            for field, value in zip(self.fields, row, strict=True):
+                setattr(instance, field, value)
+
+
+def cache_entity_fields(queryset: QuerySet[TModel], only_fields: set[str], cache_time: int) -> QuerySet[TModel]:
+    """
+    Limit the queryset to the given fields, but read the values of non-relational model fields
+    from the entity cache instead of the database. Only the values missing from the cache
+    are fetched, in a single query after the queryset has been evaluated.
+    """
+    model = queryset.model
+
+    cached_fields = sorted(name for name in only_fields if is_cacheable_field(model, name))
+    if not cached_fields:
+        return queryset.only(*only_fields)
+
+    fetched_fields = only_fields.difference(cached_fields) or {model._meta.pk.name}  # type: ignore[union-attr]
+    queryset = queryset.only(*fetched_fields)
+
+    entity_cache = EntityCache(
+        fields=cached_fields,
+        label=get_model_label(model),
+        selection=hashlib.sha256(",".join(cached_fields).encode()).hexdigest()[:16],
+        cache_time=cache_time,
+    )
+    return add_post_fetch_processor(queryset, entity_cache)
+
+
+def is_cacheable_field(model: type[Model], name: str) -> bool:
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+
+    return field.concrete and not field.is_relation and not field.primary_key  # type: ignore[union-attr]
+
+
+def invalidate_entity_cache(sender: type[Model], using: str | None = None, **kwargs: Any) -> None:
+    """Signal receiver for `post_save` and `post_delete` that invalidates the cached field values for the model."""
+    invalidate_model(sender, using=using)
+
+
+def connect_entity_cache_invalidation(model: type[Model]) -> None:
+    """
+    Connect the signal receivers for invalidating the cached field values of the given model.
+
+    Receivers are only connected for models that use the entity cache, since Django can't use
+    fast deletes for models that have `post_delete` receivers.
+    """
+    for sender in {model, model._meta.concrete_model}:
+        label = sender._meta.label_lower  # type: ignore[union-attr]
+        post_save.connect(invalidate_entity_cache, sender=sender, dispatch_uid=f"undine_entity_cache_post_save:{label}")
+        post_delete.connect(
+            invalidate_entity_cache,
+            sender=sender,
+            dispatch_uid=f"undine_entity_cache_post_delete:{label}",
+        )
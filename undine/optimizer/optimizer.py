@@ -12,6 +12,7 @@
 from undine.converters import extend_expression
 from undine.exceptions import GraphQLTooManyFiltersError, GraphQLTooManyOrdersError
 from undine.settings import undine_settings
+from undine.utils.graphql.caching import record_model_version
 from undine.utils.graphql.undine_extensions import (
     get_undine_connection,
     get_undine_field,
@@ -20,14 +21,21 @@
     get_undine_query_type,
 )
 from undine.utils.graphql.utils import get_underlying_type, is_typename_metafield, should_skip_node
-from undine.utils.model_utils import get_default_manager, get_field_name, get_related_name
+from undine.utils.model_utils import get_default_manager, get_field_name, get_related_name, limit_queryset
 from undine.utils.reflection import is_same_func
 
 from .ast_walker import GraphQLASTWalker
-from .prefetch_hack import evaluate_with_prefetch_hack_async, evaluate_with_prefetch_hack_sync
+from .calculations import annotate_calculations
+from .entity_cache import cache_entity_fields
+from .parallel import is_parallel_entrypoint, run_in_entrypoint_thread
+from .prefetch_hack import (
+    evaluate_with_prefetch_hack_async,
+    evaluate_with_prefetch_hack_sync,
+    iterate_with_prefetch_hack_async,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import AsyncGenerator, Generator
 
     from django.contrib.contenttypes.fields import GenericForeignKey
     from django.db.models import Field, Model, OrderBy, QuerySet
@@ -52,6 +60,7 @@
     "OptimizationResults",
     "QueryOptimizer",
     "optimize_async",
+    "optimize_stream_async",
     "optimize_sync",
 ]
 
@@ -129,6 +138,7 @@ async def optimize_async(
 ) -> list[TModel] | TModel | None:
     """
     Optimize a queryset and return the results asynchronously.
+    Query entrypoints are evaluated in the entrypoint thread pool if `PARALLEL_ENTRYPOINT_WORKERS` is set.
 
     :param queryset: The queryset to optimize.
     :param info: The GraphQL resolve info for the request.
@@ -146,7 +156,10 @@ async def optimize_async(
     if limit is not None or offset > 0:
         optimized_queryset = optimized_queryset[offset : offset + (limit or 0)]
 
-    instances = await evaluate_with_prefetch_hack_async(optimized_queryset)
+    if is_parallel_entrypoint(info):
+        instances = await run_in_entrypoint_thread(evaluate_with_prefetch_hack_sync, optimized_queryset)
+    else:
+        instances = await evaluate_with_prefetch_hack_async(optimized_queryset)
 
     if kwargs:
         return next(iter(instances), None)
@@ -154,6 +167,33 @@ async def optimize_async(
     return instances
 
 
+async def optimize_stream_async(
+    queryset: QuerySet[TModel],
+    info: GQLInfo,
+    *,
+    limit: int | None = None,
+) -> AsyncGenerator[TModel]:
+    """
+    Optimize a queryset and yield its results asynchronously as they are fetched from the database.
+    Results are fetched in chunks of `INCREMENTAL_DELIVERY_STREAM_CHUNK_SIZE`, so that the whole result set
+    doesn't need to be loaded into memory before the first item can be delivered.
+
+    :param queryset: The queryset to optimize.
+    :param info: The GraphQL resolve info for the request.
+    :param limit: The maximum number of items to return. By default, all items are returned.
+    """
+    optimizer: QueryOptimizer = undine_settings.OPTIMIZER_CLASS(model=queryset.model, info=info)
+    optimizations = optimizer.compile()
+    optimized_queryset = optimizations.apply(queryset, info)
+
+    if limit is not None:
+        optimized_queryset = optimized_queryset[:limit]
+
+    chunk_size = undine_settings.INCREMENTAL_DELIVERY_STREAM_CHUNK_SIZE
+    async for instance in iterate_with_prefetch_hack_async(optimized_queryset, chunk_size=chunk_size):
+        yield instance
+
+
 class QueryOptimizer(GraphQLASTWalker):
     """A class for processing the given GraphQL resolve info into required optimizations."""
 
@@ -192,6 +232,8 @@ def parse_filter_info(self, parent_type: GraphQLObjectType, field_node: FieldNod
                 after=arg_values.get("after"),
                 before=arg_values.get("before"),
                 page_size=undine_connection.page_size,
+                total_count_strategy=undine_connection.total_count_strategy,
+                total_count_limit=undine_connection.total_count_limit,
             )
 
         undine_offset_pagination = get_undine_offset_pagination(graphql_field)
@@ -222,6 +264,8 @@ def handle_undine_mutation_type(self, mutation_type: type[MutationType], arg_val
     def handle_undine_query_type(self, query_type: type[QueryType], arg_values: dict[str, Any]) -> None:
         self.optimization_data.fill_from_query_type(query_type=query_type)
 
+        filter_order_by: list[OrderBy] = []
+
         if query_type.__filterset__:
             filter_data = arg_values.get(undine_settings.QUERY_TYPE_FILTER_INPUT_KEY, {})
             filter_results = query_type.__filterset__.__build__(filter_data, self.info)
@@ -237,6 +281,9 @@ def handle_undine_query_type(self, query_type: type[QueryType], arg_values: dict
             self.optimization_data.aliases |= filter_results.aliases
             self.optimization_data.distinct |= filter_results.distinct
             self.optimization_data.none |= filter_results.none
+            self.optimization_data.filter_limit = filter_results.limit
+            self.optimization_data.filter_order_by = filter_results.order_by
+            filter_order_by = filter_results.order_by
 
         if query_type.__orderset__:
             order_data = arg_values.get(undine_settings.QUERY_TYPE_ORDER_INPUT_KEY, [])
@@ -252,6 +299,9 @@ def handle_undine_query_type(self, query_type: type[QueryType], arg_values: dict
             self.optimization_data.order_by.extend(order_results.order_by)
             self.optimization_data.aliases |= order_results.aliases
 
+        # Ordering required by filters (e.g. search rank) is applied after any ordering from the `OrderSet`.
+        self.optimization_data.order_by.extend(filter_order_by)
+
         query_type.__optimizations__(self.optimization_data, self.info)
 
     def handle_undine_field(self, parent_type: GraphQLObjectType, field_node: FieldNode) -> None:
@@ -430,12 +480,15 @@ class OptimizationData:
     order_by: list[OrderBy] = dataclasses.field(default_factory=list)
     distinct: bool = False
     none: bool = False
+    filter_limit: int | None = None
+    filter_order_by: list[OrderBy] = dataclasses.field(default_factory=list)
     pagination: PaginationHandler | None = None
 
     queryset_callback: QuerySetCallback = dataclasses.field(init=False)
     pre_filter_callback: FilterCallback | None = None
     post_filter_callback: FilterCallback | None = None
     field_calculations: list[Calculation] = dataclasses.field(default_factory=list)
+    entity_cache_time: int | None = None
 
     def __post_init__(self) -> None:
         def default_queryset_callback(info: GQLInfo) -> QuerySet:
@@ -541,6 +594,7 @@ def fill_from_query_type(self, query_type: type[QueryType]) -> OptimizationData:
 
         self.model = query_type.__model__
         self.queryset_callback = query_type.__get_queryset__
+        self.entity_cache_time = query_type.__entity_cache_time__
 
         # Only include pre-filter callback if it's different from the default.
         if (
@@ -574,6 +628,9 @@ def fill_from_mutation_type(self, mutation_type: type[MutationType]) -> Optimiza
 
     def process(self) -> OptimizationResults:
         """Process collected data to OptimizerResults that can be applied to a queryset."""
+        if self.model is not None:
+            record_model_version(self.model)
+
         results = OptimizationResults(
             related_field=self.related_field,
             only_fields=self.only_fields,
@@ -583,10 +640,13 @@ def process(self) -> OptimizationResults:
             order_by=self.order_by,
             distinct=self.distinct,
             none=self.none,
+            filter_limit=self.filter_limit,
+            filter_order_by=self.filter_order_by,
             pagination=self.pagination,
             pre_filter_callback=self.pre_filter_callback,
             post_filter_callback=self.post_filter_callback,
             field_calculations=self.field_calculations,
+            entity_cache_time=self.entity_cache_time,
         )
 
         for select_related_data in self.select_related.values():
@@ -665,11 +725,14 @@ class OptimizationResults:
     order_by: list[OrderBy] = dataclasses.field(default_factory=list)
     distinct: bool = False
     none: bool = False
+    filter_limit: int | None = None
+    filter_order_by: list[OrderBy] = dataclasses.field(default_factory=list)
     pagination: PaginationHandler | None = None
 
     pre_filter_callback: FilterCallback | None = None
     post_filter_callback: FilterCallback | None = None
     field_calculations: list[Calculation] = dataclasses.field(default_factory=list)
+    entity_cache_time: int | None = None
 
     def apply(self, queryset: QuerySet[TModel], info: GQLInfo) -> QuerySet[TModel]:  # noqa: C901, PLR0912
         """Apply the optimization results to the given queryset."""
@@ -681,7 +744,10 @@ def apply(self, queryset: QuerySet[TModel], info: GQLInfo) -> QuerySet[TModel]:
         if self.prefetch_related:
             queryset = queryset.prefetch_related(*self.prefetch_related)
         if not undine_settings.DISABLE_ONLY_FIELDS_OPTIMIZATION and self.only_fields:
-            queryset = queryset.only(*self.only_fields)
+            if self.entity_cache_time:
+                queryset = cache_entity_fields(queryset, self.only_fields, self.entity_cache_time)
+            else:
+                queryset = queryset.only(*self.only_fields)
         if self.aliases:
             queryset = queryset.alias(**self.aliases)
         if self.annotations:
@@ -695,8 +761,8 @@ def apply(self, queryset: QuerySet[TModel], info: GQLInfo) -> QuerySet[TModel]:
         if self.distinct:
             queryset = queryset.distinct()
 
-        for calculation in self.field_calculations:
-            queryset = queryset.annotate(**{calculation.__field_name__: calculation(info)})
+        if self.field_calculations:
+            queryset = annotate_calculations(queryset, self.field_calculations, info)
 
         # Note that we want to add the filters as as single Q object to prevent some issues
         # when filters are "spanning multi-valued relationships". See Django documentation here:
@@ -713,6 +779,15 @@ def apply(self, queryset: QuerySet[TModel], info: GQLInfo) -> QuerySet[TModel]:
         if self.post_filter_callback is not None:
             queryset = self.post_filter_callback(queryset, info)
 
+        # Limits required by filters (e.g. search rank limit) keep the first rows that match all the filters.
+        if self.filter_limit is not None:
+            queryset = limit_queryset(
+                queryset,
+                limit=self.filter_limit,
+                order_by=self.filter_order_by,
+                aliases=self.aliases,
+            )
+
         if self.pagination is not None:
             if self.related_field is None:
                 queryset = self.pagination.paginate_queryset(queryset, info)
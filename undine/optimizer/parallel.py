@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections  # noqa: ICN003
+from graphql import OperationType
+
+from undine.settings import undine_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from undine.typing import GQLInfo, P, T
+
+__all__ = [
+    "get_entrypoint_executor",
+    "is_parallel_entrypoint",
+    "run_in_entrypoint_thread",
+]
+
+
+_EXECUTOR_LOCK = threading.Lock()
+_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+
+
+def is_parallel_entrypoint(info: GQLInfo) -> bool:
+    """
+    Should the database queries for the given field be executed in the entrypoint thread pool?
+
+    Only entrypoints of query operations can be executed in parallel, since mutations
+    must be executed serially, and nested fields are fetched together with their entrypoint.
+    """
+    return (
+        undine_settings.ASYNC
+        and undine_settings.PARALLEL_ENTRYPOINT_WORKERS > 0
+        and info.path.prev is None
+        and info.operation.operation == OperationType.QUERY
+    )
+
+
+def get_entrypoint_executor() -> ThreadPoolExecutor:
+    """Get the thread pool for executing entrypoint database queries in parallel."""
+    max_workers = undine_settings.PARALLEL_ENTRYPOINT_WORKERS
+
+    with _EXECUTOR_LOCK:
+        executor = _EXECUTORS.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="undine-entrypoint")
+            _EXECUTORS[max_workers] = executor
+
+    return executor
+
+
+async def run_in_entrypoint_thread(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Run the given function in the entrypoint thread pool.
+
+    Each thread in the pool uses its own database connection, so functions running
+    in different threads can execute their database queries at the same time.
+    """
+    executor = get_entrypoint_executor()
+    in_thread = sync_to_async(_run_with_connection_cleanup, thread_sensitive=False, executor=executor)
+    return await in_thread(partial(func, *args, **kwargs))
+
+
+def _run_with_connection_cleanup(func: Callable[[], T]) -> T:
+    # Django only closes connections for the thread the request was handled in,
+    # so connections opened in the thread pool must follow the same lifecycle manually.
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
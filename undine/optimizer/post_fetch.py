@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from itertools import batched
+from typing import TYPE_CHECKING, Protocol
+
+from django.db.models.query import ModelIterable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from django.db.models import Model, QuerySet
+
+    from undine.typing import TModel
+
+__all__ = [
+    "PostFetchIterable",
+    "PostFetchProcessor",
+    "add_post_fetch_processor",
+]
+
+
+POST_FETCH_PROCESSORS_KEY = "_undine_post_fetch_processors"
+"""Key used for storing `PostFetchProcessors` in the queryset hints."""
+
+
+class PostFetchProcessor(Protocol):
+    """Sets values to model instances after they have been fetched from the database."""
+
+    def set_values(self, instances: Sequence[Model], *, using: str) -> None: ...
+
+
+class PostFetchIterable(ModelIterable):
+    """Model iterable that runs the queryset's post-fetch processors for the fetched instances."""
+
+    def __iter__(self) -> Iterator[Model]:
+        iterator = super().__iter__()
+
+        processors: list[PostFetchProcessor] = self.queryset._hints.get(POST_FETCH_PROCESSORS_KEY, [])
+        if not processors:  # pragma: no cover
+            yield from iterator
+            return
+
+        using = self.queryset.db
+
+        # When the queryset is iterated in chunks, process each chunk as it's fetched.
+        batches = batched(iterator, self.chunk_size) if self.chunked_fetch else [list(iterator)]
+        for batch in batches:
+            for processor in processors:
+                processor.set_values(batch, using=using)
+            yield from batch
+
+
+def add_post_fetch_processor(queryset: QuerySet[TModel], processor: PostFetchProcessor) -> QuerySet[TModel]:
+    """Add a processor that sets values to the instances of the given queryset after they have been fetched."""
+    queryset = queryset.all()
+    processors = [*queryset._hints.get(POST_FETCH_PROCESSORS_KEY, []), processor]  # type: ignore[attr-defined]
+    # Hints are shared between clones of a queryset, so replace them instead of modifying them.
+    queryset._hints = {**queryset._hints, POST_FETCH_PROCESSORS_KEY: processors}  # type: ignore[attr-defined]
+    queryset._iterable_class = PostFetchIterable  # noqa: SLF001
+    return queryset
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import threading
 from collections import defaultdict
-from typing import TYPE_CHECKING
-from unittest.mock import patch
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Self
 
 from django.db.models import ManyToManyField
+from django.db.models.fields import related_descriptors
 from django.db.models.fields.related_descriptors import (  # type: ignore[attr-defined]
     _filter_prefetch_queryset,  # noqa: PLC2701
 )
 
 from undine.settings import undine_settings
+from undine.utils.graphql.caching import record_pending_model_versions, record_pending_model_versions_async
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from types import TracebackType
+
     from django.db.models import ManyToManyRel, Model, QuerySet
 
     from undine.typing import PrefetchHackCacheType, TModel
@@ -19,25 +25,73 @@
 __all__ = [
     "evaluate_with_prefetch_hack_async",
     "evaluate_with_prefetch_hack_sync",
+    "iterate_with_prefetch_hack_async",
     "register_for_prefetch_hack",
 ]
 
 
-_PATH = f"{_filter_prefetch_queryset.__module__}.{_filter_prefetch_queryset.__name__}"
+class PrefetchHackPatch:
+    """
+    Replaces `_filter_prefetch_queryset` with `_prefetch_hack` while at least one queryset is being evaluated.
+
+    Querysets can be evaluated concurrently in multiple coroutines and threads, so the patch keeps count
+    of how many evaluations are using it, and only restores the original function after the last one exits.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users: int = 0
+
+    def __enter__(self) -> Self:
+        with self.lock:
+            if self.users == 0:
+                related_descriptors._filter_prefetch_queryset = _prefetch_hack  # noqa: SLF001
+            self.users += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        with self.lock:
+            self.users -= 1
+            if self.users == 0:
+                related_descriptors._filter_prefetch_queryset = _filter_prefetch_queryset  # noqa: SLF001
+
+
+prefetch_hack_patch = PrefetchHackPatch()
 
 
 def evaluate_with_prefetch_hack_sync(queryset: QuerySet[TModel]) -> list[TModel]:
     """Evaluates the given queryset with the prefetch hack applied."""
-    with patch(_PATH, side_effect=_prefetch_hack):
+    record_pending_model_versions()
+    with prefetch_hack_patch:
         return list(queryset)  # If the optimizer did its job, the database query is executed here
 
 
 async def evaluate_with_prefetch_hack_async(queryset: QuerySet[TModel]) -> list[TModel]:
     """Evaluates the given queryset with the prefetch hack applied."""
-    with patch(_PATH, side_effect=_prefetch_hack):
+    await record_pending_model_versions_async()
+    with prefetch_hack_patch:
         return [inst async for inst in queryset]  # If the optimizer did its job, the database query is executed here
 
 
+async def iterate_with_prefetch_hack_async(queryset: QuerySet[TModel], *, chunk_size: int) -> AsyncGenerator[TModel]:
+    """
+    Iterates the given queryset in chunks with the prefetch hack applied.
+
+    Rows are fetched from a database cursor `chunk_size` rows at a time (using a server-side cursor
+    if the database supports it), and related objects are prefetched separately for each chunk.
+    """
+    await record_pending_model_versions_async()
+    with prefetch_hack_patch:
+        async with aclosing(queryset.aiterator(chunk_size=chunk_size)) as iterator:
+            async for instance in iterator:
+                yield instance
+
+
 def register_for_prefetch_hack(queryset: QuerySet, field: ManyToManyField | ManyToManyRel) -> None:
     """
     Registers the through table of a many-to-many field for the prefetch hack.
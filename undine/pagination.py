@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import json
 from copy import copy
 from typing import TYPE_CHECKING
 
+from django.db import connections  # noqa: ICN003
 from django.db.models import F, ManyToManyField, ManyToManyRel, OuterRef, Value, Window
 from django.db.models.functions import Greatest, RowNumber
 
@@ -11,6 +13,7 @@
 from undine.exceptions import GraphQLPaginationArgumentValidationError
 from undine.optimizer.prefetch_hack import register_for_prefetch_hack
 from undine.settings import undine_settings
+from undine.typing import TotalCountStrategy
 from undine.utils.model_utils import SubqueryCount
 from undine.utils.reflection import is_subclass
 
@@ -41,6 +44,8 @@ def __init__(
         offset: int | None = None,
         limit: int | None = None,
         page_size: int | None = None,
+        total_count_strategy: TotalCountStrategy = TotalCountStrategy.exact,
+        total_count_limit: int = undine_settings.PAGINATION_TOTAL_COUNT_LIMIT,
     ) -> None:
         """
         Create a new PaginationHandler.
@@ -53,6 +58,8 @@ def __init__(
         :param offset: Number of item to skip from the start. No offset if `None`.
         :param limit: Maximum limit for the number of item that can be requested in a page. No limit if `None`.
         :param page_size: Maximum limit for the number of item that can be requested in a page. No limit if `None`.
+        :param total_count_strategy: How the total count is calculated for top-level querysets.
+        :param total_count_limit: Number of items up to which 'capped' and 'estimated' total counts are exact.
         """
         validated_args = self.validate(
             typename=typename,
@@ -80,6 +87,12 @@ def __init__(
         self.page_size = page_size
         """Maximum number of item to return in a page. No limit if `None`."""
 
+        self.total_count_strategy = total_count_strategy
+        """How the total count is calculated for top-level querysets."""
+
+        self.total_count_limit = total_count_limit
+        """Number of items up to which 'capped' and 'estimated' total counts are exact."""
+
         # Calculated in `paginate_queryset` or `paginate_prefetch_queryset` if needed.
         self.start: int = 0
         """The index to start the pagination from."""
@@ -92,6 +105,14 @@ def __init__(
         self.total_count: int | None = None
         """The total number of items that can be paginated."""
 
+        # Modified in `paginate_queryset` if the total count strategy is not exact.
+        self.total_count_is_exact: bool = True
+        """Whether the total count is the exact number of items that can be paginated."""
+
+        # Modified in `paginate_queryset` if the total count strategy is not exact.
+        self.next_page_exists: bool | None = None
+        """Whether there are items after the current page, if it cannot be inferred from the total count."""
+
         # Modified during optimization based on pagination params.
         self.requires_total_count: bool = False
         """Whether the total count is required for this query."""
@@ -218,9 +239,6 @@ def calculate_pagination_arguments(self, queryset: QuerySet, info: GQLInfo) -> N
         This function is based on the Relay pagination algorithm.
         See. https://relay.dev/graphql/connections.htm#sec-Pagination-algorithm
         """
-        if self.requires_total_count:
-            self.total_count = queryset.count()
-
         if self.after is not None:
             self.start = self.after
 
@@ -230,12 +248,68 @@ def calculate_pagination_arguments(self, queryset: QuerySet, info: GQLInfo) -> N
         if self.first is not None:
             self.stop = self.start + self.first if self.stop is None else min(self.start + self.first, self.stop)
 
+        if self.last is not None and self.stop is None:
+            # Paginating from the end requires the exact count regardless of the total count strategy.
+            if self.total_count is None:
+                self.total_count = queryset.count()
+            self.stop = self.total_count
+
+        elif self.requires_total_count:
+            self.total_count = self.count_total(queryset)
+
         if self.last is not None:
-            if self.stop is None:
-                if self.total_count is None:
-                    self.total_count = queryset.count()
-                self.stop = self.total_count
-            self.start = max(self.stop - self.last, self.start)
+            self.start = max(self.stop - self.last, self.start)  # type: ignore[operator]
+
+    def count_total(self, queryset: QuerySet) -> int:
+        """Count the total number of items in a top-level queryset using the total count strategy."""
+        if self.total_count_strategy == TotalCountStrategy.capped:
+            return self.count_capped(queryset)
+        if self.total_count_strategy == TotalCountStrategy.estimated:
+            return self.count_estimated(queryset)
+        return queryset.count()
+
+    def count_capped(self, queryset: QuerySet) -> int:
+        """
+        Count items in the queryset up to the total count limit, or the end of the current page if it's further.
+        If there are more items, return the limit and mark the total count as inexact.
+        """
+        limit = max(self.total_count_limit, self.stop or 0)
+        count = queryset[: limit + 1].count()
+        if count <= limit:
+            return count
+
+        self.total_count_is_exact = False
+        self.next_page_exists = self.stop is not None
+        return limit
+
+    def count_estimated(self, queryset: QuerySet) -> int:
+        """
+        Estimate the number of items in the queryset using the database's query planner.
+        Use an exact count instead if the estimate is below the total count limit,
+        or if the database cannot provide an estimate.
+        """
+        estimate = _estimate_count(queryset)
+        if estimate is None or estimate <= self.total_count_limit:
+            return queryset.count()
+
+        self.total_count_is_exact = False
+        if self.stop is not None:
+            self.next_page_exists = queryset[self.stop : self.stop + 1].exists()
+            # Don't report fewer items than are known to exist.
+            if self.next_page_exists:
+                estimate = max(estimate, self.stop + 1)
+
+        return estimate
+
+    def has_next_page(self) -> bool:
+        """Whether there are items after the current page."""
+        if self.stop is None:
+            return False
+        if self.next_page_exists is not None:
+            return self.next_page_exists
+        if self.total_count is None:
+            return True
+        return self.stop < self.total_count
 
     def apply_pagination(self, queryset: QuerySet, info: GQLInfo) -> QuerySet:
         """Paginate a top-level queryset using queryset slicing."""
@@ -330,6 +404,36 @@ def __init__(
         self.description = description
 
 
+def _estimate_count(queryset: QuerySet) -> int | None:
+    """
+    Estimate the number of items in the given queryset without counting them.
+
+    On PostgreSQL, unfiltered querysets use the table statistics, and other querysets
+    use the row estimate from the query plan. Returns `None` if an estimate is not available.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    query = queryset.query
+    with connection.cursor() as cursor:
+        if not query.where and not query.combinator and not query.distinct:
+            table = connection.ops.quote_name(queryset.model._meta.db_table)
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = %s::regclass", [table])
+            row = cursor.fetchone()
+            # Tables that have never been vacuumed or analyzed don't have statistics.
+            if row is not None and row[0] >= 0:
+                return int(row[0])
+
+        sql, params = queryset.order_by().query.get_compiler(using=queryset.db).as_sql()
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 def _add_partition_index(queryset: QuerySet, related_name: str) -> QuerySet:
     """Add an index to each instance in the queryset, partitioned by the given related name."""
     return queryset.alias(
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from io import BytesIO
 from typing import TYPE_CHECKING, Any
 
 from django.conf import settings
+from django.core.files.uploadhandler import load_handler
+from django.http import HttpRequest
+from django.http.multipartparser import MultiPartParser, MultiPartParserError
 from django.http.request import MediaType
 
-from undine.dataclasses import GraphQLHttpParams
+from undine.dataclasses import GraphQLHttpParams, PersistedDocumentData
 from undine.exceptions import (
     GraphQLAPQHashInvalidError,
     GraphQLAPQHashMissingError,
@@ -24,13 +28,16 @@
     GraphQLRequestDecodingError,
     GraphQLUnsupportedContentTypeError,
 )
-from undine.http.files import place_files
+from undine.http.files import GraphQLFileUploadHandler, check_uploaded_files, place_files
 from undine.http.utils import decode_body, load_json_dict, parse_json_body
 from undine.settings import undine_settings
 from undine.utils.reflection import is_list_of
 
 if TYPE_CHECKING:
     from django.core.files.uploadedfile import UploadedFile
+    from django.core.files.uploadhandler import FileUploadHandler
+    from django.http import QueryDict
+    from django.utils.datastructures import MultiValueDict
 
     from undine.typing import DjangoRequestProtocol
 
@@ -76,12 +83,43 @@ def parse_body(cls, request: DjangoRequestProtocol) -> dict[str, str]:
             and content_type.main_type == "multipart"
             and content_type.sub_type == "form-data"
         ):
-            if request.FILES:
-                return cls.parse_file_uploads(request.POST.dict(), request.FILES.dict())  # type: ignore[arg-type]
-            return request.POST.dict()  # type: ignore[return-value]
+            post_data, files = cls.parse_multipart_body(request)
+            if files:
+                return cls.parse_file_uploads(post_data.dict(), files.dict())  # type: ignore[arg-type]
+            return post_data.dict()  # type: ignore[return-value]
 
         raise GraphQLUnsupportedContentTypeError(content_type=content_type)
 
+    @classmethod
+    def parse_multipart_body(cls, request: DjangoRequestProtocol) -> tuple[QueryDict, MultiValueDict]:
+        # If the body has already been parsed before the view, e.g. by 'CsrfViewMiddleware',
+        # upload limits can only be checked after all files have been received.
+        if not isinstance(request, HttpRequest) or hasattr(request, "_files"):
+            check_uploaded_files(request.FILES.values())
+            return request.POST, request.FILES  # type: ignore[return-value]
+
+        limit_handler = GraphQLFileUploadHandler(request)
+        upload_handlers = [limit_handler, *cls.get_upload_handlers(request)]
+
+        data = BytesIO(request.body) if hasattr(request, "_body") else request
+
+        try:
+            parser = MultiPartParser(request.META, data, upload_handlers, request.encoding)
+            limit_handler.parser = parser
+            post_data, files = parser.parse()
+        except MultiPartParserError as error:
+            raise GraphQLRequestDecodingError(str(error)) from error
+
+        # Set parsed data to the request like 'HttpRequest._load_post_and_files' does.
+        request._post, request._files = post_data, files  # noqa: SLF001
+        return post_data, files
+
+    @classmethod
+    def get_upload_handlers(cls, request: HttpRequest) -> list[FileUploadHandler]:
+        if undine_settings.FILE_UPLOAD_HANDLERS is None:
+            return list(request.upload_handlers)
+        return [load_handler(path, request) for path in undine_settings.FILE_UPLOAD_HANDLERS]
+
     @classmethod
     def parse_file_uploads(cls, post_data: dict[str, str], files: dict[str, UploadedFile]) -> dict[str, Any]:
         operations = cls.get_operations(post_data)
@@ -127,6 +165,15 @@ def get_graphql_params(cls, data: dict[str, Any]) -> GraphQLHttpParams:
         variables = cls.get_operation_variables(data)
         operation_name = cls.get_operation_name(data)
 
+        if isinstance(document, PersistedDocumentData):
+            return GraphQLHttpParams(
+                document=document.document,
+                variables=variables,
+                operation_name=operation_name,
+                extensions=extensions,
+                persisted_document=document,
+            )
+
         return GraphQLHttpParams(
             document=document,
             variables=variables,
@@ -141,6 +188,15 @@ async def get_graphql_params_async(cls, data: dict[str, Any]) -> GraphQLHttpPara
         variables = cls.get_operation_variables(data)
         operation_name = cls.get_operation_name(data)
 
+        if isinstance(document, PersistedDocumentData):
+            return GraphQLHttpParams(
+                document=document.document,
+                variables=variables,
+                operation_name=operation_name,
+                extensions=extensions,
+                persisted_document=document,
+            )
+
         return GraphQLHttpParams(
             document=document,
             variables=variables,
@@ -175,7 +231,7 @@ def get_operation_extensions(cls, data: dict[str, Any]) -> dict[str, str]:
         return extensions or {}
 
     @classmethod
-    def parse_document(cls, data: dict[str, Any], extensions: dict[str, str]) -> str:
+    def parse_document(cls, data: dict[str, Any], extensions: dict[str, str]) -> str | PersistedDocumentData:
         if not undine_settings.PERSISTED_DOCUMENTS_ONLY:
             query = data.get("query")
             if query:
@@ -201,7 +257,11 @@ def parse_document(cls, data: dict[str, Any], extensions: dict[str, str]) -> str
         return cls.get_persisted_document(document_id)
 
     @classmethod
-    async def parse_document_async(cls, data: dict[str, Any], extensions: dict[str, str]) -> str:
+    async def parse_document_async(
+        cls,
+        data: dict[str, Any],
+        extensions: dict[str, str],
+    ) -> str | PersistedDocumentData:
         if not undine_settings.PERSISTED_DOCUMENTS_ONLY:
             query = data.get("query")
             if query:
@@ -269,9 +329,14 @@ def get_apq_document_id(cls, extensions: dict[str, Any]) -> str | None:
         return f"sha256:{sha256_hash}"
 
     @classmethod
-    def get_persisted_document(cls, document_id: str) -> str:
+    def get_persisted_document(cls, document_id: str) -> PersistedDocumentData:
+        from undine.persisted_documents.cache import persisted_document_cache  # noqa: PLC0415
         from undine.persisted_documents.models import PersistedDocument  # noqa: PLC0415
 
+        cached = persisted_document_cache.get(document_id)
+        if cached is not None:
+            return cached
+
         try:
             persisted_document = PersistedDocument.objects.get(document_id=document_id)
         except PersistedDocument.DoesNotExist as error:
@@ -279,12 +344,17 @@ def get_persisted_document(cls, document_id: str) -> str:
             extensions = {"code": "PERSISTED_DOCUMENT_NOT_FOUND"}
             raise GraphQLPersistedDocumentNotFoundError(document_id=document_id, extensions=extensions) from error
 
-        return persisted_document.document
+        return persisted_document_cache.set(document_id, persisted_document.document)
 
     @classmethod
-    async def get_persisted_document_async(cls, document_id: str) -> str:
+    async def get_persisted_document_async(cls, document_id: str) -> PersistedDocumentData:
+        from undine.persisted_documents.cache import persisted_document_cache  # noqa: PLC0415
         from undine.persisted_documents.models import PersistedDocument  # noqa: PLC0415
 
+        cached = await persisted_document_cache.aget(document_id)
+        if cached is not None:
+            return cached
+
         try:
             persisted_document = await PersistedDocument.objects.aget(document_id=document_id)
         except PersistedDocument.DoesNotExist as error:
@@ -292,4 +362,4 @@ async def get_persisted_document_async(cls, document_id: str) -> str:
             extensions = {"code": "PERSISTED_DOCUMENT_NOT_FOUND"}
             raise GraphQLPersistedDocumentNotFoundError(document_id=document_id, extensions=extensions) from error
 
-        return persisted_document.document
+        return await persisted_document_cache.aset(document_id, persisted_document.document)
@@ -13,3 +13,16 @@ class UndinePersistedDocumentsConfig(AppConfig):
     label = "persisted_documents"
     verbose_name = "persisted documents"
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self) -> None:
+        self.connect_cache_invalidation()
+
+    def connect_cache_invalidation(self) -> None:
+        """Invalidate cached persisted documents when they are saved or deleted."""
+        from django.db.models.signals import post_delete, post_save  # noqa: PLC0415
+
+        from .cache import invalidate_persisted_document  # noqa: PLC0415
+        from .models import PersistedDocument  # noqa: PLC0415
+
+        post_save.connect(invalidate_persisted_document, sender=PersistedDocument)
+        post_delete.connect(invalidate_persisted_document, sender=PersistedDocument)
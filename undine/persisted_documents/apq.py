@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import atexit
+import threading
+
+from django.db import DatabaseError, connections  # noqa: ICN003
+
+from undine.settings import undine_settings
+from undine.utils.logging import logger
+
+from .cache import persisted_document_cache
+from .models import PersistedDocument
+
+__all__ = [
+    "AutomaticPersistedQueryWriter",
+    "automatic_persisted_query_writer",
+]
+
+
+class AutomaticPersistedQueryWriter:
+    """
+    Writes documents registered using automatic persisted queries to the database.
+
+    Documents are written with an insert-if-absent query, and are added to the persisted document cache
+    right away so that they can be used before they are written. Documents that are already
+    in the in-process cache or waiting to be written are not written again. If a batch cannot be written,
+    its documents are removed from the cache, so that they are written again when they are re-registered.
+
+    If `PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL` is set, documents are queued and written
+    in batches in a background thread, instead of during the request.
+    """
+
+    def __init__(self) -> None:
+        self.pending: dict[str, str] = {}
+        self.lock = threading.Lock()
+        self.timer: threading.Timer | None = None
+
+    def save(self, document_id: str, document: str) -> None:
+        if not self.should_save(document_id):
+            return
+
+        if undine_settings.PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL > 0:
+            persisted_document_cache.set(document_id, document)
+            self.enqueue(document_id, document)
+            return
+
+        self.write({document_id: document})
+        persisted_document_cache.set(document_id, document)
+
+    async def asave(self, document_id: str, document: str) -> None:
+        if not self.should_save(document_id):
+            return
+
+        if undine_settings.PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL > 0:
+            await persisted_document_cache.aset(document_id, document)
+            self.enqueue(document_id, document)
+            return
+
+        await self.awrite({document_id: document})
+        await persisted_document_cache.aset(document_id, document)
+
+    def should_save(self, document_id: str) -> bool:
+        with self.lock:
+            if document_id in self.pending:
+                return False
+
+        return persisted_document_cache.get_local(document_id) is None
+
+    def enqueue(self, document_id: str, document: str) -> None:
+        with self.lock:
+            self.pending[document_id] = document
+
+            if len(self.pending) >= undine_settings.PERSISTED_DOCUMENTS_APQ_BATCH_SIZE:
+                self.start_timer(interval=0)
+            elif self.timer is None:
+                self.start_timer(interval=undine_settings.PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL)
+
+    def start_timer(self, *, interval: float) -> None:
+        # Should be called with the lock held.
+        if self.timer is not None:
+            self.timer.cancel()
+
+        self.timer = threading.Timer(interval, self.flush_in_thread)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def flush(self) -> None:
+        """Write all queued documents to the database."""
+        with self.lock:
+            documents = self.pending
+            self.pending = {}
+
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+        if not documents:
+            return
+
+        try:
+            self.write(documents)
+        except DatabaseError:
+            logger.exception("Failed to write %s automatic persisted queries.", len(documents))
+            # Remove the documents from the cache so that they are saved again when clients re-register them.
+            for document_id in documents:
+                persisted_document_cache.delete(document_id)
+
+    def flush_in_thread(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # The timer thread has its own database connections, which must be closed manually.
+            connections.close_all()
+
+    def write(self, documents: dict[str, str]) -> None:
+        docs = [PersistedDocument(document_id=document_id, document=doc) for document_id, doc in documents.items()]
+        PersistedDocument.objects.bulk_create(docs, ignore_conflicts=True)
+
+    async def awrite(self, documents: dict[str, str]) -> None:
+        docs = [PersistedDocument(document_id=document_id, document=doc) for document_id, doc in documents.items()]
+        await PersistedDocument.objects.abulk_create(docs, ignore_conflicts=True)
+
+
+automatic_persisted_query_writer = AutomaticPersistedQueryWriter()
+
+# Don't lose queued documents when the process exits.
+atexit.register(automatic_persisted_query_writer.flush)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from graphql import GraphQLError, OperationDefinitionNode, OperationType, parse
+
+from undine.dataclasses import PersistedDocumentData
+from undine.settings import undine_settings
+from undine.utils.graphql.caching import RequestCacheCalculator
+from undine.utils.graphql.utils import get_fragment_definitions
+
+if TYPE_CHECKING:
+    from django.core.cache import BaseCache
+
+    from undine.dataclasses import CacheControlResults
+
+    from .models import PersistedDocument
+
+__all__ = [
+    "PersistedDocumentCache",
+    "compile_persisted_document",
+    "invalidate_persisted_document",
+    "persisted_document_cache",
+]
+
+
+class PersistedDocumentCache:
+    """
+    Cache for persisted documents.
+
+    Documents are kept in a bounded in-process LRU cache in their precompiled form,
+    so that executing a persisted document doesn't require a database query, parsing,
+    or running validation rules that don't depend on the request.
+    Optionally, documents are also stored in a shared Django cache, so that other processes
+    can fill their in-process caches without querying the database.
+    """
+
+    def __init__(self) -> None:
+        self.documents: OrderedDict[str, PersistedDocumentData] = OrderedDict()
+        self.lock = threading.Lock()
+
+    @property
+    def shared_cache(self) -> BaseCache | None:
+        alias = undine_settings.PERSISTED_DOCUMENTS_CACHE_ALIAS
+        if alias is None:
+            return None
+        return caches[alias]
+
+    def get(self, document_id: str) -> PersistedDocumentData | None:
+        data = self.get_local(document_id)
+        if data is not None:
+            return data
+
+        shared_cache = self.shared_cache
+        if shared_cache is None:
+            return None
+
+        document: str | None = shared_cache.get(self.get_cache_key(document_id))
+        if document is None:
+            return None
+
+        return self.set_local(document_id, document)
+
+    async def aget(self, document_id: str) -> PersistedDocumentData | None:
+        data = self.get_local(document_id)
+        if data is not None:
+            return data
+
+        shared_cache = self.shared_cache
+        if shared_cache is None:
+            return None
+
+        document: str | None = await shared_cache.aget(self.get_cache_key(document_id))
+        if document is None:
+            return None
+
+        return self.set_local(document_id, document)
+
+    def set(self, document_id: str, document: str) -> PersistedDocumentData:
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            key = self.get_cache_key(document_id)
+            shared_cache.set(key, document, undine_settings.PERSISTED_DOCUMENTS_CACHE_TIMEOUT)
+
+        return self.set_local(document_id, document)
+
+    async def aset(self, document_id: str, document: str) -> PersistedDocumentData:
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            key = self.get_cache_key(document_id)
+            await shared_cache.aset(key, document, undine_settings.PERSISTED_DOCUMENTS_CACHE_TIMEOUT)
+
+        return self.set_local(document_id, document)
+
+    def set_many(self, documents: dict[str, PersistedDocumentData]) -> None:
+        """
+        Add the given precompiled documents to the cache.
+
+        :param documents: Mapping of document IDs to precompiled documents.
+        """
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            data = {self.get_cache_key(document_id): data.document for document_id, data in documents.items()}
+            shared_cache.set_many(data, undine_settings.PERSISTED_DOCUMENTS_CACHE_TIMEOUT)
+
+        if undine_settings.PERSISTED_DOCUMENTS_CACHE_MAX_SIZE <= 0:
+            return
+
+        for document_id, data in documents.items():
+            self.store_local(document_id, data)
+
+    def delete(self, document_id: str) -> None:
+        shared_cache = self.shared_cache
+        if shared_cache is not None:
+            shared_cache.delete(self.get_cache_key(document_id))
+
+        with self.lock:
+            self.documents.pop(document_id, None)
+
+    def clear(self) -> None:
+        """Clear the in-process cache. The shared cache is not cleared."""
+        with self.lock:
+            self.documents.clear()
+
+    def get_local(self, document_id: str) -> PersistedDocumentData | None:
+        with self.lock:
+            data = self.documents.get(document_id)
+            if data is not None:
+                self.documents.move_to_end(document_id)
+
+        # Precompiled data is only valid for the schema it was compiled against.
+        if data is not None and data.schema is not undine_settings.SCHEMA:
+            return self.set_local(document_id, data.document)
+
+        return data
+
+    def set_local(self, document_id: str, document: str) -> PersistedDocumentData:
+        max_size = undine_settings.PERSISTED_DOCUMENTS_CACHE_MAX_SIZE
+        if max_size <= 0:
+            return PersistedDocumentData(document=document)
+
+        data = compile_persisted_document(document)
+        self.store_local(document_id, data)
+        return data
+
+    def store_local(self, document_id: str, data: PersistedDocumentData) -> None:
+        max_size = undine_settings.PERSISTED_DOCUMENTS_CACHE_MAX_SIZE
+
+        with self.lock:
+            self.documents[document_id] = data
+            self.documents.move_to_end(document_id)
+            while len(self.documents) > max_size:
+                self.documents.popitem(last=False)
+
+    def get_cache_key(self, document_id: str) -> str:
+        return f"{undine_settings.PERSISTED_DOCUMENTS_CACHE_PREFIX}:{document_id}"
+
+
+persisted_document_cache = PersistedDocumentCache()
+
+
+def compile_persisted_document(document: str) -> PersistedDocumentData:
+    """
+    Precompile the given persisted document against the current schema.
+
+    The document is parsed and validated using the validation rules that don't depend on the request,
+    and the request cache results are calculated for its query operations. Any parse or validation errors
+    are stored in the results, and are reported again when the document is executed.
+    """
+    from undine.execution import _validate  # noqa: PLC0415
+
+    schema = undine_settings.SCHEMA
+
+    try:
+        document_node = parse(
+            source=document,
+            no_location=undine_settings.NO_ERROR_LOCATION,
+            max_tokens=undine_settings.MAX_TOKENS,
+        )
+    except GraphQLError as error:
+        return PersistedDocumentData(document=document, schema=schema, errors=[error])
+
+    errors = _validate(document=document_node)
+    if errors:
+        return PersistedDocumentData(document=document, document_node=document_node, schema=schema, errors=errors)
+
+    fragments = get_fragment_definitions(document_node)
+    cache_control: dict[str | None, CacheControlResults] = {}
+
+    for definition in document_node.definitions:
+        if isinstance(definition, OperationDefinitionNode) and definition.operation == OperationType.QUERY:
+            operation_name = definition.name.value if definition.name else None
+            cache_control[operation_name] = RequestCacheCalculator(definition, fragments).run()
+
+    return PersistedDocumentData(
+        document=document,
+        document_node=document_node,
+        schema=schema,
+        cache_control=cache_control,
+    )
+
+
+def invalidate_persisted_document(instance: PersistedDocument, **kwargs: Any) -> None:
+    """Remove a persisted document from the cache when it's saved or deleted."""
+    persisted_document_cache.delete(instance.document_id)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management import BaseCommand, CommandError
+
+from undine.persisted_documents.utils import compile_persisted_documents
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompile persisted documents against the current schema, "
+        "and report documents that are no longer valid for the schema."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        errors = compile_persisted_documents()
+        if not errors:
+            self.stdout.write("All persisted documents are valid.")
+            return
+
+        for document_id, document_errors in errors.items():
+            self.stderr.write(f"Persisted document '{document_id}' is invalid:")
+            for error in document_errors:
+                self.stderr.write(f"  {error.message}")
+
+        msg = f"{len(errors)} persisted document(s) are invalid."
+        raise CommandError(msg)
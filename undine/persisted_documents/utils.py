@@ -7,12 +7,17 @@
 
 from undine.exceptions import GraphQLErrorGroup, GraphQLRequestParseError, GraphQLValidationError
 
+from .cache import compile_persisted_document, persisted_document_cache
 from .models import PersistedDocument
 
 if TYPE_CHECKING:
+    from graphql import GraphQLError
+
+    from undine.dataclasses import PersistedDocumentData
     from undine.typing import DjangoRequestProtocol
 
 __all__ = [
+    "compile_persisted_documents",
     "parse_document_map",
     "register_persisted_documents",
     "to_document_id",
@@ -61,9 +66,33 @@ def register_persisted_documents(document_map: dict[str, str]) -> dict[str, str]
         unique_fields=["document_id"],
     )
 
+    # 'bulk_create' doesn't send 'post_save' signals, so update the cache here.
+    persisted_document_cache.set_many({doc.document_id: compile_persisted_document(doc.document) for doc in docs})
+
     return document_id_map
 
 
+def compile_persisted_documents() -> dict[str, list[GraphQLError]]:
+    """
+    Precompile all persisted documents against the current schema and add them to the cache.
+
+    :return: Mapping of 'document_ids' to the errors of the documents that failed to parse or validate,
+             e.g. because the schema has changed after the documents were registered.
+    """
+    documents: dict[str, PersistedDocumentData] = {}
+    errors: dict[str, list[GraphQLError]] = {}
+
+    queryset = PersistedDocument.objects.values_list("document_id", "document").order_by("document_id")
+    for document_id, document in queryset.iterator():
+        data = compile_persisted_document(document)
+        documents[document_id] = data
+        if data.errors:
+            errors[document_id] = data.errors
+
+    persisted_document_cache.set_many(documents)
+    return errors
+
+
 def parse_document_map(json_data: dict[str, Any]) -> dict[str, str]:
     documents = json_data.get("documents")
     if documents is None:
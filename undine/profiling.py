@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import json
+import time
+from contextvars import ContextVar
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any
+
+from django.db import connections  # noqa: ICN003
+from django.db.backends.signals import connection_created
+from graphql import ExecutionResult
+
+from undine.hooks import LifecycleHook
+from undine.settings import undine_settings
+from undine.utils.graphql.utils import get_operation_definition, is_trivial_resolver
+from undine.utils.logging import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Generator
+
+    from django.db.backends.base.base import BaseDatabaseWrapper
+    from graphql import GraphQLFieldResolver
+
+    from undine.hooks import LifecycleHookContext
+    from undine.typing import GQLInfo
+
+__all__ = [
+    "OperationProfile",
+    "ProfilingHook",
+]
+
+
+PROFILING_EXTENSION_KEY: str = "profiling"
+"""Key under GraphQL response `extensions` where the collected timings are written."""
+
+_current_profile: ContextVar[OperationProfile | None] = ContextVar("undine_current_profile", default=None)
+_current_entrypoint: ContextVar[str | None] = ContextVar("undine_current_entrypoint", default=None)
+
+
+class ProfilingHook(LifecycleHook):
+    """
+    Lifecycle hook that profiles GraphQL operations.
+
+    Records the durations of the parsing, validation and execution steps, the database time
+    and number of queries for each entrypoint, and the durations of resolvers that don't
+    simply access an attribute. Timings are reported using the `undine` logger, the response
+    `extensions`, and OpenTelemetry spans, depending on the `PROFILING_*` settings.
+    """
+
+    def __init__(self, context: LifecycleHookContext) -> None:
+        super().__init__(context)
+        self.profile = OperationProfile(operation_name=context.operation_name)
+
+    def on_operation(self) -> Generator[None, None, None]:
+        install_database_wrappers()
+
+        token = _current_profile.set(self.profile)
+        self.profile.start()
+        try:
+            yield
+        finally:
+            self.profile.stop()
+            _current_profile.reset(token)
+            self.report()
+
+    async def on_operation_async(self) -> AsyncGenerator[None, None]:
+        # Database queries are run in another thread, where the wrappers are installed
+        # by the `connection_created` signal when the connection is opened.
+        token = _current_profile.set(self.profile)
+        self.profile.start()
+        try:
+            yield
+        finally:
+            self.profile.stop()
+            _current_profile.reset(token)
+            self.report()
+
+    def on_parse(self) -> Generator[None, None, None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.profile.phases["parse"] = (start, time.perf_counter_ns())
+
+    def on_validation(self) -> Generator[None, None, None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.profile.phases["validation"] = (start, time.perf_counter_ns())
+
+    def on_execution(self) -> Generator[None, None, None]:
+        operation = get_operation_definition(self.context.document, self.context.operation_name)  # type: ignore[arg-type]
+        if operation.name is not None:
+            self.profile.operation_name = operation.name.value
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.profile.phases["execution"] = (start, time.perf_counter_ns())
+
+    def resolve(self, resolver: GraphQLFieldResolver, root: Any, info: GQLInfo, **kwargs: Any) -> Any:  # type: ignore[override]
+        if info.path.prev is None:
+            return self.resolve_entrypoint(resolver, root, info, **kwargs)
+
+        if is_trivial_resolver(info):
+            return resolver(root, info, **kwargs)
+
+        coordinate = f"{info.parent_type.name}.{info.field_name}"
+        start = time.perf_counter_ns()
+
+        result = resolver(root, info, **kwargs)
+
+        if isawaitable(result):
+
+            async def _await_and_time() -> Any:
+                try:
+                    return await result
+                finally:
+                    self.profile.add_resolver(coordinate, time.perf_counter_ns() - start)
+
+            return _await_and_time()
+
+        self.profile.add_resolver(coordinate, time.perf_counter_ns() - start)
+        return result
+
+    def resolve_entrypoint(self, resolver: GraphQLFieldResolver, root: Any, info: GQLInfo, **kwargs: Any) -> Any:
+        key = str(info.path.key)
+        entrypoint = self.profile.get_entrypoint(key)
+        entrypoint.start_ns = time.perf_counter_ns()
+
+        # Database queries made while resolving the entrypoint are attributed to it.
+        token = _current_entrypoint.set(key)
+        try:
+            result = resolver(root, info, **kwargs)
+        finally:
+            _current_entrypoint.reset(token)
+
+        if isawaitable(result):
+
+            async def _await_and_time() -> Any:
+                token = _current_entrypoint.set(key)
+                try:
+                    return await result
+                finally:
+                    _current_entrypoint.reset(token)
+                    entrypoint.end_ns = time.perf_counter_ns()
+
+            return _await_and_time()
+
+        entrypoint.end_ns = time.perf_counter_ns()
+        return result
+
+    def report(self) -> None:
+        data = self.profile.to_dict()
+
+        level = undine_settings.PROFILING_LOG_LEVEL
+        if level is not None and logger.isEnabledFor(level):
+            logger.log(level, "Profile for operation %r: %s", self.profile.operation_name, json.dumps(data))
+
+        if undine_settings.PROFILING_RESPONSE_EXTENSIONS:
+            result = self.context.result
+            if isinstance(result, ExecutionResult):
+                extensions = dict(result.extensions) if result.extensions else {}
+                extensions[PROFILING_EXTENSION_KEY] = data
+                result.extensions = extensions
+
+        if undine_settings.PROFILING_OPENTELEMETRY:
+            tracer = get_tracer()
+            if tracer is not None:
+                self.profile.export_spans(tracer)
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class ResolverProfile:
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class EntrypointProfile:
+    start_ns: int = 0
+    end_ns: int = 0
+    db_time_ns: int = 0
+    db_queries: int = 0
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class OperationProfile:
+    """Timings collected by `ProfilingHook` for a single GraphQL operation."""
+
+    operation_name: str | None = None
+
+    wall_start_ns: int = 0
+    """Wall clock time when the operation started. Used to convert other timings to timestamps."""
+
+    start_ns: int = 0
+    end_ns: int = 0
+
+    phases: dict[str, tuple[int, int]] = dataclasses.field(default_factory=dict)
+    """Start and end times of the parsing, validation and execution steps."""
+
+    entrypoints: dict[str, EntrypointProfile] = dataclasses.field(default_factory=dict)
+    """Timings for each entrypoint, by response key."""
+
+    resolvers: dict[str, ResolverProfile] = dataclasses.field(default_factory=dict)
+    """Timings of non-trivial resolvers, by schema coordinate, e.g. `TaskType.name`."""
+
+    db_time_ns: int = 0
+    db_queries: int = 0
+
+    def start(self) -> None:
+        self.wall_start_ns = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        self.end_ns = time.perf_counter_ns()
+
+    def get_entrypoint(self, key: str) -> EntrypointProfile:
+        entrypoint = self.entrypoints.get(key)
+        if entrypoint is None:
+            entrypoint = self.entrypoints[key] = EntrypointProfile()
+        return entrypoint
+
+    def add_resolver(self, coordinate: str, duration_ns: int) -> None:
+        resolver = self.resolvers.get(coordinate)
+        if resolver is None:
+            resolver = self.resolvers[coordinate] = ResolverProfile()
+
+        resolver.count += 1
+        resolver.total_ns += duration_ns
+        resolver.max_ns = max(resolver.max_ns, duration_ns)
+
+    def add_query(self, entrypoint_key: str | None, duration_ns: int) -> None:
+        self.db_time_ns += duration_ns
+        self.db_queries += 1
+
+        if entrypoint_key is not None:
+            entrypoint = self.get_entrypoint(entrypoint_key)
+            entrypoint.db_time_ns += duration_ns
+            entrypoint.db_queries += 1
+
+    def to_timestamp(self, perf_counter_ns: int) -> int:
+        return self.wall_start_ns + (perf_counter_ns - self.start_ns)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the profile to a JSON serializable dict with durations in milliseconds."""
+        data: dict[str, Any] = {"duration": _to_ms(self.end_ns - self.start_ns)}
+
+        for name, (start, end) in self.phases.items():
+            data[name] = _to_ms(end - start)
+
+        data["database"] = {"duration": _to_ms(self.db_time_ns), "queries": self.db_queries}
+
+        data["entrypoints"] = {
+            key: {
+                "duration": _to_ms(entrypoint.end_ns - entrypoint.start_ns),
+                "database": {"duration": _to_ms(entrypoint.db_time_ns), "queries": entrypoint.db_queries},
+            }
+            for key, entrypoint in self.entrypoints.items()
+        }
+
+        data["resolvers"] = {
+            coordinate: {
+                "count": resolver.count,
+                "duration": _to_ms(resolver.total_ns),
+                "max": _to_ms(resolver.max_ns),
+            }
+            for coordinate, resolver in self.resolvers.items()
+        }
+
+        return data
+
+    def export_spans(self, tracer: Any) -> None:
+        """Export the profile as OpenTelemetry spans using the given tracer."""
+        from opentelemetry.trace import set_span_in_context  # noqa: PLC0415
+
+        attributes: dict[str, Any] = {"db.duration_ms": _to_ms(self.db_time_ns), "db.queries": self.db_queries}
+        if self.operation_name:
+            attributes["graphql.operation.name"] = self.operation_name
+
+        operation_span = tracer.start_span(
+            "graphql.operation",
+            start_time=self.to_timestamp(self.start_ns),
+            attributes=attributes,
+        )
+        operation_context = set_span_in_context(operation_span)
+
+        for name, (start, end) in self.phases.items():
+            span = tracer.start_span(f"graphql.{name}", context=operation_context, start_time=self.to_timestamp(start))
+            span.end(end_time=self.to_timestamp(end))
+
+        for key, entrypoint in self.entrypoints.items():
+            span = tracer.start_span(
+                f"graphql.entrypoint {key}",
+                context=operation_context,
+                start_time=self.to_timestamp(entrypoint.start_ns),
+                attributes={
+                    "db.duration_ms": _to_ms(entrypoint.db_time_ns),
+                    "db.queries": entrypoint.db_queries,
+                },
+            )
+            span.end(end_time=self.to_timestamp(entrypoint.end_ns))
+
+        for coordinate, resolver in self.resolvers.items():
+            operation_span.add_event(
+                "graphql.resolver",
+                attributes={
+                    "graphql.field.coordinate": coordinate,
+                    "count": resolver.count,
+                    "duration_ms": _to_ms(resolver.total_ns),
+                    "max_ms": _to_ms(resolver.max_ns),
+                },
+            )
+
+        operation_span.end(end_time=self.to_timestamp(self.end_ns))
+
+
+@functools.cache
+def get_tracer() -> Any:
+    """Get the OpenTelemetry tracer for Undine, or None if OpenTelemetry is not installed."""
+    try:
+        from opentelemetry import trace  # noqa: PLC0415
+    except ImportError:
+        return None
+    return trace.get_tracer("undine")
+
+
+def profile_database_query(execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any) -> Any:  # noqa: FBT001
+    """Database execute wrapper that adds the query time to the profile of the current operation, if any."""
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter_ns()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add_query(_current_entrypoint.get(), time.perf_counter_ns() - start)
+
+
+def install_database_wrappers() -> None:
+    """Add the profiling execute wrapper to all database connections in the current thread."""
+    for connection in connections.all():
+        install_database_wrapper(connection=connection)
+
+
+def install_database_wrapper(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    # Insert as the innermost wrapper, so that `connection.execute_wrapper()` context managers,
+    # which remove the last wrapper when exiting, don't remove this one.
+    if profile_database_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, profile_database_query)
+
+
+connection_created.connect(install_database_wrapper)
+
+
+def _to_ms(duration_ns: int) -> float:
+    return round(duration_ns / 1_000_000, 3)
@@ -42,6 +42,7 @@
     from undine import FilterSet, GQLInfo, InterfaceType, OrderSet
     from undine.optimizer.optimizer import OptimizationData
     from undine.typing import (
+        CostFunc,
         DjangoRequestProtocol,
         FieldParams,
         FieldPermFunc,
@@ -65,6 +66,7 @@ class QueryTypeMeta(type):
     __orderset__: type[OrderSet] | None
     __cache_time__: int | None
     __cache_per_user__: bool
+    __entity_cache_time__: int | None
     __field_map__: dict[str, Field]
     __schema_name__: str
     __interfaces__: Collection[type[InterfaceType]]
@@ -114,6 +116,11 @@ def __new__(
         query_type.__attribute_docstrings__ = parse_class_attribute_docstrings(query_type)
         query_type.__cache_time__ = kwargs.get("cache_time")
         query_type.__cache_per_user__ = kwargs.get("cache_per_user", False)
+        query_type.__entity_cache_time__ = kwargs.get("entity_cache_time")
+        if query_type.__entity_cache_time__ is not None:
+            from undine.optimizer.entity_cache import connect_entity_cache_invalidation  # noqa: PLC0415
+
+            connect_entity_cache_invalidation(model)
 
         query_type.__interfaces__ = []
 
@@ -201,6 +208,10 @@ class QueryType(Generic[TModel], metaclass=QueryTypeMeta):
     `cache_per_user: bool = False`
         Whether the `QueryType` is cached per user or not.
 
+    `entity_cache_time: int | None = None`
+        How many seconds the values of the selected model fields are cached for each object.
+        Cached values are not fetched from the database.
+
     `interfaces: list[type[InterfaceType]] = []`
         Interfaces this `QueryType` should implement.
 
@@ -230,6 +241,7 @@ class QueryType(Generic[TModel], metaclass=QueryTypeMeta):
     __orderset__: ClassVar[type[OrderSet] | None]
     __cache_time__: ClassVar[int | None]
     __cache_per_user__: ClassVar[bool]
+    __entity_cache_time__: ClassVar[int | None]
     __field_map__: ClassVar[dict[str, Field]]
     __schema_name__: ClassVar[str]
     __interfaces__: ClassVar[Collection[type[InterfaceType]]]
@@ -322,6 +334,7 @@ def __init__(self, ref: Any = None, **kwargs: Unpack[FieldParams]) -> None:
         self.optimizer_func: OptimizerFunc | None = None
         self.permissions_func: FieldPermFunc | None = None
         self.visible_func: VisibilityFunc | None = None
+        self.cost_func: CostFunc | None = None
 
     def __connect__(self, query_type: type[QueryType], name: str) -> None:
         """Connect this `Field` to the given `QueryType` using the given name."""
@@ -456,6 +469,23 @@ def visible(self, func: VisibilityFunc | None = None, /) -> VisibilityFunc:
         self.visible_func = get_wrapped_func(func)
         return func
 
+    def cost(self, func: CostFunc | None = None, /) -> CostFunc:
+        """
+        Decorate a function to calculate the cost of this Field for each parent object
+        from the Field's arguments. Used by `QueryCostHook` instead of the Field's complexity.
+
+        >>> class TaskType(QueryType[Task]):
+        ...     name = Field()
+        ...
+        ...     @name.cost
+        ...     def name_cost(self: Field, arguments: dict[str, Any]) -> int:
+        ...         return 1
+        """
+        if func is None:  # Allow `@<field_name>.cost()`
+            return self.cost  # type: ignore[return-value]
+        self.cost_func = get_wrapped_func(func)
+        return func
+
 
 def get_fields_for_model(model: type[Model], *, exclude: Container[str] = ()) -> dict[str, Field]:
     """Add undine.Fields for all the given model's fields, except those in the 'exclude' list."""
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import base64
-from typing import TYPE_CHECKING, Unpack
+from typing import TYPE_CHECKING, Literal, Unpack
 
 from graphql import GraphQLBoolean, GraphQLField, GraphQLID, GraphQLNonNull, GraphQLString
 from graphql.type.scalars import serialize_id
@@ -10,6 +10,7 @@
 from undine.exceptions import InterfaceFieldNodeIDError
 from undine.pagination import PaginationHandler
 from undine.settings import undine_settings
+from undine.typing import TotalCountStrategy
 from undine.utils.graphql.type_registry import get_or_create_graphql_object_type
 from undine.utils.reflection import is_subclass
 
@@ -21,6 +22,7 @@
     "Connection",
     "Node",
     "NodeIDField",
+    "Nodes",
     "PageInfoType",
     "cursor_to_offset",
     "decode_base64",
@@ -55,6 +57,15 @@ class Node(InterfaceType):
     id = NodeIDField()
 
 
+class Nodes:
+    """
+    Fetch multiple objects implementing the `Node` interface using their Global IDs.
+
+    Objects are returned in the same order as the given IDs. IDs for objects that don't exist
+    or are not visible to the user resolve to null.
+    """
+
+
 class Connection:
     """A wrapper for paginating a `QueryType` using Relay Connections."""
 
@@ -65,6 +76,8 @@ def __init__(
         *,
         page_size: int | None = undine_settings.PAGINATION_PAGE_SIZE,
         pagination_handler: type[PaginationHandler] = PaginationHandler,
+        total_count_strategy: TotalCountStrategy | Literal["exact", "capped", "estimated"] = TotalCountStrategy.exact,
+        total_count_limit: int = undine_settings.PAGINATION_TOTAL_COUNT_LIMIT,
         description: str | None = None,
     ) -> None:
         """
@@ -73,6 +86,8 @@ def __init__(
         :param ref: The `QueryType`, `UnionType`, or `InterfaceType` to use.
         :param page_size: Maximum number of items to return in a page. No limit if `None`.
         :param pagination_handler: Handler to use for pagination.
+        :param total_count_strategy: How the total count of top-level connections is calculated.
+        :param total_count_limit: Number of items up to which 'capped' and 'estimated' total counts are exact.
         :param description: Description for the created GraphQL type.
         """
         self.query_type: type[QueryType] | None = ref if is_subclass(ref, QueryType) else None
@@ -81,6 +96,8 @@ def __init__(
 
         self.page_size = page_size
         self.pagination_handler = pagination_handler
+        self.total_count_strategy = TotalCountStrategy(total_count_strategy)
+        self.total_count_limit = total_count_limit
         self.description = description
 
 
@@ -31,6 +31,7 @@
     NestedQueryTypeManyResolver,
     NestedQueryTypeSingleResolver,
     NodeResolver,
+    NodesResolver,
     QueryTypeManyResolver,
     QueryTypeSingleResolver,
     UnionTypeConnectionResolver,
@@ -62,6 +63,7 @@
     "NestedQueryTypeManyResolver",
     "NestedQueryTypeSingleResolver",
     "NodeResolver",
+    "NodesResolver",
     "QueryTypeManyResolver",
     "QueryTypeSingleResolver",
     "SubscriptionValueResolver",
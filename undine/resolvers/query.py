@@ -4,16 +4,18 @@
 import inspect
 import uuid
 from collections import defaultdict
+from contextlib import aclosing
 from itertools import count
 from typing import TYPE_CHECKING, Any, Generic, Optional
 
 from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
 from django.db.models import Q, Value
 from django.db.models.manager import BaseManager
-from graphql import GraphQLID, GraphQLObjectType
+from graphql import GraphQLError, GraphQLID, GraphQLObjectType
 
 from undine import QueryType
-from undine.dataclasses import OptimizationWithPagination, QuerySetMapWithPagination
+from undine.dataclasses import InstancesWithPagination, OptimizationWithPagination, QuerySetMapWithPagination
 from undine.exceptions import (
     GraphQLFieldNotNullableError,
     GraphQLModelNotFoundError,
@@ -25,23 +27,27 @@
     GraphQLNodeQueryTypeMissingError,
     GraphQLNodeTypeNotObjectTypeError,
 )
-from undine.optimizer.optimizer import optimize_async, optimize_sync
+from undine.optimizer.optimizer import optimize_async, optimize_stream_async, optimize_sync
+from undine.optimizer.parallel import is_parallel_entrypoint, run_in_entrypoint_thread
 from undine.optimizer.prefetch_hack import evaluate_with_prefetch_hack_async, evaluate_with_prefetch_hack_sync
 from undine.relay import Node, from_global_id, offset_to_cursor, to_global_id
 from undine.settings import undine_settings
 from undine.typing import ConnectionDict, NodeDict, PageInfoDict, TModel
+from undine.utils.graphql.caching import record_pending_model_versions_async
 from undine.utils.graphql.undine_extensions import get_undine_query_type
 from undine.utils.graphql.utils import (
     get_arguments,
     get_queried_field_name,
     get_underlying_type,
+    is_streamed_field,
     pre_evaluate_request_user,
 )
-from undine.utils.model_utils import create_union_queryset
+from undine.utils.model_utils import create_union_queryset, limit_queryset
 from undine.utils.reflection import get_root_and_info_params, is_subclass
+from undine.utils.visibility import is_visible
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Hashable
+    from collections.abc import AsyncGenerator, Callable, Hashable
     from types import FunctionType
 
     from django.db.models import Model, QuerySet
@@ -68,6 +74,7 @@
     "NestedQueryTypeManyResolver",
     "NestedQueryTypeSingleResolver",
     "NodeResolver",
+    "NodesResolver",
     "QueryTypeManyResolver",
     "QueryTypeSingleResolver",
     "TypedDictFieldResolver",
@@ -485,8 +492,15 @@ class QueryTypeManyResolver(Generic[TModel]):
 
     additional_filter: Optional[Q] = None  # noqa: UP045
 
-    def __call__(self, root: Any, info: GQLInfo, **kwargs: Any) -> AwaitableOrValue[list[TModel]]:
+    def __call__(
+        self,
+        root: Any,
+        info: GQLInfo,
+        **kwargs: Any,
+    ) -> AwaitableOrValue[list[TModel]] | AsyncGenerator[TModel]:
         if undine_settings.ASYNC:
+            if is_streamed_field(info):
+                return self.run_stream(root, info, **kwargs)
             return self.run_async(root, info, **kwargs)
         return self.run_sync(root, info, **kwargs)
 
@@ -505,6 +519,16 @@ async def run_async(self, root: Any, info: GQLInfo, **kwargs: Any) -> list[TMode
         await self.check_permissions_async(root, info, instances)
         return instances
 
+    async def run_stream(self, root: Any, info: GQLInfo, **kwargs: Any) -> AsyncGenerator[TModel]:
+        # Fetch user eagerly so that its available in synchronous parts of the code.
+        await pre_evaluate_request_user(info)
+
+        queryset = self.get_queryset(info)
+        async with aclosing(optimize_stream_async(queryset, info, limit=self.entrypoint.limit)) as instances:
+            async for instance in instances:
+                await self.check_permissions_async(root, info, [instance])
+                yield instance
+
     def get_queryset(self, info: GQLInfo) -> QuerySet[TModel]:
         queryset = self.query_type.__get_queryset__(info)
         if self.additional_filter is not None:
@@ -670,30 +694,158 @@ def __call__(self, root: Any, info: GQLInfo, **kwargs: Any) -> AwaitableOrValue[
         except Exception as error:
             raise GraphQLNodeInvalidGlobalIDError(value=kwargs["id"]) from error
 
-        object_type = info.schema.get_type(typename)
-        if object_type is None:
-            raise GraphQLNodeObjectTypeMissingError(typename=typename)
+        query_type = get_node_query_type(typename, info)
+        resolver = QueryTypeSingleResolver(query_type=query_type, entrypoint=self.entrypoint)
+        return resolver(root, info, pk=object_id)
+
 
-        if not isinstance(object_type, GraphQLObjectType):
-            raise GraphQLNodeTypeNotObjectTypeError(typename=typename)
+@dataclasses.dataclass(frozen=True, slots=True)
+class NodesResolver(Generic[TModel]):
+    """
+    Resolves model instances through a list of Global IDs.
 
-        query_type = get_undine_query_type(object_type)
-        if query_type is None:
-            raise GraphQLNodeQueryTypeMissingError(typename=typename)
+    Instances of the same object type are fetched in a single query. Results are returned
+    in the order of the given IDs, with null for objects that don't exist or are not visible.
+    """
 
-        if Node not in query_type.__interfaces__:
-            raise GraphQLNodeInterfaceMissingError(typename=typename)
+    entrypoint: Entrypoint
 
-        field: Field | None = query_type.__field_map__.get("id")
-        if field is None:
-            raise GraphQLNodeMissingIDFieldError(typename=typename)
+    def __call__(self, root: Any, info: GQLInfo, **kwargs: Any) -> AwaitableOrValue[list[Any]]:
+        batch = self.group_ids(kwargs["ids"], info)
+        if undine_settings.ASYNC:
+            return self.run_async(root, info, batch)
+        return self.run_sync(root, info, batch)
 
-        field_type = get_underlying_type(field.get_field_type())  # type: ignore[type-var]
-        if field_type is not GraphQLID:
-            raise GraphQLNodeIDFieldTypeError(typename=typename)
+    def run_sync(self, root: Any, info: GQLInfo, batch: NodeBatch) -> list[Any]:
+        for query_type, indexes_by_pk in batch.pks_by_query_type.items():
+            queryset = query_type.__get_queryset__(info).filter(pk__in=list(indexes_by_pk))
+            instances = optimize_sync(queryset, info)
+
+            for instance in instances:
+                try:
+                    self.check_permissions(root, info, query_type, instance)
+                except GraphQLError as error:
+                    batch.set_result(indexes_by_pk, instance, error)
+                else:
+                    batch.set_result(indexes_by_pk, instance, instance)
+
+        return batch.results
+
+    async def run_async(self, root: Any, info: GQLInfo, batch: NodeBatch) -> list[Any]:
+        # Fetch user eagerly so that its available in synchronous parts of the code.
+        await pre_evaluate_request_user(info)
+
+        for query_type, indexes_by_pk in batch.pks_by_query_type.items():
+            queryset = query_type.__get_queryset__(info).filter(pk__in=list(indexes_by_pk))
+            instances = await optimize_async(queryset, info)
+
+            for instance in instances:
+                try:
+                    await self.check_permissions_async(root, info, query_type, instance)
+                except GraphQLError as error:
+                    batch.set_result(indexes_by_pk, instance, error)
+                else:
+                    batch.set_result(indexes_by_pk, instance, instance)
+
+        return batch.results
+
+    def group_ids(self, ids: list[str], info: GQLInfo) -> NodeBatch:
+        """Group the primary keys of the given Global IDs by their QueryType."""
+        batch = NodeBatch(results=[None] * len(ids))
+
+        for index, global_id in enumerate(ids):
+            try:
+                typename, object_id = from_global_id(global_id)
+            except Exception:  # noqa: BLE001
+                batch.results[index] = GraphQLNodeInvalidGlobalIDError(value=global_id)
+                continue
+
+            try:
+                query_type = get_node_query_type(typename, info)
+            except GraphQLError as error:
+                batch.results[index] = error
+                continue
+
+            if not is_visible(info.schema.get_type(typename), info.context):  # type: ignore[arg-type]
+                continue
+
+            try:
+                pk = query_type.__model__._meta.pk.to_python(object_id)  # type: ignore[union-attr]
+            except (ValidationError, ValueError):
+                batch.results[index] = GraphQLNodeInvalidGlobalIDError(value=global_id)
+                continue
+
+            indexes_by_pk = batch.pks_by_query_type.setdefault(query_type, {})
+            indexes_by_pk.setdefault(pk, []).append(index)
+
+        return batch
+
+    def check_permissions(self, root: Any, info: GQLInfo, query_type: type[QueryType], instance: Model) -> None:
+        if self.entrypoint.permissions_func is not None:
+            self.entrypoint.permissions_func(root, info, instance)
+        else:
+            query_type.__permissions__(instance, info)
+
+    async def check_permissions_async(
+        self,
+        root: Any,
+        info: GQLInfo,
+        query_type: type[QueryType],
+        instance: Model,
+    ) -> None:
+        if self.entrypoint.permissions_func is not None:
+            if inspect.iscoroutinefunction(self.entrypoint.permissions_func):
+                await self.entrypoint.permissions_func(root, info, instance)
+            else:
+                self.entrypoint.permissions_func(root, info, instance)
+
+        elif inspect.iscoroutinefunction(query_type.__permissions__):
+            await query_type.__permissions__(instance, info)
+
+        else:
+            query_type.__permissions__(instance, info)
+
+
+@dataclasses.dataclass(slots=True, kw_only=True)
+class NodeBatch:
+    """Global IDs given to `NodesResolver`, grouped so that each object type can be fetched in a single query."""
+
+    results: list[Any]
+    """Results in the order of the given IDs."""
+
+    pks_by_query_type: dict[type[QueryType], dict[Any, list[int]]] = dataclasses.field(default_factory=dict)
+    """Maps QueryTypes to the primary keys to fetch, and the primary keys to their indexes in the results."""
+
+    def set_result(self, indexes_by_pk: dict[Any, list[int]], instance: Model, result: Any) -> None:
+        for index in indexes_by_pk.get(instance.pk, []):
+            self.results[index] = result
 
-        resolver = QueryTypeSingleResolver(query_type=query_type, entrypoint=self.entrypoint)
-        return resolver(root, info, pk=object_id)
+
+def get_node_query_type(typename: str, info: GQLInfo) -> type[QueryType]:
+    """Get the QueryType for the given object type name, checking that it implements the `Node` interface."""
+    object_type = info.schema.get_type(typename)
+    if object_type is None:
+        raise GraphQLNodeObjectTypeMissingError(typename=typename)
+
+    if not isinstance(object_type, GraphQLObjectType):
+        raise GraphQLNodeTypeNotObjectTypeError(typename=typename)
+
+    query_type = get_undine_query_type(object_type)
+    if query_type is None:
+        raise GraphQLNodeQueryTypeMissingError(typename=typename)
+
+    if Node not in query_type.__interfaces__:
+        raise GraphQLNodeInterfaceMissingError(typename=typename)
+
+    field: Field | None = query_type.__field_map__.get("id")
+    if field is None:
+        raise GraphQLNodeMissingIDFieldError(typename=typename)
+
+    field_type = get_underlying_type(field.get_field_type())  # type: ignore[type-var]
+    if field_type is not GraphQLID:
+        raise GraphQLNodeIDFieldTypeError(typename=typename)
+
+    return query_type
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -713,19 +865,31 @@ def __call__(self, root: Any, info: GQLInfo, **kwargs: Any) -> AwaitableOrValue[
         return self.run_sync(root, info)
 
     def run_sync(self, root: Any, info: GQLInfo) -> ConnectionDict[TModel]:
-        results = self.run_optimizer(info)
-        instances = evaluate_with_prefetch_hack_sync(results.queryset)
-        self.check_permissions(root, info, instances)
-        return self.to_connection(instances, pagination=results.pagination)
+        results = self.fetch_instances(info)
+        self.check_permissions(root, info, results.instances)
+        return self.to_connection(results.instances, pagination=results.pagination)
 
     async def run_async(self, root: Any, info: GQLInfo) -> ConnectionDict[TModel]:
         # Fetch user eagerly so that its available in synchronous parts of the code.
         await pre_evaluate_request_user(info)
 
+        if is_parallel_entrypoint(info):
+            results = await run_in_entrypoint_thread(self.fetch_instances, info)
+        else:
+            results = await self.fetch_instances_async(info)
+
+        await self.check_permissions_async(root, info, results.instances)
+        return self.to_connection(results.instances, pagination=results.pagination)
+
+    def fetch_instances(self, info: GQLInfo) -> InstancesWithPagination[TModel]:
+        results = self.run_optimizer(info)
+        instances = evaluate_with_prefetch_hack_sync(results.queryset)
+        return InstancesWithPagination(instances=instances, pagination=results.pagination)
+
+    async def fetch_instances_async(self, info: GQLInfo) -> InstancesWithPagination[TModel]:
         results = await self.run_optimizer_async(info)
         instances = await evaluate_with_prefetch_hack_async(results.queryset)
-        await self.check_permissions_async(root, info, instances)
-        return self.to_connection(instances, pagination=results.pagination)
+        return InstancesWithPagination(instances=instances, pagination=results.pagination)
 
     def get_queryset(self, info: GQLInfo) -> QuerySet[TModel]:
         return self.query_type.__get_queryset__(info)
@@ -783,14 +947,9 @@ def to_connection(self, instances: list[TModel], pagination: PaginationHandler)
         ]
         return ConnectionDict(
             totalCount=pagination.total_count or 0,
+            totalCountIsExact=pagination.total_count_is_exact,
             pageInfo=PageInfoDict(
-                hasNextPage=(
-                    False
-                    if pagination.stop is None
-                    else True
-                    if pagination.total_count is None
-                    else pagination.stop < pagination.total_count
-                ),
+                hasNextPage=pagination.has_next_page(),
                 hasPreviousPage=pagination.start > 0,
                 startCursor=None if not edges else edges[0]["cursor"],
                 endCursor=None if not edges else edges[-1]["cursor"],
@@ -880,6 +1039,7 @@ def to_connection(self, instances: list[TModel]) -> ConnectionDict[TModel]:
         ]
         return ConnectionDict(
             totalCount=total_count or 0,
+            totalCountIsExact=True,
             pageInfo=PageInfoDict(
                 hasNextPage=(False if stop is None else True if total_count is None else stop < total_count),
                 hasPreviousPage=start > 0,
@@ -988,6 +1148,7 @@ async def fetch_instances_async(self, root: Any, info: GQLInfo, queryset_map: Qu
         # from each model, so that we can sort when the actual instances are fetched.
         pks_by_typename: dict[str, dict[str, Any]] = defaultdict(dict)
         counter = count()
+        await record_pending_model_versions_async()
         async for item in union_qs:
             pk = self.coalesce_pk(item["pk"])
             pks_by_typename[item["__typename"]][pk] = next(counter)
@@ -1061,6 +1222,13 @@ def filter_union(
                 queryset = queryset.distinct()  # noqa: PLW2901
             if filter_results.filters:
                 queryset = queryset.filter(Q(*filter_results.filters))  # noqa: PLW2901
+            if filter_results.limit is not None:
+                queryset = limit_queryset(  # noqa: PLW2901
+                    queryset,
+                    limit=filter_results.limit,
+                    order_by=filter_results.order_by,
+                    aliases=filter_results.aliases,
+                )
 
             queryset_map[query_type] = queryset
 
@@ -1232,6 +1400,7 @@ async def fetch_instances_async(self, root: Any, info: GQLInfo, result: QuerySet
         # from each model, so that we can sort when the actual instances are fetched.
         pks_by_typename: dict[str, dict[Hashable, int]] = defaultdict(dict)
         counter = count()
+        await record_pending_model_versions_async()
         async for item in union_qs:
             pk = self.coalesce_pk(item["pk"])
             pks_by_typename[item["__typename"]][pk] = next(counter)
@@ -1305,6 +1474,13 @@ def filter_union(
                 queryset = queryset.distinct()  # noqa: PLW2901
             if filter_results.filters:
                 queryset = queryset.filter(Q(*filter_results.filters))  # noqa: PLW2901
+            if filter_results.limit is not None:
+                queryset = limit_queryset(  # noqa: PLW2901
+                    queryset,
+                    limit=filter_results.limit,
+                    order_by=filter_results.order_by,
+                    aliases=filter_results.aliases,
+                )
 
             queryset_map[query_type] = queryset
 
@@ -1374,14 +1550,9 @@ def to_connection(self, instances: list[TModel], pagination: PaginationHandler)
         ]
         return ConnectionDict(
             totalCount=pagination.total_count or 0,
+            totalCountIsExact=pagination.total_count_is_exact,
             pageInfo=PageInfoDict(
-                hasNextPage=(
-                    False
-                    if pagination.stop is None
-                    else True
-                    if pagination.total_count is None
-                    else pagination.stop < pagination.total_count
-                ),
+                hasNextPage=pagination.has_next_page(),
                 hasPreviousPage=pagination.start > 0,
                 startCursor=None if not edges else edges[0]["cursor"],
                 endCursor=None if not edges else edges[-1]["cursor"],
@@ -1391,7 +1562,7 @@ def to_connection(self, instances: list[TModel], pagination: PaginationHandler)
 
     def empty_connection(self) -> ConnectionDict[TModel]:
         page_info = PageInfoDict(hasNextPage=False, hasPreviousPage=False, startCursor=None, endCursor=None)
-        return ConnectionDict(totalCount=0, pageInfo=page_info, edges=[])
+        return ConnectionDict(totalCount=0, totalCountIsExact=True, pageInfo=page_info, edges=[])
 
     def coalesce_pk(self, item: Any) -> Any:
         # Converting UUIDs to hex avoids an issue with union querysets with mixed int and UUID pks.
@@ -1492,6 +1663,7 @@ async def fetch_instances_async(self, info: GQLInfo, root: Any, queryset_map: Qu
         # from each model, so that we can sort when the actual instances are fetched.
         pks_by_typename: dict[str, dict[Hashable, Any]] = defaultdict(dict)
         counter = count()
+        await record_pending_model_versions_async()
         async for item in union_qs:
             pk = self.coalesce_pk(item["pk"])
             pks_by_typename[item["__typename"]][pk] = next(counter)
@@ -1565,6 +1737,13 @@ def filter_interface(
                 queryset = queryset.distinct()  # noqa: PLW2901
             if filter_results.filters:
                 queryset = queryset.filter(Q(*filter_results.filters))  # noqa: PLW2901
+            if filter_results.limit is not None:
+                queryset = limit_queryset(  # noqa: PLW2901
+                    queryset,
+                    limit=filter_results.limit,
+                    order_by=filter_results.order_by,
+                    aliases=filter_results.aliases,
+                )
 
             queryset_map[query_type] = queryset
 
@@ -1737,6 +1916,7 @@ async def fetch_instances_async(self, root: Any, info: GQLInfo, result: QuerySet
         # from each model, so that we can sort when the actual instances are fetched.
         pks_by_typename: dict[str, dict[Hashable, int]] = defaultdict(dict)
         counter = count()
+        await record_pending_model_versions_async()
         async for item in union_qs:
             pk = self.coalesce_pk(item["pk"])
             pks_by_typename[item["__typename"]][pk] = next(counter)
@@ -1810,6 +1990,13 @@ def filter_interface(
                 queryset = queryset.distinct()  # noqa: PLW2901
             if filter_results.filters:
                 queryset = queryset.filter(Q(*filter_results.filters))  # noqa: PLW2901
+            if filter_results.limit is not None:
+                queryset = limit_queryset(  # noqa: PLW2901
+                    queryset,
+                    limit=filter_results.limit,
+                    order_by=filter_results.order_by,
+                    aliases=filter_results.aliases,
+                )
 
             queryset_map[query_type] = queryset
 
@@ -1880,14 +2067,9 @@ def to_connection(self, instances: list[TModel], pagination: PaginationHandler)
         ]
         return ConnectionDict(
             totalCount=pagination.total_count or 0,
+            totalCountIsExact=pagination.total_count_is_exact,
             pageInfo=PageInfoDict(
-                hasNextPage=(
-                    False
-                    if pagination.stop is None
-                    else True
-                    if pagination.total_count is None
-                    else pagination.stop < pagination.total_count
-                ),
+                hasNextPage=pagination.has_next_page(),
                 hasPreviousPage=pagination.start > 0,
                 startCursor=None if not edges else edges[0]["cursor"],
                 endCursor=None if not edges else edges[-1]["cursor"],
@@ -1897,7 +2079,7 @@ def to_connection(self, instances: list[TModel], pagination: PaginationHandler)
 
     def empty_connection(self) -> ConnectionDict[TModel]:
         page_info = PageInfoDict(hasNextPage=False, hasPreviousPage=False, startCursor=None, endCursor=None)
-        return ConnectionDict(totalCount=0, pageInfo=page_info, edges=[])
+        return ConnectionDict(totalCount=0, totalCountIsExact=True, pageInfo=page_info, edges=[])
 
     def coalesce_pk(self, item: Any) -> Any:
         # Converting UUIDs to hex avoids an issue with union querysets with mixed int and UUID pks.
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import itertools
+import time
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import TYPE_CHECKING, Any
+
+from graphql import OperationType
+
+from undine.hooks import LifecycleHook
+from undine.settings import undine_settings
+from undine.utils.graphql.utils import get_operation_definition
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from django.db.models import Model
+    from graphql import OperationDefinitionNode
+
+__all__ = [
+    "DatabaseRoutingHook",
+    "OperationDatabaseRouter",
+]
+
+
+_operation_database: ContextVar[str | None] = ContextVar("undine_operation_database", default=None)
+_replica_counter = itertools.count()
+
+
+class DatabaseRoutingHook(LifecycleHook):
+    """
+    Lifecycle hook that chooses the database to use for the executed operation.
+
+    Queries are routed to the read replicas in round-robin order, and mutations and subscriptions
+    to the primary database. After a mutation, queries from the same client are routed to
+    the primary database for a while, so that the client can read its own writes.
+    Requires `OperationDatabaseRouter` in the `DATABASE_ROUTERS` setting.
+    """
+
+    def on_execution(self) -> Generator[None, None, None]:
+        operation = get_operation_definition(self.context.document, self.context.operation_name)  # type: ignore[arg-type]
+
+        token = _operation_database.set(self.get_database_alias(operation))
+        try:
+            yield
+        finally:
+            _operation_database.reset(token)
+            if operation.operation == OperationType.MUTATION:
+                self.set_sticky_cookie()
+
+    def get_database_alias(self, operation: OperationDefinitionNode) -> str:
+        replicas = undine_settings.DATABASE_REPLICA_ALIASES
+        if operation.operation != OperationType.QUERY or not replicas or self.is_sticky():
+            return undine_settings.DATABASE_PRIMARY_ALIAS
+
+        return replicas[next(_replica_counter) % len(replicas)]
+
+    def is_sticky(self) -> bool:
+        """Has the client made a mutation recently enough that it should still read from the primary database?"""
+        value = self.context.request.COOKIES.get(undine_settings.DATABASE_PRIMARY_STICKY_COOKIE)
+        if value is None:
+            return False
+
+        try:
+            remaining = int(value) - time.time()
+        except ValueError:
+            return False
+
+        # Don't trust a client to keep itself on the primary database for longer than allowed.
+        return 0 < remaining <= undine_settings.DATABASE_PRIMARY_STICKY_TIME
+
+    def set_sticky_cookie(self) -> None:
+        sticky_time = undine_settings.DATABASE_PRIMARY_STICKY_TIME
+        if sticky_time <= 0:
+            return
+
+        name = undine_settings.DATABASE_PRIMARY_STICKY_COOKIE
+
+        cookie = SimpleCookie()
+        cookie[name] = str(int(time.time()) + sticky_time)
+        cookie[name]["max-age"] = sticky_time
+        cookie[name]["path"] = "/"
+        cookie[name]["httponly"] = True
+        cookie[name]["samesite"] = "Lax"
+
+        self.context.request.response_headers["Set-Cookie"] = cookie[name].OutputString()
+
+
+class OperationDatabaseRouter:
+    """
+    Django database router that routes queries made during a GraphQL operation
+    to the database chosen by `DatabaseRoutingHook`.
+    Outside of GraphQL operations, routing is left to other routers.
+    """
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:
+        return _operation_database.get()
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str | None:
+        if _operation_database.get() is None:
+            return None
+        return undine_settings.DATABASE_PRIMARY_ALIAS
+
+    def allow_relation(self, obj_1: Model, obj_2: Model, **hints: Any) -> bool | None:
+        # Replicas have the same data as the primary database, so objects can be related across them.
+        aliases = {undine_settings.DATABASE_PRIMARY_ALIAS, *undine_settings.DATABASE_REPLICA_ALIASES}
+        if obj_1._state.db in aliases and obj_2._state.db in aliases:  # noqa: SLF001
+            return True
+        return None
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from functools import wraps
+from collections.abc import Iterable
 from typing import Any, Generic, NoReturn, TypeVar
 
 from django.core.exceptions import ValidationError
@@ -12,12 +11,14 @@
 from undine.directives import DirectiveList
 from undine.exceptions import GraphQLScalarConversionError, GraphQLScalarTypeNotSupportedError
 from undine.settings import undine_settings
-from undine.typing import DispatchProtocol, T
+from undine.typing import DispatchProtocol, Lambda, T
 from undine.utils.function_dispatcher import FunctionDispatcher
 from undine.utils.graphql.type_registry import get_or_create_graphql_scalar
+from undine.utils.reflection import get_instance_name
 from undine.utils.text import dotpath
 
 __all__ = [
+    "ScalarDispatcher",
     "ScalarType",
 ]
 
@@ -59,9 +60,8 @@ def __init__(
         self.extensions = extensions or {}
         self.extensions[undine_settings.SCALAR_EXTENSIONS_KEY] = self
 
-        error_wrapper = handle_scalar_errors(name)
-        self.parse: FunctionDispatcher[TParse] = FunctionDispatcher(wrapper=error_wrapper)
-        self.serialize: FunctionDispatcher[TSerialize] = FunctionDispatcher(wrapper=error_wrapper)
+        self.parse: ScalarDispatcher[TParse] = ScalarDispatcher(typename=name)
+        self.serialize: ScalarDispatcher[TSerialize] = ScalarDispatcher(typename=name)
 
         @self.serialize.register  # type: ignore[arg-type]
         @self.parse.register
@@ -85,22 +85,58 @@ def as_graphql_scalar(self) -> GraphQLScalarType:
         )
 
 
-def handle_scalar_errors(typename: str) -> Callable[[DispatchProtocol[T]], DispatchProtocol[T]]:
-    """Catch errors raised by the scalar parsers and serializers and reraise them as GraphQLErrors."""
+class ScalarDispatcher(FunctionDispatcher[T]):
+    """
+    FunctionDispatcher for the parsers and serializers of a scalar.
 
-    def decorator(func: DispatchProtocol[T]) -> DispatchProtocol[T]:
-        @wraps(func)
-        def wrapper(key: Any, **kwargs: Any) -> T:
-            try:
-                return func(key)
-            except GraphQLScalarConversionError:
-                raise
-            except ValidationError as err:
-                msg = str(err.message % err.params) if err.params else str(err.message)
-                raise GraphQLScalarConversionError(typename=typename, value=inspect(key), error=msg) from err
-            except Exception as err:
-                raise GraphQLScalarConversionError(typename=typename, value=inspect(key), error=str(err)) from err
+    Implementations are cached by the exact type of the value, so that after the first value of a type
+    has been converted, finding the implementation for values of that type requires a single dictionary lookup.
+    Errors raised by the implementations are reraised as GraphQLErrors.
+    """
 
-        return wrapper  # type: ignore[return-value]
+    def __init__(self, *, typename: str) -> None:
+        """
+        Create a new ScalarDispatcher. Must be added to a variable before use!
 
-    return decorator
+        :param typename: The name of the scalar the dispatcher converts values for.
+        """
+        super().__init__(wrapper=self.clear_cache)
+        self.__name__ = get_instance_name()
+        self.typename = typename
+        self.cache: dict[type, DispatchProtocol[T]] = {}
+
+    def __call__(self, value: Any, /, **kwargs: Any) -> T:
+        """Find the implementation for the given value and call it with the value."""
+        implementation = self.cache.get(value.__class__)
+        if implementation is None:
+            implementation = self.resolve(value)
+
+        try:
+            return implementation(value)
+        except GraphQLScalarConversionError:
+            raise
+        except ValidationError as err:
+            msg = str(err.message % err.params) if err.params else str(err.message)
+            raise GraphQLScalarConversionError(typename=self.typename, value=inspect(value), error=msg) from err
+        except Exception as err:
+            raise GraphQLScalarConversionError(typename=self.typename, value=inspect(value), error=str(err)) from err
+
+    def resolve(self, value: Any) -> DispatchProtocol[T]:
+        """Find the implementation for the given value, and cache it for the value's type if possible."""
+        implementation = self[value]
+
+        # Types, lambdas and literals are dispatched by the value itself, not by its type.
+        if (
+            not isinstance(value, type)
+            and not self.implementations.literals
+            and Lambda not in self.implementations.types
+        ):
+            self.cache[value.__class__] = implementation
+
+        return implementation
+
+    def clear_cache(self, func: DispatchProtocol[T]) -> DispatchProtocol[T]:
+        # Used as the wrapper for registered implementations, since any registration can change
+        # the implementation that values of a cached type should use.
+        self.cache.clear()
+        return func
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.db import DEFAULT_DB_ALIAS  # noqa: ICN003
 from django.test.signals import setting_changed
 from graphql import GraphQLField, GraphQLObjectType, GraphQLSchema, GraphQLString
 from settings_holder import SettingsHolder, reload_settings
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Container
+    from collections.abc import Callable, Container, Hashable
 
     from graphql import ASTValidationRule
 
@@ -18,6 +20,7 @@
     from undine.hooks import LifecycleHook, LifecycleHookContext
     from undine.optimizer.optimizer import QueryOptimizer
     from undine.typing import (
+        DjangoRequestProtocol,
         DocstringParserProtocol,
         PersistedDocumentsPermissionsCallback,
         WebSocketConnectionInitHook,
@@ -86,6 +89,18 @@ class UndineDefaultSettings(NamedTuple):
     If None, all items are fetched.
     """
 
+    FILE_UPLOAD_MAX_FILE_SIZE: int | None = None
+    """
+    Maximum size of a single uploaded file in bytes. Checked while the request body is being read.
+    If None, the size of a single file is not limited.
+    """
+
+    FILE_UPLOAD_MAX_TOTAL_SIZE: int | None = None
+    """
+    Maximum total size of all uploaded files in a single request in bytes. Checked while the request body
+    is being read. If None, the total size of uploaded files is not limited.
+    """
+
     MAX_FILTERS_PER_TYPE: int = 20
     """The maximum number of filters allowed for a single `FilterSet`."""
 
@@ -109,6 +124,13 @@ class UndineDefaultSettings(NamedTuple):
     PAGINATION_TOTAL_COUNT_KEY: str = "_undine_pagination_total_count"
     """The key to which the connection's total count annotated to or added to in the queryset hints."""
 
+    PAGINATION_TOTAL_COUNT_LIMIT: int = 1_000
+    """
+    The number of items up to which the total count of a connection using the 'capped' or 'estimated'
+    total count strategy is exact. Capped counts stop counting at this limit, while estimates
+    at or below this limit are replaced with an exact count.
+    """
+
     # GraphQL execution
 
     ADDITIONAL_VALIDATION_RULES: list[type[ASTValidationRule]] = []
@@ -120,6 +142,7 @@ class UndineDefaultSettings(NamedTuple):
     LIFECYCLE_HOOKS: list[type[LifecycleHook]] = [
         "undine.hooks.RequestCacheHook",  # type: ignore[list-item]
         "undine.hooks.VisibilityCacheHook",  # type: ignore[list-item]
+        "undine.hooks.IntrospectionCacheHook",  # type: ignore[list-item]
         "undine.hooks.AtomicMutationHook",  # type: ignore[list-item]
     ]
     """Lifecycle hooks to use during GraphQL operations."""
@@ -148,6 +171,12 @@ class UndineDefaultSettings(NamedTuple):
     NO_ERROR_LOCATION: bool = False
     """Whether to add the location information to GraphQL errors."""
 
+    PARALLEL_ENTRYPOINT_WORKERS: int = 0
+    """
+    Number of threads used for executing the database queries of query entrypoints in parallel
+    when `ASYNC` is enabled. Set to 0 to disable.
+    """
+
     ROOT_VALUE: Any = None
     """The root value for the GraphQL execution."""
 
@@ -172,6 +201,27 @@ class UndineDefaultSettings(NamedTuple):
 
     # Persisted documents
 
+    PERSISTED_DOCUMENTS_APQ_BATCH_SIZE: int = 100
+    """Number of queued automatic persisted queries that causes them to be written to the database immediately."""
+
+    PERSISTED_DOCUMENTS_APQ_FLUSH_INTERVAL: float = 0
+    """
+    How many seconds to wait before writing queued automatic persisted queries to the database in a batch.
+    `0` writes them during the request.
+    """
+
+    PERSISTED_DOCUMENTS_CACHE_ALIAS: str | None = None
+    """The cache alias to use as a shared cache for persisted documents. `None` disables the shared cache."""
+
+    PERSISTED_DOCUMENTS_CACHE_MAX_SIZE: int = 1000
+    """Maximum number of persisted documents to keep in the in-process cache. `0` disables the in-process cache."""
+
+    PERSISTED_DOCUMENTS_CACHE_PREFIX: str = "undine-persisted-document"
+    """The prefix to use for the shared cache keys of persisted documents."""
+
+    PERSISTED_DOCUMENTS_CACHE_TIMEOUT: int | None = None
+    """How many seconds to keep persisted documents in the shared cache. `None` keeps them until evicted."""
+
     PERSISTED_DOCUMENTS_ONLY: bool = False
     """Whether to only allow persisted documents to be executed."""
 
@@ -261,6 +311,12 @@ class UndineDefaultSettings(NamedTuple):
     and clients might not handle them correctly.
     """
 
+    INCREMENTAL_DELIVERY_STREAM_CHUNK_SIZE: int = 100
+    """
+    Number of rows to fetch from the database at a time when a list entrypoint is streamed
+    using the `@stream` directive. Related objects are prefetched separately for each chunk.
+    """
+
     # Federation
 
     FEDERATION_VERSION: str = "2.15"
@@ -281,6 +337,98 @@ class UndineDefaultSettings(NamedTuple):
     FEDERATION_FIELD_EXTENSIONS_KEY: str = "undine_federation_field"
     """The key used to store a `FederationField` in the field GraphQL extensions."""
 
+    FEDERATION_TRACING_SAMPLE_RATE: float = 1.0
+    """
+    Fraction of requests carrying the federated tracing header that are traced by `FederatedTracingHook`,
+    between 0 and 1. Requests that are not sampled are executed without tracing.
+    """
+
+    FEDERATION_TRACING_MAX_NODES: int | None = None
+    """
+    Maximum number of nodes recorded in a single federated trace, including the root node.
+    Fields resolved after the limit is reached are not traced. If None, all fields are traced.
+    """
+
+    FEDERATION_TRACING_AGGREGATE_LIST_ITEMS: bool = False
+    """
+    Should federated traces record a single node for each field in a list, instead of one node per list item?
+    The aggregated node spans from the start of the first item's resolver to the end of the last one's.
+    """
+
+    FEDERATION_TRACING_SKIP_TRIVIAL_RESOLVERS: bool = False
+    """
+    Should federated traces skip fields resolved by plain attribute access,
+    i.e. fields using the default resolver, or model fields without a permission check?
+    """
+
+    # Profiling
+
+    PROFILING_RESPONSE_EXTENSIONS: bool = False
+    """Should `ProfilingHook` add the collected timings to the response `extensions` under the `profiling` key?"""
+
+    PROFILING_LOG_LEVEL: int | None = logging.DEBUG
+    """Level at which `ProfilingHook` logs the collected timings using the `undine` logger. If None, don't log."""
+
+    PROFILING_OPENTELEMETRY: bool = True
+    """Should `ProfilingHook` export the collected timings as OpenTelemetry spans? Requires `opentelemetry-api`."""
+
+    # Query cost
+
+    MAX_QUERY_COST: int | None = None
+    """Maximum cost that `QueryCostHook` allows for a single operation. If None, the cost is not limited."""
+
+    QUERY_COST_LIST_SIZE: int = 100
+    """
+    Number of objects that `QueryCostHook` assumes a list field returns when the number
+    is not limited by pagination arguments, a page size, or an `Entrypoint` limit.
+    """
+
+    QUERY_COST_RESPONSE_EXTENSIONS: bool = True
+    """Should `QueryCostHook` add the cost of the operation to the response `extensions` under the `cost` key?"""
+
+    QUERY_COST_BUDGET: int | None = None
+    """
+    Total cost of operations that `QueryCostHook` allows a single client to make before
+    it needs to wait for its budget to refill. If None, cost budgets are not used.
+    """
+
+    QUERY_COST_BUDGET_REFILL_RATE: float = 10
+    """How much cost budget each client gets back per second."""
+
+    QUERY_COST_BUDGET_CACHE_ALIAS: str = DEFAULT_CACHE_ALIAS
+    """The cache alias to use for storing the remaining cost budgets of clients."""
+
+    QUERY_COST_BUDGET_CACHE_PREFIX: str = "undine-cost-budget"
+    """The prefix to use for the cache keys of cost budgets."""
+
+    # Operation deadlines
+
+    OPERATION_TIMEOUT: float | None = None
+    """
+    Number of seconds `OperationDeadlineHook` allows each entrypoint of an operation to take.
+    Can be overridden per `Entrypoint` with its `timeout` argument. If None, entrypoints are not limited.
+    """
+
+    MAX_OPERATION_TIMEOUT: float | None = None
+    """
+    Maximum number of seconds a client can request using the `timeout` key in the request `extensions`.
+    If None, clients can only request timeouts shorter than the ones set on the server.
+    """
+
+    # Database routing
+
+    DATABASE_PRIMARY_ALIAS: str = DEFAULT_DB_ALIAS
+    """Database alias that `DatabaseRoutingHook` uses for mutations, subscriptions, and sticky queries."""
+
+    DATABASE_REPLICA_ALIASES: list[str] = []
+    """Database aliases that `DatabaseRoutingHook` uses for queries in round-robin order."""
+
+    DATABASE_PRIMARY_STICKY_TIME: int = 5
+    """Number of seconds after a mutation during which `DatabaseRoutingHook` uses the primary database for queries."""
+
+    DATABASE_PRIMARY_STICKY_COOKIE: str = "undine-primary"
+    """Name of the cookie `DatabaseRoutingHook` uses to route queries to the primary database after a mutation."""
+
     # Django-modeltranslation
 
     MODELTRANSLATION_INCLUDE_TRANSLATABLE: bool = False
@@ -294,6 +442,12 @@ class UndineDefaultSettings(NamedTuple):
     DISABLE_ONLY_FIELDS_OPTIMIZATION: bool = False
     """Disable optimizing fetched fields with `queryset.only()`."""
 
+    FILTER_EXISTS_SUBQUERIES: bool = False
+    """
+    Should `FilterSets` apply `Filters` that would require `queryset.distinct()`, e.g. filters
+    for to-many relations, using an EXISTS subquery instead? Can be overridden per `FilterSet`.
+    """
+
     OPTIMIZER_CLASS: type[QueryOptimizer] = "undine.optimizer.optimizer.QueryOptimizer"  # type: ignore[assignment]
     """The optimizer class to use for optimizing queries."""
 
@@ -302,15 +456,42 @@ class UndineDefaultSettings(NamedTuple):
 
     # Caching
 
+    CALCULATION_CACHE_ALIAS: str = DEFAULT_CACHE_ALIAS
+    """The cache alias to use for caching the values of `Calculations` with a `cache_time`."""
+
+    CALCULATION_CACHE_PREFIX: str = "undine-calculation"
+    """The prefix to use for the cache keys of calculated values."""
+
+    ENTITY_CACHE_ALIAS: str = DEFAULT_CACHE_ALIAS
+    """The cache alias to use for caching the field values of `QueryTypes` with an `entity_cache_time`."""
+
+    ENTITY_CACHE_PREFIX: str = "undine-entity"
+    """The prefix to use for the cache keys of cached field values."""
+
     ENTRYPOINT_DEFAULT_CACHE_TIME: int = 0
     """The default caching time an `Entrypoint` for the @cacheRules directive."""
 
+    INTROSPECTION_CACHE_ALIAS: str = DEFAULT_CACHE_ALIAS
+    """The cache alias to use for caching introspection responses."""
+
+    INTROSPECTION_CACHE_PREFIX: str = "undine-introspection"
+    """The prefix to use for the cache keys of introspection responses."""
+
+    INTROSPECTION_CACHE_TIMEOUT: int = 3600
+    """How many seconds to cache introspection responses. `0` disables the cache."""
+
     REQUEST_CACHE_ALIAS: str = DEFAULT_CACHE_ALIAS
     """The cache alias to use for caching requests."""
 
     REQUEST_CACHE_EXTRA_CONTEXT: Callable[[LifecycleHookContext], dict[str, Any]] = "undine.hooks.default_extra_context"  # type: ignore[assignment]
     """Function to use for extra context to add to the cache key."""
 
+    REQUEST_CACHE_INVALIDATION: bool = False
+    """
+    Whether to invalidate cached requests when the models fetched for them are saved or deleted.
+    Uses version counters stored in the request cache, which are incremented by model signals.
+    """
+
     REQUEST_CACHE_READ_PREDICATE: Callable[[LifecycleHookContext], bool] = "undine.hooks.should_read_from_cache"  # type: ignore[assignment]
     """Function to use for checking if the result should be read from cache."""
 
@@ -320,11 +501,42 @@ class UndineDefaultSettings(NamedTuple):
     REQUEST_CACHE_PREFIX: str = "undine-cache"
     """The prefix to use for the cache keys of requests."""
 
+    REQUEST_CACHE_SINGLE_FLIGHT: bool = True
+    """
+    Whether identical cacheable operations executed at the same time in the same process should wait
+    for the first one to finish and use its cached result instead of executing the operation again.
+    """
+
+    REQUEST_CACHE_SINGLE_FLIGHT_TIMEOUT: float = 10
+    """How many seconds an operation waits for an identical operation to finish before executing itself."""
+
+    REQUEST_CACHE_STALE_WHILE_REVALIDATE: int = 0
+    """
+    How many seconds after its cache time a cached result can still be returned while a single request
+    refreshes it. `0` disables returning stale results.
+    """
+
     # Visibility
 
     VISIBILITY_ACTIVE_EXTENSIONS_KEY: str = "undine_visibility_active"
     """The key set to `True` on `schema.extensions` when the schema uses visibility checks."""
 
+    VISIBILITY_AUDIENCE: Callable[[DjangoRequestProtocol], Hashable | None] = (
+        "undine.utils.visibility.default_visibility_audience"  # type: ignore[assignment]
+    )
+    """
+    Function that returns the visibility audience of a request. Requests with the same audience
+    must see the same parts of the schema. A schema containing only the visible parts is built once
+    for each audience and used for validating and executing the audience's requests.
+    If the function returns `None`, visibility is checked separately for each request.
+    """
+
+    VISIBILITY_AUDIENCE_EXTENSIONS_KEY: str = "undine_visibility_audience"
+    """The key used to store the visibility audience in the GraphQL extensions of an audience schema."""
+
+    VISIBILITY_AUDIENCE_SCHEMA_MAX_SIZE: int = 16
+    """Maximum number of audience schemas to keep in memory. Least recently used schemas are removed first."""
+
     VISIBILITY_CACHE_ALIAS: str = DEFAULT_CACHE_ALIAS
     """The cache alias to use for visibility caching."""
 
@@ -361,6 +573,9 @@ class UndineDefaultSettings(NamedTuple):
     TOTAL_COUNT_PARAM_NAME: str = "totalCount"
     """The name of the total count parameter in connection resolvers."""
 
+    TOTAL_COUNT_IS_EXACT_PARAM_NAME: str = "totalCountIsExact"
+    """The name of the parameter telling whether the total count is exact in connections with an inexact strategy."""
+
     # Other
 
     DOCSTRING_PARSER: type[DocstringParserProtocol] = "undine.parsers.parse_docstring.RSTDocstringParser"  # type: ignore[assignment]
@@ -375,6 +590,12 @@ class UndineDefaultSettings(NamedTuple):
     EMPTY_VALUES: Container[Any] = (None, "", [], {})
     """By default, if a Filter receives any of these values, it will be ignored."""
 
+    FILE_UPLOAD_HANDLERS: list[str] | None = None
+    """
+    Import paths to Django upload handlers to use for GraphQL file uploads.
+    If None, the handlers from Django's `FILE_UPLOAD_HANDLERS` setting are used.
+    """
+
     # Extensions keys
 
     CALCULATION_ARGUMENT_EXTENSIONS_KEY: str = "undine_calculation_argument"
@@ -452,6 +673,7 @@ class UndineDefaultSettings(NamedTuple):
     "REQUEST_CACHE_WRITE_PREDICATE",
     "SCHEMA",
     "SDL_PRINTER",
+    "VISIBILITY_AUDIENCE",
     "VISIBILITY_CACHE_EXTRA_CONTEXT",
     "WEBSOCKET_CONNECTION_INIT_HOOK",
     "WEBSOCKET_PING_HOOK",
@@ -197,6 +197,7 @@ class ExperimentalIncrementalExecutionResults(Protocol):  # type: ignore[no-rede
     from django.contrib.contenttypes.fields import GenericForeignKey, GenericRel, GenericRelation
     from django.contrib.sessions.backends.base import SessionBase
     from django.core.files.uploadedfile import UploadedFile
+    from django.db.models import OrderBy
     from django.db.models.sql import Query
     from django.http import QueryDict
     from django.http.request import HttpHeaders, MediaType
@@ -223,6 +224,7 @@ class ExperimentalIncrementalExecutionResults(Protocol):  # type: ignore[no-rede
     "Annotatable",
     "CacheKeyData",
     "CalculationArgumentParams",
+    "CalculationParams",
     "ClientMessage",
     "CombinableExpression",
     "CompleteMessage",
@@ -230,6 +232,7 @@ class ExperimentalIncrementalExecutionResults(Protocol):  # type: ignore[no-rede
     "ConnectionDict",
     "ConnectionInitMessage",
     "ConvertionFunc",
+    "CostFunc",
     "DirectiveArgumentParams",
     "DirectiveParams",
     "DispatchProtocol",
@@ -247,6 +250,8 @@ class ExperimentalIncrementalExecutionResults(Protocol):  # type: ignore[no-rede
     "FieldParams",
     "FieldPermFunc",
     "FilterAliasesFunc",
+    "FilterLimitFunc",
+    "FilterOrderByFunc",
     "FilterParams",
     "FilterSetParams",
     "FormattedMultipartMixedHttpResult",
@@ -306,6 +311,7 @@ class ExperimentalIncrementalExecutionResults(Protocol):  # type: ignore[no-rede
     "TUnionType",
     "ToManyField",
     "ToOneField",
+    "TotalCountStrategy",
     "UndineErrorCodes",
     "UnionTypeParams",
     "ValidatorFunc",
@@ -760,6 +766,27 @@ def operator(self) -> Callable[..., Any]:
                 raise ValueError(msg)
 
 
+class TotalCountStrategy(enum.StrEnum):
+    """How the total count of a `Connection` is calculated."""
+
+    exact = "exact"
+    """
+    Count all items in the connection.
+    """
+
+    capped = "capped"
+    """
+    Count items only up to a limit. If there are more items, the limit is returned
+    and the count is marked as inexact.
+    """
+
+    estimated = "estimated"
+    """
+    Use the database's query planner estimate for large connections.
+    Falls back to an exact count if the database cannot provide an estimate.
+    """
+
+
 # noinspection PyEnum
 class UndineErrorCodes(StrEnum):
     """Error codes for Undine errors."""
@@ -794,6 +821,8 @@ def _generate_next_value_(name: str, start: Any, count: int, last_values: list[A
     FIELD_NOT_NULLABLE = auto()
     FIELD_ONE_TO_ONE_CONSTRAINT_VIOLATION = auto()
     FILE_NOT_FOUND = auto()
+    FILE_TOO_LARGE = auto()
+    FILE_UPLOAD_TOO_LARGE = auto()
     INCREMENTAL_DELIVERY_NOT_REQUESTED = auto()
     INCREMENTAL_DELIVERY_NOT_SUPPORTED = auto()
     INVALID_INPUT_DATA = auto()
@@ -825,11 +854,14 @@ def _generate_next_value_(name: str, start: Any, count: int, last_values: list[A
     NODE_QUERY_TYPE_MISSING = auto()
     NODE_TYPE_NOT_OBJECT_TYPE = auto()
     OPERATION_NOT_FOUND = auto()
+    OPERATION_TIMEOUT = auto()
     OPTIMIZER_ERROR = auto()
     PERMISSION_DENIED = auto()
     PERSISTED_DOCUMENT_NOT_FOUND = auto()
     PERSISTED_DOCUMENTS_NOT_SUPPORTED = auto()
     PRIMARY_KEYS_MISSING = auto()
+    QUERY_COST_BUDGET_EXCEEDED = auto()
+    QUERY_COST_TOO_HIGH = auto()
     RELATION_NOT_NULLABLE = auto()
     REQUEST_DECODING_ERROR = auto()
     REQUEST_PARSE_ERROR = auto()
@@ -850,6 +882,7 @@ def _generate_next_value_(name: str, start: Any, count: int, last_values: list[A
     TYPED_DICT_ANNOTATED_INCORRECT_METADATA = auto()
     UNEXPECTED_CALCULATION_ARGUMENT = auto()
     UNEXPECTED_ERROR = auto()
+    UNEXPECTED_FILE = auto()
     UNEXPECTED_MULTIPLE_PAYLOADS = auto()
     UNEXPECTED_SUBSCRIPTION_ARGUMENT = auto()
     UNION_RESOLVE_TYPE_INVALID_VALUE = auto()
@@ -990,6 +1023,7 @@ class PageInfoDict(TypedDict):
 
 class ConnectionDict(TypedDict, Generic[TModel]):
     totalCount: int
+    totalCountIsExact: bool
     pageInfo: PageInfoDict
     edges: list[NodeDict[TModel]]
 
@@ -1016,6 +1050,7 @@ class EntrypointParams(TypedDict, total=False):
     complexity: int
     cache_time: int
     cache_per_user: bool
+    timeout: float | None
     schema_name: str
     errors: Iterable[type[Exception]]
     directives: list[Directive]
@@ -1033,6 +1068,7 @@ class QueryTypeParams(TypedDict, total=False):
     interfaces: list[type[InterfaceType]]
     cache_time: int
     cache_per_user: bool
+    entity_cache_time: int
     register: bool
     schema_name: str
     directives: list[Directive]
@@ -1150,6 +1186,7 @@ class FilterSetParams(TypedDict, total=False):
     auto: bool
     exclude: list[str]
     schema_name: str
+    exists_subqueries: bool
     directives: list[Directive]
     extensions: dict[str, Any]
 
@@ -1215,6 +1252,13 @@ class DirectiveArgumentParams(TypedDict, total=False):
     extensions: dict[str, Any]
 
 
+class CalculationParams(TypedDict, total=False):
+    """Arguments for an Undine `Calculation`."""
+
+    deduplicate: bool
+    cache_time: int
+
+
 class CalculationArgumentParams(TypedDict, total=False):
     """Arguments for an Undine `DirectiveArgument`."""
 
@@ -1392,6 +1436,8 @@ class ResultCacheData(TypedDict):
 
     result: ExecutionResult
     created_at: int
+    versions: NotRequired[dict[str, int]]
+    """Versions of the models fetched for the result, if request cache invalidation is enabled."""
 
 
 class VisibilityCacheData(TypedDict):
@@ -1497,6 +1543,7 @@ def __init__(self, data: dict[str, Any], /, *, error: Exception) -> None:
 
 ConvertionFunc: TypeAlias = Callable[[_AnyInput, _AnyValue], _AnyValue]
 VisibilityFunc: TypeAlias = Callable[[Any, DjangoRequestProtocol], bool]
+CostFunc: TypeAlias = Callable[[Any, dict[str, Any]], int]
 
 OptimizerFunc: TypeAlias = Callable[[_AnyField, "OptimizationData", GQLInfo], None]
 
@@ -1505,6 +1552,14 @@ class FilterAliasesFunc(Protocol):
     def __call__(self, root: _AnyFilter, /, info: GQLInfo, *, value: Any) -> dict[str, DjangoExpression]: ...
 
 
+class FilterLimitFunc(Protocol):
+    def __call__(self, root: _AnyFilter, /, info: GQLInfo, *, value: Any) -> int | None: ...
+
+
+class FilterOrderByFunc(Protocol):
+    def __call__(self, root: _AnyFilter, /, info: GQLInfo, *, value: Any) -> list[OrderBy]: ...
+
+
 class OrderAliasesFunc(Protocol):
     def __call__(self, root: _AnyOrder, /, info: GQLInfo, *, descending: bool) -> dict[str, DjangoExpression]: ...
 
@@ -7,7 +7,7 @@
 from collections import UserString
 from typing import TYPE_CHECKING, Unpack
 
-from django.db.models import Q
+from django.db.models import F, GeneratedField, Q
 from django.utils.translation import get_language_from_path, get_language_from_request
 
 from undine.settings import undine_settings
@@ -15,11 +15,23 @@
 from .reflection import get_members
 
 if TYPE_CHECKING:
+    from django.contrib.postgres.search import SearchQuery
+    from django.db.models import OrderBy
+
     from undine import Filter
-    from undine.typing import DjangoRequestProtocol, FTSLang, GQLInfo, LangCode, LangSep, PostgresFTSLangSpecificFields
+    from undine.typing import (
+        DjangoExpression,
+        DjangoRequestProtocol,
+        FTSLang,
+        GQLInfo,
+        LangCode,
+        LangSep,
+        PostgresFTSLangSpecificFields,
+    )
 
 __all__ = [
     "PostgresFTS",
+    "search_vector_field",
 ]
 
 
@@ -27,14 +39,20 @@ class PostgresFTS:  # pragma: no cover
     """
     Filter reference for Postgres full text search.
 
-    Creates a SearchVector for the request language, annotates it to the queryset,
-    and searches using a raw search string created using the `build_pg_search` function.
+    For languages with a stored search vector (e.g. a generated column created with `search_vector_field`),
+    searches against the stored vector directly, so that a GIN index on it can be used. For other languages,
+    creates a SearchVector for the request language and annotates it to the queryset.
+    Searches using a raw search string created using the `build_pg_search` function.
+    Optionally, orders the results by their search rank.
     """
 
     def __init__(
         self,
         *common: str,
         separator: LangSep = "|",
+        vector_fields: dict[FTSLang, str] | None = None,
+        rank: bool = False,
+        rank_limit: int | None = None,
         **lang_specific: Unpack[PostgresFTSLangSpecificFields],
     ) -> None:
         """
@@ -42,25 +60,76 @@ def __init__(
 
         :param common: Common fields for all languages.
         :param separator: Separator for each search term in the query.
+        :param vector_fields: Names of stored search vector fields to search against for each language.
+        :param rank: Whether to order the results by their search rank, most relevant first.
+        :param rank_limit: Maximum number of rows to return when ranking. Only the highest-ranked rows
+                           that match all the other filters are kept, and the rest are left out of the results.
+                           By default, all matching rows are returned.
         :param lang_specific: Fields specific to each language.
         """
         from django.contrib.postgres.search import SearchVector  # noqa: PLC0415
 
         self.separator = separator
         self.vectors: dict[FTSLang, SearchVector] = {
-            lang: SearchVector(*set(*common, *fields), config=lang)  # type: ignore[misc]
+            lang: SearchVector(*dict.fromkeys((*common, *fields)), config=lang)  # type: ignore[misc]
             for lang, fields in lang_specific.items()
         }
+        self.vector_fields: dict[FTSLang, str] = vector_fields or {}
+        self.rank = rank
+        self.rank_limit = rank_limit
 
     def get_search_language(self, info: GQLInfo) -> SearchLanguage:
-        lang = get_request_search_language(info.context)
-        if lang not in self.vectors:
+        lang = get_request_search_language(info.context.request)
+        if lang not in self.vectors and lang not in self.vector_fields:
             return TextSearchLang.ENGLISH
         return lang
 
     def get_vector_alias_key(self, ftr: Filter, lang: SearchLanguage) -> str:
         return f"{undine_settings.PG_TEXT_SEARCH_PREFIX}_{ftr.name}_{lang.name}"
 
+    def get_rank_alias_key(self, ftr: Filter, lang: SearchLanguage) -> str:
+        return f"{undine_settings.PG_TEXT_SEARCH_PREFIX}_{ftr.name}_{lang.name}_rank"
+
+    def get_vector_lookup(self, ftr: Filter, lang: SearchLanguage) -> str:
+        """Get the lookup for the search vector of the given language."""
+        field_name = self.vector_fields.get(lang.name)
+        if field_name is not None:
+            return field_name
+        return self.get_vector_alias_key(ftr, lang)
+
+    def get_search_query(self, value: str, lang: SearchLanguage) -> SearchQuery:
+        from django.contrib.postgres.search import SearchQuery  # noqa: PLC0415
+
+        search = build_pg_search(value, separator=self.separator)
+        return SearchQuery(value=search, config=lang.name, search_type="raw")
+
+    def get_aliases(self, ftr: Filter, info: GQLInfo, *, value: str) -> dict[str, DjangoExpression]:
+        from django.contrib.postgres.search import SearchRank  # noqa: PLC0415
+
+        lang = self.get_search_language(info)
+        aliases: dict[str, DjangoExpression] = {}
+
+        if lang.name not in self.vector_fields:
+            aliases[self.get_vector_alias_key(ftr, lang)] = self.vectors[lang.name]
+
+        if self.rank:
+            vector = F(self.get_vector_lookup(ftr, lang))
+            aliases[self.get_rank_alias_key(ftr, lang)] = SearchRank(vector, self.get_search_query(value, lang))
+
+        return aliases
+
+    def get_order_by(self, ftr: Filter, info: GQLInfo, *, value: str) -> list[OrderBy]:
+        if not self.rank:
+            return []
+
+        lang = self.get_search_language(info)
+        return [F(self.get_rank_alias_key(ftr, lang)).desc()]
+
+    def get_limit(self, ftr: Filter, info: GQLInfo, *, value: str) -> int | None:
+        if not self.rank:
+            return None
+        return self.rank_limit
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class PostgresFTSExpressionResolver:  # pragma: no cover
@@ -69,13 +138,35 @@ class PostgresFTSExpressionResolver:  # pragma: no cover
     fts: PostgresFTS
 
     def __call__(self, root: Filter, info: GQLInfo, *, value: str) -> Q:
-        from django.contrib.postgres.search import SearchQuery  # noqa: PLC0415
-
         lang = self.fts.get_search_language(info)
-        key = self.fts.get_vector_alias_key(root, lang)
-        search = build_pg_search(value, separator=self.fts.separator)
-        query = {key: SearchQuery(value=search, config=lang.name, search_type="raw")}
-        return Q(**query)
+        lookup = self.fts.get_vector_lookup(root, lang)
+        query = self.fts.get_search_query(value, lang)
+        return Q(**{lookup: query})
+
+
+def search_vector_field(*fields: str, config: FTSLang) -> GeneratedField:  # pragma: no cover
+    """
+    Create a stored generated column that contains the search vector of the given fields for the given language.
+    Use the field in `PostgresFTS(vector_fields=...)`, and add a `GinIndex` for it in the model's `Meta.indexes`
+    so that the migration for the field also creates the index.
+
+    >>> class Task(models.Model):
+    ...     name = models.CharField(max_length=255)
+    ...     search_vector_english = search_vector_field("name", config="english")
+    ...
+    ...     class Meta:
+    ...         indexes = [GinIndex(fields=["search_vector_english"], name="task_search_vector_english")]
+
+    :param fields: Names of the text fields to include in the search vector.
+    :param config: The text search configuration to use for the search vector.
+    """
+    from django.contrib.postgres.search import SearchVector, SearchVectorField  # noqa: PLC0415
+
+    return GeneratedField(
+        expression=SearchVector(*fields, config=config),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
 
 class SearchLanguage(UserString):
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from contextlib import suppress
-from typing import TYPE_CHECKING
-
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from django.db import connections, transaction  # noqa: ICN003
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from graphql import (
     FieldNode,
     FragmentSpreadNode,
@@ -32,6 +39,9 @@
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Generator
+
+    from django.db.models import Model
     from graphql import (
         FragmentDefinitionNode,
         GraphQLCompositeType,
@@ -44,9 +54,31 @@
 
 __all__ = [
     "RequestCacheCalculator",
+    "connect_request_cache_invalidation",
+    "disconnect_request_cache_invalidation",
+    "get_model_version",
+    "get_model_version_for_label",
+    "get_model_version_for_label_async",
+    "get_model_version_key",
+    "get_model_versions",
+    "get_model_versions_async",
+    "invalidate_model",
+    "record_model_version",
+    "record_pending_model_versions",
+    "record_pending_model_versions_async",
+    "single_flight",
+    "single_flight_async",
+    "track_model_versions",
 ]
 
 
+_model_versions: ContextVar[dict[str, int | None] | None] = ContextVar("undine_model_versions", default=None)
+
+_in_flight_lock = threading.Lock()
+_in_flight: dict[str, threading.Event] = {}
+_in_flight_async: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+
 class RequestCacheCalculator:
     """Calculated the cache time allowed for the given operation."""
 
@@ -186,3 +218,258 @@ def parse_cache_time_from_type(self, field_type: GraphQLCompositeType, *, is_ent
 
                     if has_union_type_visibility_override(union_type):
                         self.cache_per_user = True
+
+
+# Invalidation
+
+
+def get_model_version_key(label: str) -> str:
+    """Get the cache key for the version counter of the model with the given label."""
+    return f"{undine_settings.REQUEST_CACHE_PREFIX}:version:{label}"
+
+
+def get_model_label(model: type[Model]) -> str:
+    # Proxy models share the version of the model whose table they use.
+    return model._meta.concrete_model._meta.label_lower  # type: ignore[union-attr]
+
+
+@contextmanager
+def track_model_versions() -> Generator[dict[str, int | None], None, None]:
+    """
+    Record the versions of the models fetched by the optimizer in the current context to the yielded dict.
+    Versions that are still pending when the context exits are `None`.
+    """
+    versions: dict[str, int | None] = {}
+    token = _model_versions.set(versions)
+    try:
+        yield versions
+    finally:
+        _model_versions.reset(token)
+
+
+def record_model_version(model: type[Model]) -> None:
+    """
+    Record the current version of the given model if model versions are being tracked.
+    Should be called before the model is fetched from the database, so that changes made
+    while the data is fetched invalidate the cached result.
+
+    When called from an event loop, the version is only marked as pending, since looking it up
+    would block the event loop. Pending versions must be recorded with `record_pending_model_versions`
+    or `record_pending_model_versions_async` before the model is fetched.
+    """
+    versions = _model_versions.get()
+    if versions is None:
+        return
+
+    label = get_model_label(model)
+    if label in versions:
+        return
+
+    if _in_event_loop():
+        versions[label] = None
+        return
+
+    versions[label] = get_model_version(model)
+
+
+def record_pending_model_versions() -> None:
+    """Record the versions of the models marked as pending in the current context."""
+    versions = _model_versions.get()
+    if not versions:
+        return
+
+    for label, version in versions.items():
+        if version is None:
+            versions[label] = get_model_version_for_label(label)
+
+
+async def record_pending_model_versions_async() -> None:
+    """Record the versions of the models marked as pending in the current context."""
+    versions = _model_versions.get()
+    if not versions:
+        return
+
+    for label, version in versions.items():
+        if version is None:
+            versions[label] = await get_model_version_for_label_async(label)
+
+
+def get_model_version(model: type[Model]) -> int:
+    """Get the current version of the given model, initializing the version counter if needed."""
+    return get_model_version_for_label(get_model_label(model))
+
+
+def get_model_version_for_label(label: str) -> int:
+    """Get the current version of the model with the given label, initializing the version counter if needed."""
+    cache = caches[undine_settings.REQUEST_CACHE_ALIAS]
+    key = get_model_version_key(label)
+
+    version: int | None = cache.get(key)
+    if version is None:
+        # Start from a unique value so that a counter evicted from the cache
+        # doesn't match a version recorded before the eviction.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key, 0)
+
+    return version  # type: ignore[return-value]
+
+
+async def get_model_version_for_label_async(label: str) -> int:
+    """Get the current version of the model with the given label, initializing the version counter if needed."""
+    cache = caches[undine_settings.REQUEST_CACHE_ALIAS]
+    key = get_model_version_key(label)
+
+    version: int | None = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key, 0)
+
+    return version  # type: ignore[return-value]
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def get_model_versions(labels: list[str]) -> dict[str, int]:
+    """Get the current versions of the models with the given labels."""
+    cache = caches[undine_settings.REQUEST_CACHE_ALIAS]
+    keys = {get_model_version_key(label): label for label in labels}
+    return {keys[key]: version for key, version in cache.get_many(list(keys)).items()}
+
+
+async def get_model_versions_async(labels: list[str]) -> dict[str, int]:
+    """Get the current versions of the models with the given labels."""
+    cache = caches[undine_settings.REQUEST_CACHE_ALIAS]
+    keys = {get_model_version_key(label): label for label in labels}
+    return {keys[key]: version for key, version in (await cache.aget_many(list(keys))).items()}
+
+
+def invalidate_model(model: type[Model], *, using: str | None = None) -> None:
+    """
+    Invalidate all cached results that contain the given model by incrementing its version counter.
+    If called in a transaction, the counter is incremented again when the transaction commits,
+    so that results cached during the transaction using the old data are invalidated as well.
+    """
+    labels = [get_model_label(model)] + [get_model_label(parent) for parent in model._meta.get_parent_list()]
+    _increment_versions(labels)
+
+    if using is not None and connections[using].in_atomic_block:
+        transaction.on_commit(lambda: _increment_versions(labels), using=using)
+
+
+def _increment_versions(labels: list[str]) -> None:
+    cache = caches[undine_settings.REQUEST_CACHE_ALIAS]
+    for label in labels:
+        key = get_model_version_key(label)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def invalidate_on_save_or_delete(sender: type[Model], using: str | None = None, **kwargs: Any) -> None:
+    """Signal receiver for `post_save` and `post_delete` that invalidates cached results for the model."""
+    if undine_settings.REQUEST_CACHE_INVALIDATION:
+        invalidate_model(sender, using=using)
+
+
+def invalidate_on_m2m_changed(
+    sender: type[Model],
+    instance: Model,
+    action: str,
+    model: type[Model],
+    using: str | None = None,
+    **kwargs: Any,
+) -> None:
+    """Signal receiver for `m2m_changed` that invalidates cached results for the models in the relation."""
+    if not undine_settings.REQUEST_CACHE_INVALIDATION or not action.startswith("post_"):
+        return
+
+    invalidate_model(sender, using=using)
+    invalidate_model(type(instance), using=using)
+    invalidate_model(model, using=using)
+
+
+def connect_request_cache_invalidation() -> None:
+    """
+    Connect the signal receivers for invalidating cached requests.
+
+    Note that Django can't use fast deletes for models that have `post_delete` receivers,
+    so this is only done when `REQUEST_CACHE_INVALIDATION` is enabled.
+    """
+    post_save.connect(invalidate_on_save_or_delete, dispatch_uid="undine_request_cache_post_save")
+    post_delete.connect(invalidate_on_save_or_delete, dispatch_uid="undine_request_cache_post_delete")
+    m2m_changed.connect(invalidate_on_m2m_changed, dispatch_uid="undine_request_cache_m2m_changed")
+
+
+def disconnect_request_cache_invalidation() -> None:
+    """Disconnect the signal receivers for invalidating cached requests."""
+    post_save.disconnect(dispatch_uid="undine_request_cache_post_save")
+    post_delete.disconnect(dispatch_uid="undine_request_cache_post_delete")
+    m2m_changed.disconnect(dispatch_uid="undine_request_cache_m2m_changed")
+
+
+# Single-flight
+
+
+@contextmanager
+def single_flight(key: str) -> Generator[bool, None, None]:
+    """
+    Coalesce executions of identical operations in the current process.
+
+    Yields `True` if the caller should execute the operation, and `False` after another
+    caller executing the operation for the same key has finished or `REQUEST_CACHE_SINGLE_FLIGHT_TIMEOUT`
+    has passed. Callers yielded `False` should check the cache before executing the operation themselves.
+    """
+    if not undine_settings.REQUEST_CACHE_SINGLE_FLIGHT:
+        yield True
+        return
+
+    with _in_flight_lock:
+        event = _in_flight.get(key)
+        is_leader = event is None
+        if event is None:
+            event = _in_flight[key] = threading.Event()
+
+    if not is_leader:
+        event.wait(timeout=undine_settings.REQUEST_CACHE_SINGLE_FLIGHT_TIMEOUT)
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+        event.set()
+
+
+@asynccontextmanager
+async def single_flight_async(key: str) -> AsyncGenerator[bool, None]:
+    """Coalesce executions of identical operations in the current event loop. See `single_flight`."""
+    if not undine_settings.REQUEST_CACHE_SINGLE_FLIGHT:
+        yield True
+        return
+
+    loop = asyncio.get_running_loop()
+
+    in_flight = _in_flight_async.get(key)
+    if in_flight is not None and in_flight[0] is loop:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(in_flight[1].wait(), timeout=undine_settings.REQUEST_CACHE_SINGLE_FLIGHT_TIMEOUT)
+        yield False
+        return
+
+    event = asyncio.Event()
+    _in_flight_async[key] = (loop, event)
+    try:
+        yield True
+    finally:
+        if _in_flight_async.get(key) == (loop, event):
+            del _in_flight_async[key]
+        event.set()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import caches
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    get_argument_values,
+    get_nullable_type,
+    is_list_type,
+)
+
+from undine.settings import undine_settings
+from undine.utils.graphql.undine_extensions import (
+    get_undine_connection,
+    get_undine_entrypoint,
+    get_undine_field,
+    get_undine_offset_pagination,
+)
+from undine.utils.graphql.utils import get_field_def, get_underlying_type
+
+if TYPE_CHECKING:
+    from graphql import (
+        FragmentDefinitionNode,
+        GraphQLCompositeType,
+        GraphQLField,
+        OperationDefinitionNode,
+        SelectionNode,
+    )
+
+    from undine import Entrypoint, Field
+    from undine.relay import Connection
+
+
+__all__ = [
+    "QueryCostCalculator",
+    "consume_cost_budget",
+    "consume_cost_budget_async",
+]
+
+
+class QueryCostCalculator:
+    """
+    Calculates the cost of the given operation.
+
+    Each field costs its complexity, or the value returned by its cost function, for each object
+    it is resolved for. Fields returning objects cost at least one for each object. The number of objects
+    is multiplied along list fields by the requested page size, the maximum page size,
+    the limit of a list `Entrypoint`, or the `QUERY_COST_LIST_SIZE` setting, in that order.
+    """
+
+    def __init__(
+        self,
+        operation: OperationDefinitionNode,
+        fragments: dict[str, FragmentDefinitionNode],
+        variable_values: dict[str, Any],
+    ) -> None:
+        self.operation = operation
+        self.fragments = fragments
+        self.variable_values = variable_values
+        self.fragments_in_progress: set[str] = set()
+
+    def run(self) -> int:
+        root_type: GraphQLObjectType = undine_settings.SCHEMA.get_root_type(self.operation.operation)  # type: ignore[assignment]
+        return self.calculate_selections(root_type, self.operation.selection_set.selections, multiplier=1)
+
+    def calculate_selections(
+        self,
+        parent_type: GraphQLCompositeType,
+        selections: tuple[SelectionNode, ...],
+        *,
+        multiplier: int,
+    ) -> int:
+        return sum(self.calculate_selection(parent_type, selection, multiplier=multiplier) for selection in selections)
+
+    def calculate_selection(
+        self, parent_type: GraphQLCompositeType, selection: SelectionNode, *, multiplier: int
+    ) -> int:
+        match selection:
+            case FieldNode():
+                return self.calculate_field(parent_type, selection, multiplier=multiplier)
+
+            case InlineFragmentNode():
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = undine_settings.SCHEMA.get_type(selection.type_condition.name.value)  # type: ignore[assignment]
+                return self.calculate_selections(
+                    fragment_type, selection.selection_set.selections, multiplier=multiplier
+                )
+
+            case FragmentSpreadNode():  # pragma: no branch
+                fragment_name = selection.name.value
+                fragment = self.fragments.get(fragment_name)
+                if fragment is None or fragment_name in self.fragments_in_progress:
+                    return 0
+
+                fragment_type = undine_settings.SCHEMA.get_type(fragment.type_condition.name.value)
+                self.fragments_in_progress.add(fragment_name)
+                try:
+                    return self.calculate_selections(
+                        fragment_type, fragment.selection_set.selections, multiplier=multiplier
+                    )  # type: ignore[arg-type]
+                finally:
+                    self.fragments_in_progress.discard(fragment_name)
+
+        return 0  # pragma: no cover
+
+    def calculate_field(self, parent_type: GraphQLCompositeType, field_node: FieldNode, *, multiplier: int) -> int:
+        field = get_field_def(undine_settings.SCHEMA, parent_type, field_node)  # type: ignore[arg-type]
+        if field is None:  # pragma: no cover
+            return 0
+
+        try:
+            arguments = get_argument_values(field, field_node, self.variable_values)
+        except GraphQLError:
+            arguments = {}
+
+        undine_obj: Entrypoint | Field | None = get_undine_entrypoint(field) or get_undine_field(field)
+
+        cost = 0
+        if undine_obj is not None:
+            cost = undine_obj.cost_func(undine_obj, arguments) if undine_obj.cost_func else undine_obj.complexity
+
+        if field_node.selection_set is None:
+            return multiplier * cost
+
+        field_type: GraphQLCompositeType = get_underlying_type(field.type)  # type: ignore[assignment]
+        list_size = self.get_list_size(parent_type, field, arguments, undine_obj)
+
+        total = multiplier * max(cost, 1)
+        total += self.calculate_selections(
+            field_type,
+            field_node.selection_set.selections,
+            multiplier=multiplier * list_size,
+        )
+        return total
+
+    def get_list_size(
+        self,
+        parent_type: GraphQLCompositeType,
+        field: GraphQLField,
+        arguments: dict[str, Any],
+        undine_obj: Entrypoint | Field | None,
+    ) -> int:
+        """Get the maximum number of objects the given field can return."""
+        connection: Connection | None = field.extensions.get(undine_settings.CONNECTION_EXTENSIONS_KEY)
+        if connection is not None:
+            return _min_size(arguments.get("first"), arguments.get("last"), connection.page_size)
+
+        offset_pagination = get_undine_offset_pagination(field)
+        if offset_pagination is not None:
+            return _min_size(arguments.get("limit"), offset_pagination.page_size)
+
+        # Edges of a connection are already counted by the connection.
+        if isinstance(parent_type, GraphQLObjectType) and get_undine_connection(parent_type) is not None:
+            return 1
+
+        if not is_list_type(get_nullable_type(field.type)):  # type: ignore[arg-type]
+            return 1
+
+        limit = getattr(undine_obj, "limit", None)
+        if isinstance(limit, int):
+            return limit
+
+        return undine_settings.QUERY_COST_LIST_SIZE
+
+
+def _min_size(*sizes: Any) -> int:
+    return min((size for size in sizes if isinstance(size, int)), default=undine_settings.QUERY_COST_LIST_SIZE)
+
+
+def get_cost_budget_key(identifier: str) -> str:
+    return f"{undine_settings.QUERY_COST_BUDGET_CACHE_PREFIX}:{identifier}"
+
+
+def consume_cost_budget(identifier: str, cost: int) -> tuple[bool, float]:
+    """
+    Consume the given cost from the cost budget of the given client using a token bucket.
+    Returns whether the cost fit in the budget, and the remaining budget.
+
+    Concurrent requests from the same client can read the same budget before it's updated,
+    so the budget can be exceeded slightly by operations executed at the same time.
+    """
+    cache = caches[undine_settings.QUERY_COST_BUDGET_CACHE_ALIAS]
+    key = get_cost_budget_key(identifier)
+
+    tokens, allowed = _take_tokens(cache.get(key), cost)
+    cache.set(key, (tokens, time.time()), timeout=_get_budget_timeout())
+    return allowed, tokens
+
+
+async def consume_cost_budget_async(identifier: str, cost: int) -> tuple[bool, float]:
+    """Same as `consume_cost_budget`, but async."""
+    cache = caches[undine_settings.QUERY_COST_BUDGET_CACHE_ALIAS]
+    key = get_cost_budget_key(identifier)
+
+    tokens, allowed = _take_tokens(await cache.aget(key), cost)
+    await cache.aset(key, (tokens, time.time()), timeout=_get_budget_timeout())
+    return allowed, tokens
+
+
+def _take_tokens(data: tuple[float, float] | None, cost: int) -> tuple[float, bool]:
+    capacity = undine_settings.QUERY_COST_BUDGET
+    rate = undine_settings.QUERY_COST_BUDGET_REFILL_RATE
+
+    tokens = float(capacity)  # type: ignore[arg-type]
+    if data is not None:
+        previous, updated_at = data
+        tokens = min(tokens, previous + (time.time() - updated_at) * rate)
+
+    if cost > tokens:
+        return tokens, False
+    return tokens - cost, True
+
+
+def _get_budget_timeout() -> int | None:
+    # After the budget has been fully refilled, the stored state is no longer needed.
+    rate = undine_settings.QUERY_COST_BUDGET_REFILL_RATE
+    if rate <= 0:
+        return None
+    return math.ceil(undine_settings.QUERY_COST_BUDGET / rate) + 1  # type: ignore[operator]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
+
+from undine.typing import T
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+__all__ = [
+    "HeartbeatScheduler",
+    "HeartbeatStream",
+    "with_heartbeat",
+]
+
+
+H = TypeVar("H")
+
+_HEARTBEAT = object()
+_STOP = object()
+
+
+class HeartbeatScheduler:
+    """
+    Sends heartbeats to idle event streams that use the same event loop and heartbeat interval.
+
+    Instead of each stream waiting for its next event with a timeout, a single timer ticks once
+    per interval for all streams, and sends a heartbeat to each stream that hasn't delivered
+    an event since the previous tick. The timer only runs while there are streams registered.
+    """
+
+    schedulers: ClassVar[dict[tuple[asyncio.AbstractEventLoop, float], HeartbeatScheduler]] = {}
+
+    def __init__(self, *, loop: asyncio.AbstractEventLoop, interval: float) -> None:
+        self.loop = loop
+        self.interval = interval
+        self.streams: set[HeartbeatStream] = set()
+        self.timer: asyncio.TimerHandle | None = None
+
+    @classmethod
+    def get(cls, interval: float) -> HeartbeatScheduler:
+        """Get the scheduler for the given interval in the running event loop."""
+        loop = asyncio.get_running_loop()
+        key = (loop, interval)
+
+        scheduler = cls.schedulers.get(key)
+        if scheduler is None:
+            scheduler = cls(loop=loop, interval=interval)
+            cls.schedulers[key] = scheduler
+
+        return scheduler
+
+    def register(self, stream: HeartbeatStream) -> None:
+        self.streams.add(stream)
+        if self.timer is None:
+            self.timer = self.loop.call_later(self.interval, self.tick)
+
+    def unregister(self, stream: HeartbeatStream) -> None:
+        self.streams.discard(stream)
+        if self.streams:
+            return
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        self.schedulers.pop((self.loop, self.interval), None)
+
+    def tick(self) -> None:
+        for stream in self.streams:
+            stream.tick()
+
+        self.timer = self.loop.call_later(self.interval, self.tick)
+
+
+class HeartbeatStream(Generic[T]):
+    """
+    Events of a single event stream, read ahead by one event so that heartbeats can be sent
+    while the consumer is waiting for the next event.
+    """
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=1)
+        self.active = True
+        self.error: Exception | None = None
+
+    def tick(self) -> None:
+        if self.active:
+            self.active = False
+            return
+
+        # If the queue is full, the next event is already waiting to be delivered.
+        with suppress(asyncio.QueueFull):
+            self.queue.put_nowait(_HEARTBEAT)
+
+    async def read(self, event_stream: AsyncIterator[T]) -> None:
+        try:
+            async for event in event_stream:
+                await self.queue.put(event)
+
+        except Exception as error:  # noqa: BLE001
+            self.error = error
+
+        await self.queue.put(_STOP)
+
+
+async def with_heartbeat(
+    event_stream: AsyncIterator[T],
+    *,
+    interval: float,
+    heartbeat: Callable[[], H],
+) -> AsyncIterator[T | H]:
+    """
+    Wrap an event stream to emit a heartbeat when no events have been emitted during the last interval.
+
+    Heartbeats for all event streams with the same interval are scheduled by a shared `HeartbeatScheduler`,
+    and events are read from the event stream by a single task for the lifetime of the stream.
+
+    :param event_stream: The event stream to wrap.
+    :param interval: Interval in seconds between heartbeats.
+    :param heartbeat: Function that creates a heartbeat event.
+    """
+    stream: HeartbeatStream[T] = HeartbeatStream()
+    reader = asyncio.create_task(stream.read(event_stream))
+
+    scheduler = HeartbeatScheduler.get(interval)
+    scheduler.register(stream)
+
+    try:
+        while True:
+            item = await stream.queue.get()
+
+            if item is _HEARTBEAT:
+                yield heartbeat()
+                continue
+
+            if item is _STOP:
+                if stream.error is not None:
+                    raise stream.error
+                return
+
+            stream.active = True
+            yield item
+
+    finally:
+        scheduler.unregister(stream)
+        if not reader.done():
+            reader.cancel()
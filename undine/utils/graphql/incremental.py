@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING
 
 from graphql import ExecutionResult
@@ -8,6 +7,7 @@
 from undine.dataclasses import IncrementalDeliveryComplete, IncrementalDeliveryHeartbeat, IncrementalDeliveryResponse
 from undine.execution import execute_graphql_http_async
 from undine.settings import undine_settings
+from undine.utils.graphql.heartbeat import with_heartbeat
 from undine.utils.graphql.utils import graphql_errors_hook
 
 if TYPE_CHECKING:
@@ -74,24 +74,11 @@ async def with_incremental_stream_heartbeat(
     # before the initial payload, which clients expect to be the first part of the response.
     initial_payload_sent = False
 
-    events = aiter(event_stream)
-    next_event = asyncio.ensure_future(anext(events))
-    try:
-        while True:
-            done, _ = await asyncio.wait({next_event}, timeout=interval)
-            if not done:
-                if initial_payload_sent:
-                    yield IncrementalDeliveryHeartbeat()
-                continue
-
-            try:
-                yield next_event.result()
-            except StopAsyncIteration:
-                return
-
-            initial_payload_sent = True
-            next_event = asyncio.ensure_future(anext(events))
-
-    finally:
-        if not next_event.done():
-            next_event.cancel()
+    async for event in with_heartbeat(event_stream, interval=interval, heartbeat=IncrementalDeliveryHeartbeat):
+        if isinstance(event, IncrementalDeliveryHeartbeat):
+            if initial_payload_sent:
+                yield event
+            continue
+
+        initial_payload_sent = True
+        yield event
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
     GraphQLArgument,
     GraphQLBoolean,
     GraphQLEnumType,
@@ -15,13 +19,15 @@
     GraphQLScalarType,
     GraphQLString,
     GraphQLUnionType,
+    InlineFragmentNode,
     TypeKind,
     TypeMetaFieldDef,
     introspection_types,
+    print_schema,
 )
 from graphql.pyutils import inspect
 
-from undine.utils.visibility import is_visible
+from undine.utils.visibility import is_audience_schema, is_visible
 
 from .undine_extensions import get_undine_root_type
 from .utils import get_underlying_type
@@ -31,6 +37,7 @@
 
     from graphql import (
         DirectiveLocation,
+        FragmentDefinitionNode,
         GraphQLDirective,
         GraphQLEnumValue,
         GraphQLInputField,
@@ -38,11 +45,15 @@
         GraphQLOutputType,
         GraphQLSchema,
         GraphQLType,
+        OperationDefinitionNode,
+        SelectionSetNode,
     )
 
     from undine import GQLInfo
 
 __all__ = [
+    "get_schema_fingerprint",
+    "is_introspection_operation",
     "patch_introspection_schema",
 ]
 
@@ -57,6 +68,61 @@
 type_kind_introspection_type: GraphQLEnumType = introspection_types["__TypeKind"]  # type: ignore[assignment]
 
 
+_schema_fingerprints: WeakKeyDictionary[GraphQLSchema, str] = WeakKeyDictionary()
+
+
+def get_schema_fingerprint(schema: GraphQLSchema) -> str:
+    """
+    Get a hash of the given schema's SDL. Schemas that would give the same introspection results
+    have the same fingerprint. The fingerprint is calculated once for each schema object.
+    """
+    fingerprint = _schema_fingerprints.get(schema)
+    if fingerprint is None:
+        fingerprint = hashlib.sha256(print_schema(schema).encode()).hexdigest()
+        _schema_fingerprints[schema] = fingerprint
+    return fingerprint
+
+
+def is_introspection_operation(
+    operation: OperationDefinitionNode,
+    fragments: dict[str, FragmentDefinitionNode],
+) -> bool:
+    """Does the given operation only query introspection fields, e.g. `__schema`, `__type` or `__typename`?"""
+    return _is_introspection_selection_set(operation.selection_set, fragments, visited=set())
+
+
+def _is_introspection_selection_set(
+    selection_set: SelectionSetNode,
+    fragments: dict[str, FragmentDefinitionNode],
+    *,
+    visited: set[str],
+) -> bool:
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if not selection.name.value.startswith("__"):
+                return False
+            continue
+
+        if isinstance(selection, InlineFragmentNode):
+            if not _is_introspection_selection_set(selection.selection_set, fragments, visited=visited):
+                return False
+            continue
+
+        if isinstance(selection, FragmentSpreadNode):  # pragma: no branch
+            name = selection.name.value
+            if name in visited:
+                continue
+
+            visited.add(name)
+            fragment = fragments.get(name)
+            if fragment is None:
+                return False
+            if not _is_introspection_selection_set(fragment.selection_set, fragments, visited=visited):
+                return False
+
+    return True
+
+
 def patch_introspection_schema() -> None:
     TypeMetaFieldDef.resolve = resolve_type_meta_field_def
 
@@ -84,7 +150,7 @@ def resolve_type_meta_field_def(root: Any, info: GQLInfo, *, name: str) -> Graph
     if gql_type is None:
         return None
 
-    if not is_visible(gql_type, info.context):
+    if not _is_visible(gql_type, info):
         return None
 
     return gql_type
@@ -132,7 +198,7 @@ def resolve_schema_description(root: GraphQLSchema, info: GQLInfo) -> str | None
 
 
 def resolve_schema_types(root: GraphQLSchema, info: GQLInfo) -> Iterable[GraphQLNamedType]:
-    return [gql_type for gql_type in root.type_map.values() if is_visible(gql_type, info.context)]
+    return [gql_type for gql_type in root.type_map.values() if _is_visible(gql_type, info)]
 
 
 def resolve_schema_query_type(root: GraphQLSchema, info: GQLInfo) -> GraphQLObjectType | None:
@@ -166,11 +232,19 @@ def _root_type_visible(object_type: GraphQLObjectType, info: GQLInfo) -> bool:
     root_type = get_undine_root_type(object_type)
     if root_type is None:
         return True
-    return is_visible(object_type, info.context)
+    return _is_visible(object_type, info)
 
 
 def resolve_schema_directives(root: GraphQLSchema, info: GQLInfo) -> Iterable[GraphQLDirective]:
-    return [directive for directive in root.directives if is_visible(directive, info.context)]
+    return [directive for directive in root.directives if _is_visible(directive, info)]
+
+
+def _is_visible(obj: Any, info: GQLInfo) -> bool:
+    # Audience schemas only contain the parts of the schema that are visible to the audience,
+    # except for hidden root types, which are kept without any fields.
+    if info.schema is not None and is_audience_schema(info.schema):
+        return not isinstance(obj, GraphQLObjectType) or bool(obj.fields)
+    return is_visible(obj, info.context)
 
 
 # Directive
@@ -221,7 +295,7 @@ def resolve_directive_locations(root: GraphQLDirective, info: GQLInfo) -> Iterab
 
 
 def resolve_directive_args(root: GraphQLDirective, info: GQLInfo, **kwargs: Any) -> list[tuple[str, GraphQLArgument]]:
-    args = ((key, arg) for key, arg in root.args.items() if is_visible(arg, info.context))
+    args = ((key, arg) for key, arg in root.args.items() if _is_visible(arg, info))
 
     if kwargs["includeDeprecated"]:
         return list(args)
@@ -327,7 +401,7 @@ def resolve_type_specified_by_url(gql_type: GraphQLType, info: GQLInfo) -> str |
 
 def resolve_type_fields(gql_type: GraphQLType, info: GQLInfo, **kwargs: Any) -> list[tuple[str, GraphQLField]] | None:
     if isinstance(gql_type, (GraphQLObjectType, GraphQLInterfaceType)):
-        fields = ((key, field) for key, field in gql_type.fields.items() if is_visible(field, info.context))
+        fields = ((key, field) for key, field in gql_type.fields.items() if _is_visible(field, info))
 
         if kwargs["includeDeprecated"]:
             return list(fields)
@@ -339,7 +413,7 @@ def resolve_type_fields(gql_type: GraphQLType, info: GQLInfo, **kwargs: Any) ->
 
 def resolve_type_interfaces(gql_type: GraphQLType, info: GQLInfo) -> Iterable[GraphQLInterfaceType] | None:
     if isinstance(gql_type, (GraphQLObjectType, GraphQLInterfaceType)):
-        return [interface for interface in gql_type.interfaces if is_visible(interface, info.context)]
+        return [interface for interface in gql_type.interfaces if _is_visible(interface, info)]
 
     return None
 
@@ -347,7 +421,7 @@ def resolve_type_interfaces(gql_type: GraphQLType, info: GQLInfo) -> Iterable[Gr
 def resolve_type_possible_types(gql_type: GraphQLType, info: GQLInfo) -> Iterable[GraphQLObjectType] | None:
     if isinstance(gql_type, (GraphQLInterfaceType, GraphQLUnionType)):
         object_types = info.schema.get_possible_types(gql_type)
-        return [object_type for object_type in object_types if is_visible(object_type, info.context)]
+        return [object_type for object_type in object_types if _is_visible(object_type, info)]
 
     return None
 
@@ -358,7 +432,7 @@ def resolve_type_enum_values(
     **kwargs: Any,
 ) -> list[tuple[str, GraphQLEnumValue]] | None:
     if isinstance(gql_type, GraphQLEnumType):
-        values = ((key, field) for key, field in gql_type.values.items() if is_visible(field, info.context))
+        values = ((key, field) for key, field in gql_type.values.items() if _is_visible(field, info))
 
         if kwargs["includeDeprecated"]:
             return list(values)
@@ -377,7 +451,7 @@ def resolve_type_input_fields(
         fields = (
             (key, field)
             for key, field in gql_type.fields.items()
-            if is_visible(field, info.context) and is_visible(get_underlying_type(field.type), info.context)
+            if _is_visible(field, info) and _is_visible(get_underlying_type(field.type), info)
         )
 
         if kwargs["includeDeprecated"]:
@@ -446,7 +520,7 @@ def resolve_field_args(
     info: GQLInfo,
     **kwargs: Any,
 ) -> list[tuple[str, GraphQLArgument]]:
-    args = ((key, arg) for key, arg in item[1].args.items() if is_visible(arg, info.context))
+    args = ((key, arg) for key, arg in item[1].args.items() if _is_visible(arg, info))
 
     if kwargs["includeDeprecated"]:
         return list(args)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING
 
@@ -10,6 +9,7 @@
 from undine.exceptions import GraphQLErrorGroup, GraphQLUnexpectedError, GraphQLUnexpectedMultiplePayloadsError
 from undine.execution import execute_graphql_with_subscription
 from undine.settings import undine_settings
+from undine.utils.graphql.heartbeat import with_heartbeat
 from undine.utils.graphql.utils import get_error_execution_result
 
 if TYPE_CHECKING:
@@ -80,22 +80,5 @@ async def with_multipart_mixed_heartbeat(
 
     yield MultipartMixedHttpHeartbeat()
 
-    events = aiter(event_stream)
-    next_event = asyncio.ensure_future(anext(events))
-    try:
-        while True:
-            done, _ = await asyncio.wait({next_event}, timeout=interval)
-            if not done:
-                yield MultipartMixedHttpHeartbeat()
-                continue
-
-            try:
-                yield next_event.result()
-            except StopAsyncIteration:
-                return
-
-            next_event = asyncio.ensure_future(anext(events))
-
-    finally:
-        if not next_event.done():
-            next_event.cancel()
+    async for event in with_heartbeat(event_stream, interval=interval, heartbeat=MultipartMixedHttpHeartbeat):
+        yield event
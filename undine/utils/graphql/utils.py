@@ -85,6 +85,8 @@
     "is_node_interface",
     "is_page_info",
     "is_relation_id",
+    "is_streamed_field",
+    "is_trivial_resolver",
     "should_skip_node",
 ]
 
@@ -262,6 +264,37 @@ def should_skip_node(node: NodeWithDirective, variable_values: VariableValues) -
     return include_args is not None and include_args["if"] is False
 
 
+def is_streamed_field(info: GQLInfo) -> bool:
+    """Is the field being resolved a list field that should be streamed using the `@stream` directive?"""
+    if undine_settings.EXPERIMENTAL_INCREMENTAL_DELIVERY and version_info >= (3, 3, 0):  # pragma: no cover
+        from graphql import GraphQLStreamDirective  # type: ignore[attr-defined] # noqa: PLC0415
+
+        for field_node in info.field_nodes:
+            stream_args = get_directive_values(GraphQLStreamDirective, field_node, info.variable_values)
+            if stream_args is not None and stream_args["if"] is not False:
+                return True
+
+    return False
+
+
+def is_trivial_resolver(info: GQLInfo) -> bool:
+    """
+    Is the field being resolved using plain attribute access, i.e. with the default resolver,
+    or a model field resolver without a permission check? Meta fields like `__typename` are also trivial.
+    """
+    from undine.resolvers import ModelAttributeResolver  # noqa: PLC0415
+
+    # Meta fields are not included in the parent type's fields.
+    field = info.parent_type.fields.get(info.field_name)
+    if field is None:
+        return True
+
+    resolver = field.resolve
+    if resolver is None:
+        return True
+    return isinstance(resolver, ModelAttributeResolver) and resolver.field.permissions_func is None
+
+
 def is_non_null_default_value(default_value: Any) -> bool:
     return not isinstance(default_value, Hashable) or default_value not in {Undefined, None}
 
@@ -20,6 +20,7 @@
 
 __all__ = [
     "DjangoRequestProtocol",
+    "get_request_validation_rules",
     "get_validation_rules",
 ]
 
@@ -38,3 +39,20 @@ def get_validation_rules(*, inside_request: bool = False) -> tuple[type[ASTValid
             undine_settings.ADDITIONAL_VALIDATION_RULES,
         )
     )
+
+
+def get_request_validation_rules() -> tuple[type[ASTValidationRule], ...]:
+    """
+    Get the GraphQL validation rules that need to be run for every request,
+    even if the document has already been validated without a request (e.g. precompiled persisted documents).
+    """
+    schema = undine_settings.SCHEMA
+    visibility_active = bool(schema.extensions.get(undine_settings.VISIBILITY_ACTIVE_EXTENSIONS_KEY, False))
+
+    return tuple(
+        itertools.chain(
+            [] if not visibility_active else [VisibilityRule],
+            # Additional rules might depend on the request, so they are always run.
+            undine_settings.ADDITIONAL_VALIDATION_RULES,
+        )
+    )
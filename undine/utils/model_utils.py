@@ -10,12 +10,16 @@
 from django.db import connections, router  # noqa: ICN003
 from django.db.models import (
     NOT_PROVIDED,
+    BooleanField,
     CharField,
+    Exists,
+    Expression,
     F,
     ForeignKey,
     IntegerField,
     ManyToManyField,
     OneToOneField,
+    OuterRef,
     Subquery,
     TextField,
 )
@@ -48,10 +52,12 @@
     from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
     from django.core.exceptions import ValidationError
     from django.db.backends.base.features import BaseDatabaseFeatures
-    from django.db.models import Field, Manager, ManyToManyRel, Model, QuerySet
+    from django.db.models import Field, Manager, ManyToManyRel, Model, OrderBy, Q, QuerySet
+    from django.db.models.sql import Query
 
     from undine.typing import (
         CombinableExpression,
+        DjangoExpression,
         GenericField,
         ModelField,
         RelatedField,
@@ -61,6 +67,7 @@
     )
 
 __all__ = [
+    "ExistsFilter",
     "SubqueryCount",
     "convert_integrity_errors",
     "create_union_queryset",
@@ -85,6 +92,7 @@
     "get_validation_error_messages",
     "is_to_many",
     "is_to_one",
+    "limit_queryset",
     "lookup_to_display_name",
     "set_forward_ids",
 ]
@@ -474,6 +482,60 @@ def __repr__(self) -> str:
         return f"<{self.__class__.__name__}{self.template % {'subquery': subquery}}>"
 
 
+class ExistsFilter(Expression):
+    """
+    Filter condition that checks if the object matching the outer query's row
+    satisfies the given conditions, using a correlated EXISTS subquery.
+    Should be used instead of filtering by to-many relations directly when
+    the rows multiplied by the joins would otherwise need to be removed with `queryset.distinct()`.
+
+    >>> Task.objects.filter(ExistsFilter(Q(assignees__name="foo"), Q(assignees__age__gt=20)))
+
+    All conditions are applied in a single `queryset.filter()` call in the subquery,
+    so, like with a regular `queryset.filter()` call, conditions for the same to-many relation
+    must be satisfied by the same related object.
+    """
+
+    conditional = True
+
+    def __init__(
+        self,
+        *filters: Q | DjangoExpression,
+        aliases: dict[str, DjangoExpression] | None = None,
+        negated: bool = False,
+    ) -> None:
+        super().__init__(output_field=BooleanField())
+        self.filters = filters
+        self.aliases = aliases or {}
+        self.negated = negated
+
+    def __invert__(self) -> ExistsFilter:
+        return ExistsFilter(*self.filters, aliases=self.aliases, negated=not self.negated)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(filters={self.filters!r}, negated={self.negated!r})>"
+
+    def resolve_expression(
+        self,
+        query: Query | None = None,
+        allow_joins: bool = True,  # noqa: FBT001, FBT002
+        reuse: set[str] | None = None,
+        summarize: bool = False,  # noqa: FBT001, FBT002
+        for_save: bool = False,  # noqa: FBT001, FBT002
+    ) -> Expression:
+        # The model is only known once the expression is added to a query.
+        model: type[Model] = query.model  # type: ignore[union-attr,assignment]
+
+        queryset = model._base_manager.filter(pk=OuterRef("pk"))
+        if self.aliases:
+            queryset = queryset.alias(**self.aliases)
+
+        exists = Exists(queryset.filter(*self.filters))
+        if self.negated:
+            exists = ~exists
+        return exists.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+
 def determine_output_field(expression: CombinableExpression, *, model: type[Model]) -> Field:
     """Determine the `output_field` for the given expression if it doesn't have one."""
     if hasattr(expression, "output_field"):
@@ -512,6 +574,30 @@ def create_union_queryset(querysets: Iterable[QuerySet]) -> QuerySet:
     return functools.reduce(lambda x, y: x.union(y), querysets)
 
 
+def limit_queryset(
+    queryset: QuerySet[TModel],
+    *,
+    limit: int,
+    order_by: Iterable[OrderBy],
+    aliases: dict[str, DjangoExpression] | None = None,
+) -> QuerySet[TModel]:
+    """
+    Limit the given queryset to its first `limit` rows in the given order, without slicing it,
+    so that it can still be ordered differently and paginated. Rows are ordered in a subquery,
+    so any aliases the ordering requires must be given.
+    """
+    matching = queryset.order_by().values("pk")
+    candidates = (
+        queryset.model._base_manager
+        .using(queryset.db)
+        .alias(**(aliases or {}))
+        .filter(pk__in=matching)
+        .order_by(*order_by, "pk")
+        .values("pk")[:limit]
+    )
+    return queryset.filter(pk__in=candidates)
+
+
 def get_db_features(db: str = DEFAULT_DB_ALIAS) -> BaseDatabaseFeatures:
     return connections[db].features
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from contextlib import suppress
 from functools import wraps
 from typing import TYPE_CHECKING, Any, TypeAlias
 
@@ -12,8 +15,13 @@
     GraphQLInputField,
     GraphQLInputObjectType,
     GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
     GraphQLObjectType,
+    GraphQLSchema,
     GraphQLUnionType,
+    is_introspection_type,
+    is_specified_directive,
 )
 
 from undine.settings import undine_settings
@@ -43,9 +51,9 @@
 from undine.utils.reflection import is_same_func, is_subclass
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable, Iterable
 
-    from graphql import GraphQLNamedType, GraphQLSchema
+    from graphql import GraphQLNamedType, GraphQLType
 
     from undine import (
         CalculationArgument,
@@ -94,7 +102,12 @@
 
 
 __all__ = [
+    "AudienceSchemaCache",
     "apply_visibility",
+    "audience_schema_cache",
+    "build_audience_schema",
+    "get_request_schema",
+    "is_audience_schema",
     "is_visible",
 ]
 
@@ -197,6 +210,208 @@ def apply_visibility(schema: GraphQLSchema) -> bool:
     return True
 
 
+# Audience schemas
+
+
+def get_request_schema(request: DjangoRequestProtocol | None) -> GraphQLSchema:
+    """
+    Get the schema to use for validating and executing operations for the given request.
+
+    If the schema uses visibility and the request has a visibility audience,
+    this is the schema built for that audience. Otherwise, it's the schema set in `SCHEMA`.
+    """
+    schema = undine_settings.SCHEMA
+    if request is None or not schema.extensions.get(undine_settings.VISIBILITY_ACTIVE_EXTENSIONS_KEY, False):
+        return schema
+
+    request_cache_attr = "_undine_audience_schema"
+
+    cached: tuple[GraphQLSchema, GraphQLSchema] | None = getattr(request, request_cache_attr, None)
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    audience = undine_settings.VISIBILITY_AUDIENCE(request)
+    request_schema = schema if audience is None else audience_schema_cache.get(schema, audience, request)
+
+    with suppress(AttributeError, TypeError):
+        setattr(request, request_cache_attr, (schema, request_schema))
+
+    return request_schema
+
+
+def is_audience_schema(schema: GraphQLSchema) -> bool:
+    """Is the given schema built for a visibility audience, and thus contains only visible parts of the schema?"""
+    return undine_settings.VISIBILITY_AUDIENCE_EXTENSIONS_KEY in schema.extensions
+
+
+class AudienceSchemaCache:
+    """
+    Bounded LRU cache for schemas built for visibility audiences.
+
+    Schemas are built lazily on the first request of each audience, and are rebuilt
+    if the schema set in `SCHEMA` changes.
+    """
+
+    def __init__(self) -> None:
+        self.schemas: OrderedDict[Hashable, tuple[GraphQLSchema, GraphQLSchema]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, schema: GraphQLSchema, audience: Hashable, request: DjangoRequestProtocol) -> GraphQLSchema:
+        with self.lock:
+            item = self.schemas.get(audience)
+            if item is not None and item[0] is schema:
+                self.schemas.move_to_end(audience)
+                return item[1]
+
+        audience_schema = build_audience_schema(schema, audience, request)
+
+        with self.lock:
+            self.schemas[audience] = (schema, audience_schema)
+            self.schemas.move_to_end(audience)
+            while len(self.schemas) > undine_settings.VISIBILITY_AUDIENCE_SCHEMA_MAX_SIZE:
+                self.schemas.popitem(last=False)
+
+        return audience_schema
+
+    def clear(self) -> None:
+        with self.lock:
+            self.schemas.clear()
+
+
+audience_schema_cache = AudienceSchemaCache()
+
+
+def build_audience_schema(  # noqa: C901
+    schema: GraphQLSchema,
+    audience: Hashable,
+    request: DjangoRequestProtocol,
+) -> GraphQLSchema:
+    """
+    Build a copy of the given schema that contains only the types, fields, arguments,
+    enum values and directives that are visible for the given request.
+
+    Resolvers and GraphQL extensions are shared with the given schema,
+    so the copy can be used for executing operations as well.
+    """
+    type_map: dict[str, GraphQLNamedType] = {}
+
+    def replace_type(gql_type: GraphQLType) -> Any:
+        if isinstance(gql_type, GraphQLList):
+            return GraphQLList(replace_type(gql_type.of_type))
+        if isinstance(gql_type, GraphQLNonNull):
+            return GraphQLNonNull(replace_type(gql_type.of_type))
+        return type_map[gql_type.name]  # type: ignore[attr-defined]
+
+    def copy_args(args: dict[str, GraphQLArgument]) -> dict[str, GraphQLArgument]:
+        return {
+            name: GraphQLArgument(**{**arg.to_kwargs(), "type_": replace_type(arg.type)})
+            for name, arg in args.items()
+            if is_visible(arg, request)
+        }
+
+    def is_field_visible(field: GraphQLField) -> bool:
+        if not is_visible(field, request):
+            return False
+
+        # MutationType entrypoints are hidden if their input type is hidden.
+        for arg in field.args.values():
+            arg_type = get_underlying_type(arg.type)
+            if get_undine_mutation_type(arg_type) is not None and not is_visible(arg_type, request):
+                return False
+
+        return True
+
+    def copy_fields(fields: dict[str, GraphQLField]) -> dict[str, GraphQLField]:
+        return {
+            name: GraphQLField(**{
+                **field.to_kwargs(),
+                "type_": replace_type(field.type),
+                "args": copy_args(field.args),
+            })
+            for name, field in fields.items()
+            if is_field_visible(field)
+        }
+
+    def copy_input_fields(fields: dict[str, GraphQLInputField]) -> dict[str, GraphQLInputField]:
+        return {
+            name: GraphQLInputField(**{**field.to_kwargs(), "type_": replace_type(field.type)})
+            for name, field in fields.items()
+            if is_visible(field, request)
+        }
+
+    def copy_named_types(named_types: Iterable[GraphQLNamedType]) -> list[Any]:
+        return [type_map[item.name] for item in named_types if item.name in type_map]
+
+    def copy_named_type(named_type: GraphQLNamedType) -> GraphQLNamedType:
+        kwargs = named_type.to_kwargs()
+
+        match named_type:
+            case GraphQLObjectType():
+                return GraphQLObjectType(**{
+                    **kwargs,
+                    "fields": lambda: copy_fields(named_type.fields),
+                    "interfaces": lambda: copy_named_types(named_type.interfaces),
+                })
+
+            case GraphQLInterfaceType():
+                return GraphQLInterfaceType(**{
+                    **kwargs,
+                    "fields": lambda: copy_fields(named_type.fields),
+                    "interfaces": lambda: copy_named_types(named_type.interfaces),
+                })
+
+            case GraphQLUnionType():
+                return GraphQLUnionType(**{
+                    **kwargs,
+                    "types": lambda: copy_named_types(named_type.types),
+                })
+
+            case GraphQLInputObjectType():
+                return GraphQLInputObjectType(**{**kwargs, "fields": lambda: copy_input_fields(named_type.fields)})
+
+            case GraphQLEnumType():
+                values = {name: value for name, value in named_type.values.items() if is_visible(value, request)}
+                return GraphQLEnumType(**{**kwargs, "values": values})
+
+        # Scalars don't have anything to hide.
+        return named_type
+
+    for name, named_type in schema.type_map.items():
+        if is_introspection_type(named_type) or not is_visible(named_type, request):
+            continue
+        type_map[name] = copy_named_type(named_type)
+
+    # Root types are kept even if they are hidden so that operations for them fail validation
+    # the same way as for a hidden field. Root types without fields are hidden in introspection.
+    for root in (schema.query_type, schema.mutation_type, schema.subscription_type):
+        if root is not None and root.name not in type_map:
+            type_map[root.name] = GraphQLObjectType(**{**root.to_kwargs(), "fields": {}, "interfaces": []})
+
+    directives = [
+        directive
+        if is_specified_directive(directive)
+        else GraphQLDirective(**{**directive.to_kwargs(), "args": copy_args(directive.args)})
+        for directive in schema.directives
+        if is_visible(directive, request)
+    ]
+
+    def root_type(object_type: GraphQLObjectType | None) -> Any:
+        return None if object_type is None else type_map[object_type.name]
+
+    return GraphQLSchema(
+        query=root_type(schema.query_type),
+        mutation=root_type(schema.mutation_type),
+        subscription=root_type(schema.subscription_type),
+        types=list(type_map.values()),
+        directives=directives,
+        description=schema.description,
+        extensions={**schema.extensions, undine_settings.VISIBILITY_AUDIENCE_EXTENSIONS_KEY: audience},
+        # Hiding parts of a valid schema can result in an invalid schema, e.g., a root type without fields,
+        # but operations validated against it can still be executed.
+        assume_valid=True,
+    )
+
+
 # Caching
 
 
@@ -324,6 +539,11 @@ def default_visibility_extra_context(request: DjangoRequestProtocol) -> Any:
     return None
 
 
+def default_visibility_audience(request: DjangoRequestProtocol) -> Hashable | None:
+    """Default visibility audience function, which checks visibility separately for each request."""
+    return None
+
+
 def any_entrypoint_visible(object_type: GraphQLObjectType, request: DjangoRequestProtocol) -> bool:
     return any(is_entrypoint_visible(field, request) for field in object_type.fields.values())
 